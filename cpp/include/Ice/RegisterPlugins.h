@@ -61,6 +61,26 @@ ICE_PLUGIN_REGISTER_DECLSPEC_IMPORT void registerIceUDP(bool loadOnInitialize =
  * plug-in property is set to 1.
  */
 ICE_PLUGIN_REGISTER_DECLSPEC_IMPORT void registerIceWS(bool loadOnInitialize = true);
+
+#ifndef _WIN32
+/**
+ * When using static libraries, calling this function ensures the shared memory transport is
+ * linked with the application.
+ * @param loadOnInitialize If true, the plug-in is loaded (created) during communicator initialization.
+ * If false, the plug-in is only loaded during communicator initialization if its corresponding
+ * plug-in property is set to 1.
+ */
+ICE_PLUGIN_REGISTER_DECLSPEC_IMPORT void registerIceSHM(bool loadOnInitialize = true);
+
+/**
+ * When using static libraries, calling this function ensures the Unix domain socket transport is
+ * linked with the application.
+ * @param loadOnInitialize If true, the plug-in is loaded (created) during communicator initialization.
+ * If false, the plug-in is only loaded during communicator initialization if its corresponding
+ * plug-in property is set to 1.
+ */
+ICE_PLUGIN_REGISTER_DECLSPEC_IMPORT void registerIceUnix(bool loadOnInitialize = true);
+#endif
 #endif
 
 #ifndef ICESSL_API_EXPORTS
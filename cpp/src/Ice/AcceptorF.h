@@ -25,6 +25,14 @@ class TcpAcceptor;
 ICE_API IceUtil::Shared* upCast(TcpAcceptor*);
 typedef Handle<TcpAcceptor> TcpAcceptorPtr;
 
+class ShmAcceptor;
+ICE_API IceUtil::Shared* upCast(ShmAcceptor*);
+typedef Handle<ShmAcceptor> ShmAcceptorPtr;
+
+class UnixAcceptor;
+ICE_API IceUtil::Shared* upCast(UnixAcceptor*);
+typedef Handle<UnixAcceptor> UnixAcceptorPtr;
+
 }
 
 #endif
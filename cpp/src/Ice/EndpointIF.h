@@ -20,6 +20,8 @@ class EndpointI;
 class TcpEndpointI;
 class UdpEndpointI;
 class WSEndpoint;
+class ShmEndpointI;
+class UnixEndpointI;
 class EndpointI_connectors;
 
 #ifdef ICE_CPP11_MAPPING // C++11 mapping
@@ -28,6 +30,8 @@ using EndpointIPtr = ::std::shared_ptr<EndpointI>;
 using TcpEndpointIPtr = ::std::shared_ptr<TcpEndpointI>;
 using UdpEndpointIPtr = ::std::shared_ptr<UdpEndpointI>;
 using WSEndpointPtr = ::std::shared_ptr<WSEndpoint>;
+using ShmEndpointIPtr = ::std::shared_ptr<ShmEndpointI>;
+using UnixEndpointIPtr = ::std::shared_ptr<UnixEndpointI>;
 using EndpointI_connectorsPtr = ::std::shared_ptr<EndpointI_connectors>;
 
 #else // C++98 mapping
@@ -44,6 +48,12 @@ typedef Handle<UdpEndpointI> UdpEndpointIPtr;
 ICE_API IceUtil::Shared* upCast(WSEndpoint*);
 typedef Handle<WSEndpoint> WSEndpointPtr;
 
+ICE_API IceUtil::Shared* upCast(ShmEndpointI*);
+typedef Handle<ShmEndpointI> ShmEndpointIPtr;
+
+ICE_API IceUtil::Shared* upCast(UnixEndpointI*);
+typedef Handle<UnixEndpointI> UnixEndpointIPtr;
+
 ICE_API IceUtil::Shared* upCast(EndpointI_connectors*);
 typedef Handle<EndpointI_connectors> EndpointI_connectorsPtr;
 
@@ -44,6 +44,7 @@
 #else
 #   include <net/if.h>
 #   include <sys/ioctl.h>
+#   include <sys/stat.h>
 #endif
 
 #if defined(__linux) || defined(__APPLE__) || defined(__FreeBSD__)
@@ -231,6 +232,12 @@ createSocketImpl(bool udp, int family)
     {
         fd = socket(family, SOCK_DGRAM, IPPROTO_UDP);
     }
+#ifndef _WIN32
+    else if(family == AF_UNIX)
+    {
+        fd = socket(family, SOCK_STREAM, 0);
+    }
+#endif
     else
     {
         fd = socket(family, SOCK_STREAM, IPPROTO_TCP);
@@ -241,7 +248,11 @@ createSocketImpl(bool udp, int family)
         throw SocketException(__FILE__, __LINE__, getSocketErrno());
     }
 
+#ifndef _WIN32
+    if(!udp && family != AF_UNIX)
+#else
     if(!udp)
+#endif
     {
         setTcpNoDelay(fd);
         setKeepAlive(fd);
@@ -806,6 +817,12 @@ getAddressStorageSize(const Address& addr)
     {
         size = sizeof(sockaddr_in6);
     }
+#ifndef _WIN32
+    else if(addr.saStorage.ss_family == AF_UNIX)
+    {
+        size = sizeof(sockaddr_un);
+    }
+#endif
     return size;
 }
 
@@ -1279,6 +1296,46 @@ IceInternal::getAddressForServer(const string& host, int port, ProtocolSupport p
     return addrs.empty() ? Address() : addrs[0];
 }
 
+#ifndef _WIN32
+Address
+IceInternal::getUnixAddress(const string& path)
+{
+    Address addr;
+    if(path.size() >= sizeof(addr.saUn.sun_path))
+    {
+        throw SocketException(__FILE__, __LINE__, ENAMETOOLONG);
+    }
+    addr.saUn.sun_family = AF_UNIX;
+    memcpy(addr.saUn.sun_path, path.c_str(), path.size() + 1);
+    return addr;
+}
+
+void
+IceInternal::removeStaleUnixSocket(const string& path)
+{
+    //
+    // A socket file left behind by a process which didn't close its
+    // acceptor (for example because it was killed) prevents binding
+    // the endpoint. The file is removed if no process accepts
+    // connections on it anymore.
+    //
+    struct stat buf;
+    if(::stat(path.c_str(), &buf) == -1 || !S_ISSOCK(buf.st_mode))
+    {
+        return;
+    }
+
+    Address addr = getUnixAddress(path);
+    SOCKET fd = createSocket(false, addr);
+    setBlock(fd, false);
+    if(::connect(fd, &addr.sa, static_cast<socklen_t>(sizeof(sockaddr_un))) == SOCKET_ERROR && connectionRefused())
+    {
+        ::unlink(path.c_str());
+    }
+    closeSocketNoThrow(fd);
+}
+#endif
+
 int
 IceInternal::compareAddress(const Address& addr1, const Address& addr2)
 {
@@ -1331,6 +1388,20 @@ IceInternal::compareAddress(const Address& addr1, const Address& addr2)
             return 1;
         }
     }
+#ifndef _WIN32
+    else if(addr1.saStorage.ss_family == AF_UNIX)
+    {
+        int res = strncmp(addr1.saUn.sun_path, addr2.saUn.sun_path, sizeof(addr1.saUn.sun_path));
+        if(res < 0)
+        {
+            return -1;
+        }
+        else if(res > 0)
+        {
+            return 1;
+        }
+    }
+#endif
     else
     {
         if(addr1.saIn6.sin6_port < addr2.saIn6.sin6_port)
@@ -1489,6 +1560,12 @@ IceInternal::closeSocket(SOCKET fd)
 string
 IceInternal::addrToString(const Address& addr)
 {
+#if !defined(_WIN32)
+    if(addr.saStorage.ss_family == AF_UNIX)
+    {
+        return inetAddrToString(addr);
+    }
+#endif
     ostringstream s;
     s << inetAddrToString(addr) << ':' << getPort(addr);
     return s.str();
@@ -1802,6 +1879,16 @@ IceInternal::inetAddrToString(const Address& ss)
         return "";
     }
 
+#  ifndef _WIN32
+    if(ss.saStorage.ss_family == AF_UNIX)
+    {
+        //
+        // The path of an unbound socket is empty.
+        //
+        return string(ss.saUn.sun_path, strnlen(ss.saUn.sun_path, sizeof(ss.saUn.sun_path)));
+    }
+#  endif
+
     char namebuf[1024];
     namebuf[0] = '\0';
     getnameinfo(&ss.sa, size, namebuf, static_cast<socklen_t>(sizeof(namebuf)), 0, 0, NI_NUMERICHOST);
@@ -2270,6 +2357,26 @@ IceInternal::setReuseAddress(SOCKET fd, bool reuse)
 }
 #endif
 
+#if defined(ICE_OS_UWP) || !defined(SO_REUSEPORT)
+bool
+IceInternal::setReusePort(SOCKET, bool)
+{
+    return false;
+}
+#else
+bool
+IceInternal::setReusePort(SOCKET fd, bool reuse)
+{
+    int flag = reuse ? 1 : 0;
+    if(setsockopt(fd, SOL_SOCKET, SO_REUSEPORT, reinterpret_cast<char*>(&flag), int(sizeof(int))) == SOCKET_ERROR)
+    {
+        closeSocketNoThrow(fd);
+        throw SocketException(__FILE__, __LINE__, getSocketErrno());
+    }
+    return true;
+}
+#endif
+
 #ifdef ICE_OS_UWP
 namespace
 {
@@ -2622,6 +2729,15 @@ repeatConnect:
         }
 
         closeSocketNoThrow(fd);
+#ifndef _WIN32
+        //
+        // ENOENT is returned when connecting to a Unix domain socket which doesn't exist.
+        //
+        if(addr.saStorage.ss_family == AF_UNIX && errno == ENOENT)
+        {
+            throw ConnectionRefusedException(__FILE__, __LINE__, getSocketErrno());
+        }
+#endif
         if(connectionRefused())
         {
             throw ConnectionRefusedException(__FILE__, __LINE__, getSocketErrno());
@@ -2730,8 +2846,11 @@ IceInternal::doAccept(SOCKET fd)
     int ret;
 #endif
 
+    Address addr;
+    socklen_t len;
 repeatAccept:
-    if((ret = ::accept(fd, 0, 0)) == INVALID_SOCKET)
+    len = static_cast<socklen_t>(sizeof(sockaddr_storage));
+    if((ret = ::accept(fd, &addr.sa, &len)) == INVALID_SOCKET)
     {
         if(acceptInterrupted())
         {
@@ -2741,6 +2860,13 @@ repeatAccept:
         throw SocketException(__FILE__, __LINE__, getSocketErrno());
     }
 
+#ifndef _WIN32
+    if(addr.saStorage.ss_family == AF_UNIX)
+    {
+        return ret;
+    }
+#endif
+
     setTcpNoDelay(ret);
     setKeepAlive(ret);
     return ret;
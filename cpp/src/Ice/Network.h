@@ -41,6 +41,7 @@ typedef int ssize_t;
 #   include <netinet/tcp.h>
 #   include <arpa/inet.h>
 #   include <netdb.h>
+#   include <sys/un.h>
 #endif
 
 #if defined(__linux) && !defined(ICE_NO_EPOLL)
@@ -60,6 +61,15 @@ typedef int ssize_t;
 #   define ICE_USE_POLL 1
 #endif
 
+//
+// The Unix domain socket transport and the shared memory transport, which
+// relies on Unix domain sockets for its notifications.
+//
+#if !defined(_WIN32) && !defined(ICE_USE_CFSTREAM)
+#   define ICE_HAS_UNIX_TRANSPORT 1
+#   define ICE_HAS_SHM_TRANSPORT 1
+#endif
+
 #if defined(_WIN32) || defined(__osf__)
 typedef int socklen_t;
 #endif
@@ -133,6 +143,9 @@ union Address
     sockaddr sa;
     sockaddr_in saIn;
     sockaddr_in6 saIn6;
+#ifndef _WIN32
+    sockaddr_un saUn;
+#endif
     sockaddr_storage saStorage;
 };
 #endif
@@ -265,6 +278,10 @@ ICE_API std::vector<Address> getAddresses(const std::string&, int, ProtocolSuppo
                                           bool);
 ICE_API ProtocolSupport getProtocolSupport(const Address&);
 ICE_API Address getAddressForServer(const std::string&, int, ProtocolSupport, bool, bool);
+#ifndef _WIN32
+ICE_API Address getUnixAddress(const std::string&);
+ICE_API void removeStaleUnixSocket(const std::string&);
+#endif
 ICE_API int compareAddress(const Address&, const Address&);
 
 ICE_API bool isIPv6Supported();
@@ -304,6 +321,7 @@ ICE_API void setMcastGroup(SOCKET, const Address&, const std::string&);
 ICE_API void setMcastInterface(SOCKET, const std::string&, const Address&);
 ICE_API void setMcastTtl(SOCKET, int, const Address&);
 ICE_API void setReuseAddress(SOCKET, bool);
+ICE_API bool setReusePort(SOCKET, bool);
 ICE_API Address doBind(SOCKET, const Address&, const std::string& intf = "");
 ICE_API void doListen(SOCKET, int);
 
@@ -1466,6 +1466,9 @@ Ice::ObjectAdapterI::filterProperties(StringSeq& unknownProps)
         "Router.LocatorCacheTimeout",
         "Router.InvocationTimeout",
         "ProxyOptions",
+        "Python.MaxConcurrency",
+        "Python.MaxQueued",
+        "Python.RejectException",
         "ThreadPool.Size",
         "ThreadPool.SizeMax",
         "ThreadPool.SizeWarn",
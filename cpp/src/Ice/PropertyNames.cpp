@@ -6,7 +6,7 @@
 // ICE_LICENSE file included in this distribution.
 //
 // **********************************************************************
-// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Apr 30 21:00:34 2018
+// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Oct 19 12:06:44 2026
 
 // IMPORTANT: Do not edit this file -- any edits made here will be lost!
 
@@ -65,6 +65,9 @@ const IceInternal::Property IcePropsData[] =
     IceInternal::Property("Ice.Admin.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("Ice.Admin.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("Ice.Admin.MessageSizeMax", false, 0),
+    IceInternal::Property("Ice.Admin.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("Ice.Admin.Python.MaxQueued", false, 0),
+    IceInternal::Property("Ice.Admin.Python.RejectException", false, 0),
     IceInternal::Property("Ice.Admin.DelayCreation", false, 0),
     IceInternal::Property("Ice.Admin.Enabled", false, 0),
     IceInternal::Property("Ice.Admin.Facets", false, 0),
@@ -143,8 +146,19 @@ const IceInternal::Property IcePropsData[] =
     IceInternal::Property("Ice.PrintProcessId", false, 0),
     IceInternal::Property("Ice.PrintStackTraces", false, 0),
     IceInternal::Property("Ice.ProgramName", false, 0),
+    IceInternal::Property("Ice.Python.AdaptivePerRequest", false, 0),
+    IceInternal::Property("Ice.Python.AdmissionFacet", false, 0),
+    IceInternal::Property("Ice.Python.AsyncLogger", false, 0),
+    IceInternal::Property("Ice.Python.AsyncLogger.QueueSize", false, 0),
+    IceInternal::Property("Ice.Python.CheckedCastCacheTimeout", false, 0),
+    IceInternal::Property("Ice.Python.Collocation", false, 0),
+    IceInternal::Property("Ice.Python.MetricsFacet", false, 0),
+    IceInternal::Property("Ice.Python.Observer.SampleRate", false, 0),
+    IceInternal::Property("Ice.Python.Processes", false, 0),
+    IceInternal::Property("Ice.Python.ProxyInternSize", false, 0),
     IceInternal::Property("Ice.RetryIntervals", false, 0),
     IceInternal::Property("Ice.ServerIdleTime", false, 0),
+    IceInternal::Property("Ice.SHM.BufferSize", false, 0),
     IceInternal::Property("Ice.SOCKSProxyHost", false, 0),
     IceInternal::Property("Ice.SOCKSProxyPort", false, 0),
     IceInternal::Property("Ice.StdErr", false, 0),
@@ -178,6 +192,7 @@ const IceInternal::Property IcePropsData[] =
     IceInternal::Property("Ice.UDP.SndSize", false, 0),
     IceInternal::Property("Ice.TCP.Backlog", false, 0),
     IceInternal::Property("Ice.TCP.RcvSize", false, 0),
+    IceInternal::Property("Ice.TCP.ReusePort", false, 0),
     IceInternal::Property("Ice.TCP.SndSize", false, 0),
     IceInternal::Property("Ice.UseApplicationClassLoader", false, 0),
     IceInternal::Property("Ice.UseSyslog", false, 0),
@@ -250,6 +265,9 @@ const IceInternal::Property IceDiscoveryPropsData[] =
     IceInternal::Property("IceDiscovery.Multicast.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceDiscovery.Multicast.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceDiscovery.Multicast.MessageSizeMax", false, 0),
+    IceInternal::Property("IceDiscovery.Multicast.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceDiscovery.Multicast.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceDiscovery.Multicast.Python.RejectException", false, 0),
     IceInternal::Property("IceDiscovery.Reply.ACM.Timeout", false, 0),
     IceInternal::Property("IceDiscovery.Reply.ACM.Heartbeat", false, 0),
     IceInternal::Property("IceDiscovery.Reply.ACM.Close", false, 0),
@@ -287,6 +305,9 @@ const IceInternal::Property IceDiscoveryPropsData[] =
     IceInternal::Property("IceDiscovery.Reply.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceDiscovery.Reply.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceDiscovery.Reply.MessageSizeMax", false, 0),
+    IceInternal::Property("IceDiscovery.Reply.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceDiscovery.Reply.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceDiscovery.Reply.Python.RejectException", false, 0),
     IceInternal::Property("IceDiscovery.Locator.ACM.Timeout", false, 0),
     IceInternal::Property("IceDiscovery.Locator.ACM.Heartbeat", false, 0),
     IceInternal::Property("IceDiscovery.Locator.ACM.Close", false, 0),
@@ -324,6 +345,9 @@ const IceInternal::Property IceDiscoveryPropsData[] =
     IceInternal::Property("IceDiscovery.Locator.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceDiscovery.Locator.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceDiscovery.Locator.MessageSizeMax", false, 0),
+    IceInternal::Property("IceDiscovery.Locator.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceDiscovery.Locator.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceDiscovery.Locator.Python.RejectException", false, 0),
     IceInternal::Property("IceDiscovery.Lookup", false, 0),
     IceInternal::Property("IceDiscovery.Timeout", false, 0),
     IceInternal::Property("IceDiscovery.RetryCount", false, 0),
@@ -377,6 +401,9 @@ const IceInternal::Property IceLocatorDiscoveryPropsData[] =
     IceInternal::Property("IceLocatorDiscovery.Reply.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Reply.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Reply.MessageSizeMax", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Reply.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Reply.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Reply.Python.RejectException", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Locator.ACM.Timeout", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Locator.ACM.Heartbeat", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Locator.ACM.Close", false, 0),
@@ -414,6 +441,9 @@ const IceInternal::Property IceLocatorDiscoveryPropsData[] =
     IceInternal::Property("IceLocatorDiscovery.Locator.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Locator.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Locator.MessageSizeMax", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Locator.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Locator.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceLocatorDiscovery.Locator.Python.RejectException", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Lookup", false, 0),
     IceInternal::Property("IceLocatorDiscovery.Timeout", false, 0),
     IceInternal::Property("IceLocatorDiscovery.RetryCount", false, 0),
@@ -511,6 +541,9 @@ const IceInternal::Property IceBridgePropsData[] =
     IceInternal::Property("IceBridge.Source.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceBridge.Source.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceBridge.Source.MessageSizeMax", false, 0),
+    IceInternal::Property("IceBridge.Source.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceBridge.Source.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceBridge.Source.Python.RejectException", false, 0),
     IceInternal::Property("IceBridge.Target.Endpoints", false, 0),
     IceInternal::Property("IceBridge.InstanceName", false, 0),
 };
@@ -566,6 +599,9 @@ const IceInternal::Property IceGridAdminPropsData[] =
     IceInternal::Property("IceGridAdmin.Server.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGridAdmin.Server.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGridAdmin.Server.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGridAdmin.Server.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGridAdmin.Server.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGridAdmin.Server.Python.RejectException", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Address", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Interface", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Lookup", false, 0),
@@ -606,6 +642,9 @@ const IceInternal::Property IceGridAdminPropsData[] =
     IceInternal::Property("IceGridAdmin.Discovery.Reply.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Reply.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Reply.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Reply.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Reply.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Reply.Python.RejectException", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Locator.ACM.Timeout", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Locator.ACM.Heartbeat", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Locator.ACM.Close", false, 0),
@@ -643,6 +682,9 @@ const IceInternal::Property IceGridAdminPropsData[] =
     IceInternal::Property("IceGridAdmin.Discovery.Locator.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Locator.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGridAdmin.Discovery.Locator.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Locator.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Locator.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGridAdmin.Discovery.Locator.Python.RejectException", false, 0),
     IceInternal::Property("IceGridAdmin.Trace.Observers", false, 0),
     IceInternal::Property("IceGridAdmin.Trace.SaveToRegistry", false, 0),
 };
@@ -690,6 +732,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.AdminRouter.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.AdminRouter.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.AdminRouter.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.AdminRouter.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.AdminRouter.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.AdminRouter.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.InstanceName", false, 0),
     IceInternal::Property("IceGrid.Node.ACM.Timeout", false, 0),
     IceInternal::Property("IceGrid.Node.ACM.Heartbeat", false, 0),
@@ -728,6 +773,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Node.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Node.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Node.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Node.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Node.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Node.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Node.AllowRunningServersAsRoot", false, 0),
     IceInternal::Property("IceGrid.Node.AllowEndpointsOverride", false, 0),
     IceInternal::Property("IceGrid.Node.CollocateRegistry", false, 0),
@@ -806,6 +854,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.AdminSessionManager.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.AdminSessionManager.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.AdminSessionManager.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.AdminSessionManager.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.AdminSessionManager.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.AdminSessionManager.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.AdminSSLPermissionsVerifier.EndpointSelection", false, 0),
     IceInternal::Property("IceGrid.Registry.AdminSSLPermissionsVerifier.ConnectionCached", false, 0),
     IceInternal::Property("IceGrid.Registry.AdminSSLPermissionsVerifier.PreferSecure", false, 0),
@@ -853,6 +904,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.Client.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.Client.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.Client.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.Client.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.Client.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.Client.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.CryptPasswords", false, 0),
     IceInternal::Property("IceGrid.Registry.DefaultTemplates", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.ACM.Timeout", false, 0),
@@ -892,6 +946,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.Discovery.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.Discovery.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.Discovery.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.Discovery.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.Enabled", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.Address", false, 0),
     IceInternal::Property("IceGrid.Registry.Discovery.Port", false, 0),
@@ -934,6 +991,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.Internal.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.Internal.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.Internal.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.Internal.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.Internal.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.Internal.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.LMDB.MapSize", false, 0),
     IceInternal::Property("IceGrid.Registry.LMDB.Path", false, 0),
     IceInternal::Property("IceGrid.Registry.NodeSessionTimeout", false, 0),
@@ -988,6 +1048,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.Server.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.Server.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.Server.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.Server.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.Server.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.Server.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionFilters", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionManager.ACM.Timeout", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionManager.ACM.Heartbeat", false, 0),
@@ -1026,6 +1089,9 @@ const IceInternal::Property IceGridPropsData[] =
     IceInternal::Property("IceGrid.Registry.SessionManager.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionManager.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionManager.MessageSizeMax", false, 0),
+    IceInternal::Property("IceGrid.Registry.SessionManager.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IceGrid.Registry.SessionManager.Python.MaxQueued", false, 0),
+    IceInternal::Property("IceGrid.Registry.SessionManager.Python.RejectException", false, 0),
     IceInternal::Property("IceGrid.Registry.SessionTimeout", false, 0),
     IceInternal::Property("IceGrid.Registry.SSLPermissionsVerifier.EndpointSelection", false, 0),
     IceInternal::Property("IceGrid.Registry.SSLPermissionsVerifier.ConnectionCached", false, 0),
@@ -1097,6 +1163,9 @@ const IceInternal::Property IcePatch2PropsData[] =
     IceInternal::Property("IcePatch2.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("IcePatch2.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("IcePatch2.MessageSizeMax", false, 0),
+    IceInternal::Property("IcePatch2.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("IcePatch2.Python.MaxQueued", false, 0),
+    IceInternal::Property("IcePatch2.Python.RejectException", false, 0),
     IceInternal::Property("IcePatch2.Directory", false, 0),
     IceInternal::Property("IcePatch2.InstanceName", false, 0),
 };
@@ -1230,6 +1299,9 @@ const IceInternal::Property Glacier2PropsData[] =
     IceInternal::Property("Glacier2.Client.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("Glacier2.Client.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("Glacier2.Client.MessageSizeMax", false, 0),
+    IceInternal::Property("Glacier2.Client.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("Glacier2.Client.Python.MaxQueued", false, 0),
+    IceInternal::Property("Glacier2.Client.Python.RejectException", false, 0),
     IceInternal::Property("Glacier2.Client.AlwaysBatch", false, 0),
     IceInternal::Property("Glacier2.Client.Buffered", false, 0),
     IceInternal::Property("Glacier2.Client.ForwardContext", false, 0),
@@ -1305,6 +1377,9 @@ const IceInternal::Property Glacier2PropsData[] =
     IceInternal::Property("Glacier2.Server.ThreadPool.ThreadIdleTime", false, 0),
     IceInternal::Property("Glacier2.Server.ThreadPool.ThreadPriority", false, 0),
     IceInternal::Property("Glacier2.Server.MessageSizeMax", false, 0),
+    IceInternal::Property("Glacier2.Server.Python.MaxConcurrency", false, 0),
+    IceInternal::Property("Glacier2.Server.Python.MaxQueued", false, 0),
+    IceInternal::Property("Glacier2.Server.Python.RejectException", false, 0),
     IceInternal::Property("Glacier2.Server.AlwaysBatch", false, 0),
     IceInternal::Property("Glacier2.Server.Buffered", false, 0),
     IceInternal::Property("Glacier2.Server.ForwardContext", false, 0),
@@ -6,7 +6,7 @@
 // ICE_LICENSE file included in this distribution.
 //
 // **********************************************************************
-// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Apr 30 21:00:34 2018
+// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Oct 19 12:06:44 2026
 
 // IMPORTANT: Do not edit this file -- any edits made here will be lost!
 
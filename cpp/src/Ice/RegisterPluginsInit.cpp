@@ -10,6 +10,7 @@
 #include <Ice/RegisterPluginsInit.h>
 #include <Ice/CommunicatorF.h>
 #include <Ice/Initialize.h>
+#include <Ice/Network.h> // for ICE_HAS_SHM_TRANSPORT and ICE_HAS_UNIX_TRANSPORT
 
 extern "C"
 {
@@ -18,6 +19,12 @@ Ice::Plugin* createStringConverter(const Ice::CommunicatorPtr&, const std::strin
 Ice::Plugin* createIceUDP(const Ice::CommunicatorPtr&, const std::string&, const Ice::StringSeq&);
 Ice::Plugin* createIceTCP(const Ice::CommunicatorPtr&, const std::string&, const Ice::StringSeq&);
 Ice::Plugin* createIceWS(const Ice::CommunicatorPtr&, const std::string&, const Ice::StringSeq&);
+#ifdef ICE_HAS_SHM_TRANSPORT
+Ice::Plugin* createIceSHM(const Ice::CommunicatorPtr&, const std::string&, const Ice::StringSeq&);
+#endif
+#ifdef ICE_HAS_UNIX_TRANSPORT
+Ice::Plugin* createIceUnix(const Ice::CommunicatorPtr&, const std::string&, const Ice::StringSeq&);
+#endif
 
 }
 
@@ -26,11 +33,17 @@ IceInternal::RegisterPluginsInit::RegisterPluginsInit()
     Ice::registerPluginFactory("IceTCP", createIceTCP, true);
 
     //
-    // Only include the UDP and WS transport plugins with non-static builds or Gem/PyPI builds.
+    // Only include the UDP, WS, SHM and Unix transport plugins with non-static builds or Gem/PyPI builds.
     //
 #if !defined(ICE_STATIC_LIBS) || defined(ICE_GEM) || defined(ICE_PYPI)
     Ice::registerPluginFactory("IceUDP", createIceUDP, true);
     Ice::registerPluginFactory("IceWS", createIceWS, true);
+#   ifdef ICE_HAS_SHM_TRANSPORT
+    Ice::registerPluginFactory("IceSHM", createIceSHM, true);
+#   endif
+#   ifdef ICE_HAS_UNIX_TRANSPORT
+    Ice::registerPluginFactory("IceUnix", createIceUnix, true);
+#   endif
 #endif
 
     //
@@ -0,0 +1,120 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/ShmAcceptor.h>
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+#include <Ice/ShmTransceiver.h>
+#include <Ice/ShmEndpointI.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/LocalException.h>
+#include <Ice/Properties.h>
+#include <Ice/StreamSocket.h>
+
+//
+// Use the system default for the listen() backlog or 511 if not defined.
+//
+#ifndef SOMAXCONN
+#  define SOMAXCONN 511
+#endif
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+IceUtil::Shared* IceInternal::upCast(ShmAcceptor* p) { return p; }
+
+NativeInfoPtr
+IceInternal::ShmAcceptor::getNativeInfo()
+{
+    return this;
+}
+
+void
+IceInternal::ShmAcceptor::close()
+{
+    if(_fd != INVALID_SOCKET)
+    {
+        closeSocketNoThrow(_fd);
+        _fd = INVALID_SOCKET;
+    }
+
+    //
+    // Remove the socket file, unless it was bound by another acceptor.
+    //
+    if(_bound)
+    {
+        ::unlink(_path.c_str());
+        _bound = false;
+    }
+}
+
+EndpointIPtr
+IceInternal::ShmAcceptor::listen()
+{
+    try
+    {
+        removeStaleUnixSocket(_path);
+        doBind(_fd, _addr);
+        _bound = true;
+        doListen(_fd, _backlog);
+    }
+    catch(...)
+    {
+        _fd = INVALID_SOCKET;
+        throw;
+    }
+    return _endpoint;
+}
+
+TransceiverPtr
+IceInternal::ShmAcceptor::accept()
+{
+    return new ShmTransceiver(_instance, new StreamSocket(_instance, doAccept(_fd)));
+}
+
+string
+IceInternal::ShmAcceptor::protocol() const
+{
+    return _instance->protocol();
+}
+
+string
+IceInternal::ShmAcceptor::toString() const
+{
+    return _path;
+}
+
+string
+IceInternal::ShmAcceptor::toDetailedString() const
+{
+    return "local address = " + toString();
+}
+
+IceInternal::ShmAcceptor::ShmAcceptor(const ShmEndpointIPtr& endpoint, const ProtocolInstancePtr& instance,
+                                      const string& path) :
+    _endpoint(endpoint),
+    _instance(instance),
+    _path(path),
+    _addr(getUnixAddress(path)),
+    _bound(false)
+{
+    _backlog = instance->properties()->getPropertyAsIntWithDefault("Ice.TCP.Backlog", SOMAXCONN);
+
+    _fd = createServerSocket(false, _addr, instance->protocolSupport());
+    setBlock(_fd, false);
+}
+
+IceInternal::ShmAcceptor::~ShmAcceptor()
+{
+    assert(_fd == INVALID_SOCKET);
+}
+
+#endif
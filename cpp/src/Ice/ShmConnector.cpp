@@ -0,0 +1,111 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/ShmConnector.h>
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+#include <Ice/ShmTransceiver.h>
+#include <Ice/ShmEndpointI.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/StreamSocket.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+TransceiverPtr
+IceInternal::ShmConnector::connect()
+{
+    return new ShmTransceiver(_instance, new StreamSocket(_instance, 0, _addr, Address()));
+}
+
+Short
+IceInternal::ShmConnector::type() const
+{
+    return _instance->type();
+}
+
+string
+IceInternal::ShmConnector::toString() const
+{
+    return _path;
+}
+
+bool
+IceInternal::ShmConnector::operator==(const Connector& r) const
+{
+    const ShmConnector* p = dynamic_cast<const ShmConnector*>(&r);
+    if(!p)
+    {
+        return false;
+    }
+
+    if(_path != p->_path)
+    {
+        return false;
+    }
+
+    if(_timeout != p->_timeout)
+    {
+        return false;
+    }
+
+    if(_connectionId != p->_connectionId)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool
+IceInternal::ShmConnector::operator<(const Connector& r) const
+{
+    const ShmConnector* p = dynamic_cast<const ShmConnector*>(&r);
+    if(!p)
+    {
+        return type() < r.type();
+    }
+
+    if(_timeout < p->_timeout)
+    {
+        return true;
+    }
+    else if(p->_timeout < _timeout)
+    {
+        return false;
+    }
+
+    if(_connectionId < p->_connectionId)
+    {
+        return true;
+    }
+    else if(p->_connectionId < _connectionId)
+    {
+        return false;
+    }
+    return _path < p->_path;
+}
+
+IceInternal::ShmConnector::ShmConnector(const ProtocolInstancePtr& instance, const string& path, Int timeout,
+                                        const string& connectionId) :
+    _instance(instance),
+    _path(path),
+    _addr(getUnixAddress(path)),
+    _timeout(timeout),
+    _connectionId(connectionId)
+{
+}
+
+IceInternal::ShmConnector::~ShmConnector()
+{
+}
+
+#endif
@@ -0,0 +1,548 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/ShmEndpointI.h>
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+#include <Ice/ShmAcceptor.h>
+#include <Ice/ShmConnector.h>
+#include <Ice/OutputStream.h>
+#include <Ice/InputStream.h>
+#include <Ice/LocalException.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/HashUtil.h>
+#include <IceUtil/StringUtil.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+#ifndef ICE_CPP11_MAPPING
+IceUtil::Shared* IceInternal::upCast(ShmEndpointI* p) { return p; }
+#endif
+
+extern "C"
+{
+
+Plugin*
+createIceSHM(const CommunicatorPtr& c, const string&, const StringSeq&)
+{
+    return new EndpointFactoryPlugin(c, new ShmEndpointFactory(new ProtocolInstance(c, SHMEndpointType, "shm", false)));
+}
+
+}
+
+namespace Ice
+{
+
+ICE_API void
+registerIceSHM(bool loadOnInitialize)
+{
+    Ice::registerPluginFactory("IceSHM", createIceSHM, loadOnInitialize);
+}
+
+}
+
+IceInternal::ShmEndpointI::ShmEndpointI(const ProtocolInstancePtr& instance, const string& name, Int timeout,
+                                        const string& connectionId, bool compress) :
+    _instance(instance),
+    _name(name),
+    _timeout(timeout),
+    _connectionId(connectionId),
+    _compress(compress),
+    _hashValue(0)
+{
+    hashInit();
+}
+
+IceInternal::ShmEndpointI::ShmEndpointI(const ProtocolInstancePtr& instance) :
+    _instance(instance),
+    _timeout(instance->defaultTimeout()),
+    _compress(false),
+    _hashValue(0)
+{
+}
+
+IceInternal::ShmEndpointI::ShmEndpointI(const ProtocolInstancePtr& instance, InputStream* s) :
+    _instance(instance),
+    _timeout(-1),
+    _compress(false),
+    _hashValue(0)
+{
+    s->read(const_cast<string&>(_name), false);
+    s->read(const_cast<Int&>(_timeout));
+    s->read(const_cast<bool&>(_compress));
+
+    //
+    // The name is used to compute the path of the socket, reject names
+    // which would refer to another directory.
+    //
+    if(_name.empty() || _name.find('/') != string::npos)
+    {
+        throw MarshalException(__FILE__, __LINE__, "invalid shared memory endpoint name `" + _name + "'");
+    }
+    hashInit();
+}
+
+void
+IceInternal::ShmEndpointI::streamWriteImpl(OutputStream* s) const
+{
+    s->write(_name, false);
+    s->write(_timeout);
+    s->write(_compress);
+}
+
+EndpointInfoPtr
+IceInternal::ShmEndpointI::getInfo() const ICE_NOEXCEPT
+{
+    SHMEndpointInfoPtr info = ICE_MAKE_SHARED(InfoI<Ice::SHMEndpointInfo>, ICE_SHARED_FROM_CONST_THIS(ShmEndpointI));
+    info->name = _name;
+    return info;
+}
+
+Short
+IceInternal::ShmEndpointI::type() const
+{
+    return _instance->type();
+}
+
+const string&
+IceInternal::ShmEndpointI::protocol() const
+{
+    return _instance->protocol();
+}
+
+Int
+IceInternal::ShmEndpointI::timeout() const
+{
+    return _timeout;
+}
+
+EndpointIPtr
+IceInternal::ShmEndpointI::timeout(Int timeout) const
+{
+    if(timeout == _timeout)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(ShmEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(ShmEndpointI, _instance, _name, timeout, _connectionId, _compress);
+    }
+}
+
+const string&
+IceInternal::ShmEndpointI::connectionId() const
+{
+    return _connectionId;
+}
+
+EndpointIPtr
+IceInternal::ShmEndpointI::connectionId(const string& connectionId) const
+{
+    if(connectionId == _connectionId)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(ShmEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(ShmEndpointI, _instance, _name, _timeout, connectionId, _compress);
+    }
+}
+
+bool
+IceInternal::ShmEndpointI::compress() const
+{
+    return _compress;
+}
+
+EndpointIPtr
+IceInternal::ShmEndpointI::compress(bool compress) const
+{
+    if(compress == _compress)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(ShmEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(ShmEndpointI, _instance, _name, _timeout, _connectionId, compress);
+    }
+}
+
+bool
+IceInternal::ShmEndpointI::datagram() const
+{
+    return false;
+}
+
+bool
+IceInternal::ShmEndpointI::secure() const
+{
+    return _instance->secure();
+}
+
+TransceiverPtr
+IceInternal::ShmEndpointI::transceiver() const
+{
+    return 0;
+}
+
+void
+IceInternal::ShmEndpointI::connectors_async(EndpointSelectionType, const EndpointI_connectorsPtr& cb) const
+{
+    vector<ConnectorPtr> connectors;
+    try
+    {
+        connectors.push_back(new ShmConnector(_instance, path(), _timeout, _connectionId));
+    }
+    catch(const Ice::LocalException& ex)
+    {
+        cb->exception(ex);
+        return;
+    }
+    cb->connectors(connectors);
+}
+
+AcceptorPtr
+IceInternal::ShmEndpointI::acceptor(const string&) const
+{
+    return new ShmAcceptor(ICE_SHARED_FROM_CONST_THIS(ShmEndpointI), _instance, path());
+}
+
+vector<EndpointIPtr>
+IceInternal::ShmEndpointI::expandIfWildcard() const
+{
+    vector<EndpointIPtr> endps;
+    endps.push_back(ICE_SHARED_FROM_CONST_THIS(ShmEndpointI));
+    return endps;
+}
+
+vector<EndpointIPtr>
+IceInternal::ShmEndpointI::expandHost(EndpointIPtr&) const
+{
+    //
+    // Nothing to do here, the endpoint name doesn't need to be resolved.
+    //
+    vector<EndpointIPtr> endps;
+    endps.push_back(ICE_SHARED_FROM_CONST_THIS(ShmEndpointI));
+    return endps;
+}
+
+bool
+IceInternal::ShmEndpointI::equivalent(const EndpointIPtr& endpoint) const
+{
+    const ShmEndpointI* shmEndpointI = dynamic_cast<const ShmEndpointI*>(endpoint.get());
+    if(!shmEndpointI)
+    {
+        return false;
+    }
+    return shmEndpointI->type() == type() && shmEndpointI->_name == _name;
+}
+
+bool
+#ifdef ICE_CPP11_MAPPING
+IceInternal::ShmEndpointI::operator==(const Ice::Endpoint& r) const
+#else
+IceInternal::ShmEndpointI::operator==(const Ice::LocalObject& r) const
+#endif
+{
+    const ShmEndpointI* p = dynamic_cast<const ShmEndpointI*>(&r);
+    if(!p)
+    {
+        return false;
+    }
+
+    if(this == p)
+    {
+        return true;
+    }
+
+    if(_name != p->_name)
+    {
+        return false;
+    }
+
+    if(_connectionId != p->_connectionId)
+    {
+        return false;
+    }
+
+    if(_timeout != p->_timeout)
+    {
+        return false;
+    }
+
+    if(_compress != p->_compress)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool
+#ifdef ICE_CPP11_MAPPING
+IceInternal::ShmEndpointI::operator<(const Ice::Endpoint& r) const
+#else
+IceInternal::ShmEndpointI::operator<(const Ice::LocalObject& r) const
+#endif
+{
+    const ShmEndpointI* p = dynamic_cast<const ShmEndpointI*>(&r);
+    if(!p)
+    {
+        const EndpointI* e = dynamic_cast<const EndpointI*>(&r);
+        if(!e)
+        {
+            return false;
+        }
+        return type() < e->type();
+    }
+
+    if(this == p)
+    {
+        return false;
+    }
+
+    if(type() < p->type())
+    {
+        return true;
+    }
+    else if(p->type() < type())
+    {
+        return false;
+    }
+
+    if(_name < p->_name)
+    {
+        return true;
+    }
+    else if(p->_name < _name)
+    {
+        return false;
+    }
+
+    if(_connectionId < p->_connectionId)
+    {
+        return true;
+    }
+    else if(p->_connectionId < _connectionId)
+    {
+        return false;
+    }
+
+    if(_timeout < p->_timeout)
+    {
+        return true;
+    }
+    else if(p->_timeout < _timeout)
+    {
+        return false;
+    }
+
+    if(!_compress && p->_compress)
+    {
+        return true;
+    }
+    else if(p->_compress < _compress)
+    {
+        return false;
+    }
+
+    return false;
+}
+
+Int
+IceInternal::ShmEndpointI::hash() const
+{
+    return _hashValue;
+}
+
+string
+IceInternal::ShmEndpointI::options() const
+{
+    //
+    // WARNING: Certain features, such as proxy validation in Glacier2,
+    // depend on the format of proxy strings. Changes to toString() and
+    // methods called to generate parts of the reference string could break
+    // these features. Please review for all features that depend on the
+    // format of proxyToString() before changing this and related code.
+    //
+    ostringstream s;
+
+    s << " -name ";
+    bool addQuote = _name.find_first_of(": \t\n\r") != string::npos;
+    if(addQuote)
+    {
+        s << "\"";
+    }
+    s << _name;
+    if(addQuote)
+    {
+        s << "\"";
+    }
+
+    if(_timeout == -1)
+    {
+        s << " -t infinite";
+    }
+    else
+    {
+        s << " -t " << _timeout;
+    }
+
+    if(_compress)
+    {
+        s << " -z";
+    }
+
+    return s.str();
+}
+
+void
+IceInternal::ShmEndpointI::initWithOptions(vector<string>& args)
+{
+    EndpointI::initWithOptions(args);
+
+    if(_name.empty())
+    {
+        throw EndpointParseException(__FILE__, __LINE__, "a name must be specified using the -name option");
+    }
+
+    hashInit();
+}
+
+bool
+IceInternal::ShmEndpointI::checkOption(const string& option, const string& argument, const string& endpoint)
+{
+    string arg = IceUtilInternal::trim(argument);
+    if(option == "-name")
+    {
+        if(arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "no argument provided for -name option in endpoint " +
+                                         endpoint);
+        }
+        if(arg.find('/') != string::npos)
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "invalid name `" + arg + "' in endpoint " + endpoint);
+        }
+        const_cast<string&>(_name) = arg;
+    }
+    else if(option == "-t")
+    {
+        if(arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "no argument provided for -t option in endpoint " +
+                                         endpoint);
+        }
+
+        if(arg == "infinite")
+        {
+            const_cast<Int&>(_timeout) = -1;
+        }
+        else
+        {
+            istringstream t(argument);
+            if(!(t >> const_cast<Int&>(_timeout)) || !t.eof() || _timeout < 1)
+            {
+                throw EndpointParseException(__FILE__, __LINE__, "invalid timeout value `" + arg + "' in endpoint " +
+                                             endpoint);
+            }
+        }
+    }
+    else if(option == "-z")
+    {
+        if(!arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "unexpected argument `" + arg +
+                                         "' provided for -z option in " + endpoint);
+        }
+        const_cast<bool&>(_compress) = true;
+    }
+    else
+    {
+        return false;
+    }
+    return true;
+}
+
+void
+IceInternal::ShmEndpointI::hashInit()
+{
+    Int h = 5381;
+    hashAdd(h, type());
+    hashAdd(h, _name);
+    hashAdd(h, _timeout);
+    hashAdd(h, _connectionId);
+    hashAdd(h, _compress);
+    const_cast<Int&>(_hashValue) = h;
+}
+
+string
+IceInternal::ShmEndpointI::path() const
+{
+    //
+    // The Unix domain socket of the endpoint is created in the shared
+    // memory file system when it's available.
+    //
+#if defined(__linux)
+    return "/dev/shm/ice-shm-" + _name;
+#else
+    return "/tmp/ice-shm-" + _name;
+#endif
+}
+
+IceInternal::ShmEndpointFactory::ShmEndpointFactory(const ProtocolInstancePtr& instance) : _instance(instance)
+{
+}
+
+IceInternal::ShmEndpointFactory::~ShmEndpointFactory()
+{
+}
+
+Short
+IceInternal::ShmEndpointFactory::type() const
+{
+    return _instance->type();
+}
+
+string
+IceInternal::ShmEndpointFactory::protocol() const
+{
+    return _instance->protocol();
+}
+
+EndpointIPtr
+IceInternal::ShmEndpointFactory::create(vector<string>& args, bool) const
+{
+    ShmEndpointIPtr endpt = ICE_MAKE_SHARED(ShmEndpointI, _instance);
+    endpt->initWithOptions(args);
+    return endpt;
+}
+
+EndpointIPtr
+IceInternal::ShmEndpointFactory::read(InputStream* s) const
+{
+    return ICE_MAKE_SHARED(ShmEndpointI, _instance, s);
+}
+
+void
+IceInternal::ShmEndpointFactory::destroy()
+{
+    _instance = 0;
+}
+
+EndpointFactoryPtr
+IceInternal::ShmEndpointFactory::clone(const ProtocolInstancePtr& instance) const
+{
+    return new ShmEndpointFactory(instance);
+}
+
+#endif
@@ -0,0 +1,118 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_SHM_ENDPOINT_I_H
+#define ICE_SHM_ENDPOINT_I_H
+
+#include <IceUtil/Config.h>
+#include <Ice/EndpointI.h>
+#include <Ice/EndpointFactory.h>
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Network.h> // for ICE_HAS_SHM_TRANSPORT
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+namespace IceInternal
+{
+
+//
+// The shared memory endpoint. Connections are established over a Unix
+// domain socket bound to a path derived from the endpoint name, and
+// each peer sends its data through a ring buffer in shared memory.
+//
+class ShmEndpointI : public EndpointI
+#ifdef ICE_CPP11_MAPPING
+                   , public std::enable_shared_from_this<ShmEndpointI>
+#endif
+{
+public:
+
+    ShmEndpointI(const ProtocolInstancePtr&, const std::string&, Ice::Int, const std::string&, bool);
+    ShmEndpointI(const ProtocolInstancePtr&);
+    ShmEndpointI(const ProtocolInstancePtr&, Ice::InputStream*);
+
+    virtual void streamWriteImpl(Ice::OutputStream*) const;
+
+    virtual Ice::EndpointInfoPtr getInfo() const ICE_NOEXCEPT;
+    virtual Ice::Short type() const;
+    virtual const std::string& protocol() const;
+    virtual Ice::Int timeout() const;
+    virtual EndpointIPtr timeout(Ice::Int) const;
+    virtual const std::string& connectionId() const;
+    virtual EndpointIPtr connectionId(const std::string&) const;
+    virtual bool compress() const;
+    virtual EndpointIPtr compress(bool) const;
+    virtual bool datagram() const;
+    virtual bool secure() const;
+
+    virtual TransceiverPtr transceiver() const;
+    virtual void connectors_async(Ice::EndpointSelectionType, const EndpointI_connectorsPtr&) const;
+    virtual AcceptorPtr acceptor(const std::string&) const;
+    virtual std::vector<EndpointIPtr> expandIfWildcard() const;
+    virtual std::vector<EndpointIPtr> expandHost(EndpointIPtr&) const;
+    virtual bool equivalent(const EndpointIPtr&) const;
+
+#ifdef ICE_CPP11_MAPPING
+    virtual bool operator==(const Ice::Endpoint&) const;
+    virtual bool operator<(const Ice::Endpoint&) const;
+#else
+    virtual bool operator==(const Ice::LocalObject&) const;
+    virtual bool operator<(const Ice::LocalObject&) const;
+#endif
+
+    virtual Ice::Int hash() const;
+    virtual std::string options() const;
+
+    void initWithOptions(std::vector<std::string>&);
+
+protected:
+
+    virtual bool checkOption(const std::string&, const std::string&, const std::string&);
+
+private:
+
+    void hashInit();
+    std::string path() const;
+
+    //
+    // All members are const, because endpoints are immutable.
+    //
+    const ProtocolInstancePtr _instance;
+    const std::string _name;
+    const Ice::Int _timeout;
+    const std::string _connectionId;
+    const bool _compress;
+    const Ice::Int _hashValue;
+};
+
+class ShmEndpointFactory : public EndpointFactory
+{
+public:
+
+    ShmEndpointFactory(const ProtocolInstancePtr&);
+    virtual ~ShmEndpointFactory();
+
+    virtual Ice::Short type() const;
+    virtual std::string protocol() const;
+    virtual EndpointIPtr create(std::vector<std::string>&, bool) const;
+    virtual EndpointIPtr read(Ice::InputStream*) const;
+    virtual void destroy();
+
+    virtual EndpointFactoryPtr clone(const ProtocolInstancePtr&) const;
+
+private:
+
+    ProtocolInstancePtr _instance;
+};
+
+}
+
+#endif
+
+#endif
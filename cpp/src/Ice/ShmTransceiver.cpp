@@ -0,0 +1,604 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/ShmTransceiver.h>
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+#include <Ice/Connection.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/Properties.h>
+#include <Ice/Buffer.h>
+#include <Ice/LocalException.h>
+#include <IceUtil/Atomic.h>
+
+#include <sys/mman.h>
+#include <sys/stat.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+namespace
+{
+
+const unsigned int shmMagic = 0x4d485349; // "ISHM"
+const unsigned int shmVersion = 1;
+
+//
+// The header of a ring buffer holds the position of the consumer. It
+// has its own cache line to avoid false sharing with the data.
+//
+const size_t headerSize = 64;
+
+const int defaultBufferSize = 4 * 1024 * 1024;
+const unsigned int minBufferSize = 64 * 1024;
+const unsigned int maxBufferSize = 1024 * 1024 * 1024;
+
+//
+// The maximum amount of data sent in a single inline record, the ring
+// buffer is checked again for free space after each record.
+//
+const size_t maxInlineSize = 64 * 1024;
+
+enum RecordType
+{
+    RecordRing = 1,
+    RecordInline = 2
+};
+
+IceUtilInternal::Atomic bufferCounter;
+
+inline unsigned int
+loadTail(const char* buf)
+{
+    unsigned int tail = *reinterpret_cast<const volatile unsigned int*>(buf);
+    __sync_synchronize();
+    return tail;
+}
+
+inline void
+storeTail(char* buf, unsigned int tail)
+{
+    __sync_synchronize();
+    *reinterpret_cast<volatile unsigned int*>(buf) = tail;
+}
+
+}
+
+NativeInfoPtr
+IceInternal::ShmTransceiver::getNativeInfo()
+{
+    return _stream;
+}
+
+SocketOperation
+IceInternal::ShmTransceiver::initialize(Buffer& readBuffer, Buffer& writeBuffer)
+{
+    if(_state == StateConnectPending)
+    {
+        SocketOperation op = _stream->connect(readBuffer, writeBuffer);
+        if(op != SocketOperationNone)
+        {
+            return op;
+        }
+        createBuffer();
+        _state = StateHandshakeWrite;
+    }
+
+    if(_state == StateHandshakeWrite)
+    {
+        if(!writeHandshake())
+        {
+            return SocketOperationWrite;
+        }
+
+        //
+        // The descriptor is no longer needed once it's sent to the peer.
+        //
+        ::close(_sndFd);
+        _sndFd = -1;
+        _state = StateHandshakeRead;
+    }
+
+    if(_state == StateHandshakeRead)
+    {
+        if(!readHandshake())
+        {
+            return SocketOperationRead;
+        }
+        mapBuffer();
+        _state = StateConnected;
+    }
+
+    return SocketOperationNone;
+}
+
+SocketOperation
+IceInternal::ShmTransceiver::closing(bool initiator, const Ice::LocalException&)
+{
+    // If we are initiating the connection closure, wait for the peer
+    // to close the connection. Otherwise, close immediately.
+    return initiator ? SocketOperationRead : SocketOperationNone;
+}
+
+void
+IceInternal::ShmTransceiver::close()
+{
+    if(_sndBuf)
+    {
+        ::munmap(_sndBuf, headerSize + _sndSize);
+        _sndBuf = 0;
+    }
+    if(_sndFd != -1)
+    {
+        ::close(_sndFd);
+        _sndFd = -1;
+    }
+    if(_rcvBuf)
+    {
+        ::munmap(_rcvBuf, headerSize + _rcvSize);
+        _rcvBuf = 0;
+    }
+    if(_rcvFd != -1)
+    {
+        ::close(_rcvFd);
+        _rcvFd = -1;
+    }
+    _stream->close();
+}
+
+SocketOperation
+IceInternal::ShmTransceiver::write(Buffer& buf)
+{
+    while(true)
+    {
+        if(_sndRecordWritten < sizeof(_sndRecord))
+        {
+            _sndRecordWritten += _stream->write(reinterpret_cast<const char*>(_sndRecord) + _sndRecordWritten,
+                                                sizeof(_sndRecord) - _sndRecordWritten);
+            if(_sndRecordWritten < sizeof(_sndRecord))
+            {
+                return SocketOperationWrite;
+            }
+
+            if(_sndRecord[0] == RecordRing)
+            {
+                //
+                // The data copied in the ring buffer is sent with its record.
+                //
+                buf.i += _sndRecord[1];
+            }
+            else
+            {
+                _sndInline = _sndRecord[1];
+            }
+        }
+
+        if(_sndInline > 0)
+        {
+            assert(static_cast<size_t>(buf.b.end() - buf.i) >= _sndInline);
+            ssize_t ret = _stream->write(reinterpret_cast<const char*>(&*buf.i), _sndInline);
+            buf.i += ret;
+            _sndInline -= ret;
+            if(_sndInline > 0)
+            {
+                return SocketOperationWrite;
+            }
+        }
+
+        if(buf.i == buf.b.end())
+        {
+            return SocketOperationNone;
+        }
+
+        size_t length = static_cast<size_t>(buf.b.end() - buf.i);
+        //
+        // The tail is written by the peer, don't trust it to be within
+        // the ring buffer.
+        //
+        unsigned int used = _sndHead - loadTail(_sndBuf);
+        if(used > _sndSize)
+        {
+            throw ProtocolException(__FILE__, __LINE__, "invalid shared memory buffer position");
+        }
+        size_t available = _sndSize - used;
+        if(available > 0)
+        {
+            length = min(length, available);
+
+            size_t pos = _sndHead & (_sndSize - 1);
+            size_t first = min(length, _sndSize - pos);
+            memcpy(_sndBuf + headerSize + pos, &*buf.i, first);
+            memcpy(_sndBuf + headerSize, &*buf.i + first, length - first);
+            _sndHead += static_cast<unsigned int>(length);
+
+            _sndRecord[0] = RecordRing;
+        }
+        else
+        {
+            length = min(length, maxInlineSize);
+            _sndRecord[0] = RecordInline;
+        }
+        _sndRecord[1] = static_cast<unsigned int>(length);
+        _sndRecordWritten = 0;
+    }
+}
+
+SocketOperation
+IceInternal::ShmTransceiver::read(Buffer& buf)
+{
+    if(buf.i == buf.b.end())
+    {
+        return SocketOperationNone;
+    }
+
+    _stream->ready(SocketOperationRead, false);
+
+    while(buf.i != buf.b.end())
+    {
+        if(_rcvRemaining == 0)
+        {
+            _rcvRecordRead += _stream->read(reinterpret_cast<char*>(_rcvRecord) + _rcvRecordRead,
+                                            sizeof(_rcvRecord) - _rcvRecordRead);
+            if(_rcvRecordRead < sizeof(_rcvRecord))
+            {
+                return SocketOperationRead;
+            }
+            _rcvRecordRead = 0;
+
+            if((_rcvRecord[0] != RecordRing && _rcvRecord[0] != RecordInline) || _rcvRecord[1] == 0 ||
+               (_rcvRecord[0] == RecordRing && _rcvRecord[1] > _rcvSize) ||
+               (_rcvRecord[0] == RecordInline && _rcvRecord[1] > maxInlineSize))
+            {
+                throw ProtocolException(__FILE__, __LINE__, "invalid shared memory record");
+            }
+            _rcvRemaining = _rcvRecord[1];
+        }
+
+        size_t length = min(_rcvRemaining, static_cast<size_t>(buf.b.end() - buf.i));
+        if(_rcvRecord[0] == RecordRing)
+        {
+            size_t pos = _rcvTail & (_rcvSize - 1);
+            size_t first = min(length, _rcvSize - pos);
+            memcpy(&*buf.i, _rcvBuf + headerSize + pos, first);
+            memcpy(&*buf.i + first, _rcvBuf + headerSize, length - first);
+            _rcvTail += static_cast<unsigned int>(length);
+
+            //
+            // Release the space to the sender.
+            //
+            storeTail(_rcvBuf, _rcvTail);
+        }
+        else
+        {
+            length = static_cast<size_t>(_stream->read(reinterpret_cast<char*>(&*buf.i), length));
+            if(length == 0)
+            {
+                return SocketOperationRead;
+            }
+        }
+        buf.i += length;
+        _rcvRemaining -= length;
+    }
+
+    //
+    // The data remaining in the ring buffer doesn't make the socket
+    // readable, set the read ready status if there's some.
+    //
+    _stream->ready(SocketOperationRead, _rcvRemaining > 0 && _rcvRecord[0] == RecordRing);
+
+    return SocketOperationNone;
+}
+
+string
+IceInternal::ShmTransceiver::protocol() const
+{
+    return _instance->protocol();
+}
+
+string
+IceInternal::ShmTransceiver::toString() const
+{
+    return _stream->toString();
+}
+
+string
+IceInternal::ShmTransceiver::toDetailedString() const
+{
+    return toString();
+}
+
+Ice::ConnectionInfoPtr
+IceInternal::ShmTransceiver::getInfo() const
+{
+    SHMConnectionInfoPtr info = ICE_MAKE_SHARED(SHMConnectionInfo);
+    info->rcvSize = static_cast<Int>(_rcvSize);
+    info->sndSize = static_cast<Int>(_sndSize);
+    return info;
+}
+
+void
+IceInternal::ShmTransceiver::checkSendSize(const Buffer&)
+{
+}
+
+void
+IceInternal::ShmTransceiver::setBufferSize(int rcvSize, int sndSize)
+{
+    _stream->setBufferSize(rcvSize, sndSize);
+}
+
+IceInternal::ShmTransceiver::ShmTransceiver(const ProtocolInstancePtr& instance, const StreamSocketPtr& stream) :
+    _instance(instance),
+    _stream(stream),
+    _state(StateConnectPending),
+    _handshakeWritten(0),
+    _peerHandshakeRead(0),
+    _sndFd(-1),
+    _sndBuf(0),
+    _sndSize(0),
+    _sndHead(0),
+    _sndRecordWritten(sizeof(_sndRecord)),
+    _sndInline(0),
+    _rcvFd(-1),
+    _rcvBuf(0),
+    _rcvSize(0),
+    _rcvTail(0),
+    _rcvRecordRead(0),
+    _rcvRemaining(0)
+{
+}
+
+IceInternal::ShmTransceiver::~ShmTransceiver()
+{
+    assert(!_sndBuf && !_rcvBuf);
+}
+
+void
+IceInternal::ShmTransceiver::createBuffer()
+{
+    //
+    // The size of the ring buffer is a power of two, to wrap the
+    // positions with a mask.
+    //
+    Int size = _instance->properties()->getPropertyAsIntWithDefault("Ice.SHM.BufferSize", defaultBufferSize);
+    unsigned int sz = minBufferSize;
+    while(sz < static_cast<unsigned int>(max(size, 0)) && sz < maxBufferSize)
+    {
+        sz <<= 1;
+    }
+
+    //
+    // The shared memory object is unlinked as soon as it's created, it
+    // only remains accessible through its descriptor.
+    //
+    int fd;
+    while(true)
+    {
+        ostringstream os;
+        os << "/ice-shm-" << getpid() << "-" << ++bufferCounter;
+        string name = os.str();
+        fd = shm_open(name.c_str(), O_RDWR | O_CREAT | O_EXCL, S_IRUSR | S_IWUSR);
+        if(fd != -1)
+        {
+            shm_unlink(name.c_str());
+            break;
+        }
+        else if(errno != EEXIST)
+        {
+            throw SyscallException(__FILE__, __LINE__, errno);
+        }
+    }
+
+    if(ftruncate(fd, static_cast<off_t>(headerSize + sz)) == -1)
+    {
+        int error = errno;
+        ::close(fd);
+        throw SyscallException(__FILE__, __LINE__, error);
+    }
+
+    void* buf = mmap(0, headerSize + sz, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    if(buf == MAP_FAILED)
+    {
+        int error = errno;
+        ::close(fd);
+        throw SyscallException(__FILE__, __LINE__, error);
+    }
+
+    _sndFd = fd;
+    _sndBuf = static_cast<char*>(buf);
+    _sndSize = sz;
+
+    _handshake[0] = shmMagic;
+    _handshake[1] = shmVersion;
+    _handshake[2] = sz;
+    _handshake[3] = 0;
+}
+
+void
+IceInternal::ShmTransceiver::mapBuffer()
+{
+    if(_peerHandshake[0] != shmMagic || _peerHandshake[1] != shmVersion)
+    {
+        throw ProtocolException(__FILE__, __LINE__, "invalid shared memory handshake");
+    }
+
+    if(_rcvFd == -1)
+    {
+        throw ProtocolException(__FILE__, __LINE__, "shared memory buffer not received");
+    }
+
+    unsigned int sz = _peerHandshake[2];
+    struct stat st;
+    if(sz < minBufferSize || sz > maxBufferSize || (sz & (sz - 1)) != 0 || fstat(_rcvFd, &st) == -1 ||
+       st.st_size < static_cast<off_t>(headerSize + sz))
+    {
+        throw ProtocolException(__FILE__, __LINE__, "invalid shared memory buffer");
+    }
+
+    void* buf = mmap(0, headerSize + sz, PROT_READ | PROT_WRITE, MAP_SHARED, _rcvFd, 0);
+    if(buf == MAP_FAILED)
+    {
+        throw SyscallException(__FILE__, __LINE__, errno);
+    }
+
+    ::close(_rcvFd);
+    _rcvFd = -1;
+    _rcvBuf = static_cast<char*>(buf);
+    _rcvSize = sz;
+}
+
+bool
+IceInternal::ShmTransceiver::writeHandshake()
+{
+    while(_handshakeWritten < sizeof(_handshake))
+    {
+        if(_handshakeWritten > 0)
+        {
+            ssize_t ret = _stream->write(reinterpret_cast<const char*>(_handshake) + _handshakeWritten,
+                                         sizeof(_handshake) - _handshakeWritten);
+            if(ret == 0)
+            {
+                return false;
+            }
+            _handshakeWritten += ret;
+            continue;
+        }
+
+        //
+        // The descriptor of the ring buffer is sent with the first bytes
+        // of the handshake.
+        //
+        iovec iov;
+        iov.iov_base = _handshake;
+        iov.iov_len = sizeof(_handshake);
+
+        union
+        {
+            cmsghdr header;
+            char data[CMSG_SPACE(sizeof(int))];
+        } control;
+        memset(&control, 0, sizeof(control));
+
+        msghdr msg;
+        memset(&msg, 0, sizeof(msg));
+        msg.msg_iov = &iov;
+        msg.msg_iovlen = 1;
+        msg.msg_control = control.data;
+        msg.msg_controllen = sizeof(control.data);
+
+        cmsghdr* cmsg = CMSG_FIRSTHDR(&msg);
+        cmsg->cmsg_level = SOL_SOCKET;
+        cmsg->cmsg_type = SCM_RIGHTS;
+        cmsg->cmsg_len = CMSG_LEN(sizeof(int));
+        memcpy(CMSG_DATA(cmsg), &_sndFd, sizeof(int));
+
+        ssize_t ret = ::sendmsg(_stream->fd(), &msg, 0);
+        if(ret == SOCKET_ERROR)
+        {
+            if(interrupted())
+            {
+                continue;
+            }
+
+            if(wouldBlock())
+            {
+                return false;
+            }
+
+            if(connectionLost())
+            {
+                throw ConnectionLostException(__FILE__, __LINE__, getSocketErrno());
+            }
+            else
+            {
+                throw SocketException(__FILE__, __LINE__, getSocketErrno());
+            }
+        }
+        _handshakeWritten += ret;
+    }
+    return true;
+}
+
+bool
+IceInternal::ShmTransceiver::readHandshake()
+{
+    while(_peerHandshakeRead < sizeof(_peerHandshake))
+    {
+        iovec iov;
+        iov.iov_base = reinterpret_cast<char*>(_peerHandshake) + _peerHandshakeRead;
+        iov.iov_len = sizeof(_peerHandshake) - _peerHandshakeRead;
+
+        union
+        {
+            cmsghdr header;
+            char data[CMSG_SPACE(sizeof(int))];
+        } control;
+
+        msghdr msg;
+        memset(&msg, 0, sizeof(msg));
+        msg.msg_iov = &iov;
+        msg.msg_iovlen = 1;
+        msg.msg_control = control.data;
+        msg.msg_controllen = sizeof(control.data);
+
+#ifdef MSG_CMSG_CLOEXEC
+        ssize_t ret = ::recvmsg(_stream->fd(), &msg, MSG_CMSG_CLOEXEC);
+#else
+        ssize_t ret = ::recvmsg(_stream->fd(), &msg, 0);
+#endif
+        if(ret == 0)
+        {
+            throw ConnectionLostException(__FILE__, __LINE__, 0);
+        }
+        else if(ret == SOCKET_ERROR)
+        {
+            if(interrupted())
+            {
+                continue;
+            }
+
+            if(wouldBlock())
+            {
+                return false;
+            }
+
+            if(connectionLost())
+            {
+                throw ConnectionLostException(__FILE__, __LINE__, getSocketErrno());
+            }
+            else
+            {
+                throw SocketException(__FILE__, __LINE__, getSocketErrno());
+            }
+        }
+
+        for(cmsghdr* cmsg = CMSG_FIRSTHDR(&msg); cmsg; cmsg = CMSG_NXTHDR(&msg, cmsg))
+        {
+            if(cmsg->cmsg_level == SOL_SOCKET && cmsg->cmsg_type == SCM_RIGHTS)
+            {
+                int fd;
+                memcpy(&fd, CMSG_DATA(cmsg), sizeof(int));
+                if(_rcvFd == -1)
+                {
+                    _rcvFd = fd;
+                }
+                else
+                {
+                    ::close(fd);
+                }
+            }
+        }
+        _peerHandshakeRead += ret;
+    }
+    return true;
+}
+
+#endif
@@ -0,0 +1,127 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_SHM_TRANSCEIVER_H
+#define ICE_SHM_TRANSCEIVER_H
+
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Transceiver.h>
+#include <Ice/Network.h>
+#include <Ice/StreamSocket.h>
+
+#ifdef ICE_HAS_SHM_TRANSPORT
+
+namespace IceInternal
+{
+
+class ShmConnector;
+class ShmAcceptor;
+
+//
+// The shared memory transceiver. Each peer writes the data it sends
+// in a ring buffer that it allocates in shared memory and passes to
+// the other peer over the Unix domain socket of the connection when
+// the connection is initialized.
+//
+// The socket carries small records which tell the receiver how many
+// bytes are available in the ring buffer. It makes the connection
+// readable for the thread pool selector as with other transports.
+// When the ring buffer is full, the data is sent inline over the
+// socket instead, so that a sender never waits for the receiver.
+//
+class ShmTransceiver : public Transceiver
+{
+public:
+
+    virtual NativeInfoPtr getNativeInfo();
+
+    virtual SocketOperation initialize(Buffer&, Buffer&);
+    virtual SocketOperation closing(bool, const Ice::LocalException&);
+
+    virtual void close();
+    virtual SocketOperation write(Buffer&);
+    virtual SocketOperation read(Buffer&);
+    virtual std::string protocol() const;
+    virtual std::string toString() const;
+    virtual std::string toDetailedString() const;
+    virtual Ice::ConnectionInfoPtr getInfo() const;
+    virtual void checkSendSize(const Buffer&);
+    virtual void setBufferSize(int rcvSize, int sndSize);
+
+private:
+
+    ShmTransceiver(const ProtocolInstancePtr&, const StreamSocketPtr&);
+    virtual ~ShmTransceiver();
+
+    friend class ShmConnector;
+    friend class ShmAcceptor;
+
+    void createBuffer();
+    void mapBuffer();
+    bool writeHandshake();
+    bool readHandshake();
+
+    enum State
+    {
+        StateConnectPending,
+        StateHandshakeWrite,
+        StateHandshakeRead,
+        StateConnected
+    };
+
+    const ProtocolInstancePtr _instance;
+    const StreamSocketPtr _stream;
+
+    State _state;
+
+    //
+    // The handshake exchanged by the peers: a magic number, the
+    // protocol version and the size of the ring buffer.
+    //
+    unsigned int _handshake[4];
+    size_t _handshakeWritten;
+    unsigned int _peerHandshake[4];
+    size_t _peerHandshakeRead;
+
+    //
+    // The ring buffer used to send data. The producer position is only
+    // known by the sender.
+    //
+    int _sndFd;
+    char* _sndBuf;
+    unsigned int _sndSize;
+    unsigned int _sndHead;
+
+    //
+    // The record to send before the data it describes. The ring buffer
+    // data is only consumed from the write buffer once its record is
+    // sent.
+    //
+    unsigned int _sndRecord[2];
+    size_t _sndRecordWritten;
+    size_t _sndInline;
+
+    //
+    // The ring buffer of the peer, used to receive data.
+    //
+    int _rcvFd;
+    char* _rcvBuf;
+    unsigned int _rcvSize;
+    unsigned int _rcvTail;
+
+    unsigned int _rcvRecord[2];
+    size_t _rcvRecordRead;
+    size_t _rcvRemaining;
+};
+
+}
+
+#endif
+
+#endif
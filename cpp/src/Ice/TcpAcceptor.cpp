@@ -341,6 +341,19 @@ IceInternal::TcpAcceptor::TcpAcceptor(const TcpEndpointIPtr& endpoint,
     // versions (XP SP2, Windows Server 2003).
     //
     setReuseAddress(_fd, true);
+
+    //
+    // With Ice.TCP.ReusePort enabled, several processes can bind the
+    // same address and port and the kernel distributes the incoming
+    // connections among them. This is used by language mappings which
+    // run a server as a group of processes (such as Ice for Python with
+    // Ice.Python.Processes).
+    //
+    if(_instance->properties()->getPropertyAsInt("Ice.TCP.ReusePort") > 0 && !setReusePort(_fd, true))
+    {
+        Warning out(_instance->logger());
+        out << "Ice.TCP.ReusePort is not supported on this platform";
+    }
 #endif
 }
 
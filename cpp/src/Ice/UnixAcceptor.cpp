@@ -0,0 +1,136 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/UnixAcceptor.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+#include <Ice/UnixTransceiver.h>
+#include <Ice/UnixEndpointI.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/LocalException.h>
+#include <Ice/Properties.h>
+#include <Ice/StreamSocket.h>
+
+#include <sys/stat.h>
+
+//
+// Use the system default for the listen() backlog or 511 if not defined.
+//
+#ifndef SOMAXCONN
+#  define SOMAXCONN 511
+#endif
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+IceUtil::Shared* IceInternal::upCast(UnixAcceptor* p) { return p; }
+
+NativeInfoPtr
+IceInternal::UnixAcceptor::getNativeInfo()
+{
+    return this;
+}
+
+void
+IceInternal::UnixAcceptor::close()
+{
+    if(_fd != INVALID_SOCKET)
+    {
+        closeSocketNoThrow(_fd);
+        _fd = INVALID_SOCKET;
+    }
+
+    //
+    // Remove the socket file, unless it was bound by another acceptor.
+    //
+    if(_bound)
+    {
+        ::unlink(_path.c_str());
+        _bound = false;
+    }
+}
+
+EndpointIPtr
+IceInternal::UnixAcceptor::listen()
+{
+    try
+    {
+        removeStaleUnixSocket(_path);
+        doBind(_fd, _addr);
+        _bound = true;
+
+        //
+        // Set the permissions of the socket file before listening, so
+        // that no connection is accepted with the permissions resulting
+        // from the process umask.
+        //
+        if(_mode != -1 && ::chmod(_path.c_str(), static_cast<mode_t>(_mode)) == -1)
+        {
+            SyscallException ex(__FILE__, __LINE__, getSocketErrno());
+            closeSocketNoThrow(_fd);
+            throw ex;
+        }
+
+        doListen(_fd, _backlog);
+    }
+    catch(...)
+    {
+        _fd = INVALID_SOCKET;
+        throw;
+    }
+    return _endpoint;
+}
+
+TransceiverPtr
+IceInternal::UnixAcceptor::accept()
+{
+    return new UnixTransceiver(_instance, new StreamSocket(_instance, doAccept(_fd)));
+}
+
+string
+IceInternal::UnixAcceptor::protocol() const
+{
+    return _instance->protocol();
+}
+
+string
+IceInternal::UnixAcceptor::toString() const
+{
+    return _path;
+}
+
+string
+IceInternal::UnixAcceptor::toDetailedString() const
+{
+    return "local address = " + toString();
+}
+
+IceInternal::UnixAcceptor::UnixAcceptor(const UnixEndpointIPtr& endpoint, const ProtocolInstancePtr& instance,
+                                        const string& path, Int mode) :
+    _endpoint(endpoint),
+    _instance(instance),
+    _path(path),
+    _addr(getUnixAddress(path)),
+    _mode(mode),
+    _bound(false)
+{
+    _backlog = instance->properties()->getPropertyAsIntWithDefault("Ice.TCP.Backlog", SOMAXCONN);
+
+    _fd = createServerSocket(false, _addr, instance->protocolSupport());
+    setBlock(_fd, false);
+}
+
+IceInternal::UnixAcceptor::~UnixAcceptor()
+{
+    assert(_fd == INVALID_SOCKET);
+}
+
+#endif
@@ -0,0 +1,56 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_UNIX_ACCEPTOR_H
+#define ICE_UNIX_ACCEPTOR_H
+
+#include <Ice/TransceiverF.h>
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Acceptor.h>
+#include <Ice/Network.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+namespace IceInternal
+{
+
+class UnixAcceptor : public Acceptor, public NativeInfo
+{
+public:
+
+    virtual NativeInfoPtr getNativeInfo();
+
+    virtual void close();
+    virtual EndpointIPtr listen();
+    virtual TransceiverPtr accept();
+    virtual std::string protocol() const;
+    virtual std::string toString() const;
+    virtual std::string toDetailedString() const;
+
+private:
+
+    UnixAcceptor(const UnixEndpointIPtr&, const ProtocolInstancePtr&, const std::string&, Ice::Int);
+    virtual ~UnixAcceptor();
+    friend class UnixEndpointI;
+
+    const UnixEndpointIPtr _endpoint;
+    const ProtocolInstancePtr _instance;
+    const std::string _path;
+    const Address _addr;
+    const Ice::Int _mode;
+
+    int _backlog;
+    bool _bound;
+};
+
+}
+
+#endif
+
+#endif
@@ -0,0 +1,111 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/UnixConnector.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+#include <Ice/UnixTransceiver.h>
+#include <Ice/UnixEndpointI.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/StreamSocket.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+TransceiverPtr
+IceInternal::UnixConnector::connect()
+{
+    return new UnixTransceiver(_instance, new StreamSocket(_instance, 0, _addr, Address()));
+}
+
+Short
+IceInternal::UnixConnector::type() const
+{
+    return _instance->type();
+}
+
+string
+IceInternal::UnixConnector::toString() const
+{
+    return _path;
+}
+
+bool
+IceInternal::UnixConnector::operator==(const Connector& r) const
+{
+    const UnixConnector* p = dynamic_cast<const UnixConnector*>(&r);
+    if(!p)
+    {
+        return false;
+    }
+
+    if(_path != p->_path)
+    {
+        return false;
+    }
+
+    if(_timeout != p->_timeout)
+    {
+        return false;
+    }
+
+    if(_connectionId != p->_connectionId)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool
+IceInternal::UnixConnector::operator<(const Connector& r) const
+{
+    const UnixConnector* p = dynamic_cast<const UnixConnector*>(&r);
+    if(!p)
+    {
+        return type() < r.type();
+    }
+
+    if(_timeout < p->_timeout)
+    {
+        return true;
+    }
+    else if(p->_timeout < _timeout)
+    {
+        return false;
+    }
+
+    if(_connectionId < p->_connectionId)
+    {
+        return true;
+    }
+    else if(p->_connectionId < _connectionId)
+    {
+        return false;
+    }
+    return _path < p->_path;
+}
+
+IceInternal::UnixConnector::UnixConnector(const ProtocolInstancePtr& instance, const string& path, Int timeout,
+                                          const string& connectionId) :
+    _instance(instance),
+    _path(path),
+    _addr(getUnixAddress(path)),
+    _timeout(timeout),
+    _connectionId(connectionId)
+{
+}
+
+IceInternal::UnixConnector::~UnixConnector()
+{
+}
+
+#endif
@@ -0,0 +1,52 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_UNIX_CONNECTOR_H
+#define ICE_UNIX_CONNECTOR_H
+
+#include <Ice/TransceiverF.h>
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Connector.h>
+#include <Ice/Network.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+namespace IceInternal
+{
+
+class UnixConnector : public Connector
+{
+public:
+
+    virtual TransceiverPtr connect();
+
+    virtual Ice::Short type() const;
+    virtual std::string toString() const;
+
+    virtual bool operator==(const Connector&) const;
+    virtual bool operator<(const Connector&) const;
+
+private:
+
+    UnixConnector(const ProtocolInstancePtr&, const std::string&, Ice::Int, const std::string&);
+    virtual ~UnixConnector();
+    friend class UnixEndpointI;
+
+    const ProtocolInstancePtr _instance;
+    const std::string _path;
+    const Address _addr;
+    const Ice::Int _timeout;
+    const std::string _connectionId;
+};
+
+}
+
+#endif
+
+#endif
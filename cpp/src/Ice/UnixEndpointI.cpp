@@ -0,0 +1,549 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/UnixEndpointI.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+#include <Ice/UnixAcceptor.h>
+#include <Ice/UnixConnector.h>
+#include <Ice/OutputStream.h>
+#include <Ice/InputStream.h>
+#include <Ice/LocalException.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/HashUtil.h>
+#include <IceUtil/StringUtil.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+#ifndef ICE_CPP11_MAPPING
+IceUtil::Shared* IceInternal::upCast(UnixEndpointI* p) { return p; }
+#endif
+
+extern "C"
+{
+
+Plugin*
+createIceUnix(const CommunicatorPtr& c, const string&, const StringSeq&)
+{
+    return new EndpointFactoryPlugin(c, new UnixEndpointFactory(new ProtocolInstance(c, UnixEndpointType, "unix",
+                                                                                     false)));
+}
+
+}
+
+namespace Ice
+{
+
+ICE_API void
+registerIceUnix(bool loadOnInitialize)
+{
+    Ice::registerPluginFactory("IceUnix", createIceUnix, loadOnInitialize);
+}
+
+}
+
+IceInternal::UnixEndpointI::UnixEndpointI(const ProtocolInstancePtr& instance, const string& path, Int mode,
+                                          Int timeout, const string& connectionId, bool compress) :
+    _instance(instance),
+    _path(path),
+    _mode(mode),
+    _timeout(timeout),
+    _connectionId(connectionId),
+    _compress(compress),
+    _hashValue(0)
+{
+    hashInit();
+}
+
+IceInternal::UnixEndpointI::UnixEndpointI(const ProtocolInstancePtr& instance) :
+    _instance(instance),
+    _mode(-1),
+    _timeout(instance->defaultTimeout()),
+    _compress(false),
+    _hashValue(0)
+{
+}
+
+IceInternal::UnixEndpointI::UnixEndpointI(const ProtocolInstancePtr& instance, InputStream* s) :
+    _instance(instance),
+    _mode(-1),
+    _timeout(-1),
+    _compress(false),
+    _hashValue(0)
+{
+    s->read(const_cast<string&>(_path), false);
+    s->read(const_cast<Int&>(_timeout));
+    s->read(const_cast<bool&>(_compress));
+    hashInit();
+}
+
+void
+IceInternal::UnixEndpointI::streamWriteImpl(OutputStream* s) const
+{
+    s->write(_path, false);
+    s->write(_timeout);
+    s->write(_compress);
+}
+
+EndpointInfoPtr
+IceInternal::UnixEndpointI::getInfo() const ICE_NOEXCEPT
+{
+    UnixEndpointInfoPtr info = ICE_MAKE_SHARED(InfoI<Ice::UnixEndpointInfo>, ICE_SHARED_FROM_CONST_THIS(UnixEndpointI));
+    info->path = _path;
+    return info;
+}
+
+Short
+IceInternal::UnixEndpointI::type() const
+{
+    return _instance->type();
+}
+
+const string&
+IceInternal::UnixEndpointI::protocol() const
+{
+    return _instance->protocol();
+}
+
+Int
+IceInternal::UnixEndpointI::timeout() const
+{
+    return _timeout;
+}
+
+EndpointIPtr
+IceInternal::UnixEndpointI::timeout(Int timeout) const
+{
+    if(timeout == _timeout)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(UnixEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(UnixEndpointI, _instance, _path, _mode, timeout, _connectionId, _compress);
+    }
+}
+
+const string&
+IceInternal::UnixEndpointI::connectionId() const
+{
+    return _connectionId;
+}
+
+EndpointIPtr
+IceInternal::UnixEndpointI::connectionId(const string& connectionId) const
+{
+    if(connectionId == _connectionId)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(UnixEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(UnixEndpointI, _instance, _path, _mode, _timeout, connectionId, _compress);
+    }
+}
+
+bool
+IceInternal::UnixEndpointI::compress() const
+{
+    return _compress;
+}
+
+EndpointIPtr
+IceInternal::UnixEndpointI::compress(bool compress) const
+{
+    if(compress == _compress)
+    {
+        return ICE_SHARED_FROM_CONST_THIS(UnixEndpointI);
+    }
+    else
+    {
+        return ICE_MAKE_SHARED(UnixEndpointI, _instance, _path, _mode, _timeout, _connectionId, compress);
+    }
+}
+
+bool
+IceInternal::UnixEndpointI::datagram() const
+{
+    return false;
+}
+
+bool
+IceInternal::UnixEndpointI::secure() const
+{
+    return _instance->secure();
+}
+
+TransceiverPtr
+IceInternal::UnixEndpointI::transceiver() const
+{
+    return 0;
+}
+
+void
+IceInternal::UnixEndpointI::connectors_async(EndpointSelectionType, const EndpointI_connectorsPtr& cb) const
+{
+    vector<ConnectorPtr> connectors;
+    try
+    {
+        connectors.push_back(new UnixConnector(_instance, _path, _timeout, _connectionId));
+    }
+    catch(const Ice::LocalException& ex)
+    {
+        cb->exception(ex);
+        return;
+    }
+    cb->connectors(connectors);
+}
+
+AcceptorPtr
+IceInternal::UnixEndpointI::acceptor(const string&) const
+{
+    return new UnixAcceptor(ICE_SHARED_FROM_CONST_THIS(UnixEndpointI), _instance, _path, _mode);
+}
+
+vector<EndpointIPtr>
+IceInternal::UnixEndpointI::expandIfWildcard() const
+{
+    vector<EndpointIPtr> endps;
+    endps.push_back(ICE_SHARED_FROM_CONST_THIS(UnixEndpointI));
+    return endps;
+}
+
+vector<EndpointIPtr>
+IceInternal::UnixEndpointI::expandHost(EndpointIPtr&) const
+{
+    //
+    // Nothing to do here, the endpoint path doesn't need to be resolved.
+    //
+    vector<EndpointIPtr> endps;
+    endps.push_back(ICE_SHARED_FROM_CONST_THIS(UnixEndpointI));
+    return endps;
+}
+
+bool
+IceInternal::UnixEndpointI::equivalent(const EndpointIPtr& endpoint) const
+{
+    const UnixEndpointI* unixEndpointI = dynamic_cast<const UnixEndpointI*>(endpoint.get());
+    if(!unixEndpointI)
+    {
+        return false;
+    }
+    return unixEndpointI->type() == type() && unixEndpointI->_path == _path;
+}
+
+bool
+#ifdef ICE_CPP11_MAPPING
+IceInternal::UnixEndpointI::operator==(const Ice::Endpoint& r) const
+#else
+IceInternal::UnixEndpointI::operator==(const Ice::LocalObject& r) const
+#endif
+{
+    const UnixEndpointI* p = dynamic_cast<const UnixEndpointI*>(&r);
+    if(!p)
+    {
+        return false;
+    }
+
+    if(this == p)
+    {
+        return true;
+    }
+
+    if(_path != p->_path)
+    {
+        return false;
+    }
+
+    if(_connectionId != p->_connectionId)
+    {
+        return false;
+    }
+
+    if(_timeout != p->_timeout)
+    {
+        return false;
+    }
+
+    if(_compress != p->_compress)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool
+#ifdef ICE_CPP11_MAPPING
+IceInternal::UnixEndpointI::operator<(const Ice::Endpoint& r) const
+#else
+IceInternal::UnixEndpointI::operator<(const Ice::LocalObject& r) const
+#endif
+{
+    const UnixEndpointI* p = dynamic_cast<const UnixEndpointI*>(&r);
+    if(!p)
+    {
+        const EndpointI* e = dynamic_cast<const EndpointI*>(&r);
+        if(!e)
+        {
+            return false;
+        }
+        return type() < e->type();
+    }
+
+    if(this == p)
+    {
+        return false;
+    }
+
+    if(type() < p->type())
+    {
+        return true;
+    }
+    else if(p->type() < type())
+    {
+        return false;
+    }
+
+    if(_path < p->_path)
+    {
+        return true;
+    }
+    else if(p->_path < _path)
+    {
+        return false;
+    }
+
+    if(_connectionId < p->_connectionId)
+    {
+        return true;
+    }
+    else if(p->_connectionId < _connectionId)
+    {
+        return false;
+    }
+
+    if(_timeout < p->_timeout)
+    {
+        return true;
+    }
+    else if(p->_timeout < _timeout)
+    {
+        return false;
+    }
+
+    if(!_compress && p->_compress)
+    {
+        return true;
+    }
+    else if(p->_compress < _compress)
+    {
+        return false;
+    }
+
+    return false;
+}
+
+Int
+IceInternal::UnixEndpointI::hash() const
+{
+    return _hashValue;
+}
+
+string
+IceInternal::UnixEndpointI::options() const
+{
+    //
+    // WARNING: Certain features, such as proxy validation in Glacier2,
+    // depend on the format of proxy strings. Changes to toString() and
+    // methods called to generate parts of the reference string could break
+    // these features. Please review for all features that depend on the
+    // format of proxyToString() before changing this and related code.
+    //
+    ostringstream s;
+
+    s << " -p ";
+    bool addQuote = _path.find_first_of(": \t\n\r") != string::npos;
+    if(addQuote)
+    {
+        s << "\"";
+    }
+    s << _path;
+    if(addQuote)
+    {
+        s << "\"";
+    }
+
+    if(_mode != -1)
+    {
+        s << " --mode 0" << oct << _mode << dec;
+    }
+
+    if(_timeout == -1)
+    {
+        s << " -t infinite";
+    }
+    else
+    {
+        s << " -t " << _timeout;
+    }
+
+    if(_compress)
+    {
+        s << " -z";
+    }
+
+    return s.str();
+}
+
+void
+IceInternal::UnixEndpointI::initWithOptions(vector<string>& args)
+{
+    EndpointI::initWithOptions(args);
+
+    if(_path.empty())
+    {
+        throw EndpointParseException(__FILE__, __LINE__, "a path must be specified using the -p option");
+    }
+
+    hashInit();
+}
+
+bool
+IceInternal::UnixEndpointI::checkOption(const string& option, const string& argument, const string& endpoint)
+{
+    string arg = IceUtilInternal::trim(argument);
+    if(option == "-p")
+    {
+        if(arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "no argument provided for -p option in endpoint " +
+                                         endpoint);
+        }
+        if(arg.size() >= sizeof(sockaddr_un().sun_path))
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "path `" + arg + "' is too long in endpoint " + endpoint);
+        }
+        const_cast<string&>(_path) = arg;
+    }
+    else if(option == "--mode")
+    {
+        if(arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "no argument provided for --mode option in endpoint " +
+                                         endpoint);
+        }
+
+        istringstream t(arg);
+        if(!(t >> oct >> const_cast<Int&>(_mode)) || !t.eof() || _mode < 0 || _mode > 07777)
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "invalid file mode value `" + arg + "' in endpoint " +
+                                         endpoint);
+        }
+    }
+    else if(option == "-t")
+    {
+        if(arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "no argument provided for -t option in endpoint " +
+                                         endpoint);
+        }
+
+        if(arg == "infinite")
+        {
+            const_cast<Int&>(_timeout) = -1;
+        }
+        else
+        {
+            istringstream t(argument);
+            if(!(t >> const_cast<Int&>(_timeout)) || !t.eof() || _timeout < 1)
+            {
+                throw EndpointParseException(__FILE__, __LINE__, "invalid timeout value `" + arg + "' in endpoint " +
+                                             endpoint);
+            }
+        }
+    }
+    else if(option == "-z")
+    {
+        if(!arg.empty())
+        {
+            throw EndpointParseException(__FILE__, __LINE__, "unexpected argument `" + arg +
+                                         "' provided for -z option in " + endpoint);
+        }
+        const_cast<bool&>(_compress) = true;
+    }
+    else
+    {
+        return false;
+    }
+    return true;
+}
+
+void
+IceInternal::UnixEndpointI::hashInit()
+{
+    Int h = 5381;
+    hashAdd(h, type());
+    hashAdd(h, _path);
+    hashAdd(h, _timeout);
+    hashAdd(h, _connectionId);
+    hashAdd(h, _compress);
+    const_cast<Int&>(_hashValue) = h;
+}
+
+IceInternal::UnixEndpointFactory::UnixEndpointFactory(const ProtocolInstancePtr& instance) : _instance(instance)
+{
+}
+
+IceInternal::UnixEndpointFactory::~UnixEndpointFactory()
+{
+}
+
+Short
+IceInternal::UnixEndpointFactory::type() const
+{
+    return _instance->type();
+}
+
+string
+IceInternal::UnixEndpointFactory::protocol() const
+{
+    return _instance->protocol();
+}
+
+EndpointIPtr
+IceInternal::UnixEndpointFactory::create(vector<string>& args, bool) const
+{
+    UnixEndpointIPtr endpt = ICE_MAKE_SHARED(UnixEndpointI, _instance);
+    endpt->initWithOptions(args);
+    return endpt;
+}
+
+EndpointIPtr
+IceInternal::UnixEndpointFactory::read(InputStream* s) const
+{
+    return ICE_MAKE_SHARED(UnixEndpointI, _instance, s);
+}
+
+void
+IceInternal::UnixEndpointFactory::destroy()
+{
+    _instance = 0;
+}
+
+EndpointFactoryPtr
+IceInternal::UnixEndpointFactory::clone(const ProtocolInstancePtr& instance) const
+{
+    return new UnixEndpointFactory(instance);
+}
+
+#endif
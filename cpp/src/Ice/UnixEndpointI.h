@@ -0,0 +1,120 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_UNIX_ENDPOINT_I_H
+#define ICE_UNIX_ENDPOINT_I_H
+
+#include <IceUtil/Config.h>
+#include <Ice/EndpointI.h>
+#include <Ice/EndpointFactory.h>
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Network.h> // for ICE_HAS_UNIX_TRANSPORT
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+namespace IceInternal
+{
+
+//
+// The Unix domain socket endpoint. The endpoint path is the file system
+// path of the socket, which the acceptor creates with the permissions
+// given by the optional --mode option. The mode only applies to the local
+// acceptor: it isn't marshaled and the endpoints which only differ by
+// their mode are equal.
+//
+class UnixEndpointI : public EndpointI
+#ifdef ICE_CPP11_MAPPING
+                    , public std::enable_shared_from_this<UnixEndpointI>
+#endif
+{
+public:
+
+    UnixEndpointI(const ProtocolInstancePtr&, const std::string&, Ice::Int, Ice::Int, const std::string&, bool);
+    UnixEndpointI(const ProtocolInstancePtr&);
+    UnixEndpointI(const ProtocolInstancePtr&, Ice::InputStream*);
+
+    virtual void streamWriteImpl(Ice::OutputStream*) const;
+
+    virtual Ice::EndpointInfoPtr getInfo() const ICE_NOEXCEPT;
+    virtual Ice::Short type() const;
+    virtual const std::string& protocol() const;
+    virtual Ice::Int timeout() const;
+    virtual EndpointIPtr timeout(Ice::Int) const;
+    virtual const std::string& connectionId() const;
+    virtual EndpointIPtr connectionId(const std::string&) const;
+    virtual bool compress() const;
+    virtual EndpointIPtr compress(bool) const;
+    virtual bool datagram() const;
+    virtual bool secure() const;
+
+    virtual TransceiverPtr transceiver() const;
+    virtual void connectors_async(Ice::EndpointSelectionType, const EndpointI_connectorsPtr&) const;
+    virtual AcceptorPtr acceptor(const std::string&) const;
+    virtual std::vector<EndpointIPtr> expandIfWildcard() const;
+    virtual std::vector<EndpointIPtr> expandHost(EndpointIPtr&) const;
+    virtual bool equivalent(const EndpointIPtr&) const;
+
+#ifdef ICE_CPP11_MAPPING
+    virtual bool operator==(const Ice::Endpoint&) const;
+    virtual bool operator<(const Ice::Endpoint&) const;
+#else
+    virtual bool operator==(const Ice::LocalObject&) const;
+    virtual bool operator<(const Ice::LocalObject&) const;
+#endif
+
+    virtual Ice::Int hash() const;
+    virtual std::string options() const;
+
+    void initWithOptions(std::vector<std::string>&);
+
+protected:
+
+    virtual bool checkOption(const std::string&, const std::string&, const std::string&);
+
+private:
+
+    void hashInit();
+
+    //
+    // All members are const, because endpoints are immutable.
+    //
+    const ProtocolInstancePtr _instance;
+    const std::string _path;
+    const Ice::Int _mode;
+    const Ice::Int _timeout;
+    const std::string _connectionId;
+    const bool _compress;
+    const Ice::Int _hashValue;
+};
+
+class UnixEndpointFactory : public EndpointFactory
+{
+public:
+
+    UnixEndpointFactory(const ProtocolInstancePtr&);
+    virtual ~UnixEndpointFactory();
+
+    virtual Ice::Short type() const;
+    virtual std::string protocol() const;
+    virtual EndpointIPtr create(std::vector<std::string>&, bool) const;
+    virtual EndpointIPtr read(Ice::InputStream*) const;
+    virtual void destroy();
+
+    virtual EndpointFactoryPtr clone(const ProtocolInstancePtr&) const;
+
+private:
+
+    ProtocolInstancePtr _instance;
+};
+
+}
+
+#endif
+
+#endif
@@ -0,0 +1,126 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#include <Ice/UnixTransceiver.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+#include <Ice/Connection.h>
+#include <Ice/ProtocolInstance.h>
+#include <Ice/LoggerUtil.h>
+#include <Ice/Buffer.h>
+#include <Ice/LocalException.h>
+
+using namespace std;
+using namespace Ice;
+using namespace IceInternal;
+
+NativeInfoPtr
+IceInternal::UnixTransceiver::getNativeInfo()
+{
+    return _stream;
+}
+
+SocketOperation
+IceInternal::UnixTransceiver::initialize(Buffer& readBuffer, Buffer& writeBuffer)
+{
+    return _stream->connect(readBuffer, writeBuffer);
+}
+
+SocketOperation
+IceInternal::UnixTransceiver::closing(bool initiator, const Ice::LocalException&)
+{
+    // If we are initiating the connection closure, wait for the peer
+    // to close the connection. Otherwise, close immediately.
+    return initiator ? SocketOperationRead : SocketOperationNone;
+}
+
+void
+IceInternal::UnixTransceiver::close()
+{
+    _stream->close();
+}
+
+SocketOperation
+IceInternal::UnixTransceiver::write(Buffer& buf)
+{
+    return _stream->write(buf);
+}
+
+SocketOperation
+IceInternal::UnixTransceiver::read(Buffer& buf)
+{
+    return _stream->read(buf);
+}
+
+string
+IceInternal::UnixTransceiver::protocol() const
+{
+    return _instance->protocol();
+}
+
+string
+IceInternal::UnixTransceiver::toString() const
+{
+    return _stream->toString();
+}
+
+string
+IceInternal::UnixTransceiver::toDetailedString() const
+{
+    return toString();
+}
+
+Ice::ConnectionInfoPtr
+IceInternal::UnixTransceiver::getInfo() const
+{
+    UnixConnectionInfoPtr info = ICE_MAKE_SHARED(UnixConnectionInfo);
+    if(_stream->fd() != INVALID_SOCKET)
+    {
+        //
+        // Only the listening side of the connection is bound to a path,
+        // the local address for outgoing connections and the remote
+        // address for incoming connections are unnamed.
+        //
+        Address addr;
+        fdToLocalAddress(_stream->fd(), addr);
+        info->path = inetAddrToString(addr);
+        if(info->path.empty() && fdToRemoteAddress(_stream->fd(), addr))
+        {
+            info->path = inetAddrToString(addr);
+        }
+
+        info->rcvSize = getRecvBufferSize(_stream->fd());
+        info->sndSize = getSendBufferSize(_stream->fd());
+    }
+    return info;
+}
+
+void
+IceInternal::UnixTransceiver::checkSendSize(const Buffer&)
+{
+}
+
+void
+IceInternal::UnixTransceiver::setBufferSize(int rcvSize, int sndSize)
+{
+    _stream->setBufferSize(rcvSize, sndSize);
+}
+
+IceInternal::UnixTransceiver::UnixTransceiver(const ProtocolInstancePtr& instance, const StreamSocketPtr& stream) :
+    _instance(instance),
+    _stream(stream)
+{
+}
+
+IceInternal::UnixTransceiver::~UnixTransceiver()
+{
+}
+
+#endif
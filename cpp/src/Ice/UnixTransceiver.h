@@ -0,0 +1,61 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICE_UNIX_TRANSCEIVER_H
+#define ICE_UNIX_TRANSCEIVER_H
+
+#include <Ice/ProtocolInstanceF.h>
+#include <Ice/Transceiver.h>
+#include <Ice/Network.h>
+#include <Ice/StreamSocket.h>
+
+#ifdef ICE_HAS_UNIX_TRANSPORT
+
+namespace IceInternal
+{
+
+class UnixConnector;
+class UnixAcceptor;
+
+class UnixTransceiver : public Transceiver
+{
+public:
+
+    virtual NativeInfoPtr getNativeInfo();
+
+    virtual SocketOperation initialize(Buffer&, Buffer&);
+    virtual SocketOperation closing(bool, const Ice::LocalException&);
+
+    virtual void close();
+    virtual SocketOperation write(Buffer&);
+    virtual SocketOperation read(Buffer&);
+    virtual std::string protocol() const;
+    virtual std::string toString() const;
+    virtual std::string toDetailedString() const;
+    virtual Ice::ConnectionInfoPtr getInfo() const;
+    virtual void checkSendSize(const Buffer&);
+    virtual void setBufferSize(int rcvSize, int sndSize);
+
+private:
+
+    UnixTransceiver(const ProtocolInstancePtr&, const StreamSocketPtr&);
+    virtual ~UnixTransceiver();
+
+    friend class UnixConnector;
+    friend class UnixAcceptor;
+
+    const ProtocolInstancePtr _instance;
+    const StreamSocketPtr _stream;
+};
+
+}
+
+#endif
+
+#endif
@@ -1043,10 +1043,11 @@ Slice::Python::CodeVisitor::visitClassDefStart(const ClassDefPtr& p)
          //
         // Define each operation. The arguments to the IcePy.Operation constructor are:
         //
-        // 'opName', Mode, SendMode, AMD, Format, MetaData, (InParams), (OutParams), ReturnParam, (Exceptions)
+        // 'opName', Mode, SendMode, AMD, Format, MetaData, lambda: ((InParams), (OutParams), ReturnParam, (Exceptions))
         //
         // where InParams and OutParams are tuples of type descriptions, and Exceptions
-        // is a tuple of exception type ids.
+        // is a tuple of exception type ids. IcePy only calls the lambda and creates the
+        // operation when it's first invoked or dispatched.
         //
         if(!ops.empty())
         {
@@ -1076,7 +1077,7 @@ Slice::Python::CodeVisitor::visitClassDefStart(const ClassDefPtr& p)
                 << ((p->hasMetaData("amd") || (*s)->hasMetaData("amd")) ? "True" : "False") << ", "
                 << format << ", ";
             writeMetaData((*s)->getMetaData());
-            _out << ", (";
+            _out << ", lambda: ((";
             for(t = params.begin(), count = 0; t != params.end(); ++t)
             {
                 if(!(*t)->isOutParam())
@@ -1152,7 +1153,7 @@ Slice::Python::CodeVisitor::visitClassDefStart(const ClassDefPtr& p)
             {
                 _out << ',';
             }
-            _out << "))";
+            _out << ")))";
 
             string deprecateMetadata;
             if((*s)->findMetaData("deprecate", deprecateMetadata) || p->findMetaData("deprecate", deprecateMetadata))
@@ -3205,10 +3206,37 @@ Slice::Python::MetaDataVisitor::visitStructStart(const StructPtr& p)
 void
 Slice::Python::MetaDataVisitor::visitOperation(const OperationPtr& p)
 {
+    //
+    // The python:maxConcurrency metadata applies to the operation itself and requires
+    // a positive integer.
+    //
+    static const string maxConcurrency = "python:maxConcurrency:";
+    StringList metaData = p->getMetaData();
+    StringList returnMetaData;
+    for(StringList::const_iterator q = metaData.begin(); q != metaData.end();)
+    {
+        string s = *q++;
+        if(s.find(maxConcurrency) == 0)
+        {
+            string arg = s.substr(maxConcurrency.size());
+            if(arg.empty() || arg.find_first_not_of("0123456789") != string::npos || atoi(arg.c_str()) <= 0)
+            {
+                p->definitionContext()->warning(InvalidMetaData, p->file(), p->line(),
+                                                "ignoring invalid metadata `" + s + "'");
+                metaData.remove(s);
+            }
+        }
+        else
+        {
+            returnMetaData.push_back(s);
+        }
+    }
+    p->setMetaData(metaData);
+
     TypePtr ret = p->returnType();
     if(ret)
     {
-        validateSequence(p->file(), p->line(), ret, p->getMetaData());
+        validateSequence(p->file(), p->line(), ret, returnMetaData);
     }
 
     ParamDeclList params = p->parameters();
@@ -6,7 +6,7 @@
 // ICE_LICENSE file included in this distribution.
 //
 // **********************************************************************
-// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Apr 30 21:00:34 2018
+// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Oct 19 12:06:44 2026
 
 // IMPORTANT: Do not edit this file -- any edits made here will be lost!
 
@@ -67,6 +67,9 @@ public final class PropertyNames
         new Property("Ice\\.Admin\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("Ice\\.Admin\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("Ice\\.Admin\\.MessageSizeMax", false, null),
+        new Property("Ice\\.Admin\\.Python\\.MaxConcurrency", false, null),
+        new Property("Ice\\.Admin\\.Python\\.MaxQueued", false, null),
+        new Property("Ice\\.Admin\\.Python\\.RejectException", false, null),
         new Property("Ice\\.Admin\\.DelayCreation", false, null),
         new Property("Ice\\.Admin\\.Enabled", false, null),
         new Property("Ice\\.Admin\\.Facets", false, null),
@@ -145,8 +148,19 @@ public final class PropertyNames
         new Property("Ice\\.PrintProcessId", false, null),
         new Property("Ice\\.PrintStackTraces", false, null),
         new Property("Ice\\.ProgramName", false, null),
+        new Property("Ice\\.Python\\.AdaptivePerRequest", false, null),
+        new Property("Ice\\.Python\\.AdmissionFacet", false, null),
+        new Property("Ice\\.Python\\.AsyncLogger", false, null),
+        new Property("Ice\\.Python\\.AsyncLogger\\.QueueSize", false, null),
+        new Property("Ice\\.Python\\.CheckedCastCacheTimeout", false, null),
+        new Property("Ice\\.Python\\.Collocation", false, null),
+        new Property("Ice\\.Python\\.MetricsFacet", false, null),
+        new Property("Ice\\.Python\\.Observer\\.SampleRate", false, null),
+        new Property("Ice\\.Python\\.Processes", false, null),
+        new Property("Ice\\.Python\\.ProxyInternSize", false, null),
         new Property("Ice\\.RetryIntervals", false, null),
         new Property("Ice\\.ServerIdleTime", false, null),
+        new Property("Ice\\.SHM\\.BufferSize", false, null),
         new Property("Ice\\.SOCKSProxyHost", false, null),
         new Property("Ice\\.SOCKSProxyPort", false, null),
         new Property("Ice\\.StdErr", false, null),
@@ -180,6 +194,7 @@ public final class PropertyNames
         new Property("Ice\\.UDP\\.SndSize", false, null),
         new Property("Ice\\.TCP\\.Backlog", false, null),
         new Property("Ice\\.TCP\\.RcvSize", false, null),
+        new Property("Ice\\.TCP\\.ReusePort", false, null),
         new Property("Ice\\.TCP\\.SndSize", false, null),
         new Property("Ice\\.UseApplicationClassLoader", false, null),
         new Property("Ice\\.UseSyslog", false, null),
@@ -246,6 +261,9 @@ public final class PropertyNames
         new Property("IceDiscovery\\.Multicast\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceDiscovery\\.Multicast\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceDiscovery\\.Multicast\\.MessageSizeMax", false, null),
+        new Property("IceDiscovery\\.Multicast\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceDiscovery\\.Multicast\\.Python\\.MaxQueued", false, null),
+        new Property("IceDiscovery\\.Multicast\\.Python\\.RejectException", false, null),
         new Property("IceDiscovery\\.Reply\\.ACM\\.Timeout", false, null),
         new Property("IceDiscovery\\.Reply\\.ACM\\.Heartbeat", false, null),
         new Property("IceDiscovery\\.Reply\\.ACM\\.Close", false, null),
@@ -283,6 +301,9 @@ public final class PropertyNames
         new Property("IceDiscovery\\.Reply\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceDiscovery\\.Reply\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceDiscovery\\.Reply\\.MessageSizeMax", false, null),
+        new Property("IceDiscovery\\.Reply\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceDiscovery\\.Reply\\.Python\\.MaxQueued", false, null),
+        new Property("IceDiscovery\\.Reply\\.Python\\.RejectException", false, null),
         new Property("IceDiscovery\\.Locator\\.ACM\\.Timeout", false, null),
         new Property("IceDiscovery\\.Locator\\.ACM\\.Heartbeat", false, null),
         new Property("IceDiscovery\\.Locator\\.ACM\\.Close", false, null),
@@ -320,6 +341,9 @@ public final class PropertyNames
         new Property("IceDiscovery\\.Locator\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceDiscovery\\.Locator\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceDiscovery\\.Locator\\.MessageSizeMax", false, null),
+        new Property("IceDiscovery\\.Locator\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceDiscovery\\.Locator\\.Python\\.MaxQueued", false, null),
+        new Property("IceDiscovery\\.Locator\\.Python\\.RejectException", false, null),
         new Property("IceDiscovery\\.Lookup", false, null),
         new Property("IceDiscovery\\.Timeout", false, null),
         new Property("IceDiscovery\\.RetryCount", false, null),
@@ -370,6 +394,9 @@ public final class PropertyNames
         new Property("IceLocatorDiscovery\\.Reply\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceLocatorDiscovery\\.Reply\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceLocatorDiscovery\\.Reply\\.MessageSizeMax", false, null),
+        new Property("IceLocatorDiscovery\\.Reply\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceLocatorDiscovery\\.Reply\\.Python\\.MaxQueued", false, null),
+        new Property("IceLocatorDiscovery\\.Reply\\.Python\\.RejectException", false, null),
         new Property("IceLocatorDiscovery\\.Locator\\.ACM\\.Timeout", false, null),
         new Property("IceLocatorDiscovery\\.Locator\\.ACM\\.Heartbeat", false, null),
         new Property("IceLocatorDiscovery\\.Locator\\.ACM\\.Close", false, null),
@@ -407,6 +434,9 @@ public final class PropertyNames
         new Property("IceLocatorDiscovery\\.Locator\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceLocatorDiscovery\\.Locator\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceLocatorDiscovery\\.Locator\\.MessageSizeMax", false, null),
+        new Property("IceLocatorDiscovery\\.Locator\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceLocatorDiscovery\\.Locator\\.Python\\.MaxQueued", false, null),
+        new Property("IceLocatorDiscovery\\.Locator\\.Python\\.RejectException", false, null),
         new Property("IceLocatorDiscovery\\.Lookup", false, null),
         new Property("IceLocatorDiscovery\\.Timeout", false, null),
         new Property("IceLocatorDiscovery\\.RetryCount", false, null),
@@ -495,6 +525,9 @@ public final class PropertyNames
         new Property("IceBridge\\.Source\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceBridge\\.Source\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceBridge\\.Source\\.MessageSizeMax", false, null),
+        new Property("IceBridge\\.Source\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceBridge\\.Source\\.Python\\.MaxQueued", false, null),
+        new Property("IceBridge\\.Source\\.Python\\.RejectException", false, null),
         new Property("IceBridge\\.Target\\.Endpoints", false, null),
         new Property("IceBridge\\.InstanceName", false, null),
         null
@@ -547,6 +580,9 @@ public final class PropertyNames
         new Property("IceGridAdmin\\.Server\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGridAdmin\\.Server\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGridAdmin\\.Server\\.MessageSizeMax", false, null),
+        new Property("IceGridAdmin\\.Server\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGridAdmin\\.Server\\.Python\\.MaxQueued", false, null),
+        new Property("IceGridAdmin\\.Server\\.Python\\.RejectException", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Address", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Interface", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Lookup", false, null),
@@ -587,6 +623,9 @@ public final class PropertyNames
         new Property("IceGridAdmin\\.Discovery\\.Reply\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Reply\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Reply\\.MessageSizeMax", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Reply\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Reply\\.Python\\.MaxQueued", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Reply\\.Python\\.RejectException", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.ACM\\.Timeout", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.ACM\\.Heartbeat", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.ACM\\.Close", false, null),
@@ -624,6 +663,9 @@ public final class PropertyNames
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGridAdmin\\.Discovery\\.Locator\\.MessageSizeMax", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Locator\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Locator\\.Python\\.MaxQueued", false, null),
+        new Property("IceGridAdmin\\.Discovery\\.Locator\\.Python\\.RejectException", false, null),
         new Property("IceGridAdmin\\.Trace\\.Observers", false, null),
         new Property("IceGridAdmin\\.Trace\\.SaveToRegistry", false, null),
         null
@@ -668,6 +710,9 @@ public final class PropertyNames
         new Property("IceGrid\\.AdminRouter\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.AdminRouter\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.AdminRouter\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.AdminRouter\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.AdminRouter\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.AdminRouter\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.InstanceName", false, null),
         new Property("IceGrid\\.Node\\.ACM\\.Timeout", false, null),
         new Property("IceGrid\\.Node\\.ACM\\.Heartbeat", false, null),
@@ -706,6 +751,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Node\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Node\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Node\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Node\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Node\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Node\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Node\\.AllowRunningServersAsRoot", false, null),
         new Property("IceGrid\\.Node\\.AllowEndpointsOverride", false, null),
         new Property("IceGrid\\.Node\\.CollocateRegistry", false, null),
@@ -784,6 +832,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.AdminSessionManager\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.AdminSessionManager\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.AdminSessionManager\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.AdminSessionManager\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.AdminSessionManager\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.AdminSessionManager\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.AdminSSLPermissionsVerifier\\.EndpointSelection", false, null),
         new Property("IceGrid\\.Registry\\.AdminSSLPermissionsVerifier\\.ConnectionCached", false, null),
         new Property("IceGrid\\.Registry\\.AdminSSLPermissionsVerifier\\.PreferSecure", false, null),
@@ -831,6 +882,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.Client\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.Client\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.Client\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.Client\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.Client\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.Client\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.CryptPasswords", false, null),
         new Property("IceGrid\\.Registry\\.DefaultTemplates", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.ACM\\.Timeout", false, null),
@@ -870,6 +924,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.Discovery\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.Discovery\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.Discovery\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.Discovery\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.Enabled", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.Address", false, null),
         new Property("IceGrid\\.Registry\\.Discovery\\.Port", false, null),
@@ -912,6 +969,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.Internal\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.Internal\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.Internal\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.Internal\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.Internal\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.Internal\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.LMDB\\.MapSize", false, null),
         new Property("IceGrid\\.Registry\\.LMDB\\.Path", false, null),
         new Property("IceGrid\\.Registry\\.NodeSessionTimeout", false, null),
@@ -966,6 +1026,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.Server\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.Server\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.Server\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.Server\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.Server\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.Server\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.SessionFilters", false, null),
         new Property("IceGrid\\.Registry\\.SessionManager\\.ACM\\.Timeout", false, null),
         new Property("IceGrid\\.Registry\\.SessionManager\\.ACM\\.Heartbeat", false, null),
@@ -1004,6 +1067,9 @@ public final class PropertyNames
         new Property("IceGrid\\.Registry\\.SessionManager\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IceGrid\\.Registry\\.SessionManager\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IceGrid\\.Registry\\.SessionManager\\.MessageSizeMax", false, null),
+        new Property("IceGrid\\.Registry\\.SessionManager\\.Python\\.MaxConcurrency", false, null),
+        new Property("IceGrid\\.Registry\\.SessionManager\\.Python\\.MaxQueued", false, null),
+        new Property("IceGrid\\.Registry\\.SessionManager\\.Python\\.RejectException", false, null),
         new Property("IceGrid\\.Registry\\.SessionTimeout", false, null),
         new Property("IceGrid\\.Registry\\.SSLPermissionsVerifier\\.EndpointSelection", false, null),
         new Property("IceGrid\\.Registry\\.SSLPermissionsVerifier\\.ConnectionCached", false, null),
@@ -1072,6 +1138,9 @@ public final class PropertyNames
         new Property("IcePatch2\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("IcePatch2\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("IcePatch2\\.MessageSizeMax", false, null),
+        new Property("IcePatch2\\.Python\\.MaxConcurrency", false, null),
+        new Property("IcePatch2\\.Python\\.MaxQueued", false, null),
+        new Property("IcePatch2\\.Python\\.RejectException", false, null),
         new Property("IcePatch2\\.Directory", false, null),
         new Property("IcePatch2\\.InstanceName", false, null),
         null
@@ -1190,6 +1259,9 @@ public final class PropertyNames
         new Property("Glacier2\\.Client\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("Glacier2\\.Client\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("Glacier2\\.Client\\.MessageSizeMax", false, null),
+        new Property("Glacier2\\.Client\\.Python\\.MaxConcurrency", false, null),
+        new Property("Glacier2\\.Client\\.Python\\.MaxQueued", false, null),
+        new Property("Glacier2\\.Client\\.Python\\.RejectException", false, null),
         new Property("Glacier2\\.Client\\.AlwaysBatch", false, null),
         new Property("Glacier2\\.Client\\.Buffered", false, null),
         new Property("Glacier2\\.Client\\.ForwardContext", false, null),
@@ -1265,6 +1337,9 @@ public final class PropertyNames
         new Property("Glacier2\\.Server\\.ThreadPool\\.ThreadIdleTime", false, null),
         new Property("Glacier2\\.Server\\.ThreadPool\\.ThreadPriority", false, null),
         new Property("Glacier2\\.Server\\.MessageSizeMax", false, null),
+        new Property("Glacier2\\.Server\\.Python\\.MaxConcurrency", false, null),
+        new Property("Glacier2\\.Server\\.Python\\.MaxQueued", false, null),
+        new Property("Glacier2\\.Server\\.Python\\.RejectException", false, null),
         new Property("Glacier2\\.Server\\.AlwaysBatch", false, null),
         new Property("Glacier2\\.Server\\.Buffered", false, null),
         new Property("Glacier2\\.Server\\.ForwardContext", false, null),
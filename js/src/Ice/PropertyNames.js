@@ -6,7 +6,7 @@
 // ICE_LICENSE file included in this distribution.
 //
 // **********************************************************************
-// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Apr 30 21:00:34 2018
+// Generated by makeprops.py from file ./config/PropertyNames.xml, Mon Oct 19 12:06:44 2026
 
 // IMPORTANT: Do not edit this file -- any edits made here will be lost!
 
@@ -70,6 +70,9 @@ PropertyNames.IceProps =
     new Property("/^Ice\.Admin\.ThreadPool\.ThreadIdleTime/", false, null),
     new Property("/^Ice\.Admin\.ThreadPool\.ThreadPriority/", false, null),
     new Property("/^Ice\.Admin\.MessageSizeMax/", false, null),
+    new Property("/^Ice\.Admin\.Python\.MaxConcurrency/", false, null),
+    new Property("/^Ice\.Admin\.Python\.MaxQueued/", false, null),
+    new Property("/^Ice\.Admin\.Python\.RejectException/", false, null),
     new Property("/^Ice\.Admin\.DelayCreation/", false, null),
     new Property("/^Ice\.Admin\.Enabled/", false, null),
     new Property("/^Ice\.Admin\.Facets/", false, null),
@@ -148,8 +151,19 @@ PropertyNames.IceProps =
     new Property("/^Ice\.PrintProcessId/", false, null),
     new Property("/^Ice\.PrintStackTraces/", false, null),
     new Property("/^Ice\.ProgramName/", false, null),
+    new Property("/^Ice\.Python\.AdaptivePerRequest/", false, null),
+    new Property("/^Ice\.Python\.AdmissionFacet/", false, null),
+    new Property("/^Ice\.Python\.AsyncLogger/", false, null),
+    new Property("/^Ice\.Python\.AsyncLogger\.QueueSize/", false, null),
+    new Property("/^Ice\.Python\.CheckedCastCacheTimeout/", false, null),
+    new Property("/^Ice\.Python\.Collocation/", false, null),
+    new Property("/^Ice\.Python\.MetricsFacet/", false, null),
+    new Property("/^Ice\.Python\.Observer\.SampleRate/", false, null),
+    new Property("/^Ice\.Python\.Processes/", false, null),
+    new Property("/^Ice\.Python\.ProxyInternSize/", false, null),
     new Property("/^Ice\.RetryIntervals/", false, null),
     new Property("/^Ice\.ServerIdleTime/", false, null),
+    new Property("/^Ice\.SHM\.BufferSize/", false, null),
     new Property("/^Ice\.SOCKSProxyHost/", false, null),
     new Property("/^Ice\.SOCKSProxyPort/", false, null),
     new Property("/^Ice\.StdErr/", false, null),
@@ -183,6 +197,7 @@ PropertyNames.IceProps =
     new Property("/^Ice\.UDP\.SndSize/", false, null),
     new Property("/^Ice\.TCP\.Backlog/", false, null),
     new Property("/^Ice\.TCP\.RcvSize/", false, null),
+    new Property("/^Ice\.TCP\.ReusePort/", false, null),
     new Property("/^Ice\.TCP\.SndSize/", false, null),
     new Property("/^Ice\.UseApplicationClassLoader/", false, null),
     new Property("/^Ice\.UseSyslog/", false, null),
@@ -0,0 +1,17 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Bench
+
+class CoroPerfI(Bench.AMDPerf):
+    async def ping(self, current=None):
+        pass
+
+    async def opByteSeq(self, s, current=None):
+        return s
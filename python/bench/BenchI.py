@@ -0,0 +1,105 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import sys, Ice, Bench
+
+class PerfI(Bench.Perf):
+    def ping(self, current=None):
+        pass
+
+    def opByteSeq(self, s, current=None):
+        return s
+
+    def opDoubleSeq(self, s, current=None):
+        return s
+
+    def opPointSeq(self, s, current=None):
+        return s
+
+    def opPointDict(self, d, current=None):
+        return d
+
+    def opNode(self, n, current=None):
+        return n
+
+    def shutdown(self, current=None):
+        current.adapter.getCommunicator().shutdown()
+
+class AMDPerfI(Bench.AMDPerf):
+    def ping(self, current=None):
+        return Ice.Future.completed(None)
+
+    def opByteSeq(self, s, current=None):
+        return Ice.Future.completed(s)
+
+#
+# The methods of an identity servant receive the name and category of the target
+# identity instead of Ice.Current, see ObjectAdapter.addDefaultIdentityServant.
+#
+class IdentityPerfI(Bench.Perf):
+    def ping(self, name, category):
+        pass
+
+    def opByteSeq(self, name, category, s):
+        return s
+
+    def opDoubleSeq(self, name, category, s):
+        return s
+
+    def opPointSeq(self, name, category, s):
+        return s
+
+    def opPointDict(self, name, category, d):
+        return d
+
+    def opNode(self, name, category, n):
+        return n
+
+    def shutdown(self, name, category):
+        pass
+
+#
+# Returns the same servant for every identity of its category, to compare with
+# the default servants.
+#
+class ServantLocatorI(Ice.ServantLocator):
+    def __init__(self):
+        self._servant = PerfI()
+
+    def locate(self, current):
+        return (self._servant, None)
+
+    def finished(self, current, servant, cookie):
+        pass
+
+    def deactivate(self, category):
+        pass
+
+#
+# Echoes the in parameters, which is a valid reply for the operations that return
+# their argument.
+#
+class BlobjectI(Ice.Blobject):
+    def ice_invoke(self, inParams, current=None):
+        return (True, inParams)
+
+def addServants(adapter):
+    adapter.add(PerfI(), Ice.stringToIdentity("perf"))
+    adapter.add(AMDPerfI(), Ice.stringToIdentity("amd"))
+    adapter.add(BlobjectI(), Ice.stringToIdentity("blobject"))
+    adapter.addDefaultServant(PerfI(), "default")
+    adapter.addDefaultIdentityServant(IdentityPerfI(), "identity")
+    adapter.addServantLocator(ServantLocatorI(), "locator")
+
+    #
+    # Older versions of Python cannot load a source file that uses the async/await keywords.
+    #
+    if sys.version_info >= (3, 5):
+        import BenchCoroI
+        adapter.add(BenchCoroI.CoroPerfI(), Ice.stringToIdentity("coroutine"))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback, argparse, json, platform, subprocess, time
+import Ice
+
+Ice.loadSlice(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Bench.ice"))
+import Bench, BenchI
+
+clock = getattr(time, "perf_counter", time.time)
+
+def measure(fn, iterations, size=0, done=None):
+    for i in range(max(iterations // 10, 1)): # Warm up
+        fn()
+    if done:
+        done()
+
+    start = clock()
+    for i in range(iterations):
+        fn()
+    if done:
+        done()
+    seconds = clock() - start
+
+    result = {
+        "iterations": iterations,
+        "seconds": seconds,
+        "usPerOp": seconds * 1000000.0 / iterations,
+        "opsPerSec": iterations / seconds if seconds > 0 else 0.0
+    }
+    if size:
+        result["MBPerSec"] = size * iterations / seconds / (1024.0 * 1024.0) if seconds > 0 else 0.0
+    return result
+
+def createNode(depth):
+    node = Bench.Node(depth)
+    if depth > 1:
+        node.left = createNode(depth - 1)
+        node.right = createNode(depth - 1)
+    return node
+
+def benchmarks(proxy, iterations):
+    '''Returns the benchmarks as (name, function) tuples. The function runs the benchmark with the
+proxies returned by proxy(identity).'''
+    perf = Bench.PerfPrx.uncheckedCast(proxy("perf"))
+    amd = Bench.AMDPerfPrx.uncheckedCast(proxy("amd"))
+    blobject = Bench.PerfPrx.uncheckedCast(proxy("blobject"))
+    default = Bench.PerfPrx.uncheckedCast(proxy("default/perf"))
+    identity = Bench.PerfPrx.uncheckedCast(proxy("identity/perf"))
+    locator = Bench.PerfPrx.uncheckedCast(proxy("locator/perf"))
+    oneway = perf.ice_oneway()
+    batch = perf.ice_batchOneway()
+    pool = perf.ice_connectionPool(4)
+
+    large = iterations // 10 or 1
+    byteSeq = bytes(bytearray(100 * 1024))
+    largeByteSeq = bytes(bytearray(4 * 1024 * 1024))
+    doubleSeq = [float(i) for i in range(100 * 1024 // 8)]
+    pointSeq = [Bench.Point(float(i), float(i), "point") for i in range(1000)]
+    pointDict = dict(("point" + str(i), Bench.Point(float(i), float(i), "point")) for i in range(1000))
+    node = createNode(7)
+    communicator = perf.ice_getCommunicator()
+    perfStr = communicator.proxyToString(perf)
+    ctx = {"key": "value"}
+
+    def concurrentByteSeq(p):
+        for f in [p.opByteSeqAsync(byteSeq) for i in range(8)]:
+            f.result()
+
+    def flushBatch():
+        batch.ice_flushBatchRequests()
+        perf.ice_ping()
+
+    def batchPing():
+        batch.ping()
+        batchPing.count += 1
+        if batchPing.count % 100 == 0:
+            batch.ice_flushBatchRequests()
+    batchPing.count = 0
+
+    result = [
+        ("twoway", lambda: measure(perf.ping, iterations)),
+        ("oneway", lambda: measure(oneway.ping, iterations, done=perf.ice_ping)),
+        ("batchOneway", lambda: measure(batchPing, iterations, done=flushBatch)),
+        ("byteSeq", lambda: measure(lambda: perf.opByteSeq(byteSeq), large, 2 * len(byteSeq))),
+        ("largeByteSeq", lambda: measure(lambda: perf.opByteSeq(largeByteSeq), iterations // 100 or 1,
+                                         2 * len(largeByteSeq))),
+        ("doubleSeq", lambda: measure(lambda: perf.opDoubleSeq(doubleSeq), large, 2 * 8 * len(doubleSeq))),
+        ("pointSeq", lambda: measure(lambda: perf.opPointSeq(pointSeq), large)),
+        ("pointDict", lambda: measure(lambda: perf.opPointDict(pointDict), large)),
+        ("classGraph", lambda: measure(lambda: perf.opNode(node), large)),
+        ("amd", lambda: measure(amd.ping, iterations)),
+        ("amdByteSeq", lambda: measure(lambda: amd.opByteSeq(byteSeq), large, 2 * len(byteSeq))),
+        ("blobject", lambda: measure(blobject.ping, iterations)),
+        ("blobjectByteSeq", lambda: measure(lambda: blobject.opByteSeq(byteSeq), large, 2 * len(byteSeq))),
+        ("defaultServant", lambda: measure(default.ping, iterations)),
+        ("defaultIdentityServant", lambda: measure(identity.ping, iterations)),
+        ("servantLocator", lambda: measure(locator.ping, iterations)),
+        ("derivedProxy", lambda: measure(lambda: perf.ice_oneway().ice_timeout(1000).ice_context(ctx), iterations)),
+        ("derivedOneway", lambda: measure(lambda: perf.ice_oneway().ping(), iterations, done=perf.ice_ping)),
+        ("stringToProxy", lambda: measure(lambda: communicator.stringToProxy(perfStr), iterations)),
+        ("checkedCast", lambda: measure(lambda: Bench.PerfPrx.checkedCast(perf), iterations)),
+        ("concurrentByteSeq", lambda: measure(lambda: concurrentByteSeq(perf), large, 16 * len(byteSeq))),
+        ("pooledByteSeq", lambda: measure(lambda: concurrentByteSeq(pool), large, 16 * len(byteSeq))),
+    ]
+
+    if sys.version_info >= (3, 5):
+        coroutine = Bench.AMDPerfPrx.uncheckedCast(proxy("coroutine"))
+        result += [
+            ("coroutine", lambda: measure(coroutine.ping, iterations)),
+            ("coroutineByteSeq", lambda: measure(lambda: coroutine.opByteSeq(byteSeq), large, 2 * len(byteSeq))),
+        ]
+
+    return result
+
+def runBenchmarks(proxy, args):
+    results = {}
+    for (name, fn) in benchmarks(proxy, args.iterations):
+        if args.filter and args.filter not in name:
+            continue
+        sys.stderr.write("  {0}... ".format(name))
+        sys.stderr.flush()
+        results[name] = fn()
+        sys.stderr.write("{0:.1f} us/op\n".format(results[name]["usPerOp"]))
+    return results
+
+def runCollocated(communicator, args):
+    #
+    # The adapter needs endpoints for the invocations on its default servants to be collocated.
+    #
+    communicator.getProperties().setProperty("BenchCollocated.Endpoints", "tcp -h 127.0.0.1")
+    adapter = communicator.createObjectAdapter("BenchCollocated")
+    BenchI.addServants(adapter)
+    try:
+        return runBenchmarks(lambda id: adapter.createProxy(Ice.stringToIdentity(id)), args)
+    finally:
+        adapter.destroy()
+
+def runLocalhost(communicator, args, endpoints):
+    server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Server.py"),
+                               "--Bench.Endpoints=" + endpoints])
+    perf = None
+    try:
+        perf = Bench.PerfPrx.uncheckedCast(communicator.stringToProxy("perf:" + endpoints))
+        start = time.time()
+        while True:
+            try:
+                perf.ice_ping()
+                break
+            except Ice.ConnectFailedException:
+                if time.time() - start > 10 or server.poll() is not None:
+                    raise
+                time.sleep(0.1)
+
+        return runBenchmarks(lambda id: communicator.stringToProxy("{0}:{1}".format(id, endpoints)), args)
+    finally:
+        try:
+            if perf:
+                perf.shutdown()
+            else:
+                server.terminate()
+        except Ice.LocalException:
+            server.terminate()
+        server.wait()
+
+def compareTransports(results):
+    '''Prints the speedup of the shared memory transport over TCP for each benchmark.'''
+    sys.stderr.write("shm compared to tcp:\n")
+    for (name, result) in sorted(results["shm"].items()):
+        tcp = results["localhost"].get(name)
+        if tcp:
+            sys.stderr.write("  {0}: {1:.1f} us/op, tcp {2:.1f} us/op (x{3:.2f})\n".format(
+                             name, result["usPerOp"], tcp["usPerOp"], tcp["usPerOp"] / result["usPerOp"]))
+
+def compare(results, baseline, threshold):
+    '''Prints the benchmarks slower than the baseline by more than threshold percent
+and returns their number.'''
+    regressions = 0
+    for (mode, benchmarks) in results["results"].items():
+        for (name, result) in benchmarks.items():
+            previous = baseline.get("results", {}).get(mode, {}).get(name)
+            if not previous:
+                continue
+            change = (result["usPerOp"] / previous["usPerOp"] - 1.0) * 100.0
+            if change > threshold:
+                regressions += 1
+                sys.stderr.write("regression: {0}/{1} {2:.1f} us/op, was {3:.1f} us/op (+{4:.1f}%)\n".format(
+                                 mode, name, result["usPerOp"], previous["usPerOp"], change))
+    return regressions
+
+def run(args, communicator):
+    parser = argparse.ArgumentParser(description="Benchmarks the Ice for Python mapping.")
+    parser.add_argument("--mode", choices=["all", "collocated", "localhost", "shm"], default="all",
+                        help="run the benchmarks with a collocated server, or a localhost server over TCP or " +
+                             "shared memory (default all)")
+    parser.add_argument("--iterations", type=int, default=1000,
+                        help="the number of invocations of the small payload benchmarks (default 1000)")
+    parser.add_argument("--filter", help="only run the benchmarks whose name contains FILTER")
+    parser.add_argument("--port", type=int, default=12030, help="the port of the localhost server (default 12030)")
+    parser.add_argument("--output", help="write the JSON results to OUTPUT instead of the standard output")
+    parser.add_argument("--baseline", help="compare the results with the JSON results in BASELINE")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="the slowdown in percent reported as a regression (default 10)")
+    args = parser.parse_args(args[1:])
+
+    results = {
+        "ice": Ice.stringVersion(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "results": {}
+    }
+
+    if args.mode in ["all", "collocated"]:
+        sys.stderr.write("collocated:\n")
+        results["results"]["collocated"] = runCollocated(communicator, args)
+    if args.mode in ["all", "localhost"]:
+        sys.stderr.write("localhost:\n")
+        endpoints = "tcp -h 127.0.0.1 -p {0}".format(args.port)
+        results["results"]["localhost"] = runLocalhost(communicator, args, endpoints)
+    if args.mode == "shm" or (args.mode == "all" and sys.platform != "win32"):
+        sys.stderr.write("shm:\n")
+        endpoints = "shm -name bench-{0}".format(args.port)
+        results["results"]["shm"] = runLocalhost(communicator, args, endpoints)
+    if "localhost" in results["results"] and "shm" in results["results"]:
+        compareTransports(results["results"])
+
+    output = json.dumps(results, indent=4, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            return compare(results, json.load(f), args.threshold) == 0
+    return True
+
+try:
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties(sys.argv)
+    initData.properties.setProperty("Ice.MessageSizeMax", "0")
+    with Ice.initialize(sys.argv, initData) as communicator:
+         status = run(sys.argv, communicator)
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
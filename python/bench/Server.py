@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback
+import Ice
+
+Ice.loadSlice(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Bench.ice"))
+import Bench, BenchI
+
+def run(args, communicator):
+    properties = communicator.getProperties()
+    properties.setProperty("BenchAdapter.Endpoints", properties.getPropertyWithDefault("Bench.Endpoints",
+                                                                                      "tcp -h 127.0.0.1 -p 12030"))
+    adapter = communicator.createObjectAdapter("BenchAdapter")
+    BenchI.addServants(adapter)
+    adapter.activate()
+    communicator.waitForShutdown()
+    return True
+
+try:
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties(sys.argv)
+    sys.argv = initData.properties.parseCommandLineOptions("Bench", sys.argv)
+    initData.properties.setProperty("Ice.MessageSizeMax", "0")
+    with Ice.initialize(sys.argv, initData) as communicator:
+         status = run(sys.argv, communicator)
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
@@ -14,6 +14,7 @@
 #include <Communicator.h>
 #include <BatchRequestInterceptor.h>
 #include <Dispatcher.h>
+#include <Instrumentation.h>
 #include <ImplicitContext.h>
 #include <Logger.h>
 #include <ObjectAdapter.h>
@@ -61,6 +62,15 @@ struct CommunicatorObject
     WaitForShutdownThreadPtr* shutdownThread;
     bool shutdown;
     DispatcherPtr* dispatcher;
+    CommunicatorObserverPtr* observer;
+    PyObject* proxies; // Proxies interned by stringToProxy, see Ice.Python.ProxyInternSize.
+    Py_ssize_t proxyInternSize;
+    CheckedCastCachePtr* checkedCastCache;
+    EndpointStatsRegistryPtr* endpointStats;
+    CollocatedAdaptersPtr* collocatedAdapters;
+    LoggerQueuePtr* loggerQueue; // See Ice.Python.AsyncLogger.
+    PyObject* properties; // Shared by the callers of getProperties, to share the property snapshots.
+    PyObject* implicitContext; // Shared by the callers of getImplicitContext, to share the context versions.
 };
 
 }
@@ -83,6 +93,15 @@ communicatorNew(PyTypeObject* type, PyObject* /*args*/, PyObject* /*kwds*/)
     self->shutdownThread = 0;
     self->shutdown = false;
     self->dispatcher = 0;
+    self->observer = 0;
+    self->proxies = 0;
+    self->proxyInternSize = 0;
+    self->checkedCastCache = 0;
+    self->endpointStats = 0;
+    self->collocatedAdapters = 0;
+    self->loggerQueue = 0;
+    self->properties = 0;
+    self->implicitContext = 0;
     return self;
 }
 
@@ -199,7 +218,9 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
     }
 
     Ice::InitializationData data;
+    LoggerQueuePtr loggerQueue;
     DispatcherPtr dispatcherWrapper;
+    CommunicatorObserverPtr observerWrapper;
 
     try
     {
@@ -212,6 +233,7 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
             PyObjectHandle threadStop = getAttr(initData, "threadStop", false);
             PyObjectHandle batchRequestInterceptor = getAttr(initData, "batchRequestInterceptor", false);
             PyObjectHandle dispatcher = getAttr(initData, "dispatcher", false);
+            PyObjectHandle observer = getAttr(initData, "observer", false);
 
             if(properties.get())
             {
@@ -239,6 +261,12 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
                 data.dispatcher = dispatcherWrapper;
             }
 
+            if(observer.get())
+            {
+                observerWrapper = new CommunicatorObserver(observer.get());
+                data.observer = observerWrapper;
+            }
+
             if(batchRequestInterceptor.get())
             {
                 data.batchRequestInterceptor = new BatchRequestInterceptor(batchRequestInterceptor.get());
@@ -264,6 +292,28 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
         {
             data.properties = Ice::createProperties(seq, data.properties);
         }
+
+        //
+        // With Ice.Python.AsyncLogger, the messages for a Python logger are queued and delivered
+        // by a separate thread. This applies to the process logger if the run time uses it.
+        //
+        if(data.properties->getPropertyAsInt("Ice.Python.AsyncLogger") > 0)
+        {
+            LoggerWrapperPtr wrapper = LoggerWrapperPtr::dynamicCast(data.logger);
+            if(!data.logger && data.properties->getProperty("Ice.LogFile").empty() &&
+               data.properties->getPropertyAsInt("Ice.UseSyslog") <= 0)
+            {
+                wrapper = LoggerWrapperPtr::dynamicCast(Ice::getProcessLogger());
+            }
+
+            if(wrapper)
+            {
+                int size = data.properties->getPropertyAsIntWithDefault("Ice.Python.AsyncLogger.QueueSize", 1024);
+                loggerQueue = new LoggerQueue(static_cast<size_t>(max(size, 1)));
+                loggerQueue->start();
+                data.logger = new AsyncLoggerWrapper(wrapper->getObject(), loggerQueue);
+            }
+        }
     }
     catch(const Ice::Exception& ex)
     {
@@ -307,6 +357,12 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
         }
         delete[] argv;
 
+        if(loggerQueue)
+        {
+            AllowThreads allowThreads;
+            loggerQueue->destroy();
+        }
+
         setPythonException(ex);
         return -1;
     }
@@ -333,6 +389,11 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
 
     self->communicator = new Ice::CommunicatorPtr(communicator);
 
+    if(loggerQueue)
+    {
+        self->loggerQueue = new LoggerQueuePtr(loggerQueue);
+    }
+
     CommunicatorMap::iterator p = _communicatorMap.find(communicator);
     if(p != _communicatorMap.end())
     {
@@ -346,6 +407,40 @@ communicatorInit(CommunicatorObject* self, PyObject* args, PyObject* /*kwds*/)
         dispatcherWrapper->setCommunicator(communicator);
     }
 
+    if(observerWrapper)
+    {
+        self->observer = new CommunicatorObserverPtr(observerWrapper);
+        observerWrapper->setCommunicator(communicator);
+    }
+
+    trackPropertiesUpdates(communicator);
+
+    int checkedCastCacheTimeout =
+        communicator->getProperties()->getPropertyAsInt("Ice.Python.CheckedCastCacheTimeout");
+    if(checkedCastCacheTimeout != 0)
+    {
+        self->checkedCastCache = new CheckedCastCachePtr(new CheckedCastCache(checkedCastCacheTimeout));
+    }
+
+    self->endpointStats = new EndpointStatsRegistryPtr(new EndpointStatsRegistry);
+
+    CollocatedAdaptersPtr collocatedAdapters =
+        createCollocatedAdapters(communicator, dispatcherWrapper != 0, observerWrapper != 0);
+    if(collocatedAdapters)
+    {
+        self->collocatedAdapters = new CollocatedAdaptersPtr(collocatedAdapters);
+    }
+
+    self->proxyInternSize = communicator->getProperties()->getPropertyAsInt("Ice.Python.ProxyInternSize");
+    if(self->proxyInternSize > 0)
+    {
+        self->proxies = PyDict_New();
+        if(!self->proxies)
+        {
+            return -1;
+        }
+    }
+
     return 0;
 }
 
@@ -371,9 +466,22 @@ communicatorDealloc(CommunicatorObject* self)
     {
         (*self->shutdownThread)->getThreadControl().join();
     }
+    if(self->loggerQueue)
+    {
+        AllowThreads allowThreads;
+        (*self->loggerQueue)->destroy();
+    }
     delete self->communicator;
     delete self->shutdownMonitor;
     delete self->shutdownThread;
+    delete self->observer;
+    delete self->checkedCastCache;
+    delete self->endpointStats;
+    delete self->collocatedAdapters;
+    delete self->loggerQueue;
+    Py_XDECREF(self->proxies);
+    Py_XDECREF(self->properties);
+    Py_XDECREF(self->implicitContext);
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -400,11 +508,53 @@ communicatorDestroy(CommunicatorObject* self)
 
     vfm->destroy();
 
+    if(self->loggerQueue)
+    {
+        //
+        // Deliver the messages logged until the communicator was destroyed. Later messages are
+        // delivered synchronously.
+        //
+        AllowThreads allowThreads;
+        (*self->loggerQueue)->destroy();
+    }
+
+    if(self->collocatedAdapters)
+    {
+        (*self->collocatedAdapters)->clear();
+    }
+
+    removeAdmissionControls(*self->communicator);
+
     if(self->dispatcher)
     {
         (*self->dispatcher)->setCommunicator(0); // Break cyclic reference.
     }
 
+    if(self->observer)
+    {
+        (*self->observer)->setCommunicator(0); // Break cyclic reference.
+    }
+
+    if(self->proxies)
+    {
+        PyDict_Clear(self->proxies);
+    }
+
+    if(self->checkedCastCache)
+    {
+        (*self->checkedCastCache)->clear();
+    }
+
+    if(self->endpointStats)
+    {
+        (*self->endpointStats)->clear();
+    }
+
+    if(self->implicitContext)
+    {
+        clearImplicitContext(self->implicitContext);
+    }
+
     //
     // Break cyclic reference between this object and its Python wrapper.
     //
@@ -567,6 +717,18 @@ communicatorStringToProxy(CommunicatorObject* self, PyObject* args)
         return 0;
     }
 
+    //
+    // Proxies are immutable so the proxies created from the same string can be shared.
+    //
+    if(self->proxies)
+    {
+        PyObject* interned = PyDict_GetItem(self->proxies, strObj); // Borrowed reference.
+        if(interned)
+        {
+            return incRef(interned);
+        }
+    }
+
     assert(self->communicator);
     Ice::ObjectPrx proxy;
     try
@@ -574,7 +736,19 @@ communicatorStringToProxy(CommunicatorObject* self, PyObject* args)
         proxy = (*self->communicator)->stringToProxy(str);
         if(proxy)
         {
-            return createProxy(proxy, *self->communicator);
+            PyObjectHandle p = createProxy(proxy, *self->communicator);
+            if(p.get() && self->proxies)
+            {
+                if(PyDict_Size(self->proxies) >= self->proxyInternSize)
+                {
+                    PyDict_Clear(self->proxies);
+                }
+                if(PyDict_SetItem(self->proxies, strObj, p.get()) < 0)
+                {
+                    return 0;
+                }
+            }
+            return p.release();
         }
     }
     catch(const Ice::Exception& ex)
@@ -1281,6 +1455,11 @@ static PyObject*
 communicatorGetProperties(CommunicatorObject* self)
 {
     assert(self->communicator);
+    if(self->properties)
+    {
+        return incRef(self->properties);
+    }
+
     Ice::PropertiesPtr properties;
     try
     {
@@ -1292,7 +1471,8 @@ communicatorGetProperties(CommunicatorObject* self)
         return 0;
     }
 
-    return createProperties(properties);
+    self->properties = createProperties(properties);
+    return self->properties ? incRef(self->properties) : 0;
 }
 
 #ifdef WIN32
@@ -1424,7 +1604,19 @@ communicatorGetImplicitContext(CommunicatorObject* self)
         return Py_None;
     }
 
-    return createImplicitContext(implicitContext);
+    if(!self->implicitContext)
+    {
+        bool perThread =
+            (*self->communicator)->getProperties()->getProperty("Ice.ImplicitContext") == "PerThread";
+        self->implicitContext = createImplicitContext(implicitContext, perThread);
+        if(!self->implicitContext)
+        {
+            return 0;
+        }
+    }
+
+    Py_INCREF(self->implicitContext);
+    return self->implicitContext;
 }
 
 #ifdef WIN32
@@ -1457,6 +1649,8 @@ communicatorCreateObjectAdapter(CommunicatorObject* self, PyObject* args)
         return 0;
     }
 
+    addCollocatedAdapter(adapter);
+
     PyObject* obj = createObjectAdapter(adapter);
     if(!obj)
     {
@@ -1508,6 +1702,8 @@ communicatorCreateObjectAdapterWithEndpoints(CommunicatorObject* self, PyObject*
         return 0;
     }
 
+    addCollocatedAdapter(adapter);
+
     PyObject* obj = createObjectAdapter(adapter);
     if(!obj)
     {
@@ -1563,6 +1759,8 @@ communicatorCreateObjectAdapterWithRouter(CommunicatorObject* self, PyObject* ar
         return 0;
     }
 
+    addCollocatedAdapter(adapter);
+
     PyObject* obj = createObjectAdapter(adapter);
     if(!obj)
     {
@@ -1901,6 +2099,51 @@ IcePy::getCommunicatorWrapper(const Ice::CommunicatorPtr& communicator)
     }
 }
 
+IcePy::CheckedCastCachePtr
+IcePy::getCheckedCastCache(const Ice::CommunicatorPtr& communicator)
+{
+    CommunicatorMap::iterator p = _communicatorMap.find(communicator);
+    if(p != _communicatorMap.end())
+    {
+        CommunicatorObject* obj = reinterpret_cast<CommunicatorObject*>(p->second);
+        if(obj->checkedCastCache)
+        {
+            return *obj->checkedCastCache;
+        }
+    }
+    return 0;
+}
+
+IcePy::CollocatedAdaptersPtr
+IcePy::getCollocatedAdapters(const Ice::CommunicatorPtr& communicator)
+{
+    CommunicatorMap::iterator p = _communicatorMap.find(communicator);
+    if(p != _communicatorMap.end())
+    {
+        CommunicatorObject* obj = reinterpret_cast<CommunicatorObject*>(p->second);
+        if(obj->collocatedAdapters)
+        {
+            return *obj->collocatedAdapters;
+        }
+    }
+    return 0;
+}
+
+IcePy::EndpointStatsRegistryPtr
+IcePy::getEndpointStatsRegistry(const Ice::CommunicatorPtr& communicator)
+{
+    CommunicatorMap::iterator p = _communicatorMap.find(communicator);
+    if(p != _communicatorMap.end())
+    {
+        CommunicatorObject* obj = reinterpret_cast<CommunicatorObject*>(p->second);
+        if(obj->endpointStats)
+        {
+            return *obj->endpointStats;
+        }
+    }
+    return 0;
+}
+
 extern "C"
 PyObject*
 IcePy_identityToString(PyObject* /*self*/, PyObject* args)
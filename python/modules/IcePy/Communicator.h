@@ -11,6 +11,8 @@
 #define ICEPY_COMMUNICATOR_H
 
 #include <Config.h>
+#include <Operation.h>
+#include <Proxy.h>
 #include <Ice/CommunicatorF.h>
 
 namespace IcePy
@@ -25,6 +27,23 @@ Ice::CommunicatorPtr getCommunicator(PyObject*);
 PyObject* createCommunicator(const Ice::CommunicatorPtr&);
 PyObject* getCommunicatorWrapper(const Ice::CommunicatorPtr&);
 
+//
+// Returns the checkedCast cache of the communicator, or 0 if it is disabled.
+//
+CheckedCastCachePtr getCheckedCastCache(const Ice::CommunicatorPtr&);
+
+//
+// Returns the adaptive endpoint selection statistics of the communicator, or 0 if
+// it is destroyed.
+//
+EndpointStatsRegistryPtr getEndpointStatsRegistry(const Ice::CommunicatorPtr&);
+
+//
+// Returns the collocated adapters of the communicator, or 0 if the collocated invocations
+// are marshaled or if it is destroyed.
+//
+CollocatedAdaptersPtr getCollocatedAdapters(const Ice::CommunicatorPtr&);
+
 }
 
 extern "C" PyObject* IcePy_initialize(PyObject*, PyObject*);
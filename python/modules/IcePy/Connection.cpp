@@ -1125,7 +1125,7 @@ connectionGetEndpoint(ConnectionObject* self)
     try
     {
         Ice::EndpointPtr endpoint = (*self->connection)->getEndpoint();
-        return createEndpoint(endpoint);
+        return createEndpoint(endpoint, *self->communicator);
     }
     catch(const Ice::Exception& ex)
     {
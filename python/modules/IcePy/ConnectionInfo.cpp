@@ -187,6 +187,61 @@ udpConnectionInfoGetSndSize(ConnectionInfoObject* self)
     return PyLong_FromLong(info->sndSize);
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+shmConnectionInfoGetRcvSize(ConnectionInfoObject* self)
+{
+    Ice::SHMConnectionInfoPtr info = Ice::SHMConnectionInfoPtr::dynamicCast(*self->connectionInfo);
+    assert(info);
+    return PyLong_FromLong(info->rcvSize);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+shmConnectionInfoGetSndSize(ConnectionInfoObject* self)
+{
+    Ice::SHMConnectionInfoPtr info = Ice::SHMConnectionInfoPtr::dynamicCast(*self->connectionInfo);
+    assert(info);
+    return PyLong_FromLong(info->sndSize);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+unixConnectionInfoGetPath(ConnectionInfoObject* self)
+{
+    Ice::UnixConnectionInfoPtr info = Ice::UnixConnectionInfoPtr::dynamicCast(*self->connectionInfo);
+    assert(info);
+    return createString(info->path);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+unixConnectionInfoGetRcvSize(ConnectionInfoObject* self)
+{
+    Ice::UnixConnectionInfoPtr info = Ice::UnixConnectionInfoPtr::dynamicCast(*self->connectionInfo);
+    assert(info);
+    return PyLong_FromLong(info->rcvSize);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+unixConnectionInfoGetSndSize(ConnectionInfoObject* self)
+{
+    Ice::UnixConnectionInfoPtr info = Ice::UnixConnectionInfoPtr::dynamicCast(*self->connectionInfo);
+    assert(info);
+    return PyLong_FromLong(info->sndSize);
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -306,6 +361,26 @@ static PyGetSetDef WSConnectionInfoGetters[] =
     { 0, 0 } /* sentinel */
 };
 
+static PyGetSetDef SHMConnectionInfoGetters[] =
+{
+    { STRCAST("rcvSize"), reinterpret_cast<getter>(shmConnectionInfoGetRcvSize), 0,
+        PyDoc_STR(STRCAST("receive buffer size")), 0 },
+    { STRCAST("sndSize"), reinterpret_cast<getter>(shmConnectionInfoGetSndSize), 0,
+        PyDoc_STR(STRCAST("send buffer size")), 0 },
+    { 0, 0 } /* sentinel */
+};
+
+static PyGetSetDef UnixConnectionInfoGetters[] =
+{
+    { STRCAST("path"), reinterpret_cast<getter>(unixConnectionInfoGetPath), 0,
+        PyDoc_STR(STRCAST("socket path")), 0 },
+    { STRCAST("rcvSize"), reinterpret_cast<getter>(unixConnectionInfoGetRcvSize), 0,
+        PyDoc_STR(STRCAST("receive buffer size")), 0 },
+    { STRCAST("sndSize"), reinterpret_cast<getter>(unixConnectionInfoGetSndSize), 0,
+        PyDoc_STR(STRCAST("send buffer size")), 0 },
+    { 0, 0 } /* sentinel */
+};
+
 static PyGetSetDef SSLConnectionInfoGetters[] =
 {
     { STRCAST("cipher"), reinterpret_cast<getter>(sslConnectionInfoGetCipher), 0,
@@ -555,6 +630,100 @@ PyTypeObject WSConnectionInfoType =
     0,                               /* tp_is_gc */
 };
 
+PyTypeObject SHMConnectionInfoType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.SHMConnectionInfo"),/* tp_name */
+    sizeof(ConnectionInfoObject),    /* tp_basicsize */
+    0,                               /* tp_itemsize */
+    /* methods */
+    (destructor)connectionInfoDealloc, /* tp_dealloc */
+    0,                               /* tp_print */
+    0,                               /* tp_getattr */
+    0,                               /* tp_setattr */
+    0,                               /* tp_reserved */
+    0,                               /* tp_repr */
+    0,                               /* tp_as_number */
+    0,                               /* tp_as_sequence */
+    0,                               /* tp_as_mapping */
+    0,                               /* tp_hash */
+    0,                               /* tp_call */
+    0,                               /* tp_str */
+    0,                               /* tp_getattro */
+    0,                               /* tp_setattro */
+    0,                               /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+    0,                               /* tp_doc */
+    0,                               /* tp_traverse */
+    0,                               /* tp_clear */
+    0,                               /* tp_richcompare */
+    0,                               /* tp_weaklistoffset */
+    0,                               /* tp_iter */
+    0,                               /* tp_iternext */
+    0,                               /* tp_methods */
+    0,                               /* tp_members */
+    SHMConnectionInfoGetters,        /* tp_getset */
+    0,                               /* tp_base */
+    0,                               /* tp_dict */
+    0,                               /* tp_descr_get */
+    0,                               /* tp_descr_set */
+    0,                               /* tp_dictoffset */
+    0,                               /* tp_init */
+    0,                               /* tp_alloc */
+    (newfunc)connectionInfoNew,      /* tp_new */
+    0,                               /* tp_free */
+    0,                               /* tp_is_gc */
+};
+
+PyTypeObject UnixConnectionInfoType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.UnixConnectionInfo"),/* tp_name */
+    sizeof(ConnectionInfoObject),    /* tp_basicsize */
+    0,                               /* tp_itemsize */
+    /* methods */
+    (destructor)connectionInfoDealloc, /* tp_dealloc */
+    0,                               /* tp_print */
+    0,                               /* tp_getattr */
+    0,                               /* tp_setattr */
+    0,                               /* tp_reserved */
+    0,                               /* tp_repr */
+    0,                               /* tp_as_number */
+    0,                               /* tp_as_sequence */
+    0,                               /* tp_as_mapping */
+    0,                               /* tp_hash */
+    0,                               /* tp_call */
+    0,                               /* tp_str */
+    0,                               /* tp_getattro */
+    0,                               /* tp_setattro */
+    0,                               /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+    0,                               /* tp_doc */
+    0,                               /* tp_traverse */
+    0,                               /* tp_clear */
+    0,                               /* tp_richcompare */
+    0,                               /* tp_weaklistoffset */
+    0,                               /* tp_iter */
+    0,                               /* tp_iternext */
+    0,                               /* tp_methods */
+    0,                               /* tp_members */
+    UnixConnectionInfoGetters,       /* tp_getset */
+    0,                               /* tp_base */
+    0,                               /* tp_dict */
+    0,                               /* tp_descr_get */
+    0,                               /* tp_descr_set */
+    0,                               /* tp_dictoffset */
+    0,                               /* tp_init */
+    0,                               /* tp_alloc */
+    (newfunc)connectionInfoNew,      /* tp_new */
+    0,                               /* tp_free */
+    0,                               /* tp_is_gc */
+};
+
 PyTypeObject SSLConnectionInfoType =
 {
     /* The ob_type field must be initialized in the module init function
@@ -661,6 +830,28 @@ IcePy::initConnectionInfo(PyObject* module)
         return false;
     }
 
+    SHMConnectionInfoType.tp_base = &ConnectionInfoType; // Force inheritance from ConnectionInfoType.
+    if(PyType_Ready(&SHMConnectionInfoType) < 0)
+    {
+        return false;
+    }
+    type = &SHMConnectionInfoType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("SHMConnectionInfo"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
+    UnixConnectionInfoType.tp_base = &ConnectionInfoType; // Force inheritance from ConnectionInfoType.
+    if(PyType_Ready(&UnixConnectionInfoType) < 0)
+    {
+        return false;
+    }
+    type = &UnixConnectionInfoType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("UnixConnectionInfo"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
     SSLConnectionInfoType.tp_base = &ConnectionInfoType; // Force inheritance from IPConnectionInfoType.
     if(PyType_Ready(&SSLConnectionInfoType) < 0)
     {
@@ -705,6 +896,14 @@ IcePy::createConnectionInfo(const Ice::ConnectionInfoPtr& connectionInfo)
     {
         type = &UDPConnectionInfoType;
     }
+    else if(Ice::SHMConnectionInfoPtr::dynamicCast(connectionInfo))
+    {
+        type = &SHMConnectionInfoType;
+    }
+    else if(Ice::UnixConnectionInfoPtr::dynamicCast(connectionInfo))
+    {
+        type = &UnixConnectionInfoType;
+    }
     else if(IceSSL::ConnectionInfoPtr::dynamicCast(connectionInfo))
     {
         type = &SSLConnectionInfoType;
@@ -0,0 +1,377 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifdef _WIN32
+#   include <IceUtil/Config.h>
+#endif
+#include <Context.h>
+#include <Util.h>
+
+using namespace std;
+using namespace IcePy;
+
+namespace IcePy
+{
+
+//
+// An immutable request context, converted into an Ice::Context when it's created.
+//
+struct ContextObject
+{
+    PyObject_HEAD
+    Ice::Context* context;
+    long hash; // Computed on first use, -1 if not computed.
+};
+
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static ContextObject*
+contextNew(PyTypeObject* type, PyObject* args, PyObject* kwds)
+{
+    ContextObject* self = reinterpret_cast<ContextObject*>(type->tp_alloc(type, 0));
+    if(!self)
+    {
+        return 0;
+    }
+    self->context = 0;
+    self->hash = -1;
+
+    if(PyTuple_GET_SIZE(args) == 1 && PyObject_TypeCheck(PyTuple_GET_ITEM(args, 0), &ContextType) &&
+       (!kwds || PyDict_Size(kwds) == 0))
+    {
+        self->context = new Ice::Context(*reinterpret_cast<ContextObject*>(PyTuple_GET_ITEM(args, 0))->context);
+        return self;
+    }
+
+    //
+    // Accept the same arguments as the dict constructor.
+    //
+    self->context = new Ice::Context;
+    PyObjectHandle dict = PyObject_Call(reinterpret_cast<PyObject*>(&PyDict_Type), args, kwds);
+    if(!dict.get() || !dictionaryToContext(dict.get(), *self->context))
+    {
+        Py_DECREF(self);
+        return 0;
+    }
+    return self;
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static void
+contextDealloc(ContextObject* self)
+{
+    delete self->context;
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+contextRepr(ContextObject* self)
+{
+    PyObjectHandle dict = PyDict_New();
+    if(!dict.get() || !contextToDictionary(*self->context, dict.get()))
+    {
+        return 0;
+    }
+
+    PyObjectHandle repr = PyObject_Repr(dict.get());
+    if(!repr.get())
+    {
+        return 0;
+    }
+    return createString("Ice.Context(" + getString(repr.get()) + ")");
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static long
+contextHash(ContextObject* self)
+{
+    if(self->hash == -1)
+    {
+        //
+        // The items of an Ice::Context are sorted by key.
+        //
+        PyObjectHandle items = PyTuple_New(static_cast<Py_ssize_t>(self->context->size() * 2));
+        if(!items.get())
+        {
+            return -1;
+        }
+
+        Py_ssize_t i = 0;
+        for(Ice::Context::const_iterator p = self->context->begin(); p != self->context->end(); ++p)
+        {
+            PyObject* key = createString(p->first);
+            if(!key)
+            {
+                return -1;
+            }
+            PyTuple_SET_ITEM(items.get(), i++, key); // Steals a reference.
+
+            PyObject* value = createString(p->second);
+            if(!value)
+            {
+                return -1;
+            }
+            PyTuple_SET_ITEM(items.get(), i++, value); // Steals a reference.
+        }
+
+        self->hash = static_cast<long>(PyObject_Hash(items.get()));
+    }
+    return self->hash;
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+contextCompare(ContextObject* self, PyObject* other, int op)
+{
+    if(op != Py_EQ && op != Py_NE)
+    {
+        return incRef(Py_NotImplemented);
+    }
+
+    bool result;
+    if(PyObject_TypeCheck(other, &ContextType))
+    {
+        result = *self->context == *reinterpret_cast<ContextObject*>(other)->context;
+    }
+    else if(PyDict_Check(other))
+    {
+        Ice::Context ctx;
+        if(PyDict_Size(other) != static_cast<Py_ssize_t>(self->context->size()) || !dictionaryToContext(other, ctx))
+        {
+            PyErr_Clear(); // The dictionary isn't a valid context.
+            result = false;
+        }
+        else
+        {
+            result = *self->context == ctx;
+        }
+    }
+    else
+    {
+        return incRef(Py_NotImplemented);
+    }
+
+    if(op == Py_NE)
+    {
+        result = !result;
+    }
+    return result ? incTrue() : incFalse();
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+contextIter(ContextObject* self)
+{
+    PyObjectHandle keys = PyList_New(0);
+    if(!keys.get())
+    {
+        return 0;
+    }
+
+    for(Ice::Context::const_iterator p = self->context->begin(); p != self->context->end(); ++p)
+    {
+        PyObjectHandle key = createString(p->first);
+        if(!key.get() || PyList_Append(keys.get(), key.get()) < 0)
+        {
+            return 0;
+        }
+    }
+    return PyObject_GetIter(keys.get());
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static Py_ssize_t
+contextLength(ContextObject* self)
+{
+    return static_cast<Py_ssize_t>(self->context->size());
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+contextSubscript(ContextObject* self, PyObject* key)
+{
+    if(checkString(key))
+    {
+        Ice::Context::const_iterator p = self->context->find(getString(key));
+        if(p != self->context->end())
+        {
+            return createString(p->second);
+        }
+    }
+
+    PyErr_SetObject(PyExc_KeyError, key);
+    return 0;
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static int
+contextContains(ContextObject* self, PyObject* key)
+{
+    return checkString(key) && self->context->find(getString(key)) != self->context->end() ? 1 : 0;
+}
+
+static PyMappingMethods ContextMapping =
+{
+    reinterpret_cast<lenfunc>(contextLength),     /* mp_length */
+    reinterpret_cast<binaryfunc>(contextSubscript), /* mp_subscript */
+    0                                             /* mp_ass_subscript */
+};
+
+static PySequenceMethods ContextSequence =
+{
+    0,                                            /* sq_length */
+    0,                                            /* sq_concat */
+    0,                                            /* sq_repeat */
+    0,                                            /* sq_item */
+    0,                                            /* sq_slice */
+    0,                                            /* sq_ass_item */
+    0,                                            /* sq_ass_slice */
+    reinterpret_cast<objobjproc>(contextContains), /* sq_contains */
+    0,                                            /* sq_inplace_concat */
+    0                                             /* sq_inplace_repeat */
+};
+
+namespace IcePy
+{
+
+PyTypeObject ContextType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.Context"),       /* tp_name */
+    sizeof(ContextObject),          /* tp_basicsize */
+    0,                              /* tp_itemsize */
+    /* methods */
+    reinterpret_cast<destructor>(contextDealloc), /* tp_dealloc */
+    0,                              /* tp_print */
+    0,                              /* tp_getattr */
+    0,                              /* tp_setattr */
+    0,                              /* tp_reserved */
+    reinterpret_cast<reprfunc>(contextRepr), /* tp_repr */
+    0,                              /* tp_as_number */
+    &ContextSequence,               /* tp_as_sequence */
+    &ContextMapping,                /* tp_as_mapping */
+    reinterpret_cast<hashfunc>(contextHash), /* tp_hash */
+    0,                              /* tp_call */
+    0,                              /* tp_str */
+    0,                              /* tp_getattro */
+    0,                              /* tp_setattro */
+    0,                              /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x03000000
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+#else
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE |
+    Py_TPFLAGS_HAVE_RICHCOMPARE,    /* tp_flags */
+#endif
+    0,                              /* tp_doc */
+    0,                              /* tp_traverse */
+    0,                              /* tp_clear */
+    reinterpret_cast<richcmpfunc>(contextCompare), /* tp_richcompare */
+    0,                              /* tp_weaklistoffset */
+    reinterpret_cast<getiterfunc>(contextIter), /* tp_iter */
+    0,                              /* tp_iternext */
+    0,                              /* tp_methods */
+    0,                              /* tp_members */
+    0,                              /* tp_getset */
+    0,                              /* tp_base */
+    0,                              /* tp_dict */
+    0,                              /* tp_descr_get */
+    0,                              /* tp_descr_set */
+    0,                              /* tp_dictoffset */
+    0,                              /* tp_init */
+    0,                              /* tp_alloc */
+    reinterpret_cast<newfunc>(contextNew), /* tp_new */
+    0,                              /* tp_free */
+    0,                              /* tp_is_gc */
+};
+
+}
+
+bool
+IcePy::initContext(PyObject* module)
+{
+    if(PyType_Ready(&ContextType) < 0)
+    {
+        return false;
+    }
+    PyTypeObject* type = &ContextType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("Context"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
+    return true;
+}
+
+bool
+IcePy::checkContext(PyObject* obj)
+{
+    return PyDict_Check(obj) || PyObject_TypeCheck(obj, &ContextType);
+}
+
+const Ice::Context*
+IcePy::getContext(PyObject* obj, Ice::Context& ctx)
+{
+    if(PyObject_TypeCheck(obj, &ContextType))
+    {
+        return reinterpret_cast<ContextObject*>(obj)->context;
+    }
+
+    if(!PyDict_Check(obj))
+    {
+        PyErr_Format(PyExc_ValueError, STRCAST("context argument must be None, a dictionary or an Ice.Context"));
+        return 0;
+    }
+
+    if(!dictionaryToContext(obj, ctx))
+    {
+        return 0;
+    }
+    return &ctx;
+}
+
+PyObject*
+IcePy::createContext(const Ice::Context& ctx)
+{
+    PyTypeObject* type = reinterpret_cast<PyTypeObject*>(lookupType("Ice.Context"));
+    if(!type)
+    {
+        return 0;
+    }
+
+    ContextObject* self = reinterpret_cast<ContextObject*>(type->tp_alloc(type, 0));
+    if(!self)
+    {
+        return 0;
+    }
+    self->context = new Ice::Context(ctx);
+    self->hash = -1;
+    return reinterpret_cast<PyObject*>(self);
+}
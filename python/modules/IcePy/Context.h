@@ -0,0 +1,42 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICEPY_CONTEXT_H
+#define ICEPY_CONTEXT_H
+
+#include <Config.h>
+#include <Ice/Current.h>
+
+namespace IcePy
+{
+
+extern PyTypeObject ContextType;
+
+bool initContext(PyObject*);
+
+//
+// Returns true if the object is a dictionary or an Ice.Context object.
+//
+bool checkContext(PyObject*);
+
+//
+// Returns the Ice::Context for a dictionary or an Ice.Context object. The dictionary is converted
+// into the given Ice::Context, whereas the context of an Ice.Context object is returned without a
+// conversion or a copy. Returns 0 and sets a Python exception if the conversion fails.
+//
+const Ice::Context* getContext(PyObject*, Ice::Context&);
+
+//
+// Creates an Ice.Context object with a copy of the given context.
+//
+PyObject* createContext(const Ice::Context&);
+
+}
+
+#endif
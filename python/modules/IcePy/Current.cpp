@@ -13,6 +13,7 @@
 #include <Current.h>
 #include <structmember.h>
 #include <Connection.h>
+#include <Context.h>
 #include <ObjectAdapter.h>
 #include <Util.h>
 #include <Ice/ObjectAdapter.h>
@@ -204,11 +205,13 @@ currentGetter(CurrentObject* self, void* closure)
     {
         if(!self->ctx)
         {
-            self->ctx = PyDict_New();
-            if(self->ctx && !contextToDictionary(self->current->ctx, self->ctx))
+            //
+            // The context is an immutable Ice.Context, it can be passed to ImplicitContext.setContext
+            // or to a proxy invocation without being converted again.
+            //
+            self->ctx = createContext(self->current->ctx);
+            if(!self->ctx)
             {
-                Py_DECREF(self->ctx);
-                self->ctx = 0;
                 break;
             }
         }
@@ -12,6 +12,7 @@
 #endif
 #include <Endpoint.h>
 #include <EndpointInfo.h>
+#include <Proxy.h>
 #include <Util.h>
 
 using namespace std;
@@ -24,6 +25,7 @@ struct EndpointObject
 {
     PyObject_HEAD
     Ice::EndpointPtr* endpoint;
+    Ice::CommunicatorPtr* communicator;
 };
 
 }
@@ -45,6 +47,7 @@ static void
 endpointDealloc(EndpointObject* self)
 {
     delete self->endpoint;
+    delete self->communicator;
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -149,12 +152,37 @@ endpointGetInfo(EndpointObject* self)
     }
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+endpointGetSelectionStats(EndpointObject* self)
+{
+    assert(self->endpoint);
+    try
+    {
+        EndpointStatsPtr stats;
+        if(self->communicator)
+        {
+            stats = getEndpointStats(*self->communicator, *self->endpoint, false);
+        }
+        return stats ? stats->getInfo() : incRef(Py_None);
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+}
+
 static PyMethodDef EndpointMethods[] =
 {
     { STRCAST("toString"), reinterpret_cast<PyCFunction>(endpointToString), METH_NOARGS,
         PyDoc_STR(STRCAST("toString() -> string")) },
     { STRCAST("getInfo"), reinterpret_cast<PyCFunction>(endpointGetInfo), METH_NOARGS,
         PyDoc_STR(STRCAST("getInfo() -> Ice.EndpointInfo")) },
+    { STRCAST("getSelectionStats"), reinterpret_cast<PyCFunction>(endpointGetSelectionStats), METH_NOARGS,
+        PyDoc_STR(STRCAST("getSelectionStats() -> dict")) },
     { 0, 0 } /* sentinel */
 };
 
@@ -242,7 +270,7 @@ IcePy::getEndpoint(PyObject* obj)
 }
 
 PyObject*
-IcePy::createEndpoint(const Ice::EndpointPtr& endpoint)
+IcePy::createEndpoint(const Ice::EndpointPtr& endpoint, const Ice::CommunicatorPtr& communicator)
 {
     EndpointObject* obj = reinterpret_cast<EndpointObject*>(EndpointType.tp_alloc(&EndpointType, 0));
     if(!obj)
@@ -250,6 +278,7 @@ IcePy::createEndpoint(const Ice::EndpointPtr& endpoint)
         return 0;
     }
     obj->endpoint = new Ice::EndpointPtr(endpoint);
+    obj->communicator = communicator ? new Ice::CommunicatorPtr(communicator) : 0;
     return (PyObject*)obj;
 }
 
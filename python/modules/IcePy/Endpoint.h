@@ -11,6 +11,7 @@
 #define ICEPY_ENDPOINT_H
 
 #include <Config.h>
+#include <Ice/CommunicatorF.h>
 #include <Ice/Endpoint.h>
 
 namespace IcePy
@@ -20,7 +21,11 @@ extern PyTypeObject EndpointType;
 
 bool initEndpoint(PyObject*);
 
-PyObject* createEndpoint(const Ice::EndpointPtr&);
+//
+// The communicator is used to find the adaptive endpoint selection statistics of
+// the endpoint, see getSelectionStats.
+//
+PyObject* createEndpoint(const Ice::EndpointPtr&, const Ice::CommunicatorPtr& = 0);
 Ice::EndpointPtr getEndpoint(PyObject*);
 
 bool toEndpointSeq(PyObject*, Ice::EndpointSeq&);
@@ -213,6 +213,28 @@ wsEndpointInfoGetResource(EndpointInfoObject* self)
     return createString(info->resource);
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+shmEndpointInfoGetName(EndpointInfoObject* self)
+{
+    Ice::SHMEndpointInfoPtr info = Ice::SHMEndpointInfoPtr::dynamicCast(*self->endpointInfo);
+    assert(info);
+    return createString(info->name);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+unixEndpointInfoGetPath(EndpointInfoObject* self)
+{
+    Ice::UnixEndpointInfoPtr info = Ice::UnixEndpointInfoPtr::dynamicCast(*self->endpointInfo);
+    assert(info);
+    return createString(info->path);
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -290,6 +312,20 @@ static PyGetSetDef WSEndpointInfoGetters[] =
     { 0, 0 } /* sentinel */
 };
 
+static PyGetSetDef SHMEndpointInfoGetters[] =
+{
+    { STRCAST("name"), reinterpret_cast<getter>(shmEndpointInfoGetName), 0,
+        PyDoc_STR(STRCAST("endpoint name")), 0 },
+    { 0, 0 } /* sentinel */
+};
+
+static PyGetSetDef UnixEndpointInfoGetters[] =
+{
+    { STRCAST("path"), reinterpret_cast<getter>(unixEndpointInfoGetPath), 0,
+        PyDoc_STR(STRCAST("socket path")), 0 },
+    { 0, 0 } /* sentinel */
+};
+
 static PyGetSetDef OpaqueEndpointInfoGetters[] =
 {
     { STRCAST("rawBytes"), reinterpret_cast<getter>(opaqueEndpointInfoGetRawBytes), 0,
@@ -537,6 +573,100 @@ PyTypeObject WSEndpointInfoType =
     0,                               /* tp_is_gc */
 };
 
+PyTypeObject SHMEndpointInfoType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.SHMEndpointInfo"), /* tp_name */
+    sizeof(EndpointInfoObject),      /* tp_basicsize */
+    0,                               /* tp_itemsize */
+    /* methods */
+    reinterpret_cast<destructor>(endpointInfoDealloc), /* tp_dealloc */
+    0,                               /* tp_print */
+    0,                               /* tp_getattr */
+    0,                               /* tp_setattr */
+    0,                               /* tp_reserved */
+    0,                               /* tp_repr */
+    0,                               /* tp_as_number */
+    0,                               /* tp_as_sequence */
+    0,                               /* tp_as_mapping */
+    0,                               /* tp_hash */
+    0,                               /* tp_call */
+    0,                               /* tp_str */
+    0,                               /* tp_getattro */
+    0,                               /* tp_setattro */
+    0,                               /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+    0,                               /* tp_doc */
+    0,                               /* tp_traverse */
+    0,                               /* tp_clear */
+    0,                               /* tp_richcompare */
+    0,                               /* tp_weaklistoffset */
+    0,                               /* tp_iter */
+    0,                               /* tp_iternext */
+    0,                               /* tp_methods */
+    0,                               /* tp_members */
+    SHMEndpointInfoGetters,          /* tp_getset */
+    0,                               /* tp_base */
+    0,                               /* tp_dict */
+    0,                               /* tp_descr_get */
+    0,                               /* tp_descr_set */
+    0,                               /* tp_dictoffset */
+    0,                               /* tp_init */
+    0,                               /* tp_alloc */
+    reinterpret_cast<newfunc>(endpointInfoNew), /* tp_new */
+    0,                               /* tp_free */
+    0,                               /* tp_is_gc */
+};
+
+PyTypeObject UnixEndpointInfoType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.UnixEndpointInfo"),/* tp_name */
+    sizeof(EndpointInfoObject),      /* tp_basicsize */
+    0,                               /* tp_itemsize */
+    /* methods */
+    reinterpret_cast<destructor>(endpointInfoDealloc), /* tp_dealloc */
+    0,                               /* tp_print */
+    0,                               /* tp_getattr */
+    0,                               /* tp_setattr */
+    0,                               /* tp_reserved */
+    0,                               /* tp_repr */
+    0,                               /* tp_as_number */
+    0,                               /* tp_as_sequence */
+    0,                               /* tp_as_mapping */
+    0,                               /* tp_hash */
+    0,                               /* tp_call */
+    0,                               /* tp_str */
+    0,                               /* tp_getattro */
+    0,                               /* tp_setattro */
+    0,                               /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /* tp_flags */
+    0,                               /* tp_doc */
+    0,                               /* tp_traverse */
+    0,                               /* tp_clear */
+    0,                               /* tp_richcompare */
+    0,                               /* tp_weaklistoffset */
+    0,                               /* tp_iter */
+    0,                               /* tp_iternext */
+    0,                               /* tp_methods */
+    0,                               /* tp_members */
+    UnixEndpointInfoGetters,         /* tp_getset */
+    0,                               /* tp_base */
+    0,                               /* tp_dict */
+    0,                               /* tp_descr_get */
+    0,                               /* tp_descr_set */
+    0,                               /* tp_dictoffset */
+    0,                               /* tp_init */
+    0,                               /* tp_alloc */
+    reinterpret_cast<newfunc>(endpointInfoNew), /* tp_new */
+    0,                               /* tp_free */
+    0,                               /* tp_is_gc */
+};
+
 PyTypeObject SSLEndpointInfoType =
 {
     /* The ob_type field must be initialized in the module init function
@@ -690,6 +820,28 @@ IcePy::initEndpointInfo(PyObject* module)
         return false;
     }
 
+    SHMEndpointInfoType.tp_base = &EndpointInfoType; // Force inheritance from EndpointInfoType.
+    if(PyType_Ready(&SHMEndpointInfoType) < 0)
+    {
+        return false;
+    }
+    type = &SHMEndpointInfoType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("SHMEndpointInfo"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
+    UnixEndpointInfoType.tp_base = &EndpointInfoType; // Force inheritance from EndpointInfoType.
+    if(PyType_Ready(&UnixEndpointInfoType) < 0)
+    {
+        return false;
+    }
+    type = &UnixEndpointInfoType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("UnixEndpointInfo"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
     SSLEndpointInfoType.tp_base = &EndpointInfoType; // Force inheritance from IPEndpointInfoType.
     if(PyType_Ready(&SSLEndpointInfoType) < 0)
     {
@@ -745,6 +897,14 @@ IcePy::createEndpointInfo(const Ice::EndpointInfoPtr& endpointInfo)
     {
         type = &UDPEndpointInfoType;
     }
+    else if(Ice::SHMEndpointInfoPtr::dynamicCast(endpointInfo))
+    {
+        type = &SHMEndpointInfoType;
+    }
+    else if(Ice::UnixEndpointInfoPtr::dynamicCast(endpointInfo))
+    {
+        type = &UnixEndpointInfoType;
+    }
     else if(IceSSL::EndpointInfoPtr::dynamicCast(endpointInfo))
     {
         type = &SSLEndpointInfoType;
@@ -11,6 +11,7 @@
 #   include <IceUtil/Config.h>
 #endif
 #include <ImplicitContext.h>
+#include <Context.h>
 #include <ObjectAdapter.h>
 #include <Proxy.h>
 #include <Util.h>
@@ -24,14 +25,47 @@ namespace IcePy
 
 extern PyTypeObject ImplicitContextType;
 
+//
+// The context of an implicit context is cached in an immutable Ice.Context object, its current version.
+// Changing the context creates a new version, so the versions can be shared and compared by identity.
+// The versions of a per-thread implicit context are stored in a thread-local object, which discards the
+// version of a thread when the thread terminates and the versions of all the threads when it's released.
+//
 struct ImplicitContextObject
 {
     PyObject_HEAD
     Ice::ImplicitContextPtr* implicitContext;
+    PyObject* local; // The thread-local object holding the versions, 0 if the context is shared.
+    PyObject* version; // The version of a shared context, 0 if not created yet.
 };
 
 }
 
+static PyObject*
+createThreadLocal()
+{
+#if PY_VERSION_HEX >= 0x03000000
+    PyObjectHandle module = PyImport_ImportModule(STRCAST("_thread"));
+#else
+    PyObjectHandle module = PyImport_ImportModule(STRCAST("thread"));
+#endif
+    if(!module.get())
+    {
+        return 0;
+    }
+    return PyObject_CallMethod(module.get(), STRCAST("_local"), 0);
+}
+
+//
+// Returns a borrowed reference to the dictionary of the calling thread in the thread-local object.
+//
+static PyObject*
+getThreadDict(ImplicitContextObject* self)
+{
+    PyObjectHandle dict = PyObject_GetAttrString(self->local, STRCAST("__dict__"));
+    return dict.get(); // The dictionary is kept alive by the thread-local object.
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -44,6 +78,8 @@ implicitContextNew(PyTypeObject* type, PyObject* /*args*/, PyObject* /*kwds*/)
         return 0;
     }
     self->implicitContext = 0;
+    self->local = 0;
+    self->version = 0;
     return self;
 }
 
@@ -54,6 +90,8 @@ static void
 implicitContextDealloc(ImplicitContextObject* self)
 {
     delete self->implicitContext;
+    Py_XDECREF(self->local);
+    Py_XDECREF(self->version);
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -111,13 +149,110 @@ implicitContextCompare(ImplicitContextObject* c1, PyObject* other, int op)
     return result ? incTrue() : incFalse();
 }
 
+//
+// Sets the current version, or discards it if version is 0.
+//
+static bool
+setVersion(ImplicitContextObject* self, PyObject* version)
+{
+    if(self->local)
+    {
+        PyObject* dict = getThreadDict(self);
+        if(!dict)
+        {
+            return false;
+        }
+        if(version)
+        {
+            return PyDict_SetItemString(dict, STRCAST("version"), version) == 0;
+        }
+        if(PyDict_DelItemString(dict, STRCAST("version")) < 0)
+        {
+            PyErr_Clear(); // The thread doesn't have a version.
+        }
+        return true;
+    }
+
+    Py_XINCREF(version);
+    Py_XDECREF(self->version);
+    self->version = version;
+    return true;
+}
+
+//
+// Returns a borrowed reference to the current version, or 0 if it's not created yet.
+//
+static PyObject*
+findVersion(ImplicitContextObject* self)
+{
+    if(self->local)
+    {
+        PyObject* dict = getThreadDict(self);
+        if(!dict)
+        {
+            PyErr_Clear();
+            return 0;
+        }
+        return PyDict_GetItemString(dict, STRCAST("version")); // Borrowed reference.
+    }
+    return self->version;
+}
+
+//
+// Returns a borrowed reference to the current version, which is created on first use.
+//
+static PyObject*
+getVersion(ImplicitContextObject* self)
+{
+    PyObject* version = findVersion(self);
+    if(version)
+    {
+        return version;
+    }
+
+    Ice::Context ctx;
+    try
+    {
+        ctx = (*self->implicitContext)->getContext();
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    PyObjectHandle newVersion = createContext(ctx);
+    if(!newVersion.get() || !setVersion(self, newVersion.get()))
+    {
+        return 0;
+    }
+    return newVersion.get(); // The version is kept alive by the thread-local object or by self.
+}
+
+static const Ice::Context*
+getVersionContext(ImplicitContextObject* self)
+{
+    PyObject* version = getVersion(self);
+    if(!version)
+    {
+        return 0;
+    }
+
+    Ice::Context ctx;
+    return getContext(version, ctx); // Returns the context of the version, not ctx.
+}
+
 #ifdef WIN32
 extern "C"
 #endif
 static PyObject*
 implicitContextGetContext(ImplicitContextObject* self)
 {
-    Ice::Context ctx = (*self->implicitContext)->getContext();
+    const Ice::Context* ctx = getVersionContext(self);
+    if(!ctx)
+    {
+        return 0;
+    }
 
     PyObjectHandle dict = PyDict_New();
     if(!dict.get())
@@ -125,7 +260,7 @@ implicitContextGetContext(ImplicitContextObject* self)
         return 0;
     }
 
-    if(!contextToDictionary(ctx, dict.get()))
+    if(!contextToDictionary(*ctx, dict.get()))
     {
         return 0;
     }
@@ -133,25 +268,62 @@ implicitContextGetContext(ImplicitContextObject* self)
     return dict.release();
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+implicitContextSnapshot(ImplicitContextObject* self)
+{
+    PyObject* version = getVersion(self);
+    if(!version)
+    {
+        return 0;
+    }
+    return incRef(version);
+}
+
 #ifdef WIN32
 extern "C"
 #endif
 static PyObject*
 implicitContextSetContext(ImplicitContextObject* self, PyObject* args)
 {
-    PyObject* dict;
-    if(!PyArg_ParseTuple(args, STRCAST("O!"), &PyDict_Type, &dict))
+    PyObject* obj;
+    if(!PyArg_ParseTuple(args, STRCAST("O"), &obj))
     {
         return 0;
     }
 
+    if(findVersion(self) == obj)
+    {
+        Py_INCREF(Py_None);
+        return Py_None; // Setting the current version doesn't change anything.
+    }
+
     Ice::Context ctx;
-    if(!dictionaryToContext(dict, ctx))
+    const Ice::Context* c = getContext(obj, ctx);
+    if(!c)
+    {
+        return 0;
+    }
+
+    try
     {
+        (*self->implicitContext)->setContext(*c);
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
         return 0;
     }
 
-    (*self->implicitContext)->setContext(ctx);
+    //
+    // An Ice.Context object becomes the new version. The version of a dictionary is only created if it's used.
+    //
+    if(!setVersion(self, c == &ctx ? 0 : obj))
+    {
+        return 0;
+    }
 
     Py_INCREF(Py_None);
     return Py_None;
@@ -175,18 +347,13 @@ implicitContextContainsKey(ImplicitContextObject* self, PyObject* args)
         return 0;
     }
 
-    bool containsKey;
-    try
-    {
-        containsKey = (*self->implicitContext)->containsKey(key);
-    }
-    catch(const Ice::Exception& ex)
+    const Ice::Context* ctx = getVersionContext(self);
+    if(!ctx)
     {
-        setPythonException(ex);
         return 0;
     }
 
-    PyRETURN_BOOL(containsKey);
+    PyRETURN_BOOL(ctx->find(key) != ctx->end());
 }
 
 #ifdef WIN32
@@ -207,17 +374,14 @@ implicitContextGet(ImplicitContextObject* self, PyObject* args)
         return 0;
     }
 
-    string val;
-    try
-    {
-        val = (*self->implicitContext)->get(key);
-    }
-    catch(const Ice::Exception& ex)
+    const Ice::Context* ctx = getVersionContext(self);
+    if(!ctx)
     {
-        setPythonException(ex);
         return 0;
     }
-    return createString(val);
+
+    Ice::Context::const_iterator p = ctx->find(key);
+    return createString(p == ctx->end() ? string() : p->second);
 }
 
 #ifdef WIN32
@@ -244,16 +408,42 @@ implicitContextPut(ImplicitContextObject* self, PyObject* args)
         return 0;
     }
 
-    string oldVal;
+    const Ice::Context* ctx = getVersionContext(self);
+    if(!ctx)
+    {
+        return 0;
+    }
+
+    Ice::Context::const_iterator p = ctx->find(key);
+    if(p != ctx->end() && p->second == value)
+    {
+        return createString(value); // No change, the current version is kept.
+    }
+
+    string oldVal = p == ctx->end() ? string() : p->second;
+    Ice::Context newCtx(*ctx);
+    newCtx[key] = value;
+
+    PyObjectHandle version = createContext(newCtx);
+    if(!version.get())
+    {
+        return 0;
+    }
+
     try
     {
-        oldVal = (*self->implicitContext)->put(key, value);
+        (*self->implicitContext)->put(key, value);
     }
     catch(const Ice::Exception& ex)
     {
         setPythonException(ex);
         return 0;
     }
+
+    if(!setVersion(self, version.get()))
+    {
+        return 0;
+    }
     return createString(oldVal);
 }
 
@@ -275,17 +465,43 @@ implicitContextRemove(ImplicitContextObject* self, PyObject* args)
         return 0;
     }
 
-    string val;
+    const Ice::Context* ctx = getVersionContext(self);
+    if(!ctx)
+    {
+        return 0;
+    }
+
+    Ice::Context::const_iterator p = ctx->find(key);
+    if(p == ctx->end())
+    {
+        return createString(string()); // No change, the current version is kept.
+    }
+
+    string oldVal = p->second;
+    Ice::Context newCtx(*ctx);
+    newCtx.erase(key);
+
+    PyObjectHandle version = createContext(newCtx);
+    if(!version.get())
+    {
+        return 0;
+    }
+
     try
     {
-        val = (*self->implicitContext)->remove(key);
+        (*self->implicitContext)->remove(key);
     }
     catch(const Ice::Exception& ex)
     {
         setPythonException(ex);
         return 0;
     }
-    return createString(val);
+
+    if(!setVersion(self, version.get()))
+    {
+        return 0;
+    }
+    return createString(oldVal);
 }
 
 static PyMethodDef ImplicitContextMethods[] =
@@ -294,6 +510,8 @@ static PyMethodDef ImplicitContextMethods[] =
       PyDoc_STR(STRCAST("getContext() -> Ice.Context")) },
     { STRCAST("setContext"), reinterpret_cast<PyCFunction>(implicitContextSetContext), METH_VARARGS,
       PyDoc_STR(STRCAST("setContext(ctx) -> string")) },
+    { STRCAST("snapshot"), reinterpret_cast<PyCFunction>(implicitContextSnapshot), METH_NOARGS,
+      PyDoc_STR(STRCAST("snapshot() -> Ice.Context")) },
     { STRCAST("containsKey"), reinterpret_cast<PyCFunction>(implicitContextContainsKey), METH_VARARGS,
       PyDoc_STR(STRCAST("containsKey(key) -> bool")) },
     { STRCAST("get"), reinterpret_cast<PyCFunction>(implicitContextGet), METH_VARARGS,
@@ -379,12 +597,46 @@ IcePy::initImplicitContext(PyObject* module)
 }
 
 PyObject*
-IcePy::createImplicitContext(const Ice::ImplicitContextPtr& implicitContext)
+IcePy::createImplicitContext(const Ice::ImplicitContextPtr& implicitContext, bool perThread)
 {
     ImplicitContextObject* obj = implicitContextNew(&ImplicitContextType, 0, 0);
     if(obj)
     {
         obj->implicitContext = new Ice::ImplicitContextPtr(implicitContext);
+        if(perThread)
+        {
+            obj->local = createThreadLocal();
+            if(!obj->local)
+            {
+                Py_DECREF(obj);
+                return 0;
+            }
+        }
     }
     return reinterpret_cast<PyObject*>(obj);
 }
+
+void
+IcePy::clearImplicitContext(PyObject* p)
+{
+    ImplicitContextObject* obj = reinterpret_cast<ImplicitContextObject*>(p);
+    if(obj->local)
+    {
+        //
+        // Releasing the thread-local object discards the versions of all the threads.
+        //
+        PyObject* local = createThreadLocal();
+        if(!local)
+        {
+            PyErr_Clear();
+            return;
+        }
+        Py_DECREF(obj->local);
+        obj->local = local;
+    }
+    else
+    {
+        Py_XDECREF(obj->version);
+        obj->version = 0;
+    }
+}
@@ -20,7 +20,15 @@ extern PyTypeObject ImplicitContextType;
 
 bool initImplicitContext(PyObject*);
 
-PyObject* createImplicitContext(const Ice::ImplicitContextPtr&);
+//
+// The implicit context must be created once per communicator, since it caches the context.
+//
+PyObject* createImplicitContext(const Ice::ImplicitContextPtr&, bool);
+
+//
+// Discards the cached versions of the context, called when the communicator is destroyed.
+//
+void clearImplicitContext(PyObject*);
 
 }
 
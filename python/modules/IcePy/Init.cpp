@@ -14,11 +14,13 @@
 #include <Communicator.h>
 #include <Connection.h>
 #include <ConnectionInfo.h>
+#include <Context.h>
 #include <Current.h>
 #include <Dispatcher.h>
 #include <Endpoint.h>
 #include <EndpointInfo.h>
 #include <ImplicitContext.h>
+#include <Instrumentation.h>
 #include <Logger.h>
 #include <ObjectAdapter.h>
 #include <Operation.h>
@@ -98,6 +100,12 @@ static PyMethodDef methods[] =
         PyDoc_STR(STRCAST("internal function")) },
     { STRCAST("loadSlice"), reinterpret_cast<PyCFunction>(IcePy_loadSlice), METH_VARARGS,
         PyDoc_STR(STRCAST("loadSlice(cmd) -> None")) },
+    { STRCAST("getAdmissionStats"), reinterpret_cast<PyCFunction>(IcePy_getAdmissionStats), METH_NOARGS,
+        PyDoc_STR(STRCAST("getAdmissionStats() -> list")) },
+    { STRCAST("enableOperationMetrics"), reinterpret_cast<PyCFunction>(IcePy_enableOperationMetrics), METH_VARARGS,
+        PyDoc_STR(STRCAST("enableOperationMetrics([enable]) -> None")) },
+    { STRCAST("getOperationMetrics"), reinterpret_cast<PyCFunction>(IcePy_getOperationMetrics), METH_NOARGS,
+        PyDoc_STR(STRCAST("getOperationMetrics() -> list")) },
     { STRCAST("cleanup"), reinterpret_cast<PyCFunction>(IcePy_cleanup), METH_NOARGS,
         PyDoc_STR(STRCAST("internal function")) },
     { STRCAST("compile"), reinterpret_cast<PyCFunction>(IcePy_compile), METH_VARARGS,
@@ -193,6 +201,10 @@ initIcePy(void)
     {
         INIT_RETURN;
     }
+    if(!initInstrumentation(module))
+    {
+        INIT_RETURN;
+    }
     if(!initCommunicator(module))
     {
         INIT_RETURN;
@@ -225,6 +237,10 @@ initIcePy(void)
     {
         INIT_RETURN;
     }
+    if(!initContext(module))
+    {
+        INIT_RETURN;
+    }
     if(!initEndpoint(module))
     {
         INIT_RETURN;
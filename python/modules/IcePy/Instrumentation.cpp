@@ -0,0 +1,829 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifdef _WIN32
+#   include <IceUtil/Config.h>
+#endif
+#include <Instrumentation.h>
+#include <ConnectionInfo.h>
+#include <Current.h>
+#include <Endpoint.h>
+#include <Proxy.h>
+#include <Thread.h>
+#include <Types.h>
+#include <Ice/Communicator.h>
+#include <Ice/Initialize.h>
+#include <Ice/Properties.h>
+
+using namespace std;
+using namespace IcePy;
+using namespace Ice::Instrumentation;
+
+namespace IcePy
+{
+
+struct ObserverUpdaterObject
+{
+    PyObject_HEAD
+    ObserverUpdaterPtr* updater;
+    ObserverStatsPtr* stats;
+};
+
+extern PyTypeObject ObserverUpdaterType;
+
+//
+// The base class of the native observers. The events are counted and, if the
+// observer was sampled, forwarded to the observer returned by the Python
+// communicator observer.
+//
+class ObserverI : public virtual Ice::Instrumentation::Observer
+{
+public:
+
+    ObserverI(const ObserverStatsPtr&, ObserverCounters*, PyObject*);
+    ~ObserverI();
+
+    virtual void attach();
+    virtual void detach();
+    virtual void failed(const string&);
+
+    PyObject* delegate() const;
+    void setDelegate(PyObject*);
+
+protected:
+
+    void count(Ice::Long ObserverCounters::*, Ice::Long);
+    void forward(const char*, PyObject* = 0);
+
+    const ObserverStatsPtr _stats;
+    ObserverCounters* _counters;
+    PyObject* _delegate;
+    bool _attached;
+};
+
+class ConnectionObserverI : public ConnectionObserver, public ObserverI
+{
+public:
+
+    ConnectionObserverI(const ObserverStatsPtr&, ObserverCounters*, PyObject*);
+
+    virtual void sentBytes(Ice::Int);
+    virtual void receivedBytes(Ice::Int);
+};
+typedef IceUtil::Handle<ConnectionObserverI> ConnectionObserverIPtr;
+
+class DispatchObserverI : public DispatchObserver, public ObserverI
+{
+public:
+
+    DispatchObserverI(const ObserverStatsPtr&, ObserverCounters*, PyObject*);
+
+    virtual void userException();
+    virtual void reply(Ice::Int);
+};
+
+//
+// Counts the bytes of the requests sent by an invocation and of their replies.
+//
+class RemoteObserverI : public RemoteObserver
+{
+public:
+
+    RemoteObserverI(const ObserverStatsPtr&, ObserverCounters*);
+
+    virtual void attach();
+    virtual void detach();
+    virtual void failed(const string&);
+    virtual void reply(Ice::Int);
+
+private:
+
+    const ObserverStatsPtr _stats;
+    ObserverCounters* _counters;
+};
+
+class InvocationObserverI : public InvocationObserver, public ObserverI
+{
+public:
+
+    InvocationObserverI(const ObserverStatsPtr&, ObserverCounters*, PyObject*);
+
+    virtual void retried();
+    virtual void userException();
+    virtual RemoteObserverPtr getRemoteObserver(const Ice::ConnectionInfoPtr&, const Ice::EndpointPtr&, Ice::Int,
+                                                Ice::Int);
+    virtual CollocatedObserverPtr getCollocatedObserver(const Ice::ObjectAdapterPtr&, Ice::Int, Ice::Int);
+};
+
+}
+
+namespace
+{
+
+//
+// Calls a method of the Python communicator observer, the arguments are a new reference
+// released by this function. Returns a new reference to the result, or 0 if the method
+// returned None or raised an exception.
+//
+PyObject*
+callObserver(PyObject* observer, const char* method, PyObject* a)
+{
+    PyObjectHandle args = a;
+    if(!args.get())
+    {
+        PyErr_Print();
+        return 0;
+    }
+
+    PyObjectHandle m = getAttr(observer, method, false);
+    if(!m.get())
+    {
+        PyErr_Clear();
+        return 0;
+    }
+
+    PyObjectHandle result = PyObject_Call(m.get(), args.get(), 0);
+    if(!result.get())
+    {
+        PyErr_Print();
+        return 0;
+    }
+    if(result.get() == Py_None)
+    {
+        return 0;
+    }
+    return result.release();
+}
+
+PyObject*
+createObserverEndpoint(const Ice::EndpointPtr& endpoint)
+{
+    if(endpoint)
+    {
+        return createEndpoint(endpoint);
+    }
+    return incRef(Py_None);
+}
+
+}
+
+IcePy::ObserverCounters::ObserverCounters() :
+    total(0), current(0), failures(0), userExceptions(0), retries(0), receivedBytes(0), sentBytes(0)
+{
+}
+
+ObserverCounters*
+IcePy::ObserverStats::counters(const string& map, const string& name)
+{
+    //
+    // The map nodes are never erased so the counters remain valid while the
+    // observers use them. They must only be accessed with our mutex locked.
+    //
+    IceUtil::Mutex::Lock sync(*this);
+    return &_maps[map][name];
+}
+
+PyObject*
+IcePy::ObserverStats::toDictionary()
+{
+    map<string, CountersMap> maps;
+    {
+        IceUtil::Mutex::Lock sync(*this);
+        maps = _maps;
+    }
+
+    PyObjectHandle result = PyDict_New();
+    if(!result.get())
+    {
+        return 0;
+    }
+
+    for(map<string, CountersMap>::const_iterator p = maps.begin(); p != maps.end(); ++p)
+    {
+        PyObjectHandle m = PyDict_New();
+        if(!m.get() || PyDict_SetItemString(result.get(), const_cast<char*>(p->first.c_str()), m.get()) < 0)
+        {
+            return 0;
+        }
+
+        for(CountersMap::const_iterator q = p->second.begin(); q != p->second.end(); ++q)
+        {
+            const ObserverCounters& c = q->second;
+            PyObjectHandle counters = Py_BuildValue(STRCAST("{s:L,s:L,s:L,s:L,s:L,s:L,s:L}"),
+                                                    "total", static_cast<PY_LONG_LONG>(c.total),
+                                                    "current", static_cast<PY_LONG_LONG>(c.current),
+                                                    "failures", static_cast<PY_LONG_LONG>(c.failures),
+                                                    "userExceptions", static_cast<PY_LONG_LONG>(c.userExceptions),
+                                                    "retries", static_cast<PY_LONG_LONG>(c.retries),
+                                                    "receivedBytes", static_cast<PY_LONG_LONG>(c.receivedBytes),
+                                                    "sentBytes", static_cast<PY_LONG_LONG>(c.sentBytes));
+            PyObjectHandle name = createString(q->first);
+            if(!counters.get() || !name.get() || PyDict_SetItem(m.get(), name.get(), counters.get()) < 0)
+            {
+                return 0;
+            }
+        }
+    }
+
+    return result.release();
+}
+
+//
+// ObserverI implementation.
+//
+IcePy::ObserverI::ObserverI(const ObserverStatsPtr& stats, ObserverCounters* counters, PyObject* delegate) :
+    _stats(stats), _counters(counters), _delegate(delegate), _attached(false)
+{
+}
+
+IcePy::ObserverI::~ObserverI()
+{
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        Py_DECREF(_delegate);
+    }
+}
+
+void
+IcePy::ObserverI::attach()
+{
+    //
+    // A connection observer is attached again on each state change of the
+    // connection, it's only counted once.
+    //
+    {
+        IceUtil::Mutex::Lock sync(*_stats);
+        if(_attached)
+        {
+            return;
+        }
+        _attached = true;
+        ++_counters->total;
+        ++_counters->current;
+    }
+    forward("attach");
+}
+
+void
+IcePy::ObserverI::detach()
+{
+    {
+        IceUtil::Mutex::Lock sync(*_stats);
+        if(!_attached)
+        {
+            return;
+        }
+        _attached = false;
+        --_counters->current;
+    }
+    forward("detach");
+}
+
+void
+IcePy::ObserverI::failed(const string& exceptionName)
+{
+    count(&ObserverCounters::failures, 1);
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle name = createString(exceptionName);
+        PyObjectHandle tmp = callObserver(_delegate, "failed", Py_BuildValue(STRCAST("(O)"), name.get()));
+    }
+}
+
+PyObject*
+IcePy::ObserverI::delegate() const
+{
+    return _delegate;
+}
+
+void
+IcePy::ObserverI::setDelegate(PyObject* delegate)
+{
+    //
+    // Must be called with the GIL.
+    //
+    Py_XDECREF(_delegate);
+    _delegate = delegate;
+}
+
+void
+IcePy::ObserverI::count(Ice::Long ObserverCounters::* counter, Ice::Long value)
+{
+    IceUtil::Mutex::Lock sync(*_stats);
+    _counters->*counter += value;
+}
+
+void
+IcePy::ObserverI::forward(const char* method, PyObject* args)
+{
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle tmp = callObserver(_delegate, method, args ? args : PyTuple_New(0));
+    }
+}
+
+//
+// ConnectionObserverI implementation.
+//
+IcePy::ConnectionObserverI::ConnectionObserverI(const ObserverStatsPtr& stats, ObserverCounters* counters,
+                                                PyObject* delegate) :
+    ObserverI(stats, counters, delegate)
+{
+}
+
+void
+IcePy::ConnectionObserverI::sentBytes(Ice::Int num)
+{
+    count(&ObserverCounters::sentBytes, num);
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle tmp = callObserver(_delegate, "sentBytes", Py_BuildValue(STRCAST("(i)"), num));
+    }
+}
+
+void
+IcePy::ConnectionObserverI::receivedBytes(Ice::Int num)
+{
+    count(&ObserverCounters::receivedBytes, num);
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle tmp = callObserver(_delegate, "receivedBytes", Py_BuildValue(STRCAST("(i)"), num));
+    }
+}
+
+//
+// DispatchObserverI implementation.
+//
+IcePy::DispatchObserverI::DispatchObserverI(const ObserverStatsPtr& stats, ObserverCounters* counters,
+                                            PyObject* delegate) :
+    ObserverI(stats, counters, delegate)
+{
+}
+
+void
+IcePy::DispatchObserverI::userException()
+{
+    count(&ObserverCounters::userExceptions, 1);
+    forward("userException");
+}
+
+void
+IcePy::DispatchObserverI::reply(Ice::Int size)
+{
+    count(&ObserverCounters::sentBytes, size);
+    if(_delegate)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle tmp = callObserver(_delegate, "reply", Py_BuildValue(STRCAST("(i)"), size));
+    }
+}
+
+//
+// RemoteObserverI implementation.
+//
+IcePy::RemoteObserverI::RemoteObserverI(const ObserverStatsPtr& stats, ObserverCounters* counters) :
+    _stats(stats), _counters(counters)
+{
+}
+
+void
+IcePy::RemoteObserverI::attach()
+{
+}
+
+void
+IcePy::RemoteObserverI::detach()
+{
+}
+
+void
+IcePy::RemoteObserverI::failed(const string&)
+{
+}
+
+void
+IcePy::RemoteObserverI::reply(Ice::Int size)
+{
+    IceUtil::Mutex::Lock sync(*_stats);
+    _counters->receivedBytes += size;
+}
+
+//
+// InvocationObserverI implementation.
+//
+IcePy::InvocationObserverI::InvocationObserverI(const ObserverStatsPtr& stats, ObserverCounters* counters,
+                                                PyObject* delegate) :
+    ObserverI(stats, counters, delegate)
+{
+}
+
+void
+IcePy::InvocationObserverI::retried()
+{
+    count(&ObserverCounters::retries, 1);
+    forward("retried");
+}
+
+void
+IcePy::InvocationObserverI::userException()
+{
+    count(&ObserverCounters::userExceptions, 1);
+    forward("userException");
+}
+
+RemoteObserverPtr
+IcePy::InvocationObserverI::getRemoteObserver(const Ice::ConnectionInfoPtr&, const Ice::EndpointPtr&, Ice::Int,
+                                              Ice::Int size)
+{
+    count(&ObserverCounters::sentBytes, size);
+    return new RemoteObserverI(_stats, _counters);
+}
+
+CollocatedObserverPtr
+IcePy::InvocationObserverI::getCollocatedObserver(const Ice::ObjectAdapterPtr&, Ice::Int, Ice::Int)
+{
+    return 0;
+}
+
+//
+// CommunicatorObserver implementation.
+//
+IcePy::CommunicatorObserver::CommunicatorObserver(PyObject* observer) :
+    _observer(observer), _stats(new ObserverStats), _sampleRate(0)
+{
+    for(int i = 0; i < ObserverKindCount; ++i)
+    {
+        _events[i] = 0;
+    }
+    Py_INCREF(_observer);
+}
+
+IcePy::CommunicatorObserver::~CommunicatorObserver()
+{
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    Py_DECREF(_observer);
+}
+
+void
+IcePy::CommunicatorObserver::setCommunicator(const Ice::CommunicatorPtr& communicator)
+{
+    //
+    // The Python observer is not called until the communicator is initialized, nor
+    // once it is destroyed.
+    //
+    int sampleRate = 0;
+    if(communicator)
+    {
+        Ice::PropertiesPtr properties = communicator->getProperties();
+        sampleRate = properties->getPropertyAsInt("Ice.Python.Observer.SampleRate");
+    }
+
+    IceUtil::Mutex::Lock sync(*this);
+    _communicator = communicator;
+    _sampleRate = sampleRate;
+}
+
+ObserverPtr
+IcePy::CommunicatorObserver::getConnectionEstablishmentObserver(const Ice::EndpointPtr& endpt,
+                                                                const string& connector)
+{
+    ObserverCounters* counters = _stats->counters("ConnectionEstablishment", endpt->toString());
+    PyObject* delegate = 0;
+    if(sample(ConnectionEstablishment))
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle e = createObserverEndpoint(endpt);
+        PyObjectHandle c = createString(connector);
+        delegate = callObserver(_observer, "getConnectionEstablishmentObserver",
+                                Py_BuildValue(STRCAST("(OO)"), e.get(), c.get()));
+    }
+    return new ObserverI(_stats, counters, delegate);
+}
+
+ObserverPtr
+IcePy::CommunicatorObserver::getEndpointLookupObserver(const Ice::EndpointPtr& endpt)
+{
+    ObserverCounters* counters = _stats->counters("EndpointLookup", endpt->toString());
+    PyObject* delegate = 0;
+    if(sample(EndpointLookup))
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle e = createObserverEndpoint(endpt);
+        delegate = callObserver(_observer, "getEndpointLookupObserver", Py_BuildValue(STRCAST("(O)"), e.get()));
+    }
+    return new ObserverI(_stats, counters, delegate);
+}
+
+ConnectionObserverPtr
+IcePy::CommunicatorObserver::getConnectionObserver(const Ice::ConnectionInfoPtr& c, const Ice::EndpointPtr& e,
+                                                   ConnectionState s, const ConnectionObserverPtr& o)
+{
+    //
+    // This is called for each state change of a connection. We keep the observer
+    // of the connection and only update the Python observer of a sampled connection.
+    //
+    ConnectionObserverIPtr observer = ConnectionObserverIPtr::dynamicCast(o);
+    if(observer && !observer->delegate())
+    {
+        return observer;
+    }
+
+    ObserverCounters* counters = observer ? 0 : _stats->counters("Connection", e->toString());
+    if(!observer && !sample(Connection))
+    {
+        return new ConnectionObserverI(_stats, counters, 0);
+    }
+
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    PyObjectHandle info = createConnectionInfo(c);
+    PyObjectHandle endpoint = createObserverEndpoint(e);
+    PyObject* stateType = lookupType("Ice.Instrumentation.ConnectionState");
+    PyObjectHandle state = PyObject_CallMethod(stateType, STRCAST("valueOf"), STRCAST("i"), static_cast<int>(s));
+    PyObject* old = observer ? observer->delegate() : Py_None;
+    PyObject* delegate = 0;
+    if(info.get() && endpoint.get() && state.get())
+    {
+        delegate = callObserver(_observer, "getConnectionObserver",
+                                Py_BuildValue(STRCAST("(OOOO)"), info.get(), endpoint.get(), state.get(), old));
+    }
+    else
+    {
+        PyErr_Print();
+    }
+
+    if(!observer)
+    {
+        return new ConnectionObserverI(_stats, counters, delegate);
+    }
+
+    //
+    // Replace the Python observer of the connection. The observer of the connection
+    // doesn't change so we attach and detach the Python observers here.
+    //
+    if(delegate != old)
+    {
+        if(delegate)
+        {
+            PyObjectHandle tmp = callObserver(delegate, "attach", PyTuple_New(0));
+        }
+        PyObjectHandle tmp = callObserver(old, "detach", PyTuple_New(0));
+        observer->setDelegate(delegate);
+    }
+    else
+    {
+        Py_XDECREF(delegate);
+    }
+    return observer;
+}
+
+ThreadObserverPtr
+IcePy::CommunicatorObserver::getThreadObserver(const string&, const string&, ThreadState, const ThreadObserverPtr&)
+{
+    //
+    // Thread state changes occur for every dispatch, they are not observed.
+    //
+    return 0;
+}
+
+InvocationObserverPtr
+IcePy::CommunicatorObserver::getInvocationObserver(const Ice::ObjectPrx& prx, const string& operation,
+                                                   const Ice::Context& ctx)
+{
+    ObserverCounters* counters = _stats->counters("Invocation", operation);
+    PyObject* delegate = 0;
+    Ice::CommunicatorPtr communicator;
+    if(sample(Invocation))
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        {
+            IceUtil::Mutex::Lock sync(*this);
+            communicator = _communicator;
+        }
+        PyObjectHandle p = createProxy(prx, communicator);
+        PyObjectHandle op = createString(operation);
+        PyObjectHandle context = PyDict_New();
+        if(p.get() && op.get() && context.get() && contextToDictionary(ctx, context.get()))
+        {
+            delegate = callObserver(_observer, "getInvocationObserver",
+                                    Py_BuildValue(STRCAST("(OOO)"), p.get(), op.get(), context.get()));
+        }
+        else
+        {
+            PyErr_Print();
+        }
+    }
+    return new InvocationObserverI(_stats, counters, delegate);
+}
+
+DispatchObserverPtr
+IcePy::CommunicatorObserver::getDispatchObserver(const Ice::Current& current, Ice::Int size)
+{
+    ObserverCounters* counters = _stats->counters("Dispatch", current.operation);
+    {
+        IceUtil::Mutex::Lock sync(*_stats);
+        counters->receivedBytes += size;
+    }
+
+    PyObject* delegate = 0;
+    if(sample(Dispatch))
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        PyObjectHandle c = createCurrent(current);
+        if(c.get())
+        {
+            delegate = callObserver(_observer, "getDispatchObserver", Py_BuildValue(STRCAST("(Oi)"), c.get(), size));
+        }
+        else
+        {
+            PyErr_Print();
+        }
+    }
+    return new DispatchObserverI(_stats, counters, delegate);
+}
+
+void
+IcePy::CommunicatorObserver::setObserverUpdater(const ObserverUpdaterPtr& updater)
+{
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+
+    ObserverUpdaterObject* obj =
+        reinterpret_cast<ObserverUpdaterObject*>(ObserverUpdaterType.tp_alloc(&ObserverUpdaterType, 0));
+    if(!obj)
+    {
+        PyErr_Print();
+        return;
+    }
+    obj->updater = new ObserverUpdaterPtr(updater);
+    obj->stats = new ObserverStatsPtr(_stats);
+
+    PyObjectHandle tmp = callObserver(_observer, "setObserverUpdater",
+                                      Py_BuildValue(STRCAST("(O)"), reinterpret_cast<PyObject*>(obj)));
+    Py_DECREF(reinterpret_cast<PyObject*>(obj));
+}
+
+bool
+IcePy::CommunicatorObserver::sample(ObserverKind kind)
+{
+    IceUtil::Mutex::Lock sync(*this);
+    return _sampleRate > 0 && ++_events[kind] % _sampleRate == 0;
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static ObserverUpdaterObject*
+observerUpdaterNew(PyTypeObject* /*type*/, PyObject* /*args*/, PyObject* /*kwds*/)
+{
+    PyErr_Format(PyExc_RuntimeError, STRCAST("An observer updater can only be created by the Ice runtime"));
+    return 0;
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static void
+observerUpdaterDealloc(ObserverUpdaterObject* self)
+{
+    delete self->updater;
+    delete self->stats;
+    Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+observerUpdaterUpdateConnectionObservers(ObserverUpdaterObject* self)
+{
+    try
+    {
+        AllowThreads allowThreads; // Release Python's global interpreter lock during blocking calls.
+        (*self->updater)->updateConnectionObservers();
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    return incRef(Py_None);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+observerUpdaterUpdateThreadObservers(ObserverUpdaterObject* self)
+{
+    try
+    {
+        AllowThreads allowThreads; // Release Python's global interpreter lock during blocking calls.
+        (*self->updater)->updateThreadObservers();
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    return incRef(Py_None);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+observerUpdaterGetMetrics(ObserverUpdaterObject* self)
+{
+    return (*self->stats)->toDictionary();
+}
+
+static PyMethodDef ObserverUpdaterMethods[] =
+{
+    { STRCAST("updateConnectionObservers"), reinterpret_cast<PyCFunction>(observerUpdaterUpdateConnectionObservers),
+        METH_NOARGS, PyDoc_STR(STRCAST("updateConnectionObservers() -> None")) },
+    { STRCAST("updateThreadObservers"), reinterpret_cast<PyCFunction>(observerUpdaterUpdateThreadObservers),
+        METH_NOARGS, PyDoc_STR(STRCAST("updateThreadObservers() -> None")) },
+    { STRCAST("getMetrics"), reinterpret_cast<PyCFunction>(observerUpdaterGetMetrics), METH_NOARGS,
+        PyDoc_STR(STRCAST("getMetrics() -> dict")) },
+    { 0, 0 } /* sentinel */
+};
+
+namespace IcePy
+{
+
+PyTypeObject ObserverUpdaterType =
+{
+    /* The ob_type field must be initialized in the module init function
+     * to be portable to Windows without using C++. */
+    PyVarObject_HEAD_INIT(0, 0)
+    STRCAST("IcePy.ObserverUpdater"),     /* tp_name */
+    sizeof(ObserverUpdaterObject),        /* tp_basicsize */
+    0,                                    /* tp_itemsize */
+    /* methods */
+    reinterpret_cast<destructor>(observerUpdaterDealloc), /* tp_dealloc */
+    0,                               /* tp_print */
+    0,                               /* tp_getattr */
+    0,                               /* tp_setattr */
+    0,                               /* tp_reserved */
+    0,                               /* tp_repr */
+    0,                               /* tp_as_number */
+    0,                               /* tp_as_sequence */
+    0,                               /* tp_as_mapping */
+    0,                               /* tp_hash */
+    0,                               /* tp_call */
+    0,                               /* tp_str */
+    0,                               /* tp_getattro */
+    0,                               /* tp_setattro */
+    0,                               /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,              /* tp_flags */
+    0,                               /* tp_doc */
+    0,                               /* tp_traverse */
+    0,                               /* tp_clear */
+    0,                               /* tp_richcompare */
+    0,                               /* tp_weaklistoffset */
+    0,                               /* tp_iter */
+    0,                               /* tp_iternext */
+    ObserverUpdaterMethods,          /* tp_methods */
+    0,                               /* tp_members */
+    0,                               /* tp_getset */
+    0,                               /* tp_base */
+    0,                               /* tp_dict */
+    0,                               /* tp_descr_get */
+    0,                               /* tp_descr_set */
+    0,                               /* tp_dictoffset */
+    0,                               /* tp_init */
+    0,                               /* tp_alloc */
+    reinterpret_cast<newfunc>(observerUpdaterNew), /* tp_new */
+    0,                               /* tp_free */
+    0,                               /* tp_is_gc */
+};
+
+}
+
+bool
+IcePy::initInstrumentation(PyObject* module)
+{
+    if(PyType_Ready(&ObserverUpdaterType) < 0)
+    {
+        return false;
+    }
+    PyTypeObject* type = &ObserverUpdaterType; // Necessary to prevent GCC's strict-alias warnings.
+    if(PyModule_AddObject(module, STRCAST("ObserverUpdater"), reinterpret_cast<PyObject*>(type)) < 0)
+    {
+        return false;
+    }
+
+    return true;
+}
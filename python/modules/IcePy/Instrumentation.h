@@ -0,0 +1,116 @@
+// **********************************************************************
+//
+// Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+//
+// This copy of Ice is licensed to you under the terms described in the
+// ICE_LICENSE file included in this distribution.
+//
+// **********************************************************************
+
+#ifndef ICEPY_INSTRUMENTATION_H
+#define ICEPY_INSTRUMENTATION_H
+
+#include <Config.h>
+#include <Util.h>
+#include <Ice/CommunicatorF.h>
+#include <Ice/Instrumentation.h>
+#include <IceUtil/Mutex.h>
+
+namespace IcePy
+{
+
+bool initInstrumentation(PyObject*);
+
+//
+// The counters of the observed objects with the same name.
+//
+struct ObserverCounters
+{
+    ObserverCounters();
+
+    Ice::Long total;
+    Ice::Long current;
+    Ice::Long failures;
+    Ice::Long userExceptions;
+    Ice::Long retries;
+    Ice::Long receivedBytes;
+    Ice::Long sentBytes;
+};
+
+//
+// Aggregates the observer events natively. The counters are grouped by
+// operation for invocations and dispatches, and by endpoint for the other
+// observers.
+//
+class ObserverStats : public IceUtil::Shared, public IceUtil::Mutex
+{
+public:
+
+    ObserverCounters* counters(const std::string&, const std::string&);
+
+    PyObject* toDictionary();
+
+private:
+
+    typedef std::map<std::string, ObserverCounters> CountersMap;
+    std::map<std::string, CountersMap> _maps;
+};
+typedef IceUtil::Handle<ObserverStats> ObserverStatsPtr;
+
+//
+// Wraps the Python communicator observer supplied with InitializationData.observer.
+//
+// Every event is counted natively without acquiring the GIL. The Python observer
+// is not called unless Ice.Python.Observer.SampleRate is set, in which case it's
+// asked for an observer for one out of SampleRate invocations, dispatches and
+// connections.
+//
+class CommunicatorObserver : public Ice::Instrumentation::CommunicatorObserver, private IceUtil::Mutex
+{
+public:
+
+    CommunicatorObserver(PyObject*);
+    ~CommunicatorObserver();
+
+    void setCommunicator(const Ice::CommunicatorPtr&);
+
+    virtual Ice::Instrumentation::ObserverPtr getConnectionEstablishmentObserver(const Ice::EndpointPtr&,
+                                                                                const std::string&);
+    virtual Ice::Instrumentation::ObserverPtr getEndpointLookupObserver(const Ice::EndpointPtr&);
+    virtual Ice::Instrumentation::ConnectionObserverPtr
+    getConnectionObserver(const Ice::ConnectionInfoPtr&, const Ice::EndpointPtr&,
+                          Ice::Instrumentation::ConnectionState, const Ice::Instrumentation::ConnectionObserverPtr&);
+    virtual Ice::Instrumentation::ThreadObserverPtr
+    getThreadObserver(const std::string&, const std::string&, Ice::Instrumentation::ThreadState,
+                      const Ice::Instrumentation::ThreadObserverPtr&);
+    virtual Ice::Instrumentation::InvocationObserverPtr getInvocationObserver(const Ice::ObjectPrx&,
+                                                                             const std::string&,
+                                                                             const Ice::Context&);
+    virtual Ice::Instrumentation::DispatchObserverPtr getDispatchObserver(const Ice::Current&, Ice::Int);
+    virtual void setObserverUpdater(const Ice::Instrumentation::ObserverUpdaterPtr&);
+
+private:
+
+    enum ObserverKind
+    {
+        ConnectionEstablishment,
+        EndpointLookup,
+        Connection,
+        Invocation,
+        Dispatch,
+        ObserverKindCount
+    };
+
+    bool sample(ObserverKind);
+
+    PyObject* _observer;
+    ObserverStatsPtr _stats;
+    Ice::CommunicatorPtr _communicator;
+    int _sampleRate;
+    Ice::Long _events[ObserverKindCount];
+};
+typedef IceUtil::Handle<CommunicatorObserver> CommunicatorObserverPtr;
+
+}
+
+#endif
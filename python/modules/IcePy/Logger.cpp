@@ -121,6 +121,208 @@ IcePy::LoggerWrapper::getObject()
     return _logger.get();
 }
 
+IcePy::LoggerQueue::LoggerQueue(size_t size) :
+    IceUtil::Thread("Ice.Python.AsyncLogger"),
+    _size(size),
+    _dropped(0),
+    _destroyed(false)
+{
+    _messages.reserve(_size);
+    _batch.reserve(_size);
+}
+
+bool
+IcePy::LoggerQueue::add(const LoggerWrapperPtr& logger, MessageType type, const string& category,
+                        const string& message)
+{
+    IceUtil::Monitor<IceUtil::Mutex>::Lock sync(*this);
+
+    if(_destroyed)
+    {
+        return false;
+    }
+
+    if(_messages.size() >= _size)
+    {
+        ++_dropped;
+        return true;
+    }
+
+    _messages.push_back(Message());
+    Message& m = _messages.back();
+    m.logger = logger;
+    m.type = type;
+    m.category = category;
+    m.message = message;
+
+    //
+    // The thread only waits when the queue is empty.
+    //
+    if(_messages.size() == 1)
+    {
+        notify();
+    }
+    return true;
+}
+
+void
+IcePy::LoggerQueue::destroy()
+{
+    {
+        IceUtil::Monitor<IceUtil::Mutex>::Lock sync(*this);
+        if(_destroyed)
+        {
+            return;
+        }
+        _destroyed = true;
+        notify();
+    }
+
+    getThreadControl().join();
+}
+
+void
+IcePy::LoggerQueue::run()
+{
+    while(true)
+    {
+        size_t dropped;
+        {
+            IceUtil::Monitor<IceUtil::Mutex>::Lock sync(*this);
+            while(_messages.empty() && !_destroyed)
+            {
+                wait();
+            }
+
+            if(_messages.empty())
+            {
+                return;
+            }
+
+            //
+            // Swap the buffers so that the loggers can add messages while the batch is delivered.
+            //
+            _messages.swap(_batch);
+            dropped = _dropped;
+            _dropped = 0;
+        }
+
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+
+        for(vector<Message>::const_iterator p = _batch.begin(); p != _batch.end(); ++p)
+        {
+            deliver(*p);
+        }
+
+        if(dropped > 0)
+        {
+            ostringstream os;
+            os << dropped << " log messages were dropped because the queue of Ice.Python.AsyncLogger is full";
+            Message m;
+            m.logger = _batch.front().logger;
+            m.type = WarningMessage;
+            m.message = os.str();
+            deliver(m);
+        }
+
+        //
+        // The loggers are released while holding the GIL.
+        //
+        _batch.clear();
+    }
+}
+
+void
+IcePy::LoggerQueue::deliver(const Message& m)
+{
+    PyObject* logger = m.logger->getObject();
+
+    PyObjectHandle tmp;
+    switch(m.type)
+    {
+        case PrintMessage:
+        {
+            tmp = PyObject_CallMethod(logger, STRCAST("_print"), STRCAST("s"), m.message.c_str());
+            break;
+        }
+        case TraceMessage:
+        {
+            tmp = PyObject_CallMethod(logger, STRCAST("trace"), STRCAST("ss"), m.category.c_str(), m.message.c_str());
+            break;
+        }
+        case WarningMessage:
+        {
+            tmp = PyObject_CallMethod(logger, STRCAST("warning"), STRCAST("s"), m.message.c_str());
+            break;
+        }
+        case ErrorMessage:
+        {
+            tmp = PyObject_CallMethod(logger, STRCAST("error"), STRCAST("s"), m.message.c_str());
+            break;
+        }
+    }
+
+    if(!tmp.get())
+    {
+        //
+        // There's no caller to report the exception to.
+        //
+        PyErr_WriteUnraisable(logger);
+    }
+}
+
+IcePy::AsyncLoggerWrapper::AsyncLoggerWrapper(PyObject* logger, const LoggerQueuePtr& queue) :
+    LoggerWrapper(logger),
+    _queue(queue)
+{
+}
+
+void
+IcePy::AsyncLoggerWrapper::print(const string& message)
+{
+    if(!_queue->add(this, LoggerQueue::PrintMessage, "", message))
+    {
+        LoggerWrapper::print(message);
+    }
+}
+
+void
+IcePy::AsyncLoggerWrapper::trace(const string& category, const string& message)
+{
+    if(!_queue->add(this, LoggerQueue::TraceMessage, category, message))
+    {
+        LoggerWrapper::trace(category, message);
+    }
+}
+
+void
+IcePy::AsyncLoggerWrapper::warning(const string& message)
+{
+    if(!_queue->add(this, LoggerQueue::WarningMessage, "", message))
+    {
+        LoggerWrapper::warning(message);
+    }
+}
+
+void
+IcePy::AsyncLoggerWrapper::error(const string& message)
+{
+    if(!_queue->add(this, LoggerQueue::ErrorMessage, "", message))
+    {
+        LoggerWrapper::error(message);
+    }
+}
+
+Ice::LoggerPtr
+IcePy::AsyncLoggerWrapper::cloneWithPrefix(const string& prefix)
+{
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+
+    LoggerWrapperPtr clone = LoggerWrapperPtr::dynamicCast(LoggerWrapper::cloneWithPrefix(prefix));
+    assert(clone);
+    return new AsyncLoggerWrapper(clone->getObject(), _queue);
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -13,6 +13,8 @@
 #include <Config.h>
 #include <Util.h>
 #include <Ice/Logger.h>
+#include <IceUtil/Thread.h>
+#include <IceUtil/Monitor.h>
 
 namespace IcePy
 {
@@ -40,6 +42,73 @@ private:
 };
 typedef IceUtil::Handle<LoggerWrapper> LoggerWrapperPtr;
 
+//
+// LoggerQueue holds the messages of AsyncLoggerWrapper objects in a bounded queue, and its
+// thread delivers them in batches to the Python loggers. Messages are dropped when the queue
+// is full, and the number of dropped messages is reported with a warning.
+//
+class LoggerQueue : public IceUtil::Thread, private IceUtil::Monitor<IceUtil::Mutex>
+{
+public:
+
+    enum MessageType { PrintMessage, TraceMessage, WarningMessage, ErrorMessage };
+
+    LoggerQueue(size_t);
+
+    //
+    // Returns false if the queue is destroyed, in which case the caller delivers the message.
+    //
+    bool add(const LoggerWrapperPtr&, MessageType, const std::string&, const std::string&);
+
+    //
+    // Delivers the queued messages and waits for the thread to terminate. Must be called
+    // without holding the GIL.
+    //
+    void destroy();
+
+    virtual void run();
+
+private:
+
+    struct Message
+    {
+        LoggerWrapperPtr logger;
+        MessageType type;
+        std::string category;
+        std::string message;
+    };
+
+    void deliver(const Message&);
+
+    const size_t _size;
+    std::vector<Message> _messages;
+    std::vector<Message> _batch;
+    size_t _dropped;
+    bool _destroyed;
+};
+typedef IceUtil::Handle<LoggerQueue> LoggerQueuePtr;
+
+//
+// AsyncLoggerWrapper adds the messages to a LoggerQueue instead of calling the Python
+// implementation, so that the threads of the Ice run time don't wait for the GIL to log.
+//
+class AsyncLoggerWrapper : public LoggerWrapper
+{
+public:
+
+    AsyncLoggerWrapper(PyObject*, const LoggerQueuePtr&);
+
+    virtual void print(const std::string&);
+    virtual void trace(const std::string&, const std::string&);
+    virtual void warning(const std::string&);
+    virtual void error(const std::string&);
+    virtual Ice::LoggerPtr cloneWithPrefix(const std::string&);
+
+private:
+
+    const LoggerQueuePtr _queue;
+};
+
 bool initLogger(PyObject*);
 
 void cleanupLogger();
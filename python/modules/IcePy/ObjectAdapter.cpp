@@ -393,6 +393,8 @@ adapterActivate(ObjectAdapterObject* self)
         return 0;
     }
 
+    setCollocatedAdapterHeld(*self->adapter, false);
+
     Py_INCREF(Py_None);
     return Py_None;
 }
@@ -404,6 +406,7 @@ static PyObject*
 adapterHold(ObjectAdapterObject* self)
 {
     assert(self->adapter);
+    setCollocatedAdapterHeld(*self->adapter, true);
     try
     {
         (*self->adapter)->hold();
@@ -506,6 +509,7 @@ static PyObject*
 adapterDeactivate(ObjectAdapterObject* self)
 {
     assert(self->adapter);
+    removeCollocatedAdapter(*self->adapter);
     try
     {
         AllowThreads allowThreads; // Release Python's global interpreter lock during blocking calls.
@@ -633,6 +637,7 @@ static PyObject*
 adapterDestroy(ObjectAdapterObject* self)
 {
     assert(self->adapter);
+    removeCollocatedAdapter(*self->adapter);
     try
     {
         AllowThreads allowThreads; // Release Python's global interpreter lock during blocking calls.
@@ -644,6 +649,8 @@ adapterDestroy(ObjectAdapterObject* self)
         return 0;
     }
 
+    removeAdmissionControls(*self->adapter);
+
     Py_INCREF(Py_None);
     return Py_None;
 }
@@ -850,6 +857,47 @@ adapterAddDefaultServant(ObjectAdapterObject* self, PyObject* args)
     return Py_None;
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+adapterAddDefaultIdentityServant(ObjectAdapterObject* self, PyObject* args)
+{
+    PyObject* objectType = lookupType("Ice.Object");
+    PyObject* servant;
+    PyObject* categoryObj;
+    if(!PyArg_ParseTuple(args, STRCAST("O!O"), objectType, &servant, &categoryObj))
+    {
+        return 0;
+    }
+
+    ServantWrapperPtr wrapper = createIdentityServantWrapper(servant);
+    if(PyErr_Occurred())
+    {
+        return 0;
+    }
+
+    string category;
+    if(!getStringArg(categoryObj, "category", category))
+    {
+        return 0;
+    }
+
+    assert(self->adapter);
+    try
+    {
+       (*self->adapter)->addDefaultServant(wrapper, category);
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -1566,7 +1614,7 @@ adapterGetEndpoints(ObjectAdapterObject* self)
     int i = 0;
     for(Ice::EndpointSeq::const_iterator p = endpoints.begin(); p != endpoints.end(); ++p, ++i)
     {
-        PyObjectHandle endp = createEndpoint(*p);
+        PyObjectHandle endp = createEndpoint(*p, (*self->adapter)->getCommunicator());
         if(!endp.get())
         {
             return 0;
@@ -1623,7 +1671,7 @@ adapterGetPublishedEndpoints(ObjectAdapterObject* self)
     int i = 0;
     for(Ice::EndpointSeq::const_iterator p = endpoints.begin(); p != endpoints.end(); ++p, ++i)
     {
-        PyObjectHandle endp = createEndpoint(*p);
+        PyObjectHandle endp = createEndpoint(*p, (*self->adapter)->getCommunicator());
         if(!endp.get())
         {
             return 0;
@@ -1705,6 +1753,8 @@ static PyMethodDef AdapterMethods[] =
         PyDoc_STR(STRCAST("addFacetWithUUID(servant, facet) -> Ice.ObjectPrx")) },
     { STRCAST("addDefaultServant"), reinterpret_cast<PyCFunction>(adapterAddDefaultServant), METH_VARARGS,
         PyDoc_STR(STRCAST("addDefaultServant(servant, category) -> None")) },
+    { STRCAST("addDefaultIdentityServant"), reinterpret_cast<PyCFunction>(adapterAddDefaultIdentityServant),
+        METH_VARARGS, PyDoc_STR(STRCAST("addDefaultIdentityServant(servant, category) -> None")) },
     { STRCAST("remove"), reinterpret_cast<PyCFunction>(adapterRemove), METH_VARARGS,
         PyDoc_STR(STRCAST("remove(identity) -> Ice.Object")) },
     { STRCAST("removeFacet"), reinterpret_cast<PyCFunction>(adapterRemoveFacet), METH_VARARGS,
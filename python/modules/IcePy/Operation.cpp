@@ -17,18 +17,24 @@
 #include <Thread.h>
 #include <Types.h>
 #include <Connection.h>
+#include <Context.h>
 #include <Util.h>
 #include <Ice/Communicator.h>
 #include <Ice/IncomingAsync.h>
 #include <Ice/Initialize.h>
 #include <Ice/LocalException.h>
+#include <Ice/ImplicitContext.h>
 #include <Ice/Logger.h>
+#include <Ice/LoggerUtil.h>
 #include <Ice/ObjectAdapter.h>
 #include <Ice/AsyncResult.h>
 #include <Ice/Properties.h>
 #include <Ice/Proxy.h>
+#include <IceUtil/Mutex.h>
+#include <IceUtil/MutexPtrLock.h>
 #include <IceUtil/Time.h>
 #include <Slice/PythonUtil.h>
+#include <limits>
 
 using namespace std;
 using namespace IcePy;
@@ -55,6 +61,103 @@ public:
 typedef IceUtil::Handle<ParamInfo> ParamInfoPtr;
 typedef list<ParamInfoPtr> ParamInfoList;
 
+//
+// Writes a sequence<byte> result supplied in chunks by an iterator, see
+// Operation::chunkedResult. The chunks are written as they are produced and the
+// size is patched once the iterator is exhausted, so the complete sequence never
+// needs to exist as a single Python object.
+//
+class ChunkWriter
+{
+public:
+
+    void start(Ice::OutputStream&);
+    void write(Ice::OutputStream&, PyObject*);
+    void finish(Ice::OutputStream&);
+
+private:
+
+    Ice::OutputStream::size_type _sizePos;
+    Py_ssize_t _total;
+};
+
+class QueuedDispatch;
+typedef IceUtil::Handle<QueuedDispatch> QueuedDispatchPtr;
+
+//
+// Limits the number of concurrent dispatches of an operation by an object adapter.
+// Dispatches beyond the limit are queued, up to the given number of queued dispatches,
+// or rejected. A queued dispatch doesn't block a thread of the server thread pool, it's
+// resumed by the thread that releases a slot.
+//
+class AdmissionControl : public IceUtil::Shared, public IceUtil::Mutex
+{
+public:
+
+    enum Result { Admitted, Wait, Queued, Rejected };
+
+    AdmissionControl(const Ice::ObjectAdapterPtr&, const string&);
+
+    //
+    // Returns Wait rather than queuing the dispatch if no dispatch is given.
+    //
+    Result admit(int, int, const QueuedDispatchPtr&);
+
+    //
+    // Releases the slot of a completed dispatch or passes it to the next queued
+    // dispatch. The given dispatch is the queued dispatch which held the slot, if any.
+    //
+    void release(const QueuedDispatchPtr&);
+
+    const Ice::ObjectAdapterPtr adapter;
+    const string name;
+    int inFlight;
+    int queued;
+    Ice::Long admitted;
+    Ice::Long rejected;
+
+private:
+
+    QueuedDispatchPtr next();
+    void resume(QueuedDispatchPtr);
+
+    deque<QueuedDispatchPtr> _queue;
+};
+typedef IceUtil::Handle<AdmissionControl> AdmissionControlPtr;
+
+//
+// The marshaling, unmarshaling and servant times (in microseconds) and the sizes
+// of an operation, collected when operation metrics are enabled. The counters are
+// only updated and read with the GIL locked.
+//
+class OperationMetrics : public IceUtil::Shared
+{
+public:
+
+    OperationMetrics(const string&);
+
+    void call();
+    void marshaled(Ice::Long, Ice::Long);
+    void unmarshaled(Ice::Long, Ice::Long);
+    void dispatched(Ice::Long);
+
+    const string name;
+    Ice::Long calls;
+    Ice::Long bytesIn;
+    Ice::Long bytesOut;
+    Ice::Long marshalCount;
+    Ice::Long marshalTime;
+    Ice::Long unmarshalCount;
+    Ice::Long unmarshalTime;
+    Ice::Long servantCount;
+    Ice::Long servantTime;
+
+private:
+
+    bool _registered;
+};
+typedef IceUtil::Handle<OperationMetrics> OperationMetricsPtr;
+
 //
 // Encapsulates attributes of an operation.
 //
@@ -64,7 +167,12 @@ public:
 
     Operation(const char*, PyObject*, PyObject*, int, PyObject*, PyObject*, PyObject*, PyObject*, PyObject*, PyObject*);
 
-    void marshalResult(Ice::OutputStream&, PyObject*);
+    //
+    // Returns the asynchronous iterator supplying the chunked result, whose chunks
+    // must then be written with the given writer, or 0 once the results are marshaled.
+    //
+    PyObject* marshalResult(Ice::OutputStream&, PyObject*, ChunkWriter* = 0);
+    PyObject* validateResult(PyObject*);
 
     void deprecate(const string&);
 
@@ -79,14 +187,19 @@ public:
     ParamInfoList outParams;
     ParamInfoList optionalOutParams;
     ParamInfoPtr returnType;
+    ParamInfoPtr chunkedResult;
     ExceptionInfoList exceptions;
     string dispatchName;
     bool sendsClasses;
     bool returnsClasses;
     bool pseudoOp;
+    int maxConcurrency;
+    OperationMetricsPtr metrics;
 
 private:
 
+    PyObject* marshalChunks(Ice::OutputStream&, PyObject*, ChunkWriter*);
+
     string _deprecateMessage;
 
     static void convertParams(PyObject*, ParamInfoList&, Py_ssize_t, bool&);
@@ -138,6 +251,8 @@ public:
 
 private:
 
+    bool invokeCollocated(PyObject*, PyObject*, PyObject*&);
+
     OperationPtr _op;
 };
 
@@ -160,15 +275,30 @@ public:
     void exception(const Ice::Exception&);
     void sent(bool);
 
+    //
+    // Releases the given proxy of the invocation router once the invocation completes.
+    //
+    void setInvocationRouter(const InvocationRouterPtr&, size_t);
+    void releaseInvocationRouter(bool);
+
 private:
 
     void checkAsyncTwowayOnly(const Ice::ObjectPrx&) const;
 
+    //
+    // Completion callbacks used to release the invocation router when no callbacks are provided.
+    //
+    void routerCompleted(const Ice::AsyncResultPtr&);
+    void routerSent(const Ice::AsyncResultPtr&);
+
     OperationPtr _op;
     PyObject* _pyProxy;
     PyObject* _response;
     PyObject* _ex;
     PyObject* _sent;
+    InvocationRouterPtr _router;
+    size_t _routerMember;
+    IceUtil::Time _routerStart;
 };
 typedef IceUtil::Handle<AsyncTypedInvocation> AsyncTypedInvocationPtr;
 
@@ -188,11 +318,18 @@ public:
     void exception(const Ice::Exception&);
     void sent(bool);
 
+    //
+    // Releases the given proxy of the invocation router once the invocation completes.
+    //
+    void setInvocationRouter(const InvocationRouterPtr&, size_t);
+
 protected:
 
     virtual Ice::AsyncResultPtr handleInvoke(PyObject*, PyObject*) = 0;
     virtual void handleResponse(PyObject*, bool, const pair<const Ice::Byte*, const Ice::Byte*>&) = 0;
 
+    void releaseInvocationRouter(bool);
+
     PyObject* _pyProxy;
     string _operation;
     bool _twoway;
@@ -203,6 +340,9 @@ protected:
     bool _ok;
     vector<Ice::Byte> _results;
     PyObject* _exception;
+    InvocationRouterPtr _router;
+    size_t _routerMember;
+    IceUtil::Time _routerStart;
 };
 typedef IceUtil::Handle<NewAsyncInvocation> NewAsyncInvocationPtr;
 
@@ -310,19 +450,40 @@ class TypedUpcall : public Upcall
 {
 public:
 
-    TypedUpcall(const OperationPtr&, const Ice::AMD_Object_ice_invokePtr&, const Ice::CommunicatorPtr&);
+    TypedUpcall(const OperationPtr&, const Ice::AMD_Object_ice_invokePtr&, const Ice::Current&, bool);
+    ~TypedUpcall();
 
     virtual void dispatch(PyObject*, const pair<const Ice::Byte*, const Ice::Byte*>&, const Ice::Current&);
     virtual void response(PyObject*);
     virtual void exception(PyException&);
     virtual void exception(const Ice::Exception&);
 
+    //
+    // Writes a chunk of the result supplied by an asynchronous iterator. The response
+    // is sent by the following call to response.
+    //
+    void writeChunk(PyObject*);
+
 private:
 
+    void dispatchIdentity(PyObject*, PyObject*, const Ice::Current&);
+    bool servantCompleted();
+    void sendResponse(Ice::OutputStream&, Ice::Long);
+
     OperationPtr _op;
     Ice::AMD_Object_ice_invokePtr _callback;
     Ice::CommunicatorPtr _communicator;
     Ice::EncodingVersion _encoding;
+    bool _identity;
+    Ice::Long _servantStart;
+
+    //
+    // The stream of a response whose chunked result is supplied by an asynchronous
+    // iterator, and the time spent marshaling it when operation metrics are enabled.
+    //
+    Ice::OutputStream* _chunked;
+    ChunkWriter _chunkWriter;
+    Ice::Long _marshalTime;
 };
 
 //
@@ -346,23 +507,101 @@ private:
 
 //
 // TypedServantWrapper uses the information in Operation to validate, marshal, and unmarshal
-// parameters and exceptions.
+// parameters and exceptions. With an identity servant, the servant methods receive the name
+// and category of the target identity instead of Ice::Current.
 //
 class TypedServantWrapper : public ServantWrapper
 {
 public:
 
-    TypedServantWrapper(PyObject*);
+    TypedServantWrapper(PyObject*, bool = false);
 
     virtual void ice_invoke_async(const Ice::AMD_Object_ice_invokePtr&,
                                   const pair<const Ice::Byte*, const Ice::Byte*>&,
                                   const Ice::Current&);
 
+    bool identity() const;
+
+    //
+    // Dispatches a request whose slot, if any, is acquired. Must be called with the GIL.
+    //
+    void dispatch(const OperationPtr&, const Ice::AMD_Object_ice_invokePtr&,
+                  const pair<const Ice::Byte*, const Ice::Byte*>&, const Ice::Current&);
+
 private:
 
+    void getAdmissionSettings(const Ice::ObjectAdapterPtr&, int&, int&, string&);
+    void reject(const OperationPtr&, const Ice::AMD_Object_ice_invokePtr&, const string&, const Ice::Current&);
+
     typedef map<string, OperationPtr> OperationMap;
     OperationMap _operationMap;
     OperationMap::iterator _lastOp;
+    bool _identity;
+
+    //
+    // The admission control settings of the object adapter that last dispatched
+    // a request to this servant. The adapter is held so that its address can't be
+    // reused by another adapter while it's cached.
+    //
+    Ice::ObjectAdapterPtr _adapter;
+    int _maxConcurrency;
+    int _maxQueued;
+    string _rejectException;
+};
+typedef IceUtil::Handle<TypedServantWrapper> TypedServantWrapperPtr;
+
+//
+// A dispatch queued by an admission control. It holds the callback of the dispatch
+// and a copy of its parameters until it's resumed with a released slot.
+//
+class QueuedDispatch : public IceUtil::Shared
+{
+public:
+
+    QueuedDispatch(const TypedServantWrapperPtr&, const OperationPtr&, const Ice::AMD_Object_ice_invokePtr&,
+                   const pair<const Ice::Byte*, const Ice::Byte*>&, const Ice::Current&);
+
+    void dispatch(const AdmissionControlPtr&);
+
+    //
+    // Protected by the mutex of the admission control. A dispatch is running while
+    // the thread that resumed it dispatches it, and completed if its slot was
+    // released meanwhile.
+    //
+    bool running;
+    bool completed;
+
+private:
+
+    const TypedServantWrapperPtr _servant;
+    const OperationPtr _op;
+    const Ice::AMD_Object_ice_invokePtr _callback;
+    const vector<Ice::Byte> _inParams;
+    const Ice::Current _current;
+};
+
+//
+// Releases the admission control slot of a dispatch once it completes.
+//
+class AdmittedCallback : public Ice::AMD_Object_ice_invoke
+{
+public:
+
+    AdmittedCallback(const Ice::AMD_Object_ice_invokePtr&, const AdmissionControlPtr&, const QueuedDispatchPtr&);
+    ~AdmittedCallback();
+
+    virtual void ice_response(bool, const vector<Ice::Byte>&);
+    virtual void ice_response(bool, const pair<const Ice::Byte*, const Ice::Byte*>&);
+    virtual void ice_exception(const std::exception&);
+    virtual void ice_exception();
+
+private:
+
+    void release();
+
+    const Ice::AMD_Object_ice_invokePtr _callback;
+    AdmissionControlPtr _admission;
+    const QueuedDispatchPtr _dispatch;
 };
 
 //
@@ -379,10 +618,17 @@ public:
                                   const Ice::Current&);
 };
 
+//
+// The Operation object is created on first use from the arguments given to the IcePy.Operation
+// constructor (the descriptor), most operations of a large Slice module are never invoked or
+// dispatched by a process.
+//
 struct OperationObject
 {
     PyObject_HEAD
     OperationPtr* op;
+    PyObject* descriptor;
+    string* deprecateMessage;
 };
 
 struct DoneCallbackObject
@@ -439,12 +685,260 @@ public:
 namespace
 {
 
+//
+// The admission controls of the operations dispatched by object adapters with a
+// concurrency limit, see IcePy_getAdmissionStats.
+//
+IceUtil::Mutex* admissionMutex = 0;
+typedef map<pair<Ice::ObjectAdapter*, string>, AdmissionControlPtr> AdmissionControlMap;
+AdmissionControlMap admissionControls;
+
+AdmissionControlPtr
+getAdmissionControl(const Ice::ObjectAdapterPtr& adapter, const string& operation)
+{
+    IceUtilInternal::MutexPtrLock<IceUtil::Mutex> lock(admissionMutex);
+    pair<Ice::ObjectAdapter*, string> key(adapter.get(), operation);
+    AdmissionControlMap::const_iterator p = admissionControls.find(key);
+    if(p != admissionControls.end())
+    {
+        return p->second;
+    }
+    AdmissionControlPtr admission = new AdmissionControl(adapter, operation);
+    admissionControls.insert(make_pair(key, admission));
+    return admission;
+}
+
+//
+// Returns true if the value supplies a sequence<byte> result in chunks, see
+// Operation::chunkedResult.
+//
+bool
+isChunked(PyObject* p)
+{
+#if PY_VERSION_HEX >= 0x03050000
+    if(Py_TYPE(p)->tp_as_async && Py_TYPE(p)->tp_as_async->am_anext)
+    {
+        return true;
+    }
+#endif
+    return PyIter_Check(p);
+}
+
+//
+// Operation metrics are disabled by default, see IcePy_enableOperationMetrics. The
+// flag and the metrics are protected by the GIL.
+//
+bool operationMetricsEnabled = false;
+vector<OperationMetricsPtr> operationMetrics;
+
+//
+// The number of adapters registered with the collocated adapters of all the communicators,
+// so that the invocations don't look for the collocated adapters of their communicator
+// when there are none. Protected by the GIL.
+//
+size_t collocatedAdapterCount = 0;
+
+//
+// Returns true if the proxy's target object is hosted by the object adapter. This
+// follows the Ice run time's check for collocated invocations, with the difference
+// that endpoints must be equal rather than equivalent.
+//
+bool
+isCollocated(const Ice::ObjectAdapterPtr& adapter, const string& adapterId, const string& replicaGroupId,
+             const Ice::ObjectPrx& proxy)
+{
+    Ice::EndpointSeq endpoints = proxy->ice_getEndpoints();
+    if(!endpoints.empty())
+    {
+        Ice::EndpointSeq local = adapter->getEndpoints();
+        Ice::EndpointSeq published = adapter->getPublishedEndpoints();
+        local.insert(local.end(), published.begin(), published.end());
+        for(Ice::EndpointSeq::const_iterator p = endpoints.begin(); p != endpoints.end(); ++p)
+        {
+            for(Ice::EndpointSeq::const_iterator q = local.begin(); q != local.end(); ++q)
+            {
+                if(**p == **q)
+                {
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
+
+    string id = proxy->ice_getAdapterId();
+    if(!id.empty())
+    {
+        return id == adapterId || id == replicaGroupId;
+    }
+    return adapter->find(proxy->ice_getIdentity()) != 0;
+}
+
+//
+// Returns true if marshaling and unmarshaling the parameter value wouldn't return a
+// value of the same Python type, for example because None is replaced by the default
+// value of a structure or a tuple by the list of a sequence.
+//
+bool
+isConverted(const ParamInfoPtr& info, PyObject* value, const Ice::StringSeq& metaData)
+{
+    if(info->optional && value == Unset)
+    {
+        return false;
+    }
+
+    SequenceInfoPtr si = SequenceInfoPtr::dynamicCast(info->type);
+    if(si)
+    {
+        return !si->isMapped(value, &metaData);
+    }
+    else if(value == Py_None)
+    {
+        PrimitiveInfoPtr pi = PrimitiveInfoPtr::dynamicCast(info->type);
+        return (pi && pi->kind == PrimitiveInfo::KindString) || StructInfoPtr::dynamicCast(info->type) ||
+            DictionaryInfoPtr::dynamicCast(info->type);
+    }
+    return false;
+}
+
+//
+// Returns a deep copy of the given value made with copy.deepcopy, or 0 if the value
+// cannot be copied.
+//
+PyObject*
+deepCopy(PyObject* value)
+{
+    static PyObject* copyModule = 0;
+    if(!copyModule)
+    {
+        copyModule = PyImport_ImportModule(STRCAST("copy"));
+        if(!copyModule)
+        {
+            return 0;
+        }
+    }
+
+    //
+    // Ice.Unset can't be copied.
+    //
+    PyObjectHandle memo = PyDict_New();
+    PyObjectHandle unsetId = PyLong_FromVoidPtr(Unset);
+    if(!memo.get() || !unsetId.get() || PyDict_SetItem(memo.get(), unsetId.get(), Unset) < 0)
+    {
+        return 0;
+    }
+    return PyObject_CallMethod(copyModule, STRCAST("deepcopy"), STRCAST("OO"), value, memo.get());
+}
+
+inline Ice::Long
+metricsTime()
+{
+    return IceUtil::Time::now(IceUtil::Time::Monotonic).toMicroSeconds();
+}
+
+class Init
+{
+public:
+
+    Init()
+    {
+        admissionMutex = new IceUtil::Mutex;
+    }
+
+    ~Init()
+    {
+        delete admissionMutex;
+        admissionMutex = 0;
+    }
+};
+
+Init init;
+
+//
+// Returns the Operation of an IcePy.Operation object, or 0 with a Python exception set if it
+// can't be created from its descriptor.
+//
 OperationPtr
 getOperation(PyObject* p)
 {
     assert(PyObject_IsInstance(p, reinterpret_cast<PyObject*>(&OperationType)) == 1);
     OperationObject* obj = reinterpret_cast<OperationObject*>(p);
-    return *obj->op;
+    if(obj->op)
+    {
+        return *obj->op;
+    }
+
+    //
+    // The descriptor is either the complete argument tuple or, with code generated by
+    // this version of slice2py, the first six arguments followed by a callable that
+    // returns the parameters, the return type and the exceptions. These arguments refer
+    // to the type objects of the module, they are only evaluated here so that the types
+    // declared after the operation are defined.
+    //
+    // Calling the Python callable and creating the Operation can switch threads, and another
+    // thread can create the Operation and release the descriptor in the meantime.
+    //
+    PyObjectHandle desc = incRef(obj->descriptor);
+    PyObjectHandle args;
+    if(PyTuple_GET_SIZE(desc.get()) == 7)
+    {
+        PyObjectHandle params = PyObject_CallObject(PyTuple_GET_ITEM(desc.get(), 6), 0);
+        if(!params.get())
+        {
+            return 0;
+        }
+        if(!PyTuple_Check(params.get()) || PyTuple_GET_SIZE(params.get()) != 4)
+        {
+            PyErr_Format(PyExc_ValueError, STRCAST("invalid parameters for operation `%s'"),
+                         getString(PyTuple_GET_ITEM(desc.get(), 0)).c_str());
+            return 0;
+        }
+        PyObjectHandle head = PyTuple_GetSlice(desc.get(), 0, 6);
+        if(!head.get())
+        {
+            return 0;
+        }
+        args = PySequence_Concat(head.get(), params.get());
+    }
+    else
+    {
+        args = desc;
+    }
+
+    char* name;
+    PyObject* mode;
+    PyObject* sendMode;
+    int amd;
+    PyObject* format;
+    PyObject* metaData;
+    PyObject* inParams;
+    PyObject* outParams;
+    PyObject* returnType;
+    PyObject* exceptions;
+    if(!args.get() ||
+       !PyArg_ParseTuple(args.get(), STRCAST("sOOiOO!O!O!OO!"), &name, &mode, &sendMode, &amd, &format,
+                         &PyTuple_Type, &metaData, &PyTuple_Type, &inParams, &PyTuple_Type, &outParams, &returnType,
+                         &PyTuple_Type, &exceptions))
+    {
+        return 0;
+    }
+
+    OperationPtr op = new Operation(name, mode, sendMode, amd, format, metaData, inParams, outParams, returnType,
+                                    exceptions);
+    if(obj->op)
+    {
+        return *obj->op;
+    }
+
+    if(obj->deprecateMessage)
+    {
+        op->deprecate(*obj->deprecateMessage);
+        delete obj->deprecateMessage;
+        obj->deprecateMessage = 0;
+    }
+    obj->op = new OperationPtr(op);
+    Py_CLEAR(obj->descriptor);
+    return op;
 }
 
 void
@@ -498,6 +992,72 @@ callSent(PyObject* method, bool sentSynchronously, bool passArg)
     }
 }
 
+//
+// The typed invocations on a proxy created with ice_connectionPool or with the adaptive
+// endpoint selection use one of the proxies of its invocation router. The local
+// exceptions are reported as failures to the router.
+//
+PyObject*
+invokeTyped(PyObject* pyProxy, const OperationPtr& op, PyObject* args)
+{
+    InvocationRouterPtr router = getInvocationRouter(pyProxy);
+    if(!router)
+    {
+        InvocationPtr i = new SyncTypedInvocation(getProxy(pyProxy), op);
+        return i->invoke(args);
+    }
+
+    size_t member = router->acquire();
+    IceUtil::Time start = IceUtil::Time::now(IceUtil::Time::Monotonic);
+    InvocationPtr i = new SyncTypedInvocation(router->proxy(member), op);
+    PyObject* result = i->invoke(args);
+    router->release(member, start, !result && PyErr_ExceptionMatches(lookupType("Ice.LocalException")));
+    return result;
+}
+
+PyObject*
+invokeTypedAsync(PyObject* pyProxy, const OperationPtr& op, PyObject* args)
+{
+    InvocationRouterPtr router = getInvocationRouter(pyProxy);
+    if(!router)
+    {
+        InvocationPtr i = new NewAsyncTypedInvocation(getProxy(pyProxy), pyProxy, op);
+        return i->invoke(args);
+    }
+
+    size_t member = router->acquire();
+    NewAsyncInvocationPtr i = new NewAsyncTypedInvocation(router->proxy(member), pyProxy, op);
+    i->setInvocationRouter(router, member);
+    return i->invoke(args);
+}
+
+PyObject*
+beginTyped(PyObject* pyProxy, const OperationPtr& op, PyObject* args)
+{
+    InvocationRouterPtr router = getInvocationRouter(pyProxy);
+    if(!router)
+    {
+        InvocationPtr i = new AsyncTypedInvocation(getProxy(pyProxy), pyProxy, op);
+        return i->invoke(args);
+    }
+
+    size_t member = router->acquire();
+    AsyncTypedInvocationPtr i = new AsyncTypedInvocation(router->proxy(member), pyProxy, op);
+    i->setInvocationRouter(router, member);
+    PyObject* result = i->invoke(args);
+    if(!result)
+    {
+        i->releaseInvocationRouter(PyErr_ExceptionMatches(lookupType("Ice.LocalException")));
+    }
+    return result;
+}
+
+Ice::ObjectPrx
+endProxy(PyObject* pyProxy, const Ice::AsyncResultPtr& r)
+{
+    return getInvocationRouter(pyProxy) ? r->getProxy() : getProxy(pyProxy);
+}
+
 }
 
 #ifdef WIN32
@@ -512,6 +1072,8 @@ operationNew(PyTypeObject* type, PyObject* /*args*/, PyObject* /*kwds*/)
         return 0;
     }
     self->op = 0;
+    self->descriptor = 0;
+    self->deprecateMessage = 0;
     return self;
 }
 
@@ -533,17 +1095,28 @@ operationInit(OperationObject* self, PyObject* args, PyObject* /*kwds*/)
     PyObject* outParams;
     PyObject* returnType;
     PyObject* exceptions;
-    if(!PyArg_ParseTuple(args, STRCAST("sO!O!iOO!O!O!OO!"), &name, modeType, &mode, modeType, &sendMode, &amd,
-                         &format, &PyTuple_Type, &metaData, &PyTuple_Type, &inParams, &PyTuple_Type, &outParams,
-                         &returnType, &PyTuple_Type, &exceptions))
+    if(PyTuple_GET_SIZE(args) == 7)
+    {
+        if(!PyArg_ParseTuple(args, STRCAST("sO!O!iOO!O"), &name, modeType, &mode, modeType, &sendMode, &amd,
+                             &format, &PyTuple_Type, &metaData, &inParams))
+        {
+            return -1;
+        }
+        if(!PyCallable_Check(inParams))
+        {
+            PyErr_Format(PyExc_TypeError, STRCAST("parameters of operation `%s' must be callable"), name);
+            return -1;
+        }
+    }
+    else if(!PyArg_ParseTuple(args, STRCAST("sO!O!iOO!O!O!OO!"), &name, modeType, &mode, modeType, &sendMode, &amd,
+                              &format, &PyTuple_Type, &metaData, &PyTuple_Type, &inParams, &PyTuple_Type,
+                              &outParams, &returnType, &PyTuple_Type, &exceptions))
     {
         return -1;
     }
 
-    OperationPtr op = new Operation(name, mode, sendMode, amd, format, metaData, inParams, outParams, returnType,
-                                    exceptions);
-    self->op = new OperationPtr(op);
-
+    Py_XDECREF(self->descriptor);
+    self->descriptor = incRef(args);
     return 0;
 }
 
@@ -554,6 +1127,8 @@ static void
 operationDealloc(OperationObject* self)
 {
     delete self->op;
+    Py_XDECREF(self->descriptor);
+    delete self->deprecateMessage;
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -570,11 +1145,12 @@ operationInvoke(OperationObject* self, PyObject* args)
         return 0;
     }
 
-    Ice::ObjectPrx prx = getProxy(pyProxy);
-    assert(self->op);
-
-    InvocationPtr i = new SyncTypedInvocation(prx, *self->op);
-    return i->invoke(opArgs);
+    OperationPtr op = getOperation(reinterpret_cast<PyObject*>(self));
+    if(!op)
+    {
+        return 0;
+    }
+    return invokeTyped(pyProxy, op, opArgs);
 }
 
 #ifdef WIN32
@@ -590,9 +1166,12 @@ operationInvokeAsync(OperationObject* self, PyObject* args)
         return 0;
     }
 
-    Ice::ObjectPrx p = getProxy(proxy);
-    InvocationPtr i = new NewAsyncTypedInvocation(p, proxy, *self->op);
-    return i->invoke(opArgs);
+    OperationPtr op = getOperation(reinterpret_cast<PyObject*>(self));
+    if(!op)
+    {
+        return 0;
+    }
+    return invokeTypedAsync(proxy, op, opArgs);
 }
 
 #ifdef WIN32
@@ -608,9 +1187,12 @@ operationBegin(OperationObject* self, PyObject* args)
         return 0;
     }
 
-    Ice::ObjectPrx p = getProxy(proxy);
-    InvocationPtr i = new AsyncTypedInvocation(p, proxy, *self->op);
-    return i->invoke(opArgs);
+    OperationPtr op = getOperation(reinterpret_cast<PyObject*>(self));
+    if(!op)
+    {
+        return 0;
+    }
+    return beginTyped(proxy, op, opArgs);
 }
 
 #ifdef WIN32
@@ -626,17 +1208,21 @@ operationEnd(OperationObject* self, PyObject* args)
         return 0;
     }
 
+    OperationPtr op = getOperation(reinterpret_cast<PyObject*>(self));
+    if(!op)
+    {
+        return 0;
+    }
+
     AsyncResultObject* ar = reinterpret_cast<AsyncResultObject*>(result);
     assert(ar);
     AsyncTypedInvocationPtr i = AsyncTypedInvocationPtr::dynamicCast(*ar->invocation);
     if(!i)
     {
-        PyErr_Format(PyExc_ValueError, STRCAST("invalid AsyncResult object passed to end_%s"),
-                     (*self->op)->name.c_str());
+        PyErr_Format(PyExc_ValueError, STRCAST("invalid AsyncResult object passed to end_%s"), op->name.c_str());
         return 0;
     }
-    Ice::ObjectPrx p = getProxy(proxy);
-    return i->end(p, *self->op, *ar->result);
+    return i->end(endProxy(proxy, *ar->result), op, *ar->result);
 }
 
 #ifdef WIN32
@@ -651,8 +1237,15 @@ operationDeprecate(OperationObject* self, PyObject* args)
         return 0;
     }
 
-    assert(self->op);
-    (*self->op)->deprecate(msg);
+    if(self->op)
+    {
+        (*self->op)->deprecate(msg);
+    }
+    else
+    {
+        delete self->deprecateMessage;
+        self->deprecateMessage = new string(msg);
+    }
 
     return incRef(Py_None);
 }
@@ -805,16 +1398,44 @@ dispatchCallbackException(DispatchCallbackObject* self, PyObject* args)
 
     try
     {
-        assert(self->upcall);
-        PyException pyex(ex);
-        (*self->upcall)->exception(pyex);
+        assert(self->upcall);
+        PyException pyex(ex);
+        (*self->upcall)->exception(pyex);
+    }
+    catch(...)
+    {
+        //
+        // No exceptions should propagate to Python.
+        //
+        assert(false);
+    }
+
+    return incRef(Py_None);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+dispatchCallbackWriteChunk(DispatchCallbackObject* self, PyObject* args)
+{
+    PyObject* chunk = 0;
+    if(!PyArg_ParseTuple(args, STRCAST("O"), &chunk))
+    {
+        return 0;
+    }
+
+    assert(self->upcall);
+    TypedUpcallPtr upcall = TypedUpcallPtr::dynamicCast(*self->upcall);
+    assert(upcall);
+    try
+    {
+        upcall->writeChunk(chunk);
     }
-    catch(...)
+    catch(const AbortMarshaling&)
     {
-        //
-        // No exceptions should propagate to Python.
-        //
-        assert(false);
+        assert(PyErr_Occurred());
+        return 0;
     }
 
     return incRef(Py_None);
@@ -1190,7 +1811,11 @@ marshaledResultInit(MarshaledResultObject* self, PyObject* args, PyObject* /*kwd
 
     self->out = new Ice::OutputStream(communicator);
 
-    OperationPtr op = *opObj->op;
+    OperationPtr op = getOperation(reinterpret_cast<PyObject*>(opObj));
+    if(!op)
+    {
+        return -1;
+    }
     self->out->startEncapsulation(encoding, op->format);
 
     try
@@ -1237,6 +1862,400 @@ IcePy::ParamInfo::unmarshaled(PyObject* val, PyObject* target, void* closure)
 //
 // Operation implementation.
 //
+//
+// AdmissionControl implementation.
+//
+IcePy::AdmissionControl::AdmissionControl(const Ice::ObjectAdapterPtr& a, const string& n) :
+    adapter(a), name(n), inFlight(0), queued(0), admitted(0), rejected(0)
+{
+}
+
+IcePy::AdmissionControl::Result
+IcePy::AdmissionControl::admit(int limit, int maxQueued, const QueuedDispatchPtr& dispatch)
+{
+    Lock sync(*this);
+    if(inFlight < limit)
+    {
+        ++inFlight;
+        ++admitted;
+        return Admitted;
+    }
+    else if(queued < maxQueued)
+    {
+        if(!dispatch)
+        {
+            return Wait;
+        }
+        _queue.push_back(dispatch);
+        ++queued;
+        return Queued;
+    }
+    ++rejected;
+    return Rejected;
+}
+
+void
+IcePy::AdmissionControl::release(const QueuedDispatchPtr& dispatch)
+{
+    QueuedDispatchPtr n;
+    {
+        Lock sync(*this);
+        if(dispatch && dispatch->running)
+        {
+            //
+            // The dispatch completed before the thread that resumed it regained
+            // control, that thread passes the slot on, see resume.
+            //
+            dispatch->completed = true;
+            return;
+        }
+        n = next();
+    }
+    if(n)
+    {
+        resume(n);
+    }
+}
+
+IcePy::QueuedDispatchPtr
+IcePy::AdmissionControl::next()
+{
+    //
+    // Must be called with the mutex locked. Passes the released slot to the next
+    // queued dispatch, if any.
+    //
+    if(_queue.empty())
+    {
+        --inFlight;
+        return 0;
+    }
+    QueuedDispatchPtr dispatch = _queue.front();
+    _queue.pop_front();
+    --queued;
+    ++admitted;
+    dispatch->running = true;
+    return dispatch;
+}
+
+void
+IcePy::AdmissionControl::resume(QueuedDispatchPtr dispatch)
+{
+    //
+    // The dispatches that complete before dispatch returns pass their slot on in
+    // this loop rather than recursively.
+    //
+    while(dispatch)
+    {
+        dispatch->dispatch(this);
+
+        Lock sync(*this);
+        dispatch->running = false;
+        dispatch = dispatch->completed ? next() : QueuedDispatchPtr();
+    }
+}
+
+//
+// QueuedDispatch implementation.
+//
+IcePy::QueuedDispatch::QueuedDispatch(const TypedServantWrapperPtr& servant, const OperationPtr& op,
+                                      const Ice::AMD_Object_ice_invokePtr& callback,
+                                      const pair<const Ice::Byte*, const Ice::Byte*>& inParams,
+                                      const Ice::Current& current) :
+    running(false), completed(false), _servant(servant), _op(op), _callback(callback),
+    _inParams(inParams.first, inParams.second), _current(current)
+{
+}
+
+void
+IcePy::QueuedDispatch::dispatch(const AdmissionControlPtr& admission)
+{
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+
+    pair<const Ice::Byte*, const Ice::Byte*> inParams(0, 0);
+    if(!_inParams.empty())
+    {
+        inParams.first = &_inParams[0];
+        inParams.second = inParams.first + _inParams.size();
+    }
+    _servant->dispatch(_op, new AdmittedCallback(_callback, admission, this), inParams, _current);
+}
+
+//
+// ChunkWriter implementation.
+//
+void
+IcePy::ChunkWriter::start(Ice::OutputStream& os)
+{
+    os.write(Ice::Byte(255));
+    _sizePos = os.startSize();
+    _total = 0;
+}
+
+void
+IcePy::ChunkWriter::write(Ice::OutputStream& os, PyObject* chunk)
+{
+    const void* buf = 0;
+    Py_ssize_t sz;
+    if(PyObject_AsReadBuffer(chunk, &buf, &sz) != 0)
+    {
+        PyErr_Clear(); // PyObject_AsReadBuffer sets an exception on failure.
+        PyErr_Format(PyExc_ValueError, STRCAST("expected a buffer value for sequence<byte> chunk"));
+        throw AbortMarshaling();
+    }
+    if(sz > static_cast<Py_ssize_t>(numeric_limits<Ice::Int>::max()) - _total)
+    {
+        PyErr_Format(PyExc_ValueError, STRCAST("sequence<byte> value is too large"));
+        throw AbortMarshaling();
+    }
+    os.writeBlob(reinterpret_cast<const Ice::Byte*>(buf), static_cast<size_t>(sz));
+    _total += sz;
+}
+
+void
+IcePy::ChunkWriter::finish(Ice::OutputStream& os)
+{
+    if(_total < 255)
+    {
+        //
+        // Use the compact size encoding for small sequences by moving the data over the
+        // placeholder.
+        //
+        Ice::OutputStream::Container::iterator dest = os.b.begin() + _sizePos - 1;
+        memmove(dest + 1, dest + 5, static_cast<size_t>(_total));
+        os.rewriteSize(static_cast<Ice::Int>(_total), dest);
+        os.b.resize(os.b.size() - 4);
+    }
+    else
+    {
+        os.rewrite(static_cast<Ice::Int>(_total), _sizePos);
+    }
+}
+
+//
+// OperationMetrics implementation.
+//
+IcePy::OperationMetrics::OperationMetrics(const string& n) :
+    name(n), calls(0), bytesIn(0), bytesOut(0), marshalCount(0), marshalTime(0), unmarshalCount(0),
+    unmarshalTime(0), servantCount(0), servantTime(0), _registered(false)
+{
+}
+
+void
+IcePy::OperationMetrics::call()
+{
+    if(!_registered)
+    {
+        _registered = true;
+        operationMetrics.push_back(this);
+    }
+    ++calls;
+}
+
+void
+IcePy::OperationMetrics::marshaled(Ice::Long size, Ice::Long time)
+{
+    bytesOut += size;
+    ++marshalCount;
+    marshalTime += time;
+}
+
+void
+IcePy::OperationMetrics::unmarshaled(Ice::Long size, Ice::Long time)
+{
+    bytesIn += size;
+    ++unmarshalCount;
+    unmarshalTime += time;
+}
+
+void
+IcePy::OperationMetrics::dispatched(Ice::Long time)
+{
+    ++servantCount;
+    servantTime += time;
+}
+
+IcePy::CollocatedAdapters::CollocatedAdapters(bool copy) :
+    _copy(copy)
+{
+}
+
+void
+IcePy::CollocatedAdapters::add(const Ice::ObjectAdapterPtr& adapter)
+{
+    Ice::PropertiesPtr properties = adapter->getCommunicator()->getProperties();
+    Adapter collocated;
+    collocated.adapter = adapter;
+    collocated.adapterId = properties->getProperty(adapter->getName() + ".AdapterId");
+    collocated.replicaGroupId = properties->getProperty(adapter->getName() + ".ReplicaGroupId");
+    collocated.admission = properties->getPropertyAsInt(adapter->getName() + ".Python.MaxConcurrency") > 0;
+    collocated.held = false;
+    _adapters.push_back(collocated);
+    ++collocatedAdapterCount;
+}
+
+void
+IcePy::CollocatedAdapters::setHeld(const Ice::ObjectAdapterPtr& adapter, bool held)
+{
+    for(vector<Adapter>::iterator p = _adapters.begin(); p != _adapters.end(); ++p)
+    {
+        if(p->adapter == adapter)
+        {
+            p->held = held;
+        }
+    }
+}
+
+void
+IcePy::CollocatedAdapters::remove(const Ice::ObjectAdapterPtr& adapter)
+{
+    for(vector<Adapter>::iterator p = _adapters.begin(); p != _adapters.end(); ++p)
+    {
+        if(p->adapter == adapter)
+        {
+            _adapters.erase(p);
+            --collocatedAdapterCount;
+            return;
+        }
+    }
+}
+
+void
+IcePy::CollocatedAdapters::clear()
+{
+    collocatedAdapterCount -= _adapters.size();
+    _adapters.clear();
+}
+
+Ice::ObjectAdapterPtr
+IcePy::CollocatedAdapters::find(const Ice::ObjectPrx& proxy)
+{
+    vector<Adapter>::iterator p = _adapters.begin();
+    while(p != _adapters.end())
+    {
+        //
+        // The adapter can also be deactivated by the shutdown of the communicator.
+        //
+        if(p->adapter->isDeactivated())
+        {
+            p = _adapters.erase(p);
+            --collocatedAdapterCount;
+            continue;
+        }
+
+        if(isCollocated(p->adapter, p->adapterId, p->replicaGroupId, proxy))
+        {
+            //
+            // The invocations on an adapter which is held, or which limits the concurrent
+            // dispatches, go through the regular collocated dispatch.
+            //
+            return !p->held && !p->admission ? p->adapter : Ice::ObjectAdapterPtr();
+        }
+        ++p;
+    }
+    return 0;
+}
+
+bool
+IcePy::CollocatedAdapters::copy() const
+{
+    return _copy;
+}
+
+IcePy::CollocatedAdaptersPtr
+IcePy::createCollocatedAdapters(const Ice::CommunicatorPtr& communicator, bool dispatcher, bool observer)
+{
+    string mode = communicator->getProperties()->getPropertyWithDefault("Ice.Python.Collocation", "Marshal");
+    if(mode == "Marshal")
+    {
+        return 0;
+    }
+    else if(mode != "Copy" && mode != "Share")
+    {
+        Ice::Warning out(communicator->getLogger());
+        out << "invalid value `" << mode << "' for Ice.Python.Collocation, collocated invocations are marshaled";
+        return 0;
+    }
+
+    //
+    // The dispatcher and the dispatch observers, including the observer of the Metrics admin
+    // facet, must see the collocated invocations.
+    //
+    if(dispatcher || observer || communicator->findAdminFacet("Metrics"))
+    {
+        return 0;
+    }
+    return new CollocatedAdapters(mode == "Copy");
+}
+
+void
+IcePy::addCollocatedAdapter(const Ice::ObjectAdapterPtr& adapter)
+{
+    CollocatedAdaptersPtr collocated = getCollocatedAdapters(adapter->getCommunicator());
+    if(collocated)
+    {
+        collocated->add(adapter);
+    }
+}
+
+void
+IcePy::setCollocatedAdapterHeld(const Ice::ObjectAdapterPtr& adapter, bool held)
+{
+    if(collocatedAdapterCount > 0)
+    {
+        CollocatedAdaptersPtr collocated = getCollocatedAdapters(adapter->getCommunicator());
+        if(collocated)
+        {
+            collocated->setHeld(adapter, held);
+        }
+    }
+}
+
+void
+IcePy::removeCollocatedAdapter(const Ice::ObjectAdapterPtr& adapter)
+{
+    if(collocatedAdapterCount > 0)
+    {
+        CollocatedAdaptersPtr collocated = getCollocatedAdapters(adapter->getCommunicator());
+        if(collocated)
+        {
+            collocated->remove(adapter);
+        }
+    }
+}
+
+void
+IcePy::removeAdmissionControls(const Ice::ObjectAdapterPtr& adapter)
+{
+    vector<AdmissionControlPtr> removed; // Destroyed once the mutex is unlocked.
+    IceUtilInternal::MutexPtrLock<IceUtil::Mutex> lock(admissionMutex);
+    AdmissionControlMap::iterator p = admissionControls.lower_bound(make_pair(adapter.get(), string()));
+    while(p != admissionControls.end() && p->first.first == adapter.get())
+    {
+        removed.push_back(p->second);
+        admissionControls.erase(p++);
+    }
+}
+
+void
+IcePy::removeAdmissionControls(const Ice::CommunicatorPtr& communicator)
+{
+    vector<AdmissionControlPtr> removed; // Destroyed once the mutex is unlocked.
+    IceUtilInternal::MutexPtrLock<IceUtil::Mutex> lock(admissionMutex);
+    AdmissionControlMap::iterator p = admissionControls.begin();
+    while(p != admissionControls.end())
+    {
+        if(p->second->adapter->getCommunicator() == communicator)
+        {
+            removed.push_back(p->second);
+            admissionControls.erase(p++);
+        }
+        else
+        {
+            ++p;
+        }
+    }
+}
+
 IcePy::Operation::Operation(const char* n, PyObject* m, PyObject* sm, int amdFlag, PyObject* fmt, PyObject* meta,
                             PyObject* in, PyObject* out, PyObject* ret, PyObject* ex)
 {
@@ -1286,6 +2305,20 @@ IcePy::Operation::Operation(const char* n, PyObject* m, PyObject* sm, int amdFla
     tupleToStringSeq(meta, metaData);
     assert(b);
 
+    //
+    // The python:maxConcurrency metadata limits the number of concurrent dispatches.
+    //
+    static const string maxConcurrencyPrefix = "python:maxConcurrency:";
+    maxConcurrency = 0;
+    for(Ice::StringSeq::const_iterator q = metaData.begin(); q != metaData.end(); ++q)
+    {
+        if(q->find(maxConcurrencyPrefix) == 0)
+        {
+            maxConcurrency = atoi(q->substr(maxConcurrencyPrefix.size()).c_str());
+        }
+    }
+    metrics = new OperationMetrics(name);
+
     //
     // returnType
     //
@@ -1345,6 +2378,26 @@ IcePy::Operation::Operation(const char* n, PyObject* m, PyObject* sm, int amdFla
     }
     optionalOutParams.sort(SortFn::compare);
 
+    //
+    // A sequence<byte> result can be supplied in chunks by an iterator if it's the
+    // last result marshaled, that is the required return value or, without one, the
+    // last out parameter, and there are no optional results.
+    //
+    if(optionalOutParams.empty())
+    {
+        ParamInfoPtr last = returnType;
+        if(!last && !outParams.empty())
+        {
+            last = outParams.back();
+        }
+        SequenceInfoPtr seq = last ? SequenceInfoPtr::dynamicCast(last->type) : SequenceInfoPtr();
+        PrimitiveInfoPtr pi = seq ? PrimitiveInfoPtr::dynamicCast(seq->elementType) : PrimitiveInfoPtr();
+        if(pi && pi->kind == PrimitiveInfo::KindByte)
+        {
+            chunkedResult = last;
+        }
+    }
+
     //
     // exceptions
     //
@@ -1360,14 +2413,13 @@ IcePy::Operation::Operation(const char* n, PyObject* m, PyObject* sm, int amdFla
     pseudoOp = name.find("ice_") == 0;
 }
 
-void
-Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
+PyObject*
+Operation::validateResult(PyObject* result)
 {
     //
-    // Marshal the results. If there is more than one value to be returned, then they must be
-    // returned in a tuple of the form (result, outParam1, ...).
+    // Returns the results in a tuple of the form (result, outParam1, ...), or raises
+    // MarshalException if they are invalid.
     //
-
     Py_ssize_t numResults = static_cast<Py_ssize_t>(outParams.size());
     if(returnType)
     {
@@ -1402,17 +2454,15 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
         PyTuple_SET_ITEM(t.get(), 0, incRef(result));
     }
 
-    ObjectMap objectMap;
-    ParamInfoList::iterator p;
-
     //
     // Validate the results.
     //
-    for(p = outParams.begin(); p != outParams.end(); ++p)
+    for(ParamInfoList::iterator p = outParams.begin(); p != outParams.end(); ++p)
     {
         ParamInfoPtr info = *p;
         PyObject* arg = PyTuple_GET_ITEM(t.get(), info->pos);
-        if((!info->optional || arg != Unset) && !info->type->validate(arg))
+        if((!info->optional || arg != Unset) && !(info.get() == chunkedResult.get() && isChunked(arg)) &&
+           !info->type->validate(arg))
         {
             // TODO: Provide the parameter name instead?
             ostringstream ostr;
@@ -1425,7 +2475,8 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
     if(returnType)
     {
         PyObject* res = PyTuple_GET_ITEM(t.get(), 0);
-        if((!returnType->optional || res != Unset) && !returnType->type->validate(res))
+        if((!returnType->optional || res != Unset) &&
+           !(returnType.get() == chunkedResult.get() && isChunked(res)) && !returnType->type->validate(res))
         {
             ostringstream ostr;
             ostr << "invalid return value for operation `" << dispatchName << "'";
@@ -1435,6 +2486,22 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
         }
     }
 
+    return t.release();
+}
+
+PyObject*
+Operation::marshalResult(Ice::OutputStream& os, PyObject* result, ChunkWriter* writer)
+{
+    //
+    // Marshal the results. If there is more than one value to be returned, then they must be
+    // returned in a tuple of the form (result, outParam1, ...).
+    //
+    PyObjectHandle t = validateResult(result);
+
+    ObjectMap objectMap;
+    ParamInfoList::iterator p;
+    PyObjectHandle chunks;
+
     //
     // Marshal the required out parameters.
     //
@@ -1444,7 +2511,14 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
         if(!info->optional)
         {
             PyObject* arg = PyTuple_GET_ITEM(t.get(), info->pos);
-            info->type->marshal(arg, &os, &objectMap, false, &info->metaData);
+            if(info.get() == chunkedResult.get() && isChunked(arg))
+            {
+                chunks = marshalChunks(os, arg, writer);
+            }
+            else
+            {
+                info->type->marshal(arg, &os, &objectMap, false, &info->metaData);
+            }
         }
     }
 
@@ -1454,7 +2528,14 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
     if(returnType && !returnType->optional)
     {
         PyObject* res = PyTuple_GET_ITEM(t.get(), 0);
-        returnType->type->marshal(res, &os, &objectMap, false, &metaData);
+        if(returnType.get() == chunkedResult.get() && isChunked(res))
+        {
+            chunks = marshalChunks(os, res, writer);
+        }
+        else
+        {
+            returnType->type->marshal(res, &os, &objectMap, false, &metaData);
+        }
     }
 
     //
@@ -1470,10 +2551,55 @@ Operation::marshalResult(Ice::OutputStream& os, PyObject* result)
         }
     }
 
-    if(returnsClasses)
+    //
+    // The pending values follow the chunked result, they're written once its chunks are.
+    //
+    if(returnsClasses && !chunks.get())
     {
         os.writePendingValues();
     }
+
+    return chunks.release();
+}
+
+PyObject*
+Operation::marshalChunks(Ice::OutputStream& os, PyObject* chunks, ChunkWriter* writer)
+{
+    if(PyIter_Check(chunks))
+    {
+        ChunkWriter w;
+        w.start(os);
+        while(true)
+        {
+            PyObjectHandle chunk = PyIter_Next(chunks);
+            if(!chunk.get())
+            {
+                if(PyErr_Occurred())
+                {
+                    throw AbortMarshaling();
+                }
+                break;
+            }
+            w.write(os, chunk.get());
+        }
+        w.finish(os);
+        return 0;
+    }
+
+    //
+    // The chunks supplied by an asynchronous iterator are written as they're produced,
+    // which isn't possible for a collocated invocation.
+    //
+    if(!writer)
+    {
+        ostringstream ostr;
+        ostr << "asynchronous iterator not supported for the results of operation `" << dispatchName << "'";
+        string str = ostr.str();
+        PyErr_WarnEx(PyExc_RuntimeWarning, const_cast<char*>(str.c_str()), 1);
+        throw Ice::MarshalException(__FILE__, __LINE__);
+    }
+    writer->start(os);
+    return incRef(chunks);
 }
 
 void
@@ -1579,6 +2705,8 @@ static PyMethodDef DispatchCallbackMethods[] =
       PyDoc_STR(STRCAST("internal function")) },
     { STRCAST("exception"), reinterpret_cast<PyCFunction>(dispatchCallbackException), METH_VARARGS,
       PyDoc_STR(STRCAST("internal function")) },
+    { STRCAST("writeChunk"), reinterpret_cast<PyCFunction>(dispatchCallbackWriteChunk), METH_VARARGS,
+      PyDoc_STR(STRCAST("internal function")) },
     { 0, 0 } /* sentinel */
 };
 
@@ -1947,6 +3075,13 @@ IcePy::Invocation::prepareRequest(const OperationPtr& op, PyObject* args, Mappin
         return false;
     }
 
+    Ice::Long start = 0;
+    if(operationMetricsEnabled)
+    {
+        op->metrics->call();
+        start = metricsTime();
+    }
+
     if(!op->inParams.empty())
     {
         try
@@ -2033,6 +3168,11 @@ IcePy::Invocation::prepareRequest(const OperationPtr& op, PyObject* args, Mappin
         }
     }
 
+    if(start)
+    {
+        op->metrics->marshaled(static_cast<Ice::Long>(params.second - params.first), metricsTime() - start);
+    }
+
     return true;
 }
 
@@ -2045,6 +3185,8 @@ IcePy::Invocation::unmarshalResults(const OperationPtr& op, const pair<const Ice
         numResults++;
     }
 
+    Ice::Long start = operationMetricsEnabled ? metricsTime() : 0;
+
     PyObjectHandle results = PyTuple_New(numResults);
     if(results.get() && numResults > 0)
     {
@@ -2112,6 +3254,11 @@ IcePy::Invocation::unmarshalResults(const OperationPtr& op, const pair<const Ice
         util.updateSlicedData();
     }
 
+    if(start)
+    {
+        op->metrics->unmarshaled(static_cast<Ice::Long>(bytes.second - bytes.first), metricsTime() - start);
+    }
+
     return results.release();
 }
 
@@ -2222,6 +3369,12 @@ IcePy::SyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
     assert(PyTuple_Check(pyparams));
     PyObject* pyctx = PyTuple_GET_ITEM(args, 1);
 
+    PyObject* result;
+    if(collocatedAdapterCount > 0 && invokeCollocated(pyparams, pyctx, result))
+    {
+        return result;
+    }
+
     //
     // Marshal the input parameters to a byte sequence.
     //
@@ -2245,20 +3398,14 @@ IcePy::SyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
             if(pyctx != Py_None)
             {
                 Ice::Context ctx;
-
-                if(!PyDict_Check(pyctx))
-                {
-                    PyErr_Format(PyExc_ValueError, STRCAST("context argument must be None or a dictionary"));
-                    return 0;
-                }
-
-                if(!dictionaryToContext(pyctx, ctx))
+                const Ice::Context* c = getContext(pyctx, ctx);
+                if(!c)
                 {
                     return 0;
                 }
 
                 AllowThreads allowThreads; // Release Python's global interpreter lock during remote invocations.
-                status = _prx->ice_invoke(_op->name, _op->sendMode, params, result, ctx);
+                status = _prx->ice_invoke(_op->name, _op->sendMode, params, result, *c);
             }
             else
             {
@@ -2268,80 +3415,400 @@ IcePy::SyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
         }
 
         //
-        // Process the reply.
+        // Process the reply.
+        //
+        if(_prx->ice_isTwoway())
+        {
+            if(!status)
+            {
+                //
+                // Unmarshal a user exception.
+                //
+                pair<const Ice::Byte*, const Ice::Byte*> rb(static_cast<const Ice::Byte*>(0),
+                                                            static_cast<const Ice::Byte*>(0));
+                if(!result.empty())
+                {
+                    rb.first = &result[0];
+                    rb.second = &result[0] + result.size();
+                }
+                PyObjectHandle ex = unmarshalException(_op, rb);
+
+                //
+                // Set the Python exception.
+                //
+                setPythonException(ex.get());
+                return 0;
+            }
+            else if(_op->outParams.size() > 0 || _op->returnType)
+            {
+                //
+                // Unmarshal the results. If there is more than one value to be returned, then return them
+                // in a tuple of the form (result, outParam1, ...). Otherwise just return the value.
+                //
+                pair<const Ice::Byte*, const Ice::Byte*> rb(static_cast<const Ice::Byte*>(0),
+                                                            static_cast<const Ice::Byte*>(0));
+                if(!result.empty())
+                {
+                    rb.first = &result[0];
+                    rb.second = &result[0] + result.size();
+                }
+                PyObjectHandle results = unmarshalResults(_op, rb);
+                if(!results.get())
+                {
+                    return 0;
+                }
+
+                if(PyTuple_GET_SIZE(results.get()) > 1)
+                {
+                    return results.release();
+                }
+                else
+                {
+                    PyObject* ret = PyTuple_GET_ITEM(results.get(), 0);
+                    if(!ret)
+                    {
+                        return 0;
+                    }
+                    else
+                    {
+                        return incRef(ret);
+                    }
+                }
+            }
+        }
+    }
+    catch(const AbortMarshaling&)
+    {
+        assert(PyErr_Occurred());
+        return 0;
+    }
+    catch(const Ice::Exception& ex)
+    {
+        invalidateCheckedCast(_communicator, ex);
+        setPythonException(ex);
+        return 0;
+    }
+
+    return incRef(Py_None);
+}
+
+//
+// Invokes the operation directly on a Python servant hosted by an object adapter of
+// the communicator when Ice.Python.Collocation is set to Copy or Share. The parameters,
+// results and user exceptions are passed to and from the servant without marshaling,
+// as deep copies with Copy. Returns false if the invocation must be sent as usual.
+//
+bool
+IcePy::SyncTypedInvocation::invokeCollocated(PyObject* pyparams, PyObject* pyctx, PyObject*& result)
+{
+    result = 0;
+
+    //
+    // Class graphs are always marshaled to preserve the ice_preMarshal and ice_postUnmarshal
+    // semantics, and so are the parameters of proxies that use another encoding.
+    //
+    if(_op->amd || _op->maxConcurrency > 0 || _op->sendsClasses || _op->returnsClasses ||
+       !_prx->ice_isTwoway() || !_prx->ice_isCollocationOptimized() || _prx->ice_getRouter() ||
+       _prx->ice_getEncodingVersion() != Ice::currentEncoding ||
+       PyTuple_GET_SIZE(pyparams) != static_cast<Py_ssize_t>(_op->inParams.size()))
+    {
+        return false;
+    }
+
+    CollocatedAdaptersPtr collocated = getCollocatedAdapters(_communicator);
+    if(!collocated)
+    {
+        return false;
+    }
+    Ice::ObjectAdapterPtr adapter = collocated->find(_prx);
+    if(!adapter)
+    {
+        return false;
+    }
+    bool copyValues = collocated->copy();
+
+    //
+    // Only dispatch to typed servants that implement this operation. Servant locators,
+    // default identity servants and coroutine servant methods use the regular dispatch.
+    //
+    Ice::ObjectPtr servant = adapter->findByProxy(_prx);
+    TypedServantWrapper* wrapper = dynamic_cast<TypedServantWrapper*>(servant.get());
+    if(!wrapper || wrapper->identity())
+    {
+        return false;
+    }
+
+    PyObjectHandle servantObj = wrapper->getObject();
+    PyObjectHandle h = getAttr(reinterpret_cast<PyObject*>(Py_TYPE(servantObj.get())), "_op_" + _op->name, false);
+    if(!h.get() || PyObject_IsInstance(h.get(), reinterpret_cast<PyObject*>(&OperationType)) != 1 ||
+       getOperation(h.get()).get() != _op.get())
+    {
+        PyErr_Clear();
+        return false;
+    }
+
+    PyObjectHandle method = getAttr(servantObj.get(), _op->dispatchName, false);
+    if(!method.get())
+    {
+        PyErr_Clear();
+        return false;
+    }
+#if PY_VERSION_HEX >= 0x03050000
+    PyObjectHandle code = getAttr(method.get(), "__code__", false);
+    if(code.get() && PyCode_Check(code.get()) &&
+       (reinterpret_cast<PyCodeObject*>(code.get())->co_flags & (CO_COROUTINE | CO_ITERABLE_COROUTINE)))
+    {
+        return false;
+    }
+    PyErr_Clear();
+#endif
+
+    //
+    // Validate the arguments as they would be before marshaling. The arguments that
+    // marshaling would convert are marshaled.
+    //
+    for(ParamInfoList::iterator q = _op->inParams.begin(); q != _op->inParams.end(); ++q)
+    {
+        ParamInfoPtr info = *q;
+        PyObject* arg = PyTuple_GET_ITEM(pyparams, info->pos);
+        if(isConverted(info, arg, info->metaData))
+        {
+            return false;
+        }
+        if((!info->optional || arg != Unset) && !info->type->validate(arg))
+        {
+            string name = fixIdent(_op->name);
+            PyErr_Format(PyExc_ValueError, STRCAST("invalid value for argument %" PY_FORMAT_SIZE_T "d in operation `%s'"),
+                         info->pos + 1, const_cast<char*>(name.c_str()));
+            return true;
+        }
+    }
+
+    PyObjectHandle params;
+    if(copyValues)
+    {
+        params = deepCopy(pyparams);
+        if(!params.get())
+        {
+            PyErr_Clear(); // The parameters will be marshaled instead.
+            return false;
+        }
+    }
+    else
+    {
+        params = incRef(pyparams);
+    }
+
+    try
+    {
+        Ice::Current current;
+        current.adapter = adapter;
+        current.id = _prx->ice_getIdentity();
+        current.facet = _prx->ice_getFacet();
+        current.operation = _op->name;
+        current.mode = _op->sendMode;
+        current.requestId = -1;
+        current.encoding = _prx->ice_getEncodingVersion();
+
+        Ice::ImplicitContextPtr implicitContext = _communicator->getImplicitContext();
+        if(implicitContext)
+        {
+            current.ctx = implicitContext->getContext();
+        }
+        Ice::Context ctx;
+        const Ice::Context* c = &ctx;
+        if(pyctx != Py_None)
+        {
+            c = getContext(pyctx, ctx);
+            if(!c)
+            {
+                return true;
+            }
+        }
+        else
+        {
+            ctx = _prx->ice_getContext();
+        }
+        for(Ice::Context::const_iterator q = c->begin(); q != c->end(); ++q)
+        {
+            current.ctx[q->first] = q->second;
+        }
+
+        Py_ssize_t count = PyTuple_GET_SIZE(params.get());
+        PyObjectHandle args = PyTuple_New(count + 1);
+        PyObjectHandle curr = createCurrent(current);
+        if(!args.get() || !curr.get())
+        {
+            return true;
+        }
+        for(Py_ssize_t i = 0; i < count; ++i)
+        {
+            PyTuple_SET_ITEM(args.get(), i, incRef(PyTuple_GET_ITEM(params.get(), i))); // Steals a reference.
+        }
+        PyTuple_SET_ITEM(args.get(), count, curr.release()); // Steals a reference.
+
+        Ice::Long start = 0;
+        if(operationMetricsEnabled)
+        {
+            _op->metrics->call();
+            start = metricsTime();
+        }
+
+        PyObjectHandle ret = PyObject_Call(method.get(), args.get(), 0);
+        if(ret.get() && PyObject_HasAttrString(ret.get(), STRCAST("add_done_callback")) == 1)
+        {
+            ret = callMethod(ret.get(), "result");
+        }
+
+        if(start)
+        {
+            _op->metrics->dispatched(metricsTime() - start);
+        }
+
+        if(!ret.get())
+        {
+            PyException ex; // Retrieve it before another Python API call clears it.
+            ex.checkSystemExit();
+
+            PyObject* userExceptionType = lookupType("Ice.UserException");
+            if(PyObject_IsInstance(ex.ex.get(), userExceptionType) && validateException(_op, ex.ex.get()))
+            {
+                PyObjectHandle copy = copyValues ? deepCopy(ex.ex.get()) : incRef(ex.ex.get());
+                if(!copy.get())
+                {
+                    return true;
+                }
+                setPythonException(copy.get());
+                return true;
+            }
+
+            try
+            {
+                ex.raise();
+            }
+            catch(Ice::RequestFailedException& e)
+            {
+                if(e.id.name.empty())
+                {
+                    e.id = current.id;
+                }
+                if(e.facet.empty() && !current.facet.empty())
+                {
+                    e.facet = current.facet;
+                }
+                if(e.operation.empty() && !current.operation.empty())
+                {
+                    e.operation = current.operation;
+                }
+                throw;
+            }
+        }
+
+        Py_ssize_t numResults = static_cast<Py_ssize_t>(_op->outParams.size()) + (_op->returnType ? 1 : 0);
+        PyObjectHandle t;
+        if(PyObject_IsInstance(ret.get(), reinterpret_cast<PyObject*>(&MarshaledResultType)))
+        {
+            MarshaledResultObject* mro = reinterpret_cast<MarshaledResultObject*>(ret.get());
+            t = unmarshalResults(_op, mro->out->finished());
+            if(!t.get())
+            {
+                return true;
+            }
+            result = numResults == 1 ? incRef(PyTuple_GET_ITEM(t.get(), 0)) : numResults == 0 ? incRef(Py_None) :
+                t.release();
+            return true;
+        }
+
+        //
+        // Validate the results as they would be before marshaling, and join the chunks
+        // of a chunked result supplied by an iterator.
         //
-        if(_prx->ice_isTwoway())
+        try
         {
-            if(!status)
+            t = _op->validateResult(ret.get());
+        }
+        catch(const Ice::LocalException& ex)
+        {
+            ostringstream ostr;
+            ostr << ex;
+            throw Ice::UnknownLocalException(__FILE__, __LINE__, ostr.str());
+        }
+
+        if(_op->chunkedResult && PyIter_Check(PyTuple_GET_ITEM(t.get(), _op->chunkedResult->pos)))
+        {
+            Py_ssize_t i = _op->chunkedResult->pos;
+            PyObjectHandle empty = PyBytes_FromStringAndSize(0, 0);
+            PyObjectHandle joined = empty.get() ? callMethod(empty.get(), "join", PyTuple_GET_ITEM(t.get(), i)) : 0;
+            PyObjectHandle tmp = joined.get() ? PyTuple_GetSlice(t.get(), 0, numResults) : 0;
+            if(!tmp.get())
             {
-                //
-                // Unmarshal a user exception.
-                //
-                pair<const Ice::Byte*, const Ice::Byte*> rb(static_cast<const Ice::Byte*>(0),
-                                                            static_cast<const Ice::Byte*>(0));
-                if(!result.empty())
-                {
-                    rb.first = &result[0];
-                    rb.second = &result[0] + result.size();
-                }
-                PyObjectHandle ex = unmarshalException(_op, rb);
+                return true;
+            }
+            PyObject* old = PyTuple_GET_ITEM(tmp.get(), i);
+            PyTuple_SET_ITEM(tmp.get(), i, joined.release()); // Steals a reference.
+            Py_DECREF(old);
+            t = tmp.release();
+        }
 
-                //
-                // Set the Python exception.
-                //
-                setPythonException(ex.get());
-                return 0;
+        bool marshal = false;
+        for(ParamInfoList::iterator q = _op->outParams.begin(); q != _op->outParams.end(); ++q)
+        {
+            marshal = marshal || isConverted(*q, PyTuple_GET_ITEM(t.get(), (*q)->pos), (*q)->metaData);
+        }
+        if(_op->returnType)
+        {
+            marshal = marshal || isConverted(_op->returnType, PyTuple_GET_ITEM(t.get(), 0), _op->metaData);
+        }
+
+        if(copyValues || marshal)
+        {
+            PyObjectHandle copy = marshal ? 0 : deepCopy(t.get());
+            if(copy.get())
+            {
+                t = copy.release();
             }
-            else if(_op->outParams.size() > 0 || _op->returnType)
+            else
             {
                 //
-                // Unmarshal the results. If there is more than one value to be returned, then return them
-                // in a tuple of the form (result, outParam1, ...). Otherwise just return the value.
+                // Results which can't be copied, or which marshaling would convert, are marshaled
+                // and unmarshaled instead.
                 //
-                pair<const Ice::Byte*, const Ice::Byte*> rb(static_cast<const Ice::Byte*>(0),
-                                                            static_cast<const Ice::Byte*>(0));
-                if(!result.empty())
-                {
-                    rb.first = &result[0];
-                    rb.second = &result[0] + result.size();
-                }
-                PyObjectHandle results = unmarshalResults(_op, rb);
-                if(!results.get())
-                {
-                    return 0;
-                }
-
-                if(PyTuple_GET_SIZE(results.get()) > 1)
-                {
-                    return results.release();
-                }
-                else
+                PyErr_Clear();
+                Ice::OutputStream os(_communicator);
+                os.startEncapsulation(current.encoding, _op->format);
+                _op->marshalResult(os, numResults == 1 ? PyTuple_GET_ITEM(t.get(), 0) : numResults == 0 ?
+                                   Py_None : t.get());
+                os.endEncapsulation();
+                t = unmarshalResults(_op, os.finished());
+                if(!t.get())
                 {
-                    PyObject* ret = PyTuple_GET_ITEM(results.get(), 0);
-                    if(!ret)
-                    {
-                        return 0;
-                    }
-                    else
-                    {
-                        return incRef(ret);
-                    }
+                    return true;
                 }
             }
         }
+
+        if(numResults == 0)
+        {
+            result = incRef(Py_None);
+        }
+        else if(numResults == 1)
+        {
+            result = incRef(PyTuple_GET_ITEM(t.get(), 0));
+        }
+        else
+        {
+            result = t.release();
+        }
     }
     catch(const AbortMarshaling&)
     {
         assert(PyErr_Occurred());
-        return 0;
     }
     catch(const Ice::Exception& ex)
     {
         setPythonException(ex);
-        return 0;
     }
-
-    return incRef(Py_None);
+    return true;
 }
 
 //
@@ -2349,7 +3816,7 @@ IcePy::SyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
 //
 IcePy::AsyncTypedInvocation::AsyncTypedInvocation(const Ice::ObjectPrx& prx, PyObject* pyProxy,
                                                   const OperationPtr& op) :
-    Invocation(prx), _op(op), _pyProxy(pyProxy), _response(0), _ex(0), _sent(0)
+    Invocation(prx), _op(op), _pyProxy(pyProxy), _response(0), _ex(0), _sent(0), _routerMember(0)
 {
     Py_INCREF(_pyProxy);
 }
@@ -2415,9 +3882,9 @@ IcePy::AsyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
     }
 
     PyObject* pyctx = PyTuple_GET_ITEM(args, 4);
-    if(pyctx != Py_None && !PyDict_Check(pyctx))
+    if(pyctx != Py_None && !checkContext(pyctx))
     {
-        PyErr_Format(PyExc_RuntimeError, STRCAST("context must be a dictionary or None"));
+        PyErr_Format(PyExc_RuntimeError, STRCAST("context must be a dictionary, an Ice.Context or None"));
         return 0;
     }
 
@@ -2437,11 +3904,20 @@ IcePy::AsyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
         checkAsyncTwowayOnly(_prx);
 
         Ice::Callback_Object_ice_invokePtr cb;
+        Ice::CallbackPtr routerCb;
         if(_response || _ex || _sent)
         {
             cb = Ice::newCallback_Object_ice_invoke(this, &AsyncTypedInvocation::response,
                                                     &AsyncTypedInvocation::exception, &AsyncTypedInvocation::sent);
         }
+        else if(_router)
+        {
+            //
+            // The results are left for end_ but the router must still learn about the completion.
+            //
+            routerCb = Ice::newCallback(this, &AsyncTypedInvocation::routerCompleted,
+                                        &AsyncTypedInvocation::routerSent);
+        }
 
         //
         // Invoke the operation asynchronously.
@@ -2449,18 +3925,23 @@ IcePy::AsyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
         if(pyctx != Py_None)
         {
             Ice::Context ctx;
-            if(!dictionaryToContext(pyctx, ctx))
+            const Ice::Context* c = getContext(pyctx, ctx);
+            if(!c)
             {
                 return 0;
             }
 
             if(cb)
             {
-                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, ctx, cb);
+                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, *c, cb);
+            }
+            else if(routerCb)
+            {
+                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, *c, routerCb);
             }
             else
             {
-                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, ctx);
+                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, *c);
             }
         }
         else
@@ -2469,6 +3950,10 @@ IcePy::AsyncTypedInvocation::invoke(PyObject* args, PyObject* /* kwds */)
             {
                 result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, cb);
             }
+            else if(routerCb)
+            {
+                result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params, routerCb);
+            }
             else
             {
                 result = _prx->begin_ice_invoke(_op->name, _op->sendMode, params);
@@ -2576,6 +4061,7 @@ IcePy::AsyncTypedInvocation::end(const Ice::ObjectPrx& proxy, const OperationPtr
     }
     catch(const Ice::Exception& ex)
     {
+        invalidateCheckedCast(proxy->ice_getCommunicator(), ex);
         setPythonException(ex);
     }
 
@@ -2593,6 +4079,7 @@ void
 IcePy::AsyncTypedInvocation::response(bool ok, const pair<const Ice::Byte*, const Ice::Byte*>& results)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    releaseInvocationRouter(false);
 
     try
     {
@@ -2646,6 +4133,8 @@ void
 IcePy::AsyncTypedInvocation::exception(const Ice::Exception& ex)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    invalidateCheckedCast(_communicator, ex);
+    releaseInvocationRouter(true);
     assert(_ex);
     callException(_ex, ex);
 }
@@ -2653,10 +4142,62 @@ IcePy::AsyncTypedInvocation::exception(const Ice::Exception& ex)
 void
 IcePy::AsyncTypedInvocation::sent(bool sentSynchronously)
 {
-    if(_sent)
+    if(_sent || (_router && !_prx->ice_isTwoway()))
     {
         AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
-        callSent(_sent, sentSynchronously, true);
+        if(!_prx->ice_isTwoway())
+        {
+            releaseInvocationRouter(false);
+        }
+        if(_sent)
+        {
+            callSent(_sent, sentSynchronously, true);
+        }
+    }
+}
+
+void
+IcePy::AsyncTypedInvocation::setInvocationRouter(const InvocationRouterPtr& router, size_t member)
+{
+    _router = router;
+    _routerMember = member;
+    _routerStart = IceUtil::Time::now(IceUtil::Time::Monotonic);
+}
+
+void
+IcePy::AsyncTypedInvocation::releaseInvocationRouter(bool failed)
+{
+    if(_router)
+    {
+        _router->release(_routerMember, _routerStart, failed);
+        _router = 0;
+    }
+}
+
+void
+IcePy::AsyncTypedInvocation::routerCompleted(const Ice::AsyncResultPtr& r)
+{
+    bool failed = false;
+    try
+    {
+        r->throwLocalException();
+    }
+    catch(const Ice::LocalException&)
+    {
+        failed = true;
+    }
+
+    AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    releaseInvocationRouter(failed);
+}
+
+void
+IcePy::AsyncTypedInvocation::routerSent(const Ice::AsyncResultPtr&)
+{
+    if(!_prx->ice_isTwoway())
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        releaseInvocationRouter(false);
     }
 }
 
@@ -2680,7 +4221,7 @@ IcePy::AsyncTypedInvocation::checkAsyncTwowayOnly(const Ice::ObjectPrx& proxy) c
 //
 IcePy::NewAsyncInvocation::NewAsyncInvocation(const Ice::ObjectPrx& prx, PyObject* pyProxy, const string& operation)
     : Invocation(prx), _pyProxy(pyProxy), _operation(operation), _twoway(prx->ice_isTwoway()), _sent(false),
-      _sentSynchronously(false), _done(false), _future(0), _ok(false), _exception(0)
+      _sentSynchronously(false), _done(false), _future(0), _ok(false), _exception(0), _routerMember(0)
 {
     Py_INCREF(_pyProxy);
 }
@@ -2733,6 +4274,7 @@ IcePy::NewAsyncInvocation::invoke(PyObject* args, PyObject* kwds)
 
     if(PyErr_Occurred())
     {
+        releaseInvocationRouter(false);
         return 0;
     }
 
@@ -2811,6 +4353,7 @@ IcePy::NewAsyncInvocation::invoke(PyObject* args, PyObject* kwds)
     }
     else
     {
+        releaseInvocationRouter(false);
         PyObjectHandle tmp = callMethod(future.get(), "set_result", Py_None);
         if(PyErr_Occurred())
         {
@@ -2824,6 +4367,7 @@ void
 IcePy::NewAsyncInvocation::response(bool ok, const pair<const Ice::Byte*, const Ice::Byte*>& results)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    releaseInvocationRouter(false);
 
     if(!_future)
     {
@@ -2869,6 +4413,8 @@ void
 IcePy::NewAsyncInvocation::exception(const Ice::Exception& ex)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    invalidateCheckedCast(_communicator, ex);
+    releaseInvocationRouter(true);
 
     PyObjectHandle exh = convertException(ex); // NOTE: This can release the GIL
 
@@ -2898,6 +4444,10 @@ void
 IcePy::NewAsyncInvocation::sent(bool sentSynchronously)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    if(!_twoway)
+    {
+        releaseInvocationRouter(false);
+    }
 
     if(!_future)
     {
@@ -2944,6 +4494,24 @@ IcePy::NewAsyncInvocation::sent(bool sentSynchronously)
     }
 }
 
+void
+IcePy::NewAsyncInvocation::setInvocationRouter(const InvocationRouterPtr& router, size_t member)
+{
+    _router = router;
+    _routerMember = member;
+    _routerStart = IceUtil::Time::now(IceUtil::Time::Monotonic);
+}
+
+void
+IcePy::NewAsyncInvocation::releaseInvocationRouter(bool failed)
+{
+    if(_router)
+    {
+        _router->release(_routerMember, _routerStart, failed);
+        _router = 0;
+    }
+}
+
 //
 // NewAsyncTypedInvocation
 //
@@ -2994,25 +4562,19 @@ IcePy::NewAsyncTypedInvocation::handleInvoke(PyObject* args, PyObject* /* kwds *
     if(pyctx != Py_None)
     {
         Ice::Context ctx;
-
-        if(!PyDict_Check(pyctx))
-        {
-            PyErr_Format(PyExc_ValueError, STRCAST("context argument must be None or a dictionary"));
-            return 0;
-        }
-
-        if(!dictionaryToContext(pyctx, ctx))
+        const Ice::Context* c = getContext(pyctx, ctx);
+        if(!c)
         {
             return 0;
         }
 
         if(cb)
         {
-            return _prx->begin_ice_invoke(_op->name, _op->sendMode, params, ctx, cb);
+            return _prx->begin_ice_invoke(_op->name, _op->sendMode, params, *c, cb);
         }
         else
         {
-            return _prx->begin_ice_invoke(_op->name, _op->sendMode, params, ctx);
+            return _prx->begin_ice_invoke(_op->name, _op->sendMode, params, *c);
         }
     }
     else
@@ -3168,13 +4730,14 @@ IcePy::SyncBlobjectInvocation::invoke(PyObject* args, PyObject* /* kwds */)
         else
         {
             Ice::Context context;
-            if(!dictionaryToContext(ctx, context))
+            const Ice::Context* c = getContext(ctx, context);
+            if(!c)
             {
                 return 0;
             }
 
             AllowThreads allowThreads; // Release Python's global interpreter lock during remote invocations.
-            ok = _prx->ice_invoke(operation, sendMode, in, out, context);
+            ok = _prx->ice_invoke(operation, sendMode, in, out, *c);
         }
 
         //
@@ -3229,6 +4792,7 @@ IcePy::SyncBlobjectInvocation::invoke(PyObject* args, PyObject* /* kwds */)
     }
     catch(const Ice::Exception& ex)
     {
+        invalidateCheckedCast(_communicator, ex);
         setPythonException(ex);
         return 0;
     }
@@ -3332,9 +4896,9 @@ IcePy::AsyncBlobjectInvocation::invoke(PyObject* args, PyObject* kwds)
         return 0;
     }
 
-    if(pyctx != Py_None && !PyDict_Check(pyctx))
+    if(pyctx != Py_None && !checkContext(pyctx))
     {
-        PyErr_Format(PyExc_RuntimeError, STRCAST("context must be a dictionary or None"));
+        PyErr_Format(PyExc_RuntimeError, STRCAST("context must be a dictionary, an Ice.Context or None"));
         return 0;
     }
 
@@ -3388,18 +4952,19 @@ IcePy::AsyncBlobjectInvocation::invoke(PyObject* args, PyObject* kwds)
         else
         {
             Ice::Context context;
-            if(!dictionaryToContext(pyctx, context))
+            const Ice::Context* c = getContext(pyctx, context);
+            if(!c)
             {
                 return 0;
             }
 
             if(cb)
             {
-                result = _prx->begin_ice_invoke(operation, sendMode, in, context, cb);
+                result = _prx->begin_ice_invoke(operation, sendMode, in, *c, cb);
             }
             else
             {
-                result = _prx->begin_ice_invoke(operation, sendMode, in, context);
+                result = _prx->begin_ice_invoke(operation, sendMode, in, *c);
             }
         }
     }
@@ -3505,6 +5070,7 @@ IcePy::AsyncBlobjectInvocation::end(const Ice::ObjectPrx& proxy, const Ice::Asyn
     }
     catch(const Ice::Exception& ex)
     {
+        invalidateCheckedCast(proxy->ice_getCommunicator(), ex);
         setPythonException(ex);
     }
 
@@ -3587,6 +5153,7 @@ void
 IcePy::AsyncBlobjectInvocation::exception(const Ice::Exception& ex)
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+    invalidateCheckedCast(_communicator, ex);
     assert(_ex);
     callException(_ex, ex);
 }
@@ -3686,18 +5253,19 @@ IcePy::NewAsyncBlobjectInvocation::handleInvoke(PyObject* args, PyObject* /* kwd
     else
     {
         Ice::Context context;
-        if(!dictionaryToContext(ctx, context))
+        const Ice::Context* c = getContext(ctx, context);
+        if(!c)
         {
             return 0;
         }
 
         if(cb)
         {
-            return _prx->begin_ice_invoke(operation, sendMode, in, context, cb);
+            return _prx->begin_ice_invoke(operation, sendMode, in, *c, cb);
         }
         else
         {
-            return _prx->begin_ice_invoke(operation, sendMode, in, context);
+            return _prx->begin_ice_invoke(operation, sendMode, in, *c);
         }
     }
 }
@@ -3841,22 +5409,28 @@ Upcall::dispatchImpl(PyObject* servant, const string& dispatchName, PyObject* ar
 // TypedUpcall
 //
 IcePy::TypedUpcall::TypedUpcall(const OperationPtr& op, const Ice::AMD_Object_ice_invokePtr& callback,
-                                const Ice::CommunicatorPtr& communicator) :
-    _op(op), _callback(callback), _communicator(communicator)
+                                const Ice::Current& current, bool identity) :
+    _op(op), _callback(callback), _communicator(current.adapter->getCommunicator()), _encoding(current.encoding),
+    _identity(identity), _servantStart(0), _chunked(0), _marshalTime(-1)
+{
+}
+
+IcePy::TypedUpcall::~TypedUpcall()
 {
+    delete _chunked;
 }
 
 void
 IcePy::TypedUpcall::dispatch(PyObject* servant, const pair<const Ice::Byte*, const Ice::Byte*>& inBytes,
                              const Ice::Current& current)
 {
-    _encoding = current.encoding;
-
     //
     // Unmarshal the in parameters. We have to leave room in the arguments for a trailing
-    // Ice::Current object.
+    // Ice::Current object, or for the leading servant, identity name and identity category
+    // with an identity servant.
     //
-    Py_ssize_t count = static_cast<Py_ssize_t>(_op->inParams.size()) + 1;
+    Py_ssize_t offset = _identity ? 3 : 0;
+    Py_ssize_t count = static_cast<Py_ssize_t>(_op->inParams.size()) + (_identity ? 3 : 1);
 
     PyObjectHandle args = PyTuple_New(count);
     if(!args.get())
@@ -3864,6 +5438,13 @@ IcePy::TypedUpcall::dispatch(PyObject* servant, const pair<const Ice::Byte*, con
         throwPythonException();
     }
 
+    Ice::Long start = 0;
+    if(operationMetricsEnabled)
+    {
+        _op->metrics->call();
+        start = metricsTime();
+    }
+
     if(!_op->inParams.empty())
     {
         Ice::InputStream is(_communicator, inBytes);
@@ -3887,59 +5468,180 @@ IcePy::TypedUpcall::dispatch(PyObject* servant, const pair<const Ice::Byte*, con
             //
             for(p = _op->inParams.begin(); p != _op->inParams.end(); ++p)
             {
-                ParamInfoPtr info = *p;
-                if(!info->optional)
+                ParamInfoPtr info = *p;
+                if(!info->optional)
+                {
+                    void* closure = reinterpret_cast<void*>(info->pos + offset);
+                    info->type->unmarshal(&is, info, args.get(), closure, false, &info->metaData);
+                }
+            }
+
+            //
+            // Unmarshal the optional parameters.
+            //
+            for(p = _op->optionalInParams.begin(); p != _op->optionalInParams.end(); ++p)
+            {
+                ParamInfoPtr info = *p;
+                if(is.readOptional(info->tag, info->type->optionalFormat()))
+                {
+                    void* closure = reinterpret_cast<void*>(info->pos + offset);
+                    info->type->unmarshal(&is, info, args.get(), closure, true, &info->metaData);
+                }
+                else
+                {
+                    PyTuple_SET_ITEM(args.get(), info->pos + offset,
+                                     incRef(Unset)); // PyTuple_SET_ITEM steals a reference.
+                }
+            }
+
+            if(_op->sendsClasses)
+            {
+                is.readPendingValues();
+            }
+
+            is.endEncapsulation();
+
+            util.updateSlicedData();
+        }
+        catch(const AbortMarshaling&)
+        {
+            throwPythonException();
+        }
+    }
+
+    if(start)
+    {
+        _servantStart = metricsTime();
+        _op->metrics->unmarshaled(static_cast<Ice::Long>(inBytes.second - inBytes.first), _servantStart - start);
+    }
+
+    if(_identity)
+    {
+        dispatchIdentity(servant, args.get(), current);
+        return;
+    }
+
+    //
+    // Create an object to represent Ice::Current. We need to append this to the argument tuple.
+    //
+    PyObjectHandle curr = createCurrent(current);
+    PyTuple_SET_ITEM(args.get(), PyTuple_GET_SIZE(args.get()) - 1,
+                     curr.release()); // PyTuple_SET_ITEM steals a reference.
+
+    dispatchImpl(servant, _op->dispatchName, args.get(), current);
+}
+
+void
+IcePy::TypedUpcall::dispatchIdentity(PyObject* servant, PyObject* args, const Ice::Current& current)
+{
+    //
+    // Call the servant method directly, without creating the Ice::Current object and
+    // without going through Ice.Object._iceDispatch. The method is looked up in the
+    // servant's type and receives the servant, the name and the category of the target
+    // identity followed by the in parameters.
+    //
+    PyObjectHandle servantMethod = getAttr(reinterpret_cast<PyObject*>(Py_TYPE(servant)), _op->dispatchName, false);
+    if(!servantMethod.get())
+    {
+        ostringstream ostr;
+        ostr << "servant for identity " << _communicator->identityToString(current.id)
+             << " does not define operation `" << _op->dispatchName << "'";
+        string str = ostr.str();
+        PyErr_WarnEx(PyExc_RuntimeWarning, const_cast<char*>(str.c_str()), 1);
+        Ice::UnknownException ex(__FILE__, __LINE__);
+        ex.unknown = str;
+        throw ex;
+    }
+
+    PyObjectHandle name = createString(current.id.name);
+    PyObjectHandle category = createString(current.id.category);
+    if(!name.get() || !category.get())
+    {
+        throwPythonException();
+    }
+    PyTuple_SET_ITEM(args, 0, incRef(servant)); // PyTuple_SET_ITEM steals a reference.
+    PyTuple_SET_ITEM(args, 1, name.release()); // PyTuple_SET_ITEM steals a reference.
+    PyTuple_SET_ITEM(args, 2, category.release()); // PyTuple_SET_ITEM steals a reference.
+
+    PyObjectHandle result = PyObject_Call(servantMethod.get(), args, 0);
+    if(!result.get())
+    {
+        PyException ex; // Retrieve it before another Python API call clears it.
+        exception(ex);
+        return;
+    }
+
+    bool pending = PyObject_HasAttrString(result.get(), STRCAST("add_done_callback")) == 1;
+#if PY_VERSION_HEX >= 0x03050000
+    pending = pending || PyCoro_CheckExact(result.get());
+#endif
+    if(!pending)
+    {
+        response(result.get());
+        return;
+    }
+
+    //
+    // Let Ice.Object._iceDispatchResult wait for the future or run the coroutine.
+    //
+    DispatchCallbackObject* callback = dispatchCallbackNew(&DispatchCallbackType, 0, 0);
+    if(!callback)
+    {
+        throwPythonException();
+    }
+    callback->upcall = new UpcallPtr(this);
+    PyObjectHandle cb = reinterpret_cast<PyObject*>(callback);
+
+    PyObjectHandle ignore = callMethod(servant, "_iceDispatchResult", cb.get(), result.get());
+    if(PyErr_Occurred())
+    {
+        PyException ex; // Retrieve it before another Python API call clears it.
+        exception(ex);
+    }
+}
+
+void
+IcePy::TypedUpcall::response(PyObject* result)
+{
+    if(_chunked)
+    {
+        //
+        // The chunks of the result supplied by an asynchronous iterator are written,
+        // complete the response.
+        //
+        try
+        {
+            try
+            {
+                Ice::Long start = _marshalTime >= 0 ? metricsTime() : 0;
+                _chunkWriter.finish(*_chunked);
+                if(_op->returnsClasses)
                 {
-                    void* closure = reinterpret_cast<void*>(info->pos);
-                    info->type->unmarshal(&is, info, args.get(), closure, false, &info->metaData);
+                    _chunked->writePendingValues();
                 }
+                sendResponse(*_chunked, start);
             }
-
-            //
-            // Unmarshal the optional parameters.
-            //
-            for(p = _op->optionalInParams.begin(); p != _op->optionalInParams.end(); ++p)
+            catch(const AbortMarshaling&)
             {
-                ParamInfoPtr info = *p;
-                if(is.readOptional(info->tag, info->type->optionalFormat()))
+                try
                 {
-                    void* closure = reinterpret_cast<void*>(info->pos);
-                    info->type->unmarshal(&is, info, args.get(), closure, true, &info->metaData);
+                    throwPythonException();
                 }
-                else
+                catch(const Ice::Exception& ex)
                 {
-                    PyTuple_SET_ITEM(args.get(), info->pos, incRef(Unset)); // PyTuple_SET_ITEM steals a reference.
+                    _callback->ice_exception(ex);
                 }
             }
-
-            if(_op->sendsClasses)
-            {
-                is.readPendingValues();
-            }
-
-            is.endEncapsulation();
-
-            util.updateSlicedData();
         }
-        catch(const AbortMarshaling&)
+        catch(const Ice::Exception& ex)
         {
-            throwPythonException();
+            _callback->ice_exception(ex);
         }
+        return;
     }
 
-    //
-    // Create an object to represent Ice::Current. We need to append this to the argument tuple.
-    //
-    PyObjectHandle curr = createCurrent(current);
-    PyTuple_SET_ITEM(args.get(), PyTuple_GET_SIZE(args.get()) - 1,
-                     curr.release()); // PyTuple_SET_ITEM steals a reference.
-
-    dispatchImpl(servant, _op->dispatchName, args.get(), current);
-}
+    bool timed = servantCompleted();
 
-void
-IcePy::TypedUpcall::response(PyObject* result)
-{
     try
     {
         if(PyObject_IsInstance(result, reinterpret_cast<PyObject*>(&MarshaledResultType)))
@@ -3951,14 +5653,52 @@ IcePy::TypedUpcall::response(PyObject* result)
         {
             try
             {
-                Ice::OutputStream os(_communicator);
-                os.startEncapsulation(_encoding, _op->format);
+                Ice::Long start = timed ? metricsTime() : 0;
+
+                //
+                // A result that can be supplied in chunks by an asynchronous iterator is
+                // marshaled in a stream kept until the chunks are written.
+                //
+                Ice::OutputStream out(_communicator);
+                Ice::OutputStream* os = &out;
+                if(_op->chunkedResult)
+                {
+                    _chunked = new Ice::OutputStream(_communicator);
+                    os = _chunked;
+                }
 
-                _op->marshalResult(os, result);
+                os->startEncapsulation(_encoding, _op->format);
 
-                os.endEncapsulation();
+                PyObjectHandle chunks = _op->marshalResult(*os, result, &_chunkWriter);
+                if(chunks.get())
+                {
+                    //
+                    // Let Ice._iceWriteChunks write the chunks as they're produced.
+                    //
+                    _marshalTime = start ? metricsTime() - start : -1;
+
+                    DispatchCallbackObject* callback = dispatchCallbackNew(&DispatchCallbackType, 0, 0);
+                    if(!callback)
+                    {
+                        throwPythonException();
+                    }
+                    callback->upcall = new UpcallPtr(this);
+                    PyObjectHandle cb = reinterpret_cast<PyObject*>(callback);
+
+                    PyObject* writeChunks = lookupType("Ice._iceWriteChunks");
+                    assert(writeChunks);
+                    PyObjectHandle args = Py_BuildValue(STRCAST("(OO)"), cb.get(), chunks.get());
+                    PyObjectHandle ignore = args.get() ? PyObject_Call(writeChunks, args.get(), 0) : 0;
+                    if(!ignore.get())
+                    {
+                        throw AbortMarshaling();
+                    }
+                    return;
+                }
 
-                _callback->ice_response(true, os.finished());
+                sendResponse(*os, start);
+                delete _chunked;
+                _chunked = 0;
             }
             catch(const AbortMarshaling&)
             {
@@ -3979,9 +5719,38 @@ IcePy::TypedUpcall::response(PyObject* result)
     }
 }
 
+void
+IcePy::TypedUpcall::writeChunk(PyObject* chunk)
+{
+    assert(_chunked);
+    Ice::Long start = _marshalTime >= 0 ? metricsTime() : 0;
+    _chunkWriter.write(*_chunked, chunk);
+    if(start)
+    {
+        _marshalTime += metricsTime() - start;
+    }
+}
+
+void
+IcePy::TypedUpcall::sendResponse(Ice::OutputStream& os, Ice::Long start)
+{
+    os.endEncapsulation();
+
+    pair<const Ice::Byte*, const Ice::Byte*> outBytes = os.finished();
+    if(start)
+    {
+        Ice::Long time = metricsTime() - start + (_marshalTime > 0 ? _marshalTime : 0);
+        _op->metrics->marshaled(static_cast<Ice::Long>(outBytes.second - outBytes.first), time);
+    }
+
+    _callback->ice_response(true, outBytes);
+}
+
 void
 IcePy::TypedUpcall::exception(PyException& ex)
 {
+    servantCompleted();
+
     try
     {
         try
@@ -4038,6 +5807,22 @@ IcePy::TypedUpcall::exception(const Ice::Exception& ex)
     _callback->ice_exception(ex);
 }
 
+bool
+IcePy::TypedUpcall::servantCompleted()
+{
+    //
+    // The servant time of an asynchronous dispatch includes the time until the
+    // dispatch completes.
+    //
+    if(!_servantStart || !operationMetricsEnabled)
+    {
+        return false;
+    }
+    _op->metrics->dispatched(metricsTime() - _servantStart);
+    _servantStart = 0;
+    return true;
+}
+
 //
 // BlobjectUpcall
 //
@@ -4217,9 +6002,7 @@ IcePy::invokeBuiltin(PyObject* proxy, const string& builtin, PyObject* args)
     OperationPtr op = getOperation(obj.get());
     assert(op);
 
-    Ice::ObjectPrx p = getProxy(proxy);
-    InvocationPtr i = new SyncTypedInvocation(p, op);
-    return i->invoke(args);
+    return invokeTyped(proxy, op, args);
 }
 
 PyObject*
@@ -4234,9 +6017,7 @@ IcePy::invokeBuiltinAsync(PyObject* proxy, const string& builtin, PyObject* args
     OperationPtr op = getOperation(obj.get());
     assert(op);
 
-    Ice::ObjectPrx p = getProxy(proxy);
-    InvocationPtr i = new NewAsyncTypedInvocation(p, proxy, op);
-    return i->invoke(args);
+    return invokeTypedAsync(proxy, op, args);
 }
 
 PyObject*
@@ -4251,9 +6032,7 @@ IcePy::beginBuiltin(PyObject* proxy, const string& builtin, PyObject* args)
     OperationPtr op = getOperation(obj.get());
     assert(op);
 
-    Ice::ObjectPrx p = getProxy(proxy);
-    InvocationPtr i = new AsyncTypedInvocation(p, proxy, op);
-    return i->invoke(args);
+    return beginTyped(proxy, op, args);
 }
 
 PyObject*
@@ -4282,8 +6061,7 @@ IcePy::endBuiltin(PyObject* proxy, const string& builtin, PyObject* args)
         PyErr_Format(PyExc_ValueError, STRCAST("invalid AsyncResult object passed to end_%s"), op->name.c_str());
         return 0;
     }
-    Ice::ObjectPrx p = getProxy(proxy);
-    return i->end(p, op, *ar->result);
+    return i->end(endProxy(proxy, *ar->result), op, *ar->result);
 }
 
 PyObject*
@@ -4636,11 +6414,18 @@ IcePy::ServantWrapper::getObject()
 //
 // TypedServantWrapper implementation.
 //
-IcePy::TypedServantWrapper::TypedServantWrapper(PyObject* servant) :
-    ServantWrapper(servant), _lastOp(_operationMap.end())
+IcePy::TypedServantWrapper::TypedServantWrapper(PyObject* servant, bool identity) :
+    ServantWrapper(servant), _lastOp(_operationMap.end()), _identity(identity), _maxConcurrency(0),
+    _maxQueued(0)
 {
 }
 
+bool
+IcePy::TypedServantWrapper::identity() const
+{
+    return _identity;
+}
+
 void
 IcePy::TypedServantWrapper::ice_invoke_async(const Ice::AMD_Object_ice_invokePtr& cb,
                                              const pair<const Ice::Byte*, const Ice::Byte*>& inParams,
@@ -4648,6 +6433,7 @@ IcePy::TypedServantWrapper::ice_invoke_async(const Ice::AMD_Object_ice_invokePtr
 {
     AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
 
+    Ice::AMD_Object_ice_invokePtr callback = cb;
     try
     {
         //
@@ -4683,8 +6469,11 @@ IcePy::TypedServantWrapper::ice_invoke_async(const Ice::AMD_Object_ice_invokePtr
                 }
 
                 assert(PyObject_IsInstance(h.get(), reinterpret_cast<PyObject*>(&OperationType)) == 1);
-                OperationObject* obj = reinterpret_cast<OperationObject*>(h.get());
-                op = *obj->op;
+                op = getOperation(h.get());
+                if(!op)
+                {
+                    throwPythonException();
+                }
                 _lastOp = _operationMap.insert(OperationMap::value_type(current.operation, op)).first;
             }
             else
@@ -4701,7 +6490,68 @@ IcePy::TypedServantWrapper::ice_invoke_async(const Ice::AMD_Object_ice_invokePtr
             _iceCheckMode(op->mode, current.mode);
         }
 
-        UpcallPtr up = new TypedUpcall(op, cb, current.adapter->getCommunicator());
+        //
+        // Apply the admission control before unmarshaling the parameters. The limit of the
+        // operation's python:maxConcurrency metadata takes precedence over the object
+        // adapter's default.
+        //
+        if(!op->pseudoOp)
+        {
+            int maxConcurrency;
+            int maxQueued;
+            string rejectException;
+            getAdmissionSettings(current.adapter, maxConcurrency, maxQueued, rejectException);
+            if(op->maxConcurrency > 0)
+            {
+                maxConcurrency = op->maxConcurrency;
+            }
+
+            if(maxConcurrency > 0)
+            {
+                AdmissionControlPtr admission = getAdmissionControl(current.adapter, op->name);
+                AdmissionControl::Result result = admission->admit(maxConcurrency, maxQueued, 0);
+                if(result == AdmissionControl::Wait)
+                {
+                    //
+                    // The dispatch is resumed by the thread that releases a slot.
+                    //
+                    QueuedDispatchPtr dispatch = new QueuedDispatch(this, op, cb, inParams, current);
+                    result = admission->admit(maxConcurrency, maxQueued, dispatch);
+                    if(result == AdmissionControl::Queued)
+                    {
+                        return;
+                    }
+                }
+
+                if(result == AdmissionControl::Rejected)
+                {
+                    reject(op, cb, rejectException, current);
+                    return;
+                }
+                callback = new AdmittedCallback(cb, admission, 0);
+            }
+        }
+
+        dispatch(op, callback, inParams, current);
+    }
+    catch(const Ice::Exception& ex)
+    {
+        callback->ice_exception(ex);
+    }
+}
+
+void
+IcePy::TypedServantWrapper::dispatch(const OperationPtr& op, const Ice::AMD_Object_ice_invokePtr& cb,
+                                     const pair<const Ice::Byte*, const Ice::Byte*>& inParams,
+                                     const Ice::Current& current)
+{
+    try
+    {
+        //
+        // The Ice::Object operations (ice_ping, ice_isA, etc.) are always dispatched with
+        // Ice::Current.
+        //
+        UpcallPtr up = new TypedUpcall(op, cb, current, _identity && !op->pseudoOp);
         up->dispatch(_servant, inParams, current);
     }
     catch(const Ice::Exception& ex)
@@ -4710,6 +6560,128 @@ IcePy::TypedServantWrapper::ice_invoke_async(const Ice::AMD_Object_ice_invokePtr
     }
 }
 
+void
+IcePy::TypedServantWrapper::getAdmissionSettings(const Ice::ObjectAdapterPtr& adapter, int& maxConcurrency,
+                                                 int& maxQueued, string& rejectException)
+{
+    if(_adapter == adapter)
+    {
+        maxConcurrency = _maxConcurrency;
+        maxQueued = _maxQueued;
+        rejectException = _rejectException;
+        return;
+    }
+
+    Ice::PropertiesPtr properties = adapter->getCommunicator()->getProperties();
+    const string prefix = adapter->getName() + ".Python.";
+    maxConcurrency = properties->getPropertyAsInt(prefix + "MaxConcurrency");
+    maxQueued = properties->getPropertyAsInt(prefix + "MaxQueued");
+    rejectException = properties->getProperty(prefix + "RejectException");
+
+    _adapter = adapter;
+    _maxConcurrency = maxConcurrency;
+    _maxQueued = maxQueued;
+    _rejectException = rejectException;
+}
+
+void
+IcePy::TypedServantWrapper::reject(const OperationPtr& op, const Ice::AMD_Object_ice_invokePtr& cb,
+                                   const string& rejectException, const Ice::Current& current)
+{
+    //
+    // Reject the dispatch with the configured user exception, which is marshaled like an
+    // exception raised by the servant, or with an UnknownLocalException.
+    //
+    ExceptionInfoPtr info;
+    if(!rejectException.empty())
+    {
+        info = lookupExceptionInfo(rejectException);
+    }
+
+    if(!info)
+    {
+        ostringstream ostr;
+        ostr << "dispatch of operation `" << op->name << "' rejected: too many concurrent dispatches";
+        Ice::UnknownLocalException ex(__FILE__, __LINE__);
+        ex.unknown = ostr.str();
+        cb->ice_exception(ex);
+        return;
+    }
+
+    UpcallPtr up = new TypedUpcall(op, cb, current, false);
+    PyObjectHandle ex = PyObject_CallObject(info->pythonType, 0);
+    if(!ex.get())
+    {
+        PyException pe; // Retrieve it before another Python API call clears it.
+        up->exception(pe);
+        return;
+    }
+
+    PyException pe(ex.get());
+    up->exception(pe);
+}
+
+//
+// AdmittedCallback implementation.
+//
+IcePy::AdmittedCallback::AdmittedCallback(const Ice::AMD_Object_ice_invokePtr& callback,
+                                          const AdmissionControlPtr& admission,
+                                          const QueuedDispatchPtr& dispatch) :
+    _callback(callback), _admission(admission), _dispatch(dispatch)
+{
+}
+
+IcePy::AdmittedCallback::~AdmittedCallback()
+{
+    //
+    // Release the slot of a dispatch that never completed.
+    //
+    release();
+}
+
+//
+// The response is sent before the slot is released, since releasing the slot may
+// dispatch the next queued request on this thread.
+//
+void
+IcePy::AdmittedCallback::ice_response(bool ok, const vector<Ice::Byte>& bytes)
+{
+    _callback->ice_response(ok, bytes);
+    release();
+}
+
+void
+IcePy::AdmittedCallback::ice_response(bool ok, const pair<const Ice::Byte*, const Ice::Byte*>& bytes)
+{
+    _callback->ice_response(ok, bytes);
+    release();
+}
+
+void
+IcePy::AdmittedCallback::ice_exception(const std::exception& ex)
+{
+    _callback->ice_exception(ex);
+    release();
+}
+
+void
+IcePy::AdmittedCallback::ice_exception()
+{
+    _callback->ice_exception();
+    release();
+}
+
+void
+IcePy::AdmittedCallback::release()
+{
+    if(_admission)
+    {
+        AdmissionControlPtr admission = _admission;
+        _admission = 0;
+        admission->release(_dispatch);
+    }
+}
+
 //
 // BlobjectServantWrapper implementation.
 //
@@ -4754,6 +6726,20 @@ IcePy::createServantWrapper(PyObject* servant)
     return new TypedServantWrapper(servant);
 }
 
+IcePy::ServantWrapperPtr
+IcePy::createIdentityServantWrapper(PyObject* servant)
+{
+    PyObject* blobjectType = lookupType("Ice.Blobject");
+    PyObject* blobjectAsyncType = lookupType("Ice.BlobjectAsync");
+    if(PyObject_IsInstance(servant, blobjectType) || PyObject_IsInstance(servant, blobjectAsyncType))
+    {
+        PyErr_Format(PyExc_ValueError, STRCAST("expected a typed servant"));
+        return 0;
+    }
+
+    return new TypedServantWrapper(servant, true);
+}
+
 PyObject*
 IcePy::createFuture()
 {
@@ -4800,3 +6786,93 @@ IcePy::createFuture(const string& operation, PyObject* asyncResult)
     type->tp_init(future, args.get(), 0); // Call the constructor
     return future;
 }
+
+extern "C"
+PyObject*
+IcePy_getAdmissionStats(PyObject* /*self*/)
+{
+    vector<AdmissionControlPtr> controls;
+    {
+        IceUtilInternal::MutexPtrLock<IceUtil::Mutex> lock(admissionMutex);
+        for(AdmissionControlMap::const_iterator p = admissionControls.begin(); p != admissionControls.end(); ++p)
+        {
+            controls.push_back(p->second);
+        }
+    }
+
+    PyObjectHandle result = PyList_New(0);
+    if(!result.get())
+    {
+        return 0;
+    }
+
+    for(vector<AdmissionControlPtr>::const_iterator p = controls.begin(); p != controls.end(); ++p)
+    {
+        int inFlight;
+        int queued;
+        Ice::Long admitted;
+        Ice::Long rejected;
+        {
+            IceUtil::Mutex::Lock sync(**p);
+            inFlight = (*p)->inFlight;
+            queued = (*p)->queued;
+            admitted = (*p)->admitted;
+            rejected = (*p)->rejected;
+        }
+
+        PyObjectHandle stats = Py_BuildValue(STRCAST("(NiiLL)"), createString((*p)->name), inFlight, queued,
+                                             static_cast<PY_LONG_LONG>(admitted),
+                                             static_cast<PY_LONG_LONG>(rejected));
+        if(!stats.get() || PyList_Append(result.get(), stats.get()) < 0)
+        {
+            return 0;
+        }
+    }
+
+    return result.release();
+}
+
+extern "C"
+PyObject*
+IcePy_enableOperationMetrics(PyObject* /*self*/, PyObject* args)
+{
+    PyObject* enable = Py_True;
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &enable))
+    {
+        return 0;
+    }
+
+    operationMetricsEnabled = PyObject_IsTrue(enable) == 1;
+    return incRef(Py_None);
+}
+
+extern "C"
+PyObject*
+IcePy_getOperationMetrics(PyObject* /*self*/)
+{
+    PyObjectHandle result = PyList_New(0);
+    if(!result.get())
+    {
+        return 0;
+    }
+
+    for(vector<OperationMetricsPtr>::const_iterator p = operationMetrics.begin(); p != operationMetrics.end(); ++p)
+    {
+        PyObjectHandle metrics = Py_BuildValue(STRCAST("(NLLLLLLLLL)"), createString((*p)->name),
+                                               static_cast<PY_LONG_LONG>((*p)->calls),
+                                               static_cast<PY_LONG_LONG>((*p)->bytesIn),
+                                               static_cast<PY_LONG_LONG>((*p)->bytesOut),
+                                               static_cast<PY_LONG_LONG>((*p)->marshalCount),
+                                               static_cast<PY_LONG_LONG>((*p)->marshalTime),
+                                               static_cast<PY_LONG_LONG>((*p)->unmarshalCount),
+                                               static_cast<PY_LONG_LONG>((*p)->unmarshalTime),
+                                               static_cast<PY_LONG_LONG>((*p)->servantCount),
+                                               static_cast<PY_LONG_LONG>((*p)->servantTime));
+        if(!metrics.get() || PyList_Append(result.get(), metrics.get()) < 0)
+        {
+            return 0;
+        }
+    }
+
+    return result.release();
+}
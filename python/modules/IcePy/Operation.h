@@ -156,9 +156,79 @@ typedef IceUtil::Handle<ServantWrapper> ServantWrapperPtr;
 
 ServantWrapperPtr createServantWrapper(PyObject*);
 
+//
+// Creates the wrapper for a default servant whose methods receive the name and category
+// of the target identity instead of Ice::Current.
+//
+ServantWrapperPtr createIdentityServantWrapper(PyObject*);
+
+//
+// The object adapters of a communicator for the collocated invocations that bypass
+// marshaling, see Ice.Python.Collocation. Protected by the GIL.
+//
+class CollocatedAdapters : public IceUtil::Shared
+{
+public:
+
+    CollocatedAdapters(bool);
+
+    void add(const Ice::ObjectAdapterPtr&);
+    void setHeld(const Ice::ObjectAdapterPtr&, bool);
+    void remove(const Ice::ObjectAdapterPtr&);
+    void clear();
+
+    //
+    // Returns the adapter hosting the target object of the proxy, or 0 if the invocation
+    // must be sent as usual.
+    //
+    Ice::ObjectAdapterPtr find(const Ice::ObjectPrx&);
+
+    bool copy() const;
+
+private:
+
+    struct Adapter
+    {
+        Ice::ObjectAdapterPtr adapter;
+        std::string adapterId;
+        std::string replicaGroupId;
+        bool admission;
+        bool held;
+    };
+
+    const bool _copy;
+    std::vector<Adapter> _adapters;
+};
+typedef IceUtil::Handle<CollocatedAdapters> CollocatedAdaptersPtr;
+
+//
+// Returns the collocated adapters of a communicator configured with Ice.Python.Collocation
+// set to Copy or Share, or 0 if the collocated invocations must be marshaled. They are
+// always marshaled if the communicator has a dispatcher or a dispatch observer.
+//
+CollocatedAdaptersPtr createCollocatedAdapters(const Ice::CommunicatorPtr&, bool, bool);
+
+//
+// Update the collocated adapters of the communicator of the adapter, if any. The
+// invocations on an adapter which is held or deactivated are sent as usual.
+//
+void addCollocatedAdapter(const Ice::ObjectAdapterPtr&);
+void setCollocatedAdapterHeld(const Ice::ObjectAdapterPtr&, bool);
+void removeCollocatedAdapter(const Ice::ObjectAdapterPtr&);
+
+//
+// Remove the admission controls of a destroyed object adapter or communicator.
+//
+void removeAdmissionControls(const Ice::ObjectAdapterPtr&);
+void removeAdmissionControls(const Ice::CommunicatorPtr&);
+
 PyObject* createFuture();
 PyObject* createFuture(const std::string&, PyObject*);
 
 }
 
+extern "C" PyObject* IcePy_getAdmissionStats(PyObject*);
+extern "C" PyObject* IcePy_enableOperationMetrics(PyObject*, PyObject*);
+extern "C" PyObject* IcePy_getOperationMetrics(PyObject*);
+
 #endif
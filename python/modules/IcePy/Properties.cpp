@@ -11,8 +11,11 @@
 #   include <IceUtil/Config.h>
 #endif
 #include <Properties.h>
+#include <Thread.h>
 #include <Util.h>
+#include <Ice/Communicator.h>
 #include <Ice/Initialize.h>
+#include <Ice/NativePropertiesAdmin.h>
 #include <Ice/Properties.h>
 
 using namespace std;
@@ -25,8 +28,71 @@ struct PropertiesObject
 {
     PyObject_HEAD
     Ice::PropertiesPtr* properties;
+    PyObject* snapshot; // The last snapshot, see propertiesSnapshot.
+    Ice::PropertyDict* snapshotProperties;
+    Ice::Long snapshotVersion; // The version of the properties when the last snapshot was checked.
 };
 
+//
+// Bumps the version of the properties when they are updated with the Properties admin facet.
+//
+class VersionUpdateCallback : public Ice::PropertiesAdminUpdateCallback
+{
+public:
+
+    VersionUpdateCallback(const Ice::PropertiesPtr& properties) : _properties(properties)
+    {
+    }
+
+    virtual void updated(const Ice::PropertyDict&)
+    {
+        AdoptThread adoptThread; // Ensure the current thread is able to call into Python.
+        propertiesUpdated(_properties);
+    }
+
+private:
+
+    const Ice::PropertiesPtr _properties;
+};
+
+}
+
+//
+// The generation of the last snapshot created for any property set, protected by the GIL.
+//
+static Ice::Long _snapshotGeneration = 0;
+
+//
+// The version of the property sets wrapped by a Properties object, incremented when they are modified.
+// The entries are counted by the wrappers and protected by the GIL.
+//
+struct PropertiesVersion
+{
+    Ice::Long version;
+    int wrappers;
+};
+typedef map<Ice::Properties*, PropertiesVersion> PropertiesVersionMap;
+static PropertiesVersionMap _propertiesVersions;
+
+static void
+setProperties(PropertiesObject* self, const Ice::PropertiesPtr& properties)
+{
+    self->properties = new Ice::PropertiesPtr(properties);
+    PropertiesVersionMap::iterator p = _propertiesVersions.find(properties.get());
+    if(p == _propertiesVersions.end())
+    {
+        PropertiesVersion v = { 0, 0 };
+        p = _propertiesVersions.insert(PropertiesVersionMap::value_type(properties.get(), v)).first;
+    }
+    ++p->second.wrappers;
+}
+
+static Ice::Long
+getPropertiesVersion(const Ice::PropertiesPtr& properties)
+{
+    PropertiesVersionMap::const_iterator p = _propertiesVersions.find(properties.get());
+    assert(p != _propertiesVersions.end());
+    return p->second.version;
 }
 
 #ifdef WIN32
@@ -41,6 +107,9 @@ propertiesNew(PyTypeObject* type, PyObject* /*args*/, PyObject* /*kwds*/)
         return 0;
     }
     self->properties = 0;
+    self->snapshot = 0;
+    self->snapshotProperties = 0;
+    self->snapshotVersion = 0;
     return self;
 }
 
@@ -127,7 +196,7 @@ propertiesInit(PropertiesObject* self, PyObject* args, PyObject* /*kwds*/)
         }
     }
 
-    self->properties = new Ice::PropertiesPtr(props);
+    setProperties(self, props);
 
     return 0;
 }
@@ -138,7 +207,18 @@ extern "C"
 static void
 propertiesDealloc(PropertiesObject* self)
 {
+    if(self->properties)
+    {
+        PropertiesVersionMap::iterator p = _propertiesVersions.find(self->properties->get());
+        assert(p != _propertiesVersions.end());
+        if(--p->second.wrappers == 0)
+        {
+            _propertiesVersions.erase(p);
+        }
+    }
     delete self->properties;
+    Py_XDECREF(self->snapshot);
+    delete self->snapshotProperties;
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -481,6 +561,7 @@ propertiesSetProperty(PropertiesObject* self, PyObject* args)
     try
     {
         (*self->properties)->setProperty(key, value);
+        propertiesUpdated(*self->properties);
     }
     catch(const Ice::Exception& ex)
     {
@@ -553,6 +634,7 @@ propertiesParseCommandLineOptions(PropertiesObject* self, PyObject* args)
     try
     {
         filteredSeq = (*self->properties)->parseCommandLineOptions(prefix, seq);
+        propertiesUpdated(*self->properties);
     }
     catch(const Ice::Exception& ex)
     {
@@ -596,6 +678,7 @@ propertiesParseIceCommandLineOptions(PropertiesObject* self, PyObject* args)
     try
     {
         filteredSeq = (*self->properties)->parseIceCommandLineOptions(seq);
+        propertiesUpdated(*self->properties);
     }
     catch(const Ice::Exception& ex)
     {
@@ -638,6 +721,7 @@ propertiesLoad(PropertiesObject* self, PyObject* args)
     try
     {
         (*self->properties)->load(file);
+        propertiesUpdated(*self->properties);
     }
     catch(const Ice::Exception& ex)
     {
@@ -670,6 +754,82 @@ propertiesClone(PropertiesObject* self)
     return createProperties(properties);
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+propertiesSnapshot(PropertiesObject* self)
+{
+    //
+    // The last snapshot is returned until the properties are modified. Otherwise, the
+    // properties are read from a clone, so that they aren't marked as used for
+    // Ice.Warn.UnusedProperties, and the last snapshot is still returned if the
+    // modifications didn't change them.
+    //
+    assert(self->properties);
+    Ice::Long version = getPropertiesVersion(*self->properties);
+    if(self->snapshot && self->snapshotVersion == version)
+    {
+        return incRef(self->snapshot);
+    }
+
+    Ice::PropertiesPtr properties;
+    Ice::PropertyDict dict;
+    try
+    {
+        properties = (*self->properties)->clone();
+        dict = properties->getPropertiesForPrefix("");
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    if(self->snapshot && *self->snapshotProperties == dict)
+    {
+        self->snapshotVersion = version;
+        return incRef(self->snapshot);
+    }
+
+    PyObjectHandle items = PyDict_New();
+    if(!items.get())
+    {
+        return 0;
+    }
+    for(Ice::PropertyDict::iterator p = dict.begin(); p != dict.end(); ++p)
+    {
+        PyObjectHandle key = createString(p->first);
+        PyObjectHandle val = createString(p->second);
+        if(!key.get() || !val.get() || PyDict_SetItem(items.get(), key.get(), val.get()) < 0)
+        {
+            return 0;
+        }
+    }
+
+    PyObjectHandle impl = createProperties(properties);
+    if(!impl.get())
+    {
+        return 0;
+    }
+
+    PyObject* type = lookupType("Ice.PropertiesSnapshot");
+    assert(type);
+    PyObjectHandle snapshot = PyObject_CallFunction(type, STRCAST("OOL"), impl.get(), items.get(),
+                                                    static_cast<PY_LONG_LONG>(++_snapshotGeneration));
+    if(!snapshot.get())
+    {
+        return 0;
+    }
+
+    Py_XDECREF(self->snapshot);
+    self->snapshot = incRef(snapshot.get());
+    delete self->snapshotProperties;
+    self->snapshotProperties = new Ice::PropertyDict(dict);
+    self->snapshotVersion = version;
+    return snapshot.release();
+}
+
 static PyMethodDef PropertyMethods[] =
 {
     { STRCAST("getProperty"), reinterpret_cast<PyCFunction>(propertiesGetProperty), METH_VARARGS,
@@ -698,6 +858,8 @@ static PyMethodDef PropertyMethods[] =
         PyDoc_STR(STRCAST("load(file) -> None")) },
     { STRCAST("clone"), reinterpret_cast<PyCFunction>(propertiesClone), METH_NOARGS,
         PyDoc_STR(STRCAST("clone() -> Ice.Properties")) },
+    { STRCAST("snapshot"), reinterpret_cast<PyCFunction>(propertiesSnapshot), METH_NOARGS,
+        PyDoc_STR(STRCAST("snapshot() -> Ice.PropertiesSnapshot")) },
     { 0, 0 } /* sentinel */
 };
 
@@ -775,11 +937,32 @@ IcePy::createProperties(const Ice::PropertiesPtr& props)
     PropertiesObject* obj = propertiesNew(&PropertiesType, 0, 0);
     if(obj)
     {
-        obj->properties = new Ice::PropertiesPtr(props);
+        setProperties(obj, props);
     }
     return reinterpret_cast<PyObject*>(obj);
 }
 
+void
+IcePy::propertiesUpdated(const Ice::PropertiesPtr& props)
+{
+    PropertiesVersionMap::iterator p = _propertiesVersions.find(props.get());
+    if(p != _propertiesVersions.end())
+    {
+        ++p->second.version;
+    }
+}
+
+void
+IcePy::trackPropertiesUpdates(const Ice::CommunicatorPtr& communicator)
+{
+    Ice::NativePropertiesAdminPtr admin =
+        Ice::NativePropertiesAdminPtr::dynamicCast(communicator->findAdminFacet("Properties"));
+    if(admin)
+    {
+        admin->addUpdateCallback(new VersionUpdateCallback(communicator->getProperties()));
+    }
+}
+
 Ice::PropertiesPtr
 IcePy::getProperties(PyObject* p)
 {
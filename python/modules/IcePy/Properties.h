@@ -12,6 +12,7 @@
 
 #include <Config.h>
 #include <Ice/PropertiesF.h>
+#include <Ice/CommunicatorF.h>
 
 namespace IcePy
 {
@@ -24,6 +25,16 @@ PyObject* createProperties(const Ice::PropertiesPtr&);
 
 Ice::PropertiesPtr getProperties(PyObject*);
 
+//
+// Invalidates the snapshots of the given properties, which must be called when they are modified.
+//
+void propertiesUpdated(const Ice::PropertiesPtr&);
+
+//
+// Invalidates the snapshots of the communicator properties when they are updated with the Properties admin facet.
+//
+void trackPropertiesUpdates(const Ice::CommunicatorPtr&);
+
 }
 
 extern "C" PyObject* IcePy_createProperties(PyObject*, PyObject*);
@@ -15,16 +15,22 @@
 #include <structmember.h>
 #include <Communicator.h>
 #include <Connection.h>
+#include <ConnectionInfo.h>
+#include <Context.h>
 #include <Endpoint.h>
 #include <Operation.h>
 #include <Thread.h>
 #include <Util.h>
 #include <Types.h>
 #include <Ice/Communicator.h>
+#include <Ice/Connection.h>
 #include <Ice/LocalException.h>
 #include <Ice/Locator.h>
+#include <Ice/Properties.h>
 #include <Ice/Proxy.h>
 #include <Ice/Router.h>
+#include <IceUtil/Atomic.h>
+#include <limits>
 
 using namespace std;
 using namespace IcePy;
@@ -37,10 +43,39 @@ struct ProxyObject
     PyObject_HEAD
     Ice::ObjectPrx* proxy;
     Ice::CommunicatorPtr* communicator;
+    PyObject* derived; // The cache of derived proxies, see findDerivedProxy.
+    InvocationRouterPtr* router;
 };
 
 }
 
+namespace
+{
+
+//
+// The transformations whose result is cached by the proxy.
+//
+enum DerivedProxyKind
+{
+    DerivedTwoway,
+    DerivedOneway,
+    DerivedBatchOneway,
+    DerivedDatagram,
+    DerivedBatchDatagram,
+    DerivedTimeout,
+    DerivedInvocationTimeout,
+    DerivedContext,
+    DerivedFacet,
+    DerivedUncheckedCast
+};
+
+//
+// The maximum number of derived proxies cached by a proxy, the cache is cleared when full.
+//
+const Py_ssize_t derivedProxyCacheSize = 16;
+
+}
+
 //
 // Proxy implementation.
 //
@@ -66,10 +101,93 @@ allocateProxy(const Ice::ObjectPrx& proxy, const Ice::CommunicatorPtr& communica
     //
     p->proxy = new Ice::ObjectPrx(proxy);
     p->communicator = new Ice::CommunicatorPtr(communicator);
+    p->derived = 0;
+    p->router = 0;
+
+    return p;
+}
 
+//
+// The proxies created by casting a proxy with a connection pool or the adaptive
+// endpoint selection share its invocation router.
+//
+static PyObject*
+shareRouter(ProxyObject* self, PyObject* p)
+{
+    ProxyObject* obj = reinterpret_cast<ProxyObject*>(p);
+    if(obj && self->router && obj->proxy->get() == self->proxy->get())
+    {
+        obj->router = new InvocationRouterPtr(*self->router);
+    }
     return p;
 }
 
+//
+// Proxies are immutable, so each proxy caches the proxies derived from it by the most
+// common transformations such as ice_oneway or ice_timeout. This avoids creating a new
+// proxy object with each call in code such as prx.ice_oneway().op(). The key identifies
+// the transformation and its arguments.
+//
+static PyObject*
+findDerivedProxy(ProxyObject* self, PyObject* key)
+{
+    if(!key)
+    {
+        PyErr_Clear(); // The transformation isn't cached if the key can't be created.
+        return 0;
+    }
+    else if(!self->derived)
+    {
+        return 0;
+    }
+
+    PyObject* p = PyDict_GetItem(self->derived, key); // Borrowed reference.
+    return p ? incRef(p) : 0;
+}
+
+static PyObject*
+cacheDerivedProxy(ProxyObject* self, PyObject* key, const Ice::ObjectPrx& proxy, PyObject* type)
+{
+    if(!type)
+    {
+        PyTypeObject* proxyType = &ProxyType; // Necessary to prevent GCC's strict-alias warnings.
+        type = reinterpret_cast<PyObject*>(proxyType);
+    }
+
+    //
+    // The transformation returns the same proxy if it doesn't change anything.
+    //
+    if(proxy.get() == self->proxy->get() && reinterpret_cast<PyObject*>(Py_TYPE(self)) == type)
+    {
+        return incRef(reinterpret_cast<PyObject*>(self));
+    }
+
+    PyObjectHandle p = shareRouter(self, reinterpret_cast<PyObject*>(allocateProxy(proxy, *self->communicator, type)));
+    if(!p.get() || !key)
+    {
+        return p.release();
+    }
+
+    if(!self->derived)
+    {
+        self->derived = PyDict_New();
+        if(!self->derived)
+        {
+            return 0;
+        }
+    }
+    else if(PyDict_Size(self->derived) >= derivedProxyCacheSize)
+    {
+        PyDict_Clear(self->derived);
+    }
+
+    if(PyDict_SetItem(self->derived, key, p.get()) < 0)
+    {
+        PyErr_Clear(); // The key can't be hashed.
+    }
+    return p.release();
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -88,6 +206,8 @@ proxyDealloc(ProxyObject* self)
 {
     delete self->proxy;
     delete self->communicator;
+    Py_XDECREF(self->derived);
+    delete self->router;
     Py_TYPE(self)->tp_free(reinterpret_cast<PyObject*>(self));
 }
 
@@ -177,6 +297,18 @@ proxyIceGetCommunicator(ProxyObject* self)
     return getCommunicatorWrapper(*self->communicator);
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+proxyCopy(ProxyObject* self, PyObject* /*args*/)
+{
+    //
+    // Proxies are immutable, copy.copy and copy.deepcopy return the same proxy.
+    //
+    return incRef(reinterpret_cast<PyObject*>(self));
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -185,7 +317,7 @@ proxyIceIsA(ProxyObject* self, PyObject* args)
 {
     PyObject* type;
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("O|O!"), &type, &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("O|O"), &type, &ctx))
     {
         return 0;
     }
@@ -206,7 +338,7 @@ proxyIceIsAAsync(ProxyObject* self, PyObject* args)
 {
     PyObject* type;
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("O|O!"), &type, &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("O|O"), &type, &ctx))
     {
         return 0;
     }
@@ -270,7 +402,7 @@ static PyObject*
 proxyIcePing(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -290,7 +422,7 @@ static PyObject*
 proxyIcePingAsync(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -352,7 +484,7 @@ static PyObject*
 proxyIceIds(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -372,7 +504,7 @@ static PyObject*
 proxyIceIdsAsync(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -434,7 +566,7 @@ static PyObject*
 proxyIceId(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -454,7 +586,7 @@ static PyObject*
 proxyIceIdAsync(ProxyObject* self, PyObject* args)
 {
     PyObject* ctx = Py_None;
-    if(!PyArg_ParseTuple(args, STRCAST("|O!"), &PyDict_Type, &ctx))
+    if(!PyArg_ParseTuple(args, STRCAST("|O"), &ctx))
     {
         return 0;
     }
@@ -600,8 +732,8 @@ extern "C"
 static PyObject*
 proxyIceContext(ProxyObject* self, PyObject* args)
 {
-    PyObject* dict;
-    if(!PyArg_ParseTuple(args, STRCAST("O!"), &PyDict_Type, &dict))
+    PyObject* obj;
+    if(!PyArg_ParseTuple(args, STRCAST("O"), &obj))
     {
         return 0;
     }
@@ -609,15 +741,37 @@ proxyIceContext(ProxyObject* self, PyObject* args)
     assert(self->proxy);
 
     Ice::Context ctx;
-    if(!dictionaryToContext(dict, ctx))
+    const Ice::Context* c = getContext(obj, ctx);
+    if(!c)
     {
         return 0;
     }
 
+    //
+    // The context is identified by the frozen set of its items, or by the Ice.Context object
+    // which is hashable.
+    //
+    PyObjectHandle key;
+    if(PyDict_Check(obj))
+    {
+        PyObjectHandle items = PyDict_Items(obj);
+        PyObjectHandle itemSet = items.get() ? PyFrozenSet_New(items.get()) : 0;
+        key = itemSet.get() ? Py_BuildValue(STRCAST("(iO)"), DerivedContext, itemSet.get()) : 0;
+    }
+    else
+    {
+        key = Py_BuildValue(STRCAST("(iO)"), DerivedContext, obj);
+    }
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
-        newProxy = (*self->proxy)->ice_context(ctx);
+        newProxy = (*self->proxy)->ice_context(*c);
     }
     catch(const Ice::Exception& ex)
     {
@@ -625,7 +779,7 @@ proxyIceContext(ProxyObject* self, PyObject* args)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -670,6 +824,13 @@ proxyIceFacet(ProxyObject* self, PyObject* args)
 
     assert(self->proxy);
 
+    PyObjectHandle key = Py_BuildValue(STRCAST("(iO)"), DerivedFacet, facetObj);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -681,7 +842,7 @@ proxyIceFacet(ProxyObject* self, PyObject* args)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator);
+    return cacheDerivedProxy(self, key.get(), newProxy, 0);
 }
 
 #ifdef WIN32
@@ -764,7 +925,7 @@ proxyIceGetEndpoints(ProxyObject* self)
     int i = 0;
     for(Ice::EndpointSeq::const_iterator p = endpoints.begin(); p != endpoints.end(); ++p, ++i)
     {
-        PyObjectHandle endp = createEndpoint(*p);
+        PyObjectHandle endp = createEndpoint(*p, *self->communicator);
         if(!endp.get())
         {
             return 0;
@@ -922,6 +1083,13 @@ proxyIceInvocationTimeout(ProxyObject* self, PyObject* args)
 
     assert(self->proxy);
 
+    PyObjectHandle key = Py_BuildValue(STRCAST("(ii)"), DerivedInvocationTimeout, timeout);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -938,7 +1106,7 @@ proxyIceInvocationTimeout(ProxyObject* self, PyObject* args)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1009,8 +1177,10 @@ proxyIceGetEndpointSelection(ProxyObject* self)
 
     PyObjectHandle rnd = getAttr(cls, "Random", false);
     PyObjectHandle ord = getAttr(cls, "Ordered", false);
+    PyObjectHandle adp = getAttr(cls, "Adaptive", false);
     assert(rnd.get());
     assert(ord.get());
+    assert(adp.get());
 
     assert(self->proxy);
 
@@ -1018,7 +1188,11 @@ proxyIceGetEndpointSelection(ProxyObject* self)
     try
     {
         Ice::EndpointSelectionType val = (*self->proxy)->ice_getEndpointSelection();
-        if(val == Ice::Random)
+        if(self->router && AdaptiveEndpointSelectorPtr::dynamicCast(*self->router))
+        {
+            type = adp.get();
+        }
+        else if(val == Ice::Random)
         {
             type = rnd.get();
         }
@@ -1054,28 +1228,42 @@ proxyIceEndpointSelection(ProxyObject* self, PyObject* args)
     Ice::EndpointSelectionType val;
     PyObjectHandle rnd = getAttr(cls, "Random", false);
     PyObjectHandle ord = getAttr(cls, "Ordered", false);
+    PyObjectHandle adp = getAttr(cls, "Adaptive", false);
     assert(rnd.get());
     assert(ord.get());
+    assert(adp.get());
     if(rnd.get() == type)
     {
         val = Ice::Random;
     }
-    else if(ord.get() == type)
+    else if(ord.get() == type || adp.get() == type)
     {
         val = Ice::Ordered;
     }
     else
     {
-        PyErr_Format(PyExc_ValueError, STRCAST("ice_endpointSelection requires Random or Ordered"));
+        PyErr_Format(PyExc_ValueError, STRCAST("ice_endpointSelection requires Random, Ordered or Adaptive"));
         return 0;
     }
 
     assert(self->proxy);
 
     Ice::ObjectPrx newProxy;
+    InvocationRouterPtr selector;
     try
     {
         newProxy = (*self->proxy)->ice_endpointSelection(val);
+
+        //
+        // The adaptive selection is only useful with several endpoints, otherwise the
+        // proxy uses the Ordered selection.
+        //
+        if(adp.get() == type && newProxy->ice_getEndpoints().size() > 1)
+        {
+            Ice::PropertiesPtr properties = (*self->communicator)->getProperties();
+            bool perRequest = properties->getPropertyAsInt("Ice.Python.AdaptivePerRequest") > 0;
+            selector = new AdaptiveEndpointSelector(newProxy, perRequest);
+        }
     }
     catch(const Ice::Exception& ex)
     {
@@ -1083,7 +1271,17 @@ proxyIceEndpointSelection(ProxyObject* self, PyObject* args)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    if(!selector)
+    {
+        return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    }
+
+    ProxyObject* p = allocateProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    if(p)
+    {
+        p->router = new InvocationRouterPtr(selector);
+    }
+    return reinterpret_cast<PyObject*>(p);
 }
 
 #ifdef WIN32
@@ -1399,6 +1597,13 @@ proxyIceTwoway(ProxyObject* self)
 {
     assert(self->proxy);
 
+    PyObjectHandle key = PyLong_FromLong(DerivedTwoway);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1410,7 +1615,7 @@ proxyIceTwoway(ProxyObject* self)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1444,6 +1649,13 @@ proxyIceOneway(ProxyObject* self)
 {
     assert(self->proxy);
 
+    PyObjectHandle key = PyLong_FromLong(DerivedOneway);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1455,7 +1667,7 @@ proxyIceOneway(ProxyObject* self)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1489,6 +1701,13 @@ proxyIceBatchOneway(ProxyObject* self)
 {
     assert(self->proxy);
 
+    PyObjectHandle key = PyLong_FromLong(DerivedBatchOneway);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1500,7 +1719,7 @@ proxyIceBatchOneway(ProxyObject* self)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1534,6 +1753,13 @@ proxyIceDatagram(ProxyObject* self)
 {
     assert(self->proxy);
 
+    PyObjectHandle key = PyLong_FromLong(DerivedDatagram);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1545,7 +1771,7 @@ proxyIceDatagram(ProxyObject* self)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1579,6 +1805,13 @@ proxyIceBatchDatagram(ProxyObject* self)
 {
     assert(self->proxy);
 
+    PyObjectHandle key = PyLong_FromLong(DerivedBatchDatagram);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1590,7 +1823,7 @@ proxyIceBatchDatagram(ProxyObject* self)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1694,6 +1927,13 @@ proxyIceTimeout(ProxyObject* self, PyObject* args)
 
     assert(self->proxy);
 
+    PyObjectHandle key = Py_BuildValue(STRCAST("(ii)"), DerivedTimeout, timeout);
+    PyObject* cached = findDerivedProxy(self, key.get());
+    if(cached)
+    {
+        return cached;
+    }
+
     Ice::ObjectPrx newProxy;
     try
     {
@@ -1710,7 +1950,7 @@ proxyIceTimeout(ProxyObject* self, PyObject* args)
         return 0;
     }
 
-    return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    return cacheDerivedProxy(self, key.get(), newProxy, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
 #ifdef WIN32
@@ -1866,6 +2106,73 @@ proxyIceFixed(ProxyObject* self, PyObject* args)
     return createProxy(newProxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
 }
 
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+proxyIceConnectionPool(ProxyObject* self, PyObject* args)
+{
+    PyObject* cls = lookupType("Ice.ConnectionPoolPolicy");
+    assert(cls);
+    int size;
+    PyObject* policyObj = 0;
+    if(!PyArg_ParseTuple(args, STRCAST("i|O!"), &size, cls, &policyObj))
+    {
+        return 0;
+    }
+
+    if(size < 1)
+    {
+        PyErr_Format(PyExc_ValueError, STRCAST("ice_connectionPool requires a positive size"));
+        return 0;
+    }
+
+    ConnectionPool::Policy policy = ConnectionPool::RoundRobin;
+    if(policyObj)
+    {
+        PyObjectHandle leastOutstanding = getAttr(cls, "LeastOutstanding", false);
+        assert(leastOutstanding.get());
+        if(policyObj == leastOutstanding.get())
+        {
+            policy = ConnectionPool::LeastOutstanding;
+        }
+    }
+
+    assert(self->proxy);
+
+    ConnectionPoolPtr pool;
+    try
+    {
+        pool = new ConnectionPool(*self->proxy, size, policy);
+    }
+    catch(const Ice::Exception& ex)
+    {
+        setPythonException(ex);
+        return 0;
+    }
+
+    ProxyObject* p = allocateProxy(*self->proxy, *self->communicator, reinterpret_cast<PyObject*>(Py_TYPE(self)));
+    if(p)
+    {
+        p->router = new InvocationRouterPtr(pool);
+    }
+    return reinterpret_cast<PyObject*>(p);
+}
+
+#ifdef WIN32
+extern "C"
+#endif
+static PyObject*
+proxyIceGetConnectionPoolInfo(ProxyObject* self)
+{
+    ConnectionPoolPtr pool = self->router ? ConnectionPoolPtr::dynamicCast(*self->router) : ConnectionPoolPtr();
+    if(!pool)
+    {
+        return incRef(Py_None);
+    }
+    return pool->getInfo();
+}
+
 #ifdef WIN32
 extern "C"
 #endif
@@ -2366,20 +2673,36 @@ checkedCastImpl(ProxyObject* p, const string& id, PyObject* facet, PyObject* ctx
         target = (*p->proxy)->ice_facet(facetStr);
     }
 
+    //
+    // The results of checkedCast with an explicit context are not cached.
+    //
+    CheckedCastCachePtr cache;
+    if(!ctx || ctx == Py_None)
+    {
+        cache = getCheckedCastCache(*p->communicator);
+    }
+
     bool b = false;
+    if(cache && cache->find(target->ice_getIdentity(), target->ice_getFacet(), id, b))
+    {
+        return b ? shareRouter(p, createProxy(target, *p->communicator, type)) : incRef(Py_None);
+    }
+
     try
     {
-        Ice::Context c = ::Ice::noExplicitContext;
+        Ice::Context context;
+        const Ice::Context* c = &::Ice::noExplicitContext;
         if(ctx && ctx != Py_None)
         {
-            if(!dictionaryToContext(ctx, c))
+            c = getContext(ctx, context);
+            if(!c)
             {
                 return 0;
             }
         }
 
         AllowThreads allowThreads; // Release Python's global interpreter lock during remote invocations.
-        b = target->ice_isA(id, c);
+        b = target->ice_isA(id, *c);
     }
     catch(const Ice::FacetNotExistException&)
     {
@@ -2387,13 +2710,22 @@ checkedCastImpl(ProxyObject* p, const string& id, PyObject* facet, PyObject* ctx
     }
     catch(const Ice::Exception& ex)
     {
+        if(cache)
+        {
+            cache->invalidate(ex);
+        }
         setPythonException(ex);
         return 0;
     }
 
+    if(cache)
+    {
+        cache->add(target->ice_getIdentity(), target->ice_getFacet(), id, b);
+    }
+
     if(b)
     {
-        return createProxy(target, *p->communicator, type);
+        return shareRouter(p, createProxy(target, *p->communicator, type));
     }
 
     Py_INCREF(Py_None);
@@ -2437,7 +2769,7 @@ proxyIceCheckedCast(PyObject* type, PyObject* args)
     {
         facet = facetOrContext;
     }
-    else if(PyDict_Check(facetOrContext))
+    else if(checkContext(facetOrContext))
     {
         if(ctx != Py_None)
         {
@@ -2452,9 +2784,10 @@ proxyIceCheckedCast(PyObject* type, PyObject* args)
         return 0;
     }
 
-    if(ctx != Py_None && !PyDict_Check(ctx))
+    if(ctx != Py_None && !checkContext(ctx))
     {
-        PyErr_Format(PyExc_ValueError, STRCAST("context argument to checkedCast must be a dictionary"));
+        PyErr_Format(PyExc_ValueError,
+                     STRCAST("context argument to checkedCast must be a dictionary or an Ice.Context"));
         return 0;
     }
 
@@ -2492,13 +2825,28 @@ proxyIceUncheckedCast(PyObject* type, PyObject* args)
 
     ProxyObject* p = reinterpret_cast<ProxyObject*>(obj);
 
-    if(facet)
+    PyObjectHandle key = Py_BuildValue(STRCAST("(iOz)"), DerivedUncheckedCast, type, facet);
+    PyObject* cached = findDerivedProxy(p, key.get());
+    if(cached)
     {
-        return createProxy((*p->proxy)->ice_facet(facet), *p->communicator, type);
+        return cached;
     }
-    else
+
+    try
+    {
+        if(facet)
+        {
+            return cacheDerivedProxy(p, key.get(), (*p->proxy)->ice_facet(facet), type);
+        }
+        else
+        {
+            return cacheDerivedProxy(p, key.get(), *p->proxy, type);
+        }
+    }
+    catch(const Ice::Exception& ex)
     {
-        return createProxy(*p->proxy, *p->communicator, type);
+        setPythonException(ex);
+        return 0;
     }
 }
 
@@ -2553,9 +2901,10 @@ proxyCheckedCast(PyObject* /*self*/, PyObject* args)
             facet = arg1;
         }
 
-        if(arg2 != 0 && !PyDict_Check(arg2))
+        if(arg2 != 0 && !checkContext(arg2))
         {
-            PyErr_Format(PyExc_ValueError, STRCAST("context argument to checkedCast must be a dictionary"));
+            PyErr_Format(PyExc_ValueError,
+                         STRCAST("context argument to checkedCast must be a dictionary or an Ice.Context"));
             return 0;
         }
         ctx = arg2;
@@ -2566,7 +2915,7 @@ proxyCheckedCast(PyObject* /*self*/, PyObject* args)
         {
             facet = arg1;
         }
-        else if(PyDict_Check(arg1))
+        else if(checkContext(arg1))
         {
             ctx = arg1;
         }
@@ -2641,6 +2990,10 @@ static PyMethodDef ProxyMethods[] =
         PyDoc_STR(STRCAST("ice_getCommunicator() -> Ice.Communicator")) },
     { STRCAST("ice_toString"), reinterpret_cast<PyCFunction>(proxyRepr), METH_NOARGS,
         PyDoc_STR(STRCAST("ice_toString() -> string")) },
+    { STRCAST("__copy__"), reinterpret_cast<PyCFunction>(proxyCopy), METH_NOARGS,
+        PyDoc_STR(STRCAST("__copy__() -> Ice.ObjectPrx")) },
+    { STRCAST("__deepcopy__"), reinterpret_cast<PyCFunction>(proxyCopy), METH_VARARGS,
+        PyDoc_STR(STRCAST("__deepcopy__(memo) -> Ice.ObjectPrx")) },
     { STRCAST("ice_isA"), reinterpret_cast<PyCFunction>(proxyIceIsA), METH_VARARGS,
         PyDoc_STR(STRCAST("ice_isA(type, [ctx]) -> bool")) },
     { STRCAST("ice_isAAsync"), reinterpret_cast<PyCFunction>(proxyIceIsAAsync), METH_VARARGS,
@@ -2680,7 +3033,7 @@ static PyMethodDef ProxyMethods[] =
     { STRCAST("ice_getContext"), reinterpret_cast<PyCFunction>(proxyIceGetContext), METH_NOARGS,
         PyDoc_STR(STRCAST("ice_getContext() -> dict")) },
     { STRCAST("ice_context"), reinterpret_cast<PyCFunction>(proxyIceContext), METH_VARARGS,
-        PyDoc_STR(STRCAST("ice_context(dict) -> Ice.ObjectPrx")) },
+        PyDoc_STR(STRCAST("ice_context(dict|Ice.Context) -> Ice.ObjectPrx")) },
     { STRCAST("ice_getFacet"), reinterpret_cast<PyCFunction>(proxyIceGetFacet), METH_NOARGS,
         PyDoc_STR(STRCAST("ice_getFacet() -> string")) },
     { STRCAST("ice_facet"), reinterpret_cast<PyCFunction>(proxyIceFacet), METH_VARARGS,
@@ -2712,7 +3065,7 @@ static PyMethodDef ProxyMethods[] =
     { STRCAST("ice_connectionCached"), reinterpret_cast<PyCFunction>(proxyIceConnectionCached), METH_VARARGS,
         PyDoc_STR(STRCAST("ice_connectionCached(bool) -> Ice.ObjectPrx")) },
     { STRCAST("ice_getEndpointSelection"), reinterpret_cast<PyCFunction>(proxyIceGetEndpointSelection), METH_NOARGS,
-        PyDoc_STR(STRCAST("ice_getEndpointSelection() -> bool")) },
+        PyDoc_STR(STRCAST("ice_getEndpointSelection() -> Ice.EndpointSelectionType")) },
     { STRCAST("ice_endpointSelection"), reinterpret_cast<PyCFunction>(proxyIceEndpointSelection), METH_VARARGS,
         PyDoc_STR(STRCAST("ice_endpointSelection(Ice.EndpointSelectionType) -> Ice.ObjectPrx")) },
     { STRCAST("ice_isSecure"), reinterpret_cast<PyCFunction>(proxyIceIsSecure), METH_NOARGS,
@@ -2765,6 +3118,10 @@ static PyMethodDef ProxyMethods[] =
         PyDoc_STR(STRCAST("ice_getTimeout() -> int")) },
     { STRCAST("ice_connectionId"), reinterpret_cast<PyCFunction>(proxyIceConnectionId), METH_VARARGS,
         PyDoc_STR(STRCAST("ice_connectionId(string) -> Ice.ObjectPrx")) },
+    { STRCAST("ice_connectionPool"), reinterpret_cast<PyCFunction>(proxyIceConnectionPool), METH_VARARGS,
+        PyDoc_STR(STRCAST("ice_connectionPool(int, [Ice.ConnectionPoolPolicy]) -> Ice.ObjectPrx")) },
+    { STRCAST("ice_getConnectionPoolInfo"), reinterpret_cast<PyCFunction>(proxyIceGetConnectionPoolInfo),
+        METH_NOARGS, PyDoc_STR(STRCAST("ice_getConnectionPoolInfo() -> list")) },
     { STRCAST("ice_fixed"), reinterpret_cast<PyCFunction>(proxyIceFixed), METH_VARARGS,
         PyDoc_STR(STRCAST("ice_fixed(Ice.Connection) -> Ice.ObjectPrx")) },
     { STRCAST("ice_getConnection"), reinterpret_cast<PyCFunction>(proxyIceGetConnection), METH_NOARGS,
@@ -2959,3 +3316,701 @@ IcePy::getProxyCommunicator(PyObject* p)
     ProxyObject* obj = reinterpret_cast<ProxyObject*>(p);
     return *obj->communicator;
 }
+
+IcePy::InvocationRouterPtr
+IcePy::getInvocationRouter(PyObject* p)
+{
+    assert(checkProxy(p));
+    ProxyObject* obj = reinterpret_cast<ProxyObject*>(p);
+    return obj->router ? *obj->router : InvocationRouterPtr();
+}
+
+namespace
+{
+
+//
+// Used to give the connections of each pool a distinct connection id, so that pools
+// created from the same proxy don't share connections.
+//
+IceUtilInternal::Atomic poolCounter;
+
+//
+// Returns true if the connection is closing or closed.
+//
+bool
+isClosed(const Ice::ConnectionPtr& connection)
+{
+    try
+    {
+        connection->throwException();
+        return false;
+    }
+    catch(const Ice::LocalException&)
+    {
+        return true;
+    }
+}
+
+}
+
+IcePy::ConnectionPool::ConnectionPool(const Ice::ObjectPrx& proxy, int size, Policy policy) :
+    _policy(policy),
+    _next(0)
+{
+    string prefix = proxy->ice_getConnectionId();
+    if(!prefix.empty())
+    {
+        prefix += "-";
+    }
+    int id = ++poolCounter;
+
+    for(int i = 0; i < size; ++i)
+    {
+        ostringstream os;
+        os << prefix << "pool" << id << "-" << i;
+        Member member;
+        member.proxy = proxy->ice_connectionId(os.str());
+        member.outstanding = 0;
+        member.requests = 0;
+        member.failures = 0;
+        member.connects = 0;
+        member.closes = 0;
+        _members.push_back(member);
+    }
+}
+
+size_t
+IcePy::ConnectionPool::acquire()
+{
+    IceUtil::Mutex::Lock sync(*this);
+
+    size_t member = _next;
+    _next = (_next + 1) % _members.size();
+    if(_policy == LeastOutstanding)
+    {
+        //
+        // Use the member with the fewest outstanding requests, starting with the next
+        // member in round-robin order to spread the requests when they are even.
+        //
+        for(size_t i = 1; i < _members.size() && _members[member].outstanding > 0; ++i)
+        {
+            size_t j = (member + i) % _members.size();
+            if(_members[j].outstanding < _members[member].outstanding)
+            {
+                member = j;
+            }
+        }
+    }
+
+    ++_members[member].outstanding;
+    ++_members[member].requests;
+    return member;
+}
+
+void
+IcePy::ConnectionPool::release(size_t member, const IceUtil::Time&, bool failed)
+{
+    Ice::ConnectionPtr connection = _members[member].proxy->ice_getCachedConnection();
+
+    IceUtil::Mutex::Lock sync(*this);
+
+    Member& m = _members[member];
+    --m.outstanding;
+    if(failed)
+    {
+        ++m.failures;
+    }
+
+    checkClosed(m);
+    if(connection && connection != m.connection && !isClosed(connection))
+    {
+        if(m.connection)
+        {
+            ++m.closes;
+        }
+        m.connection = connection;
+        ++m.connects;
+    }
+}
+
+const Ice::ObjectPrx&
+IcePy::ConnectionPool::proxy(size_t member) const
+{
+    return _members[member].proxy;
+}
+
+void
+IcePy::ConnectionPool::checkClosed(Member& m)
+{
+    //
+    // The closure of the connections is detected when the pool is used rather than
+    // with a close callback, which would replace the callback set by the application
+    // on the connection.
+    //
+    if(m.connection && isClosed(m.connection))
+    {
+        ++m.closes;
+        m.connection = 0;
+    }
+}
+
+PyObject*
+IcePy::ConnectionPool::getInfo()
+{
+    vector<Member> members;
+    {
+        IceUtil::Mutex::Lock sync(*this);
+        for(vector<Member>::iterator p = _members.begin(); p != _members.end(); ++p)
+        {
+            checkClosed(*p);
+        }
+        members = _members;
+    }
+
+    PyObjectHandle result = PyList_New(0);
+    if(!result.get())
+    {
+        return 0;
+    }
+
+    for(vector<Member>::const_iterator p = members.begin(); p != members.end(); ++p)
+    {
+        PyObjectHandle info;
+        if(p->connection)
+        {
+            try
+            {
+                info = createConnectionInfo(p->connection->getInfo());
+            }
+            catch(const Ice::Exception&)
+            {
+                // Ignore, the connection is closed.
+            }
+            if(!info.get() && PyErr_Occurred())
+            {
+                return 0;
+            }
+        }
+
+        PyObjectHandle connectionId = createString(p->proxy->ice_getConnectionId());
+        PyObjectHandle d = Py_BuildValue(STRCAST("{s:O,s:L,s:L,s:L,s:L,s:L,s:O}"),
+                                         "connectionId", connectionId.get(),
+                                         "outstanding", static_cast<PY_LONG_LONG>(p->outstanding),
+                                         "requests", static_cast<PY_LONG_LONG>(p->requests),
+                                         "failures", static_cast<PY_LONG_LONG>(p->failures),
+                                         "connects", static_cast<PY_LONG_LONG>(p->connects),
+                                         "closes", static_cast<PY_LONG_LONG>(p->closes),
+                                         "connectionInfo", info.get() ? info.get() : Py_None);
+        if(!d.get() || PyList_Append(result.get(), d.get()) < 0)
+        {
+            return 0;
+        }
+    }
+
+    return result.release();
+}
+
+namespace
+{
+
+//
+// The weight of a new sample in the moving averages of EndpointStats.
+//
+const double endpointStatsWeight = 0.2;
+
+//
+// The adaptive endpoint selection picks the endpoint with the oldest sample every
+// adaptiveProbeInterval selections, to refresh the statistics of the endpoints
+// that are not used, for example because they failed.
+//
+const Ice::Long adaptiveProbeInterval = 50;
+
+//
+// The statistics of an endpoint are evicted from the registry of the communicator
+// once no proxy uses them and they weren't updated for endpointStatsIdleTime. The
+// registry looks for such statistics at most every endpointStatsIdleTime.
+//
+const IceUtil::Time endpointStatsIdleTime = IceUtil::Time::seconds(60);
+
+//
+// Returns a string identifying the address of the given endpoint. This is used to
+// find the endpoint of a connection among the endpoints of a proxy, the endpoint
+// of the connection might have a different timeout or compression flag.
+//
+string
+endpointAddress(const Ice::EndpointPtr& endpoint)
+{
+    Ice::EndpointInfoPtr info = endpoint->getInfo();
+    for(Ice::EndpointInfoPtr p = info; p; p = p->underlying)
+    {
+        Ice::IPEndpointInfoPtr ipInfo = Ice::IPEndpointInfoPtr::dynamicCast(p);
+        if(ipInfo)
+        {
+            ostringstream os;
+            os << info->type() << ' ' << ipInfo->host << ':' << ipInfo->port;
+            return os.str();
+        }
+    }
+    return endpoint->toString();
+}
+
+}
+
+IcePy::EndpointStats::EndpointStats() :
+    _latency(0),
+    _errorRate(0),
+    _sampled(false),
+    _outstanding(0),
+    _requests(0),
+    _failures(0)
+{
+}
+
+void
+IcePy::EndpointStats::started()
+{
+    IceUtil::Mutex::Lock sync(*this);
+    ++_outstanding;
+    ++_requests;
+}
+
+void
+IcePy::EndpointStats::finished()
+{
+    IceUtil::Mutex::Lock sync(*this);
+    --_outstanding;
+}
+
+void
+IcePy::EndpointStats::record(const IceUtil::Time& latency, bool failed)
+{
+    IceUtil::Mutex::Lock sync(*this);
+    _lastSample = IceUtil::Time::now(IceUtil::Time::Monotonic);
+    if(failed)
+    {
+        ++_failures;
+        _errorRate += (1.0 - _errorRate) * endpointStatsWeight;
+        return;
+    }
+
+    _errorRate -= _errorRate * endpointStatsWeight;
+    if(!_sampled)
+    {
+        _latency = latency.toSecondsDouble();
+        _sampled = true;
+    }
+    else
+    {
+        _latency += (latency.toSecondsDouble() - _latency) * endpointStatsWeight;
+    }
+}
+
+double
+IcePy::EndpointStats::cost() const
+{
+    IceUtil::Mutex::Lock sync(*this);
+    if(!_sampled)
+    {
+        return _failures > 0 ? numeric_limits<double>::max() : 0;
+    }
+    return _latency * static_cast<double>(_outstanding + 1) / max(1.0 - _errorRate, 0.01);
+}
+
+IceUtil::Time
+IcePy::EndpointStats::lastSample() const
+{
+    IceUtil::Mutex::Lock sync(*this);
+    return _lastSample;
+}
+
+PyObject*
+IcePy::EndpointStats::getInfo() const
+{
+    IceUtil::Mutex::Lock sync(*this);
+    PyObjectHandle latency = _sampled ? PyFloat_FromDouble(_latency) : incRef(Py_None);
+    if(!latency.get())
+    {
+        return 0;
+    }
+    return Py_BuildValue(STRCAST("{s:O,s:d,s:L,s:L,s:L}"),
+                         "latency", latency.get(),
+                         "errorRate", _errorRate,
+                         "outstanding", static_cast<PY_LONG_LONG>(_outstanding),
+                         "requests", static_cast<PY_LONG_LONG>(_requests),
+                         "failures", static_cast<PY_LONG_LONG>(_failures));
+}
+
+IcePy::EndpointStatsPtr
+IcePy::EndpointStatsRegistry::get(const Ice::EndpointPtr& endpoint, bool create)
+{
+    string key = endpoint->toString();
+    map<string, EndpointStatsPtr>::const_iterator p = _stats.find(key);
+    if(p != _stats.end())
+    {
+        return p->second;
+    }
+    else if(!create)
+    {
+        return 0;
+    }
+
+    evict();
+
+    EndpointStatsPtr stats = new EndpointStats;
+    _stats.insert(make_pair(key, stats));
+    return stats;
+}
+
+void
+IcePy::EndpointStatsRegistry::clear()
+{
+    _stats.clear();
+}
+
+void
+IcePy::EndpointStatsRegistry::evict()
+{
+    IceUtil::Time now = IceUtil::Time::now(IceUtil::Time::Monotonic);
+    if(now < _nextEviction)
+    {
+        return;
+    }
+    _nextEviction = now + endpointStatsIdleTime;
+
+    map<string, EndpointStatsPtr>::iterator p = _stats.begin();
+    while(p != _stats.end())
+    {
+        //
+        // The statistics referenced only by the registry are no longer used by a proxy.
+        //
+        if(p->second->__getRef() == 1 && now - p->second->lastSample() > endpointStatsIdleTime)
+        {
+            _stats.erase(p++);
+        }
+        else
+        {
+            ++p;
+        }
+    }
+}
+
+IcePy::EndpointStatsPtr
+IcePy::getEndpointStats(const Ice::CommunicatorPtr& communicator, const Ice::EndpointPtr& endpoint, bool create)
+{
+    EndpointStatsRegistryPtr registry = getEndpointStatsRegistry(communicator);
+    return registry ? registry->get(endpoint, create) : EndpointStatsPtr();
+}
+
+IcePy::AdaptiveEndpointSelector::AdaptiveEndpointSelector(const Ice::ObjectPrx& proxy, bool perRequest) :
+    _perRequest(perRequest),
+    _current(0),
+    _selections(0)
+{
+    string prefix = proxy->ice_getConnectionId();
+    if(!prefix.empty())
+    {
+        prefix += "-";
+    }
+
+    //
+    // The proxy of each endpoint lists the other endpoints after it, in order, so an
+    // invocation can still be sent when the endpoint can't be reached. The connection
+    // id ensures it doesn't use the connection established by another proxy.
+    //
+    Ice::EndpointSeq endpoints = proxy->ice_getEndpoints();
+    Ice::CommunicatorPtr communicator = proxy->ice_getCommunicator();
+    for(size_t i = 0; i < endpoints.size(); ++i)
+    {
+        Ice::EndpointSeq ordered;
+        ordered.push_back(endpoints[i]);
+        for(size_t j = 0; j < endpoints.size(); ++j)
+        {
+            if(j != i)
+            {
+                ordered.push_back(endpoints[j]);
+            }
+        }
+
+        ostringstream os;
+        os << prefix << "adaptive-" << i;
+        Member member;
+        member.proxy = proxy->ice_endpoints(ordered)->ice_connectionId(os.str());
+        member.address = endpointAddress(endpoints[i]);
+        member.stats = getEndpointStats(communicator, endpoints[i], true);
+        member.connected = i;
+        _members.push_back(member);
+    }
+    _current = _members.size();
+}
+
+size_t
+IcePy::AdaptiveEndpointSelector::acquire()
+{
+    IceUtil::Mutex::Lock sync(*this);
+
+    size_t member = _current;
+    if(_perRequest || member == _members.size())
+    {
+        member = select();
+        if(!_perRequest)
+        {
+            _current = member;
+        }
+    }
+
+    _members[member].stats->started();
+    return member;
+}
+
+void
+IcePy::AdaptiveEndpointSelector::release(size_t member, const IceUtil::Time& start, bool failed)
+{
+    IceUtil::Time latency = IceUtil::Time::now(IceUtil::Time::Monotonic) - start;
+    Member& m = _members[member];
+    Ice::ConnectionPtr connection = m.proxy->ice_getCachedConnection();
+
+    //
+    // Find the endpoint which was actually used by the invocation, when the connection
+    // of this member was established with one of the other endpoints.
+    //
+    size_t connected = member;
+    if(connection)
+    {
+        bool found = false;
+        {
+            IceUtil::Mutex::Lock sync(*this);
+            if(connection == m.connection)
+            {
+                connected = m.connected;
+                found = true;
+            }
+        }
+
+        if(!found)
+        {
+            string address;
+            try
+            {
+                address = endpointAddress(connection->getEndpoint());
+            }
+            catch(const Ice::Exception&)
+            {
+                // Ignore, the connection is closed.
+            }
+
+            for(size_t i = 0; i < _members.size(); ++i)
+            {
+                if(_members[i].address == address)
+                {
+                    connected = i;
+                    break;
+                }
+            }
+
+            IceUtil::Mutex::Lock sync(*this);
+            m.connection = connection;
+            m.connected = connected;
+        }
+    }
+
+    m.stats->finished();
+    if(connected != member)
+    {
+        m.stats->record(latency, true);
+    }
+    _members[connected].stats->record(latency, failed);
+
+    if(failed && !_perRequest)
+    {
+        IceUtil::Mutex::Lock sync(*this);
+        if(_current == member)
+        {
+            _current = _members.size();
+        }
+    }
+}
+
+const Ice::ObjectPrx&
+IcePy::AdaptiveEndpointSelector::proxy(size_t member) const
+{
+    return _members[member].proxy;
+}
+
+size_t
+IcePy::AdaptiveEndpointSelector::select()
+{
+    //
+    // Must be called with the mutex locked.
+    //
+    size_t selected = 0;
+    if(++_selections % adaptiveProbeInterval == 0)
+    {
+        IceUtil::Time oldest = _members[0].stats->lastSample();
+        for(size_t i = 1; i < _members.size(); ++i)
+        {
+            IceUtil::Time lastSample = _members[i].stats->lastSample();
+            if(lastSample < oldest)
+            {
+                oldest = lastSample;
+                selected = i;
+            }
+        }
+    }
+    else
+    {
+        double lowest = _members[0].stats->cost();
+        for(size_t i = 1; i < _members.size() && lowest > 0; ++i)
+        {
+            double cost = _members[i].stats->cost();
+            if(cost < lowest)
+            {
+                lowest = cost;
+                selected = i;
+            }
+        }
+    }
+    return selected;
+}
+
+namespace
+{
+
+//
+// The maximum number of objects whose checkedCast results are cached. The expired
+// results are removed when this number is reached, and all the results if none expired.
+//
+const size_t checkedCastCacheSize = 10000;
+
+}
+
+IcePy::CheckedCastCache::CheckedCastCache(int timeout) :
+    _timeout(IceUtil::Time::seconds(timeout))
+{
+}
+
+bool
+IcePy::CheckedCastCache::find(const Ice::Identity& ident, const string& facet, const string& typeId, bool& isA)
+{
+    IceUtil::Mutex::Lock sync(*this);
+
+    map<Ice::Identity, EntryMap>::iterator p = _entries.find(ident);
+    if(p == _entries.end())
+    {
+        return false;
+    }
+
+    EntryMap::iterator q = p->second.find(make_pair(facet, typeId));
+    if(q == p->second.end())
+    {
+        return false;
+    }
+
+    if(_timeout > IceUtil::Time() && q->second.expires <= IceUtil::Time::now(IceUtil::Time::Monotonic))
+    {
+        p->second.erase(q);
+        if(p->second.empty())
+        {
+            _entries.erase(p);
+        }
+        return false;
+    }
+
+    isA = q->second.isA;
+    return true;
+}
+
+void
+IcePy::CheckedCastCache::add(const Ice::Identity& ident, const string& facet, const string& typeId, bool isA)
+{
+    IceUtil::Mutex::Lock sync(*this);
+
+    IceUtil::Time now = IceUtil::Time::now(IceUtil::Time::Monotonic);
+    if(_entries.size() >= checkedCastCacheSize && _entries.find(ident) == _entries.end())
+    {
+        if(_timeout > IceUtil::Time())
+        {
+            map<Ice::Identity, EntryMap>::iterator p = _entries.begin();
+            while(p != _entries.end())
+            {
+                EntryMap::iterator q = p->second.begin();
+                while(q != p->second.end())
+                {
+                    if(q->second.expires <= now)
+                    {
+                        p->second.erase(q++);
+                    }
+                    else
+                    {
+                        ++q;
+                    }
+                }
+
+                if(p->second.empty())
+                {
+                    _entries.erase(p++);
+                }
+                else
+                {
+                    ++p;
+                }
+            }
+        }
+
+        if(_entries.size() >= checkedCastCacheSize)
+        {
+            _entries.clear();
+        }
+    }
+
+    Entry& entry = _entries[ident][make_pair(facet, typeId)];
+    entry.isA = isA;
+    entry.expires = now + _timeout;
+}
+
+void
+IcePy::CheckedCastCache::invalidate(const Ice::Exception& ex)
+{
+    IceUtil::Mutex::Lock sync(*this);
+
+    if(const Ice::ObjectNotExistException* one = dynamic_cast<const Ice::ObjectNotExistException*>(&ex))
+    {
+        _entries.erase(one->id);
+    }
+    else if(const Ice::FacetNotExistException* fne = dynamic_cast<const Ice::FacetNotExistException*>(&ex))
+    {
+        map<Ice::Identity, EntryMap>::iterator p = _entries.find(fne->id);
+        if(p != _entries.end())
+        {
+            EntryMap::iterator q = p->second.lower_bound(make_pair(fne->facet, string()));
+            while(q != p->second.end() && q->first.first == fne->facet)
+            {
+                p->second.erase(q++);
+            }
+
+            if(p->second.empty())
+            {
+                _entries.erase(p);
+            }
+        }
+    }
+}
+
+void
+IcePy::CheckedCastCache::clear()
+{
+    IceUtil::Mutex::Lock sync(*this);
+    _entries.clear();
+}
+
+void
+IcePy::invalidateCheckedCast(const Ice::CommunicatorPtr& communicator, const Ice::Exception& ex)
+{
+    if(dynamic_cast<const Ice::RequestFailedException*>(&ex))
+    {
+        CheckedCastCachePtr cache = getCheckedCastCache(communicator);
+        if(cache)
+        {
+            cache->invalidate(ex);
+        }
+    }
+}
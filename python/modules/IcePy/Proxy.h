@@ -13,6 +13,12 @@
 #include <Config.h>
 #include <Ice/ProxyF.h>
 #include <Ice/CommunicatorF.h>
+#include <Ice/ConnectionF.h>
+#include <Ice/EndpointF.h>
+#include <Ice/Exception.h>
+#include <Ice/Identity.h>
+#include <IceUtil/Mutex.h>
+#include <IceUtil/Time.h>
 
 namespace IcePy
 {
@@ -48,6 +54,226 @@ bool getProxyArg(PyObject*, const std::string&, const std::string&, Ice::ObjectP
 //
 Ice::CommunicatorPtr getProxyCommunicator(PyObject*);
 
+//
+// Routes the invocations of a proxy to one of several proxies, see ConnectionPool
+// and AdaptiveEndpointSelector.
+//
+class InvocationRouter : public IceUtil::Shared
+{
+public:
+
+    //
+    // Returns the index of the proxy to use for the next invocation. The invocation
+    // must be released with release() once completed, with the time at which it was
+    // started and whether or not it failed.
+    //
+    virtual size_t acquire() = 0;
+    virtual void release(size_t, const IceUtil::Time&, bool) = 0;
+
+    virtual const Ice::ObjectPrx& proxy(size_t) const = 0;
+};
+typedef IceUtil::Handle<InvocationRouter> InvocationRouterPtr;
+
+//
+// Returns the invocation router of the given proxy object, or 0 if it doesn't use one.
+//
+InvocationRouterPtr getInvocationRouter(PyObject*);
+
+//
+// Spreads the invocations of a proxy created with ice_connectionPool over the
+// connections of several proxies which only differ by their connection id.
+//
+class ConnectionPool : public InvocationRouter, private IceUtil::Mutex
+{
+public:
+
+    enum Policy
+    {
+        RoundRobin,
+        LeastOutstanding
+    };
+
+    ConnectionPool(const Ice::ObjectPrx&, int, Policy);
+
+    virtual size_t acquire();
+    virtual void release(size_t, const IceUtil::Time&, bool);
+
+    virtual const Ice::ObjectPrx& proxy(size_t) const;
+
+    //
+    // Returns a list with the counters, the connection id and the connection info
+    // of the proxies of the pool.
+    //
+    PyObject* getInfo();
+
+private:
+
+    struct Member
+    {
+        Ice::ObjectPrx proxy;
+        Ice::ConnectionPtr connection;
+        Ice::Long outstanding;
+        Ice::Long requests;
+        Ice::Long failures;
+        Ice::Long connects;
+        Ice::Long closes;
+    };
+
+    void checkClosed(Member&);
+
+    const Policy _policy;
+    std::vector<Member> _members;
+    size_t _next;
+};
+typedef IceUtil::Handle<ConnectionPool> ConnectionPoolPtr;
+
+//
+// The statistics of the invocations sent to an endpoint by the proxies using the
+// adaptive endpoint selection. The latency and the error rate are exponentially
+// weighted moving averages.
+//
+class EndpointStats : public IceUtil::Shared, private IceUtil::Mutex
+{
+public:
+
+    EndpointStats();
+
+    void started();
+    void finished();
+    void record(const IceUtil::Time&, bool);
+
+    //
+    // The expected cost of sending an invocation to the endpoint, based on its
+    // latency, error rate and outstanding invocations. The cost of an endpoint
+    // without latency sample is 0, or the highest cost if it failed.
+    //
+    double cost() const;
+    IceUtil::Time lastSample() const;
+
+    PyObject* getInfo() const;
+
+private:
+
+    double _latency;
+    double _errorRate;
+    bool _sampled;
+    Ice::Long _outstanding;
+    Ice::Long _requests;
+    Ice::Long _failures;
+    IceUtil::Time _lastSample;
+};
+typedef IceUtil::Handle<EndpointStats> EndpointStatsPtr;
+
+//
+// The statistics of the endpoints used by the proxies of a communicator with the
+// adaptive endpoint selection, indexed by endpoint string. The statistics which are
+// no longer used by a proxy are evicted once they are idle. Protected by the GIL.
+//
+class EndpointStatsRegistry : public IceUtil::Shared
+{
+public:
+
+    EndpointStatsPtr get(const Ice::EndpointPtr&, bool);
+    void clear();
+
+private:
+
+    void evict();
+
+    std::map<std::string, EndpointStatsPtr> _stats;
+    IceUtil::Time _nextEviction;
+};
+typedef IceUtil::Handle<EndpointStatsRegistry> EndpointStatsRegistryPtr;
+
+//
+// Returns the statistics of the given endpoint in the registry of the communicator,
+// or 0 if no proxy with the adaptive endpoint selection has used it and create is
+// false.
+//
+EndpointStatsPtr getEndpointStats(const Ice::CommunicatorPtr&, const Ice::EndpointPtr&, bool);
+
+//
+// Implements the Adaptive endpoint selection of the Python mapping. Each endpoint
+// has its own proxy which lists the endpoint first and uses its own connection id.
+// The invocations are sent with the proxy of the endpoint with the lowest cost, see
+// EndpointStats. Unless perRequest is true, the endpoint is only selected again
+// once an invocation fails.
+//
+class AdaptiveEndpointSelector : public InvocationRouter, private IceUtil::Mutex
+{
+public:
+
+    AdaptiveEndpointSelector(const Ice::ObjectPrx&, bool);
+
+    virtual size_t acquire();
+    virtual void release(size_t, const IceUtil::Time&, bool);
+
+    virtual const Ice::ObjectPrx& proxy(size_t) const;
+
+private:
+
+    size_t select();
+
+    struct Member
+    {
+        Ice::ObjectPrx proxy;
+        std::string address;
+        EndpointStatsPtr stats;
+        Ice::ConnectionPtr connection;
+        size_t connected;
+    };
+
+    const bool _perRequest;
+    std::vector<Member> _members;
+    size_t _current;
+    Ice::Long _selections;
+};
+typedef IceUtil::Handle<AdaptiveEndpointSelector> AdaptiveEndpointSelectorPtr;
+
+//
+// Caches the results of checkedCast by identity, facet and type id, see
+// Ice.Python.CheckedCastCacheTimeout. The results are cached for the given
+// number of seconds, or until the communicator is destroyed if the timeout
+// is negative.
+//
+class CheckedCastCache : public IceUtil::Shared, private IceUtil::Mutex
+{
+public:
+
+    CheckedCastCache(int);
+
+    bool find(const Ice::Identity&, const std::string&, const std::string&, bool&);
+    void add(const Ice::Identity&, const std::string&, const std::string&, bool);
+
+    //
+    // Removes the results of the object or facet of an ObjectNotExistException or
+    // a FacetNotExistException. Other exceptions are ignored.
+    //
+    void invalidate(const Ice::Exception&);
+
+    void clear();
+
+private:
+
+    struct Entry
+    {
+        bool isA;
+        IceUtil::Time expires;
+    };
+
+    typedef std::map<std::pair<std::string, std::string>, Entry> EntryMap;
+
+    const IceUtil::Time _timeout;
+    std::map<Ice::Identity, EntryMap> _entries;
+};
+typedef IceUtil::Handle<CheckedCastCache> CheckedCastCachePtr;
+
+//
+// Invalidates the checkedCast results cached by the communicator for the object of
+// the given exception.
+//
+void invalidateCheckedCast(const Ice::CommunicatorPtr&, const Ice::Exception&);
+
 }
 
 #endif
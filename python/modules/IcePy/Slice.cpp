@@ -15,14 +15,20 @@
 #include <Slice/Preprocessor.h>
 #include <Slice/PythonUtil.h>
 #include <Slice/Util.h>
+#include <Slice/MD5.h>
 #include <IceUtil/Options.h>
 #include <IceUtil/ConsoleUtil.h>
+#include <IceUtil/FileUtil.h>
+#include <Ice/UUID.h>
+#include <fstream>
+#include <iomanip>
 
 //
 // Python headers needed for PyEval_EvalCode.
 //
 #include <compile.h>
 #include <eval.h>
+#include <marshal.h>
 
 using namespace std;
 using namespace IcePy;
@@ -30,6 +36,219 @@ using namespace Slice;
 using namespace Slice::Python;
 using namespace IceUtilInternal;
 
+namespace
+{
+
+//
+// The version of the code generated by loadSlice, which is part of the key of the cached
+// code. It must be changed whenever the generated code changes.
+//
+const char* const cacheFormat = "3";
+
+bool
+readFile(const string& path, string& data)
+{
+    ifstream in(IceUtilInternal::streamFilename(path).c_str(), ios::binary);
+    if(!in)
+    {
+        return false;
+    }
+    ostringstream os;
+    os << in.rdbuf();
+    data = os.str();
+    return true;
+}
+
+string
+digest(const string& data)
+{
+    MD5 md5(reinterpret_cast<const unsigned char*>(data.c_str()), static_cast<int>(data.size()));
+    unsigned char bytes[16];
+    md5.getDigest(bytes);
+
+    ostringstream os;
+    os << hex << setfill('0');
+    for(int i = 0; i < 16; ++i)
+    {
+        os << setw(2) << static_cast<int>(bytes[i]);
+    }
+    return os.str();
+}
+
+string
+absolutePath(const string& path)
+{
+    string cwd;
+    if(IceUtilInternal::isAbsolutePath(path) || IceUtilInternal::getcwd(cwd) != 0)
+    {
+        return path;
+    }
+    return cwd + "/" + path;
+}
+
+//
+// Returns the path of the file caching the code generated for the given Slice file, in the
+// given directory or in the __pycache__ directory of the Slice file, like the .pyc files.
+//
+string
+cachePath(const string& file, const string& cacheDir)
+{
+    string dir = cacheDir;
+    string base = file;
+    string::size_type pos = file.find_last_of("/\\");
+    if(pos != string::npos)
+    {
+        base = file.substr(pos + 1);
+        if(dir.empty())
+        {
+            dir = file.substr(0, pos + 1) + "__pycache__";
+        }
+    }
+    else if(dir.empty())
+    {
+        dir = "__pycache__";
+    }
+
+    ostringstream os;
+    os << dir << "/" << base << ".cpython-" << PY_MAJOR_VERSION << PY_MINOR_VERSION << ".icepyc";
+    return os.str();
+}
+
+//
+// Returns the code object of the given cache file if its key matches and none of the Slice
+// files it was generated from changed, 0 otherwise. The cache file contains the marshaled
+// tuple (key, ((path, digest), ...), code).
+//
+PyObject*
+readCache(const string& path, const string& key)
+{
+    string data;
+    if(!readFile(path, data))
+    {
+        return 0;
+    }
+
+    PyObjectHandle entry = PyMarshal_ReadObjectFromString(const_cast<char*>(data.c_str()),
+                                                          static_cast<Py_ssize_t>(data.size()));
+    if(!entry.get() || !PyTuple_Check(entry.get()) || PyTuple_GET_SIZE(entry.get()) != 3 ||
+       !PyTuple_Check(PyTuple_GET_ITEM(entry.get(), 1)) || !PyCode_Check(PyTuple_GET_ITEM(entry.get(), 2)) ||
+       getString(PyTuple_GET_ITEM(entry.get(), 0)) != key)
+    {
+        PyErr_Clear();
+        return 0;
+    }
+
+    PyObject* deps = PyTuple_GET_ITEM(entry.get(), 1);
+    for(Py_ssize_t i = 0; i < PyTuple_GET_SIZE(deps); ++i)
+    {
+        PyObject* dep = PyTuple_GET_ITEM(deps, i);
+        string contents;
+        if(!PyTuple_Check(dep) || PyTuple_GET_SIZE(dep) != 2 ||
+           !readFile(getString(PyTuple_GET_ITEM(dep, 0)), contents) ||
+           digest(contents) != getString(PyTuple_GET_ITEM(dep, 1)))
+        {
+            return 0;
+        }
+    }
+
+    return incRef(PyTuple_GET_ITEM(entry.get(), 2));
+}
+
+//
+// Writes the cache file, the errors are ignored. The file is written to a temporary file
+// which is then renamed, to never expose a partially written file to other processes.
+//
+void
+writeCache(const string& path, const string& key, const StringList& files, PyObject* code)
+{
+    PyObject* dontWrite = PySys_GetObject(STRCAST("dont_write_bytecode"));
+    if(dontWrite && PyObject_IsTrue(dontWrite) > 0)
+    {
+        return;
+    }
+
+    PyObjectHandle deps = PyTuple_New(static_cast<Py_ssize_t>(files.size()));
+    if(!deps.get())
+    {
+        PyErr_Clear();
+        return;
+    }
+
+    Py_ssize_t i = 0;
+    for(StringList::const_iterator p = files.begin(); p != files.end(); ++p, ++i)
+    {
+        string contents;
+        if(!readFile(*p, contents))
+        {
+            return;
+        }
+        PyObject* dep = Py_BuildValue(STRCAST("(ss)"), p->c_str(), digest(contents).c_str());
+        if(!dep)
+        {
+            PyErr_Clear();
+            return;
+        }
+        PyTuple_SET_ITEM(deps.get(), i, dep);
+    }
+
+    PyObjectHandle entry = Py_BuildValue(STRCAST("(sOO)"), key.c_str(), deps.get(), code);
+    PyObjectHandle data = entry.get() ? PyMarshal_WriteObjectToString(entry.get(), Py_MARSHAL_VERSION) : 0;
+    if(!data.get())
+    {
+        PyErr_Clear();
+        return;
+    }
+
+    string dir = path.substr(0, path.rfind('/'));
+    if(!IceUtilInternal::directoryExists(dir))
+    {
+        IceUtilInternal::mkdir(dir, 0777);
+    }
+
+    ostringstream os;
+    os << path << "." << Ice::generateUUID() << ".tmp";
+    string tmp = os.str();
+    {
+        ofstream out(IceUtilInternal::streamFilename(tmp).c_str(), ios::binary);
+        if(!out)
+        {
+            return;
+        }
+        out.write(PyBytes_AS_STRING(data.get()), PyBytes_GET_SIZE(data.get()));
+        if(!out)
+        {
+            out.close();
+            IceUtilInternal::remove(tmp);
+            return;
+        }
+    }
+
+    if(IceUtilInternal::rename(tmp, path) != 0)
+    {
+        IceUtilInternal::remove(tmp);
+    }
+}
+
+bool
+evalSliceCode(PyObject* src)
+{
+    PyObjectHandle globals = PyDict_New();
+    if(!globals.get())
+    {
+        return false;
+    }
+    PyDict_SetItemString(globals.get(), "__builtins__", PyEval_GetBuiltins());
+
+#if PY_VERSION_HEX >= 0x03000000
+    PyObjectHandle val = PyEval_EvalCode(src, globals.get(), 0);
+#else
+    PyObjectHandle val = PyEval_EvalCode(reinterpret_cast<PyCodeObject*>(src), globals.get(), 0);
+#endif
+    return val.get() != 0;
+}
+
+}
+
 extern "C"
 PyObject*
 IcePy_loadSlice(PyObject* /*self*/, PyObject* args)
@@ -74,6 +293,8 @@ IcePy_loadSlice(PyObject* /*self*/, PyObject* args)
     opts.addOpt("", "underscore");
     opts.addOpt("", "checksum");
     opts.addOpt("", "all");
+    opts.addOpt("", "cache-dir", IceUtilInternal::Options::NeedArg);
+    opts.addOpt("", "no-cache");
 
     vector<string> files;
     try
@@ -132,12 +353,53 @@ IcePy_loadSlice(PyObject* /*self*/, PyObject* args)
     all = opts.isSet("all");
     checksum = opts.isSet("checksum");
 
+    //
+    // Unless --no-cache is set, the code generated for each Slice file is cached in a file
+    // whose key includes the options which affect the generated code. The cached code is
+    // only used if none of the files included by the Slice file changed.
+    //
+    bool cache = !opts.isSet("no-cache") && !debug;
+    string cacheDir = opts.optArg("cache-dir");
+    ostringstream key;
+    key << cacheFormat << ' ' << ICE_STRING_VERSION << ' ' << underscore << all << checksum;
+    for(vector<string>::const_iterator p = cppArgs.begin(); p != cppArgs.end(); ++p)
+    {
+        //
+        // The include paths are made absolute, a relative path refers to another directory
+        // when loadSlice is called from another working directory.
+        //
+        if(p->compare(0, 2, "-I") == 0)
+        {
+            key << " -I" << Slice::fullPath(p->substr(2));
+        }
+        else
+        {
+            key << ' ' << *p;
+        }
+    }
+
     bool ignoreRedefs = false;
     bool keepComments = true;
 
     for(vector<string>::const_iterator p = files.begin(); p != files.end(); ++p)
     {
         string file = *p;
+        string path;
+        PyObjectHandle src;
+        if(cache)
+        {
+            path = cachePath(file, cacheDir);
+            src = readCache(path, key.str() + ' ' + file);
+            if(src.get())
+            {
+                if(!evalSliceCode(src.get()))
+                {
+                    return 0;
+                }
+                continue;
+            }
+        }
+
         Slice::PreprocessorPtr icecpp = Slice::Preprocessor::create("icecpp", file, cppArgs);
         FILE* cppHandle = icecpp->preprocess(keepComments, "-D__SLICE2PY__");
 
@@ -149,6 +411,7 @@ IcePy_loadSlice(PyObject* /*self*/, PyObject* args)
 
         UnitPtr u = Slice::Unit::createUnit(ignoreRedefs, all, ice, underscore);
         int parseStatus = u->parse(file, cppHandle, debug);
+        StringList sliceFiles = u->allFiles();
 
         if(!icecpp->close() || parseStatus == EXIT_FAILURE)
         {
@@ -174,32 +437,31 @@ IcePy_loadSlice(PyObject* /*self*/, PyObject* args)
 
         string code = codeStream.str();
 
+#if PY_VERSION_HEX < 0x03040000
         //
         // We need to invoke Ice.updateModules() so that all of the types we've just generated
-        // are made "public".
+        // are made "public". With later Python versions, the modules are imported by the
+        // Slice module finder of the Ice package.
         //
         code += "\nIce.updateModules()\n";
+#endif
 
-        PyObjectHandle src = Py_CompileString(const_cast<char*>(code.c_str()), const_cast<char*>(file.c_str()),
-                                              Py_file_input);
+        src = Py_CompileString(const_cast<char*>(code.c_str()), const_cast<char*>(file.c_str()), Py_file_input);
         if(!src.get())
         {
             return 0;
         }
 
-        PyObjectHandle globals = PyDict_New();
-        if(!globals.get())
+        if(cache)
         {
-            return 0;
+            for(StringList::iterator q = sliceFiles.begin(); q != sliceFiles.end(); ++q)
+            {
+                *q = absolutePath(*q);
+            }
+            writeCache(path, key.str() + ' ' + file, sliceFiles, src.get());
         }
-        PyDict_SetItemString(globals.get(), "__builtins__", PyEval_GetBuiltins());
 
-#if PY_VERSION_HEX >= 0x03000000
-        PyObjectHandle val = PyEval_EvalCode(src.get(), globals.get(), 0);
-#else
-        PyObjectHandle val = PyEval_EvalCode(reinterpret_cast<PyCodeObject*>(src.get()), globals.get(), 0);
-#endif
-        if(!val.get())
+        if(!evalSliceCode(src.get()))
         {
             return 0;
         }
@@ -11,6 +11,7 @@
 #   include <IceUtil/Config.h>
 #endif
 #include <Types.h>
+#include <Context.h>
 #include <Current.h>
 #include <Proxy.h>
 #include <Thread.h>
@@ -2331,6 +2332,30 @@ IcePy::SequenceInfo::unmarshalPrimitiveSequence(const PrimitiveInfoPtr& pi, Ice:
     cb->unmarshaled(result.get(), target, closure);
 }
 
+bool
+IcePy::SequenceInfo::isMapped(PyObject* p, const Ice::StringSeq* metaData)
+{
+    SequenceMapping::Type type = mapping->type;
+    if(metaData)
+    {
+        SequenceMapping::getType(*metaData, type);
+    }
+
+    PrimitiveInfoPtr pi = PrimitiveInfoPtr::dynamicCast(elementType);
+    if(pi && pi->kind == PrimitiveInfo::KindByte && type == SequenceMapping::SEQ_DEFAULT)
+    {
+        return PyBytes_CheckExact(p);
+    }
+    else if(type == SequenceMapping::SEQ_TUPLE)
+    {
+        return PyTuple_CheckExact(p);
+    }
+    else
+    {
+        return PyList_CheckExact(p);
+    }
+}
+
 bool
 IcePy::SequenceInfo::SequenceMapping::getType(const Ice::StringSeq& metaData, Type& t)
 {
@@ -2604,7 +2629,18 @@ IcePy::DictionaryInfo::getId() const
 bool
 IcePy::DictionaryInfo::validate(PyObject* val)
 {
-    return val == Py_None || PyDict_Check(val) == 1;
+    if(val == Py_None || PyDict_Check(val) == 1)
+    {
+        return true;
+    }
+
+    //
+    // An Ice.Context, such as Current.ctx, is also a valid dictionary of strings.
+    //
+    PrimitiveInfoPtr k = PrimitiveInfoPtr::dynamicCast(keyType);
+    PrimitiveInfoPtr v = PrimitiveInfoPtr::dynamicCast(valueType);
+    return k && k->kind == PrimitiveInfo::KindString && v && v->kind == PrimitiveInfo::KindString &&
+        PyObject_TypeCheck(val, &ContextType);
 }
 
 bool
@@ -2635,10 +2671,25 @@ void
 IcePy::DictionaryInfo::marshal(PyObject* p, Ice::OutputStream* os, ObjectMap* objectMap, bool optional,
                                const Ice::StringSeq*)
 {
+    PyObjectHandle dict;
     if(p != Py_None && !PyDict_Check(p))
     {
-        PyErr_Format(PyExc_ValueError, STRCAST("expected dictionary value"));
-        throw AbortMarshaling();
+        if(!validate(p))
+        {
+            PyErr_Format(PyExc_ValueError, STRCAST("expected dictionary value"));
+            throw AbortMarshaling();
+        }
+
+        //
+        // Marshal the items of an Ice.Context as a dictionary.
+        //
+        Ice::Context ctx;
+        dict = PyDict_New();
+        if(!dict.get() || !contextToDictionary(*getContext(p, ctx), dict.get()))
+        {
+            throw AbortMarshaling();
+        }
+        p = dict.get();
     }
 
     const Ice::Int sz = p == Py_None ? 0 : static_cast<Ice::Int>(PyDict_Size(p));
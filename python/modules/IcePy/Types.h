@@ -331,6 +331,11 @@ public:
 
     virtual void destroy();
 
+    //
+    // Returns true if the value has the Python type produced by unmarshaling.
+    //
+    bool isMapped(PyObject*, const Ice::StringSeq* = 0);
+
 private:
 
     struct SequenceMapping : public UnmarshalCallback
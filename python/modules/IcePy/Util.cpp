@@ -677,27 +677,54 @@ IcePy::lookupType(const string& typeName)
     assert(sysModules);
 
     PyObject* module = PyDict_GetItemString(sysModules, const_cast<char*>(moduleName.c_str()));
-    PyObject* dict;
+    PyObjectHandle h;
     if(!module)
     {
         //
         // Not found, so we need to import the module.
         //
-        PyObjectHandle h = PyImport_ImportModule(const_cast<char*>(moduleName.c_str()));
+        h = PyImport_ImportModule(const_cast<char*>(moduleName.c_str()));
         if(!h.get())
         {
-            return 0;
+            //
+            // The module may be a Slice module created by a generated module, such as
+            // Ice.Instrumentation, in which case we look it up in its parent module.
+            //
+            if(moduleName.find('.') == string::npos)
+            {
+                return 0;
+            }
+            PyErr_Clear();
+            module = lookupType(moduleName);
+            if(!module || !PyModule_Check(module))
+            {
+                return 0;
+            }
+        }
+        else
+        {
+            module = h.get();
         }
-
-        dict = PyModule_GetDict(h.get());
-    }
-    else
-    {
-        dict = PyModule_GetDict(module);
     }
 
+    PyObject* dict = PyModule_GetDict(module);
     assert(dict);
-    return PyDict_GetItemString(dict, const_cast<char*>(name.c_str()));
+    PyObject* type = PyDict_GetItemString(dict, const_cast<char*>(name.c_str()));
+    if(!type)
+    {
+        //
+        // The type may be defined by a generated module imported on demand by the
+        // module __getattr__, see Ice/__init__.py.
+        //
+        PyObjectHandle attr = PyObject_GetAttrString(module, const_cast<char*>(name.c_str()));
+        if(!attr.get())
+        {
+            PyErr_Clear();
+            return 0;
+        }
+        type = PyDict_GetItemString(dict, const_cast<char*>(name.c_str()));
+    }
+    return type;
 }
 
 PyObject*
@@ -46,3 +46,8 @@ def wrap_future(future, *, loop=None):
 
     future.add_done_callback(lambda f: loop.call_soon_threadsafe(callback))
     return af
+
+async def write_chunks(cb, chunks):
+    '''Write the chunks supplied by the given asynchronous iterator with the given dispatch callback.'''
+    async for chunk in chunks:
+        cb.writeChunk(chunk)
@@ -11,7 +11,7 @@
 Ice module
 """
 
-import sys, string, imp, os, threading, warnings, datetime, logging, time, inspect, traceback
+import sys, string, types, os, threading, warnings, datetime, logging, time, inspect, traceback, json, select, errno, numbers
 
 #
 # RTTI problems can occur in C++ code unless we modify Python's dlopen flags.
@@ -80,7 +80,7 @@ def Python35():
     return sys.version_info[:2] >= (3, 5)
 
 if Python35():
-    from Ice.Py3.IceFuture import FutureBase, wrap_future
+    from Ice.Py3.IceFuture import FutureBase, wrap_future, write_chunks
 else:
     FutureBase = object
 
@@ -410,8 +410,9 @@ Returns:
 
     def _iceDispatch(self, cb, method, args):
         # Invoke the given servant method. Exceptions can propagate to the caller.
-        result = method(*args)
+        self._iceDispatchResult(cb, method(*args))
 
+    def _iceDispatchResult(self, cb, result):
         # Check for a future.
         if isinstance(result, Future) or callable(getattr(result, "add_done_callback", None)):
             def handler(future):
@@ -425,7 +426,8 @@ Returns:
         else:
             cb.response(result)
 
-    def _iceDispatchCoroutine(self, cb, coro, value=None, exception=None):
+    @staticmethod
+    def _iceDispatchCoroutine(cb, coro, value=None, exception=None):
         try:
             if exception:
                 result = coro.throw(exception)
@@ -436,9 +438,9 @@ Returns:
             if isinstance(result, Future) or callable(getattr(result, "add_done_callback", None)):
                 def handler(future):
                     try:
-                        self._iceDispatchCoroutine(cb, coro, value=future.result())
+                        Object._iceDispatchCoroutine(cb, coro, value=future.result())
                     except:
-                        self._iceDispatchCoroutine(cb, coro, exception=sys.exc_info()[1])
+                        Object._iceDispatchCoroutine(cb, coro, exception=sys.exc_info()[1])
                 result.add_done_callback(handler)
             else:
                 raise RuntimeError('unexpected value of type ' + str(type(result)) + ' provided by coroutine')
@@ -448,6 +450,12 @@ Returns:
         except:
             cb.exception(sys.exc_info()[1])
 
+def _iceWriteChunks(cb, chunks):
+    # Called by IcePy when the trailing sequence<byte> result of a dispatch is supplied by an asynchronous
+    # iterator. The chunks are written to the response as they are produced, the response is sent once the
+    # iterator is exhausted.
+    Object._iceDispatchCoroutine(cb, write_chunks(cb, chunks))
+
 class Blobject(Object):
     '''Special-purpose servant base class that allows a subclass to
 handle synchronous Ice invocations as "blobs" of bytes.'''
@@ -566,6 +574,12 @@ class EnumBase(object):
             return False
         return NotImplemented
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def _getName(self):
         return self._name
 
@@ -671,21 +685,24 @@ def getSliceDir():
 # Utilities for use by generated code.
 #
 
-_pendingModules = {}
+#
+# The Slice modules created by the generated code with openModule. A module is kept here
+# until it's imported: with Python 3.4 or later, the _SliceModuleFinder meta path finder
+# imports it, and if the module is also a package generated by slice2py, the package is
+# initialized in the same module object. Older versions copy the module into sys.modules
+# with updateModule and updateModules.
+#
+_sliceModules = {}
 
 def openModule(name):
-    global _pendingModules
-    if name in sys.modules:
-        result = sys.modules[name]
-    elif name in _pendingModules:
-        result = _pendingModules[name]
-    else:
-        result = createModule(name)
-
+    result = sys.modules.get(name)
+    if result is None:
+        result = _sliceModules.get(name)
+        if result is None:
+            result = createModule(name)
     return result
 
 def createModule(name):
-    global _pendingModules
     l = name.split(".")
     curr = ''
     mod = None
@@ -693,35 +710,88 @@ def createModule(name):
     for s in l:
         curr = curr + s
 
-        if curr in sys.modules:
-            mod = sys.modules[curr]
-        elif curr in _pendingModules:
-            mod = _pendingModules[curr]
-        else:
-            nmod = imp.new_module(curr)
-            _pendingModules[curr] = nmod
-            mod = nmod
+        mod = sys.modules.get(curr)
+        if mod is None:
+            mod = _sliceModules.get(curr)
+            if mod is None:
+                mod = types.ModuleType(curr)
+                _sliceModules[curr] = mod
 
         curr = curr + "."
 
     return mod
 
 def updateModule(name):
-    global _pendingModules
-    if name in _pendingModules:
-        pendingModule = _pendingModules[name]
-        mod = sys.modules[name]
-        mod.__dict__.update(pendingModule.__dict__)
-        del _pendingModules[name]
+    mod = _sliceModules.pop(name, None)
+    if mod is not None and mod is not sys.modules[name]:
+        sys.modules[name].__dict__.update(mod.__dict__)
 
 def updateModules():
-    global _pendingModules
-    for name in _pendingModules.keys():
+    if _SliceModuleFinder:
+        return
+    global _sliceModules
+    for name in _sliceModules.keys():
         if name in sys.modules:
-            sys.modules[name].__dict__.update(_pendingModules[name].__dict__)
+            sys.modules[name].__dict__.update(_sliceModules[name].__dict__)
         else:
-            sys.modules[name] = _pendingModules[name]
-    _pendingModules = {}
+            sys.modules[name] = _sliceModules[name]
+    _sliceModules = {}
+
+if sys.version_info[:2] >= (3, 4):
+    import importlib.machinery
+
+    class _SliceModuleLoader(object):
+        def __init__(self, module, loader):
+            self._module = module
+            self._loader = loader
+
+        def create_module(self, spec):
+            return self._module
+
+        def exec_module(self, module):
+            if self._loader:
+                self._loader.exec_module(module)
+            _sliceModules.pop(module.__name__, None)
+
+        def __getattr__(self, name):
+            # Delegates get_source, get_filename, etc. to the loader of the package.
+            return getattr(self._loader, name)
+
+    class _SliceModuleFinder(object):
+        @classmethod
+        def find_spec(cls, fullname, path, target=None):
+            module = _sliceModules.get(fullname)
+            if module is None:
+                return None
+
+            #
+            # If there's also a package with this name, such as a package generated by slice2py,
+            # the package is initialized in the Slice module.
+            #
+            locations = None
+            for finder in sys.meta_path:
+                if finder is cls or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.submodule_search_locations is not None:
+                    if spec.loader is not None:
+                        if not hasattr(spec.loader, "exec_module"):
+                            return None # The package calls updateModule.
+                        spec.loader = _SliceModuleLoader(module, spec.loader)
+                        return spec
+                    locations = spec.submodule_search_locations # Namespace package.
+                break
+
+            spec = importlib.machinery.ModuleSpec(fullname, _SliceModuleLoader(module, None), is_package=True)
+            if locations is not None:
+                spec.submodule_search_locations = locations
+            return spec
+
+    sys.meta_path.insert(0, _SliceModuleFinder)
+else:
+    _SliceModuleFinder = None
 
 def createTempClass():
     class __temp: pass
@@ -736,6 +806,29 @@ FormatType.DefaultFormat = FormatType(0)
 FormatType.CompactFormat = FormatType(1)
 FormatType.SlicedFormat = FormatType(2)
 
+class ConnectionPoolPolicy(EnumBase):
+    """
+    Determines how the invocations on a proxy created with ice_connectionPool
+    are spread over the connections of the pool.
+    Enumerators:
+    RoundRobin -- The connections are used in turn.
+    LeastOutstanding -- The connection with the fewest outstanding requests
+    is used.
+    """
+
+    def __init__(self, _n, _v):
+        EnumBase.__init__(self, _n, _v)
+
+    def valueOf(self, _n):
+        if _n in self._enumerators:
+            return self._enumerators[_n]
+        return None
+    valueOf = classmethod(valueOf)
+
+ConnectionPoolPolicy.RoundRobin = ConnectionPoolPolicy("RoundRobin", 0)
+ConnectionPoolPolicy.LeastOutstanding = ConnectionPoolPolicy("LeastOutstanding", 1)
+ConnectionPoolPolicy._enumerators = { 0:ConnectionPoolPolicy.RoundRobin, 1:ConnectionPoolPolicy.LeastOutstanding }
+
 #
 # Forward declarations.
 #
@@ -775,13 +868,43 @@ import Ice.ObjectFactory_ice
 import Ice.ValueFactory_ice
 import Ice.Process_ice
 import Ice.Properties_ice
-import Ice.RemoteLogger_ice
 import Ice.Router_ice
 import Ice.ServantLocator_ice
 import Ice.Connection_ice
 import Ice.Version_ice
-import Ice.Instrumentation_ice
-import Ice.Metrics_ice
+
+#
+# The generated modules below are rarely used, they are imported on the first access
+# to one of their definitions with the module __getattr__ (Python >= 3.7). Ice.Metrics_ice
+# only defines the IceMX module, it's imported by the IceMX package or by the metrics admin
+# facets of this module. Router, Locator, Process and PropertiesAdmin can't be imported
+# lazily, they are included by Communicator, ObjectAdapter and Properties.
+#
+_lazyModules = ["Ice.RemoteLogger_ice", "Ice.Instrumentation_ice"]
+_lazyModulesLock = threading.RLock()
+
+def _lazyGetattr(module):
+    def getattr(name):
+        if not name.startswith("__"):
+            with _lazyModulesLock:
+                while _lazyModules:
+                    __import__(_lazyModules.pop(0))
+                    if name in module.__dict__:
+                        return module.__dict__[name]
+        raise AttributeError("module '{0}' has no attribute '{1}'".format(module.__name__, name))
+    return getattr
+
+if sys.version_info[:2] >= (3, 7):
+    #
+    # The Ice.Instrumentation module is already created by Ice.InstrumentationF_ice.
+    #
+    __getattr__ = _lazyGetattr(sys.modules[__name__])
+    Instrumentation.__getattr__ = _lazyGetattr(Instrumentation)
+else:
+    import Ice.RemoteLogger_ice
+    import Ice.Instrumentation_ice
+    import Ice.Metrics_ice
+    _lazyModules = []
 
 #
 # Replace EndpointInfo with our implementation.
@@ -796,6 +919,10 @@ del UDPEndpointInfo
 UDPEndpointInfo =  IcePy.UDPEndpointInfo
 del WSEndpointInfo
 WSEndpointInfo =  IcePy.WSEndpointInfo
+del SHMEndpointInfo
+SHMEndpointInfo =  IcePy.SHMEndpointInfo
+del UnixEndpointInfo
+UnixEndpointInfo =  IcePy.UnixEndpointInfo
 del OpaqueEndpointInfo
 OpaqueEndpointInfo =  IcePy.OpaqueEndpointInfo
 
@@ -814,9 +941,21 @@ del UDPConnectionInfo
 UDPConnectionInfo =  IcePy.UDPConnectionInfo
 del WSConnectionInfo
 WSConnectionInfo =  IcePy.WSConnectionInfo
+del SHMConnectionInfo
+SHMConnectionInfo =  IcePy.SHMConnectionInfo
+del UnixConnectionInfo
+UnixConnectionInfo =  IcePy.UnixConnectionInfo
 
 SSLConnectionInfo =  IcePy.SSLConnectionInfo
 
+#
+# The Adaptive endpoint selection is specific to the Python mapping. A proxy with
+# several endpoints sends its invocations to the endpoint with the lowest latency
+# and error rate, see Endpoint.getSelectionStats.
+#
+EndpointSelectionType.Adaptive = EndpointSelectionType("Adaptive", 2)
+EndpointSelectionType._enumerators[2] = EndpointSelectionType.Adaptive
+
 class ThreadNotification(object):
     '''Base class for thread notification callbacks. A subclass must
 define the start and stop methods.'''
@@ -893,6 +1032,12 @@ batchRequestInterceptor: A callable that will be invoked when a batch request is
     enqueue method on the BatchRequest object.
 
 valueFactoryManager: An object that implements ValueFactoryManager.
+
+observer: An object that implements Ice.Instrumentation.CommunicatorObserver. The
+    invocations, dispatches and connections are counted natively; the observer is only
+    asked for an observer for one out of Ice.Python.Observer.SampleRate of them (default
+    0, the observer is not called). The updater given to setObserverUpdater also provides
+    getMetrics(), which returns the native counters. Thread observers are not supported.
 '''
     def __init__(self):
         self.properties = None
@@ -903,6 +1048,78 @@ valueFactoryManager: An object that implements ValueFactoryManager.
         self.dispatcher = None
         self.batchRequestInterceptor = None
         self.valueFactoryManager = None
+        self.observer = None
+
+#
+# Establishes the connections of several proxies with ice_getConnectionAsync, see
+# Communicator.prewarm.
+#
+class _Prewarm(object):
+    def __init__(self, proxies, parallelism):
+        self.future = Future()
+        self._proxies = list(proxies)
+        self._parallelism = parallelism
+        self._connections = [None] * len(self._proxies)
+        self._exception = None
+        self._lock = threading.Lock()
+        self._next = 0
+        self._running = 0
+        self._completed = 0
+        self._starting = False
+
+    def start(self):
+        if not self._proxies:
+            self.future.set_result([])
+        else:
+            self._startNext()
+
+    def _startNext(self):
+        #
+        # The callback of a connection which is already established is called by
+        # add_done_callback, the _starting flag prevents this method from recursing.
+        #
+        with self._lock:
+            if self._starting:
+                return
+            self._starting = True
+
+        while True:
+            with self._lock:
+                if self._next == len(self._proxies) or \
+                   (self._parallelism > 0 and self._running == self._parallelism):
+                    self._starting = False
+                    return
+                i = self._next
+                self._next += 1
+                self._running += 1
+
+            if self._proxies[i] is None:
+                self._finished(i, None, None)
+                continue
+
+            try:
+                f = self._proxies[i].ice_getConnectionAsync()
+            except Exception as ex:
+                self._finished(i, None, ex)
+                continue
+            f.add_done_callback(lambda f, i=i: self._finished(i, None if f.exception() else f.result(),
+                                                              f.exception()))
+
+    def _finished(self, i, connection, exception):
+        with self._lock:
+            self._connections[i] = connection
+            if exception and not self._exception:
+                self._exception = exception
+            self._running -= 1
+            self._completed += 1
+            done = self._completed == len(self._proxies)
+
+        if not done:
+            self._startNext()
+        elif self._exception:
+            self.future.set_exception(self._exception)
+        else:
+            self.future.set_result(self._connections)
 
 #
 # Communicator wrapper.
@@ -1027,6 +1244,24 @@ class CommunicatorI(Communicator):
     def end_flushBatchRequests(self, r):
         return self._impl.end_flushBatchRequests(r)
 
+    def prewarm(self, proxies, parallelism=0):
+        '''Establishes the connections of the given proxies concurrently, with
+ice_getConnectionAsync. The endpoints of indirect proxies are resolved with
+their locator, which populates the locator cache. The connections are
+established even if some of them fail.
+Arguments:
+    proxies -- The proxies to connect.
+    parallelism -- The maximum number of connections being established at
+                   the same time, or 0 for no limit.
+Returns:
+    A future that completes with the list of connections of the proxies, in
+    order, once all of them are established. The connection of a collocated
+    proxy is None. If a connection can't be established, the future raises
+    the first exception instead.'''
+        p = _Prewarm(proxies, parallelism)
+        p.start()
+        return p.future
+
     def createAdmin(self, adminAdapter, adminIdentity):
         return self._impl.createAdmin(adminAdapter, adminIdentity)
 
@@ -1045,6 +1280,210 @@ class CommunicatorI(Communicator):
     def removeAdminFacet(self, facet):
         return self._impl.removeAdminFacet(facet)
 
+#
+# The locator servant of LocatorCache.
+#
+class _LocatorCacheI(Locator):
+    def __init__(self, cache):
+        self._cache = cache
+
+    def findObjectById(self, id, current=None):
+        return self._cache._find(self._cache._objects, id, self._cache._locator.findObjectByIdAsync)
+
+    def findAdapterById(self, id, current=None):
+        return self._cache._find(self._cache._adapters, id, self._cache._locator.findAdapterByIdAsync)
+
+    def getRegistry(self, current=None):
+        return self._cache._locator.getRegistryAsync()
+
+class LocatorCache(object):
+    '''A cache of the proxies returned by a locator, which can be inspected,
+saved to a file and loaded from a file. The cache provides a locator proxy
+which forwards the requests that it can't answer to the given locator. To
+use the cache, set this proxy as the default locator of the communicator or
+as the locator of the proxies, for example:
+
+    cache = Ice.LocatorCache(communicator)
+    cache.load("locator.cache")
+    communicator.setDefaultLocator(cache.getLocator())
+
+The cache complements the locator cache of the Ice run time, see
+ice_locatorCacheTimeout: it is only used when the Ice run time resolves an
+adapter id or a well-known object.'''
+
+    def __init__(self, communicator, locator=None, timeout=-1):
+        '''Creates a cache for the given locator, or for the default locator
+of the communicator if locator is None.
+Arguments:
+    communicator -- The communicator.
+    locator -- The locator whose results are cached.
+    timeout -- The number of seconds after which an entry is resolved again
+               by the locator, or -1 if the entries never expire. An
+               expired entry is still used if the locator can't be reached.'''
+        self._locator = locator or communicator.getDefaultLocator()
+        if not self._locator:
+            raise ValueError("LocatorCache requires a locator")
+        self._locator = LocatorPrx.uncheckedCast(self._locator)
+        self._communicator = communicator
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._adapters = {}
+        self._objects = {}
+        self._adapter = communicator.createObjectAdapter("")
+        self._proxy = LocatorPrx.uncheckedCast(self._adapter.addWithUUID(_LocatorCacheI(self)))
+        self._adapter.activate()
+
+    def destroy(self):
+        '''Destroys the object adapter of the cache locator.'''
+        self._adapter.destroy()
+
+    def getLocator(self):
+        '''Returns the proxy of the cache locator.'''
+        return self._proxy
+
+    def getAdapterEntries(self):
+        '''Returns a dictionary of the cached adapter entries, with the adapter
+id as the key and a tuple of the proxy and the time at which it was resolved
+(as returned by time.time()) as the value.'''
+        with self._lock:
+            return dict(self._adapters)
+
+    def getObjectEntries(self):
+        '''Returns a dictionary of the cached well-known object entries, with
+the identity as the key and a tuple of the proxy and the time at which it was
+resolved (as returned by time.time()) as the value.'''
+        with self._lock:
+            return dict(self._objects)
+
+    def clear(self):
+        '''Removes all the entries from the cache.'''
+        with self._lock:
+            self._adapters.clear()
+            self._objects.clear()
+
+    def save(self, path):
+        '''Saves the entries of the cache to the given file.'''
+        with self._lock:
+            adapters = dict(self._adapters)
+            objects = dict(self._objects)
+
+        c = self._communicator
+        data = {
+            "adapters": [[k, c.proxyToString(p), t] for k, (p, t) in adapters.items()],
+            "objects": [[c.identityToString(k), c.proxyToString(p), t] for k, (p, t) in objects.items()]
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+    def load(self, path):
+        '''Loads the entries saved with save from the given file. The loaded
+entries keep the time at which they were resolved. An entry of the cache is
+only replaced if the loaded entry is more recent. Returns the number of
+entries loaded.'''
+        with open(path) as f:
+            data = json.load(f)
+
+        c = self._communicator
+        adapters = [(k, c.stringToProxy(p), t) for k, p, t in data.get("adapters", [])]
+        objects = [(c.stringToIdentity(k), c.stringToProxy(p), t) for k, p, t in data.get("objects", [])]
+        count = 0
+        with self._lock:
+            for table, entries in ((self._adapters, adapters), (self._objects, objects)):
+                for k, p, t in entries:
+                    if k not in table or table[k][1] < t:
+                        table[k] = (p, t)
+                        count += 1
+        return count
+
+    def resolve(self, adapterIds=(), objectIds=()):
+        '''Resolves the given adapter ids and well-known object identities with
+the locator and adds them to the cache. All the requests are sent at once,
+without waiting for the replies of the previous requests.
+Arguments:
+    adapterIds -- The adapter ids to resolve.
+    objectIds -- The identities of the well-known objects to resolve.
+Returns:
+    A future that completes with the number of entries resolved once all
+    the replies are received. The adapters and objects unknown to
+    the locator are ignored. If the locator can't be reached, the future
+    raises the first exception instead.'''
+        requests = [(self._adapters, k, self._locator.findAdapterByIdAsync) for k in adapterIds]
+        requests += [(self._objects, k, self._locator.findObjectByIdAsync) for k in objectIds]
+        future = Future()
+        if not requests:
+            future.set_result(0)
+            return future
+
+        state = { "remaining": len(requests), "count": 0, "exception": None }
+
+        def completed(table, key, f):
+            try:
+                if self._add(table, key, f.result()):
+                    with self._lock:
+                        state["count"] += 1
+            except (AdapterNotFoundException, ObjectNotFoundException):
+                pass
+            except Exception as ex:
+                with self._lock:
+                    state["exception"] = state["exception"] or ex
+
+            with self._lock:
+                state["remaining"] -= 1
+                if state["remaining"] > 0:
+                    return
+
+            if state["exception"]:
+                future.set_exception(state["exception"])
+            else:
+                future.set_result(state["count"])
+
+        for table, key, lookup in requests:
+            try:
+                f = lookup(key)
+            except Exception as ex:
+                f = Future()
+                f.set_exception(ex)
+            f.add_done_callback(lambda f, table=table, key=key: completed(table, key, f))
+        return future
+
+    def _add(self, table, key, proxy):
+        if not proxy:
+            return False
+        with self._lock:
+            table[key] = (proxy, time.time())
+        return True
+
+    def _find(self, table, key, lookup):
+        with self._lock:
+            entry = table.get(key)
+        if entry and (self._timeout < 0 or time.time() - entry[1] < self._timeout):
+            return entry[0]
+
+        future = Future()
+
+        def completed(f):
+            try:
+                proxy = f.result()
+            except (AdapterNotFoundException, ObjectNotFoundException) as ex:
+                with self._lock:
+                    table.pop(key, None)
+                future.set_exception(ex)
+                return
+            except LocalException as ex:
+                if entry:
+                    future.set_result(entry[0])
+                else:
+                    future.set_exception(ex)
+                return
+            self._add(table, key, proxy)
+            future.set_result(proxy)
+
+        try:
+            lookup(key).add_done_callback(completed)
+        except Exception as ex:
+            future.set_exception(ex)
+        return future
+
 #
 # Ice.initialize()
 #
@@ -1061,8 +1500,13 @@ Ice.initialize(args, data)
 If you supply an argument list, the function removes those arguments from
 the list that were recognized by the Ice run time.
 '''
-    communicator = IcePy.Communicator(args, data)
-    return CommunicatorI(communicator)
+    communicator = CommunicatorI(IcePy.Communicator(args, data))
+    if communicator.getProperties().getPropertyAsInt("Ice.Python.AdmissionFacet") > 0:
+        communicator.addAdminFacet(_createMetricsAdmin(_AdmissionMetricsAdmin), "IcePy.Admission")
+    if communicator.getProperties().getPropertyAsInt("Ice.Python.MetricsFacet") > 0:
+        enableOperationMetrics()
+        communicator.addAdminFacet(_createMetricsAdmin(_OperationMetricsAdmin), "IcePy.Metrics")
+    return communicator
 
 #
 # Ice.identityToString
@@ -1138,6 +1582,21 @@ class ObjectAdapterI(ObjectAdapter):
     def addDefaultServant(self, servant, category):
         self._impl.addDefaultServant(servant, category)
 
+    def addDefaultIdentityServant(self, servant, category):
+        '''Adds a default servant for the given category, like
+addDefaultServant. The methods of this servant do not receive
+an Ice.Current object: they receive the name and the category
+of the target identity followed by the in parameters, for
+example op(self, name, category, arg1, arg2). This avoids the
+creation of Ice.Current for every request. The Ice.Object
+operations (ice_ping, ice_isA, ice_ids and ice_id) still receive
+an Ice.Current object.
+Arguments:
+    servant -- The default servant.
+    category -- The category for which the default servant is registered.
+'''
+        self._impl.addDefaultIdentityServant(servant, category)
+
     def remove(self, id):
         return self._impl.remove(id)
 
@@ -1277,6 +1736,12 @@ class PropertiesI(Properties):
         properties = self._impl.clone()
         return PropertiesI(properties)
 
+    def snapshot(self):
+        '''Returns an immutable snapshot of the properties. A new snapshot, with a
+greater generation, is only created if the properties changed since the last
+snapshot of this property set, including with the Properties admin facet.'''
+        return self._impl.snapshot()
+
     def __iter__(self):
         dict = self._impl.getPropertiesForPrefix('')
         return iter(dict)
@@ -1284,6 +1749,71 @@ class PropertiesI(Properties):
     def __str__(self):
         return str(self._impl)
 
+#
+# Properties snapshot, see PropertiesI.snapshot().
+#
+try:
+    from collections.abc import Mapping as _Mapping
+except ImportError:
+    from collections import Mapping as _Mapping
+
+class PropertiesSnapshot(_Mapping):
+    '''An immutable snapshot of a property set, which maps the property names to
+their values. The accessors return the same results as the Properties accessors
+and their results are cached. The generation attribute identifies the snapshot:
+snapshots of the same properties with the same generation are identical, so
+applications can cache the configuration derived from a snapshot until the
+generation changes.'''
+    def __init__(self, impl, properties, generation):
+        self._impl = impl
+        self._properties = properties
+        self._cache = {}
+        self.generation = generation
+
+    def __getitem__(self, key):
+        return self._properties[key]
+
+    def __iter__(self):
+        return iter(self._properties)
+
+    def __len__(self):
+        return len(self._properties)
+
+    def getProperty(self, key):
+        return self._properties.get(key, "")
+
+    def getPropertyWithDefault(self, key, value):
+        return self._properties.get(key, value)
+
+    def getPropertyAsInt(self, key):
+        return self._get(self._impl.getPropertyAsInt, key)
+
+    def getPropertyAsIntWithDefault(self, key, value):
+        return self._get(self._impl.getPropertyAsIntWithDefault, key, value)
+
+    def getPropertyAsList(self, key):
+        return list(self._get(self._impl.getPropertyAsList, key))
+
+    def getPropertyAsListWithDefault(self, key, value):
+        if key in self._properties:
+            return self.getPropertyAsList(key)
+        return list(value)
+
+    def getPropertiesForPrefix(self, prefix):
+        return dict(self._get(self._impl.getPropertiesForPrefix, prefix))
+
+    def _get(self, fn, *args):
+        key = (fn.__name__,) + args
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = fn(*args)
+            self._cache[key] = result
+            return result
+
+    def __str__(self):
+        return str(self._impl)
+
 #
 # Ice.createProperties()
 #
@@ -1320,6 +1850,29 @@ def setProcessLogger(logger):
     '''Sets the default logger object.'''
     IcePy.setProcessLogger(logger)
 
+#
+# Ice.enableOperationMetrics()
+# Ice.getOperationMetrics()
+#
+def enableOperationMetrics(enable=True):
+    '''Enables or disables the collection of the marshaling, unmarshaling and
+servant times and sizes of the operations invoked or dispatched by this process.'''
+    IcePy.enableOperationMetrics(enable)
+
+def getOperationMetrics():
+    '''Returns a dictionary of the operation metrics collected since they were
+enabled, keyed by operation name. Each value is a dictionary with the following
+keys: calls, bytesIn, bytesOut, marshalCount, marshalTime, unmarshalCount,
+unmarshalTime, servantCount and servantTime. The times are in microseconds.'''
+    keys = ("calls", "bytesIn", "bytesOut", "marshalCount", "marshalTime", "unmarshalCount", "unmarshalTime",
+            "servantCount", "servantTime")
+    metrics = {}
+    for m in IcePy.getOperationMetrics():
+        d = metrics.setdefault(m[0], dict((k, 0) for k in keys))
+        for (k, v) in zip(keys, m[1:]):
+            d[k] += v
+    return metrics
+
 #
 # ImplicitContext wrapper
 #
@@ -1333,6 +1886,13 @@ class ImplicitContextI(ImplicitContext):
     def getContext(self):
         return self._impl.getContext()
 
+    def snapshot(self):
+        '''Returns the context as an immutable Ice.Context. The same snapshot is
+returned until the context changes, and it can be passed to setContext, for
+example in another thread with a per-thread implicit context, without being
+converted again.'''
+        return self._impl.snapshot()
+
     def containsKey(self, key):
         return self._impl.containsKey(key)
 
@@ -1345,6 +1905,18 @@ class ImplicitContextI(ImplicitContext):
     def remove(self, key):
         return self._impl.remove(key)
 
+#
+# Immutable request context.
+#
+class Context(IcePy.Context, _Mapping):
+    '''An immutable request context. It accepts the same arguments as dict,
+and its items are converted once, when the context is created. A Context can
+be used instead of a dictionary for the context argument of proxy operations,
+checkedCast, ice_context and ImplicitContext.setContext, in which case the
+invocation uses the converted items directly. A Context is hashable and
+compares equal to a dictionary with the same items.'''
+    __slots__ = ()
+
 #
 # Its not possible to block in a python signal handler since this
 # blocks the main thread from doing further work. As such we queue the
@@ -1442,6 +2014,346 @@ class CtrlCHandler(threading.Thread):
         self._self._condVar.release()
     signalHandler = classmethod(signalHandler)
 
+#
+# Process group support for Ice.Python.Processes.
+#
+# A Python server cannot dispatch on more than one core because of the
+# GIL. With Ice.Python.Processes=N, Application.main forks N-1 additional
+# worker processes before the communicator is created. Each worker runs
+# the application with Ice.TCP.ReusePort enabled, so the workers share
+# the listening endpoints of their object adapters and the kernel spreads
+# incoming connections among them.
+#
+# Each worker is connected to the first process (worker 0) by a pipe. A
+# worker writes the stringified proxy of its admin object to the pipe
+# and keeps it open until it exits, so worker 0 detects the termination
+# of a worker by reading EOF from the pipe. When a worker terminates
+# because its communicator was shut down, worker 0 shuts down its own
+# communicator; when worker 0 terminates, it terminates the other
+# workers.
+#
+class _ProcessGroup(object):
+    def __init__(self, processes, properties):
+        self._index = 0
+        self._pipes = {}
+        self._pids = []
+        self._admins = {}
+        self._communicator = None
+        self._thread = None
+        self._stopped = False
+        self._failed = False
+        self._lock = threading.Lock()
+
+        properties.setProperty("Ice.TCP.ReusePort", "1")
+
+        #
+        # Flush the standard streams to not duplicate buffered output in the
+        # workers.
+        #
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        for i in range(1, processes):
+            r, w = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(r)
+                for fd in self._pipes:
+                    os.close(fd)
+                self._index = i
+                self._pipes = { w: i }
+                self._pids = []
+
+                #
+                # The admin object of a worker other than worker 0 is only
+                # used by worker 0, it listens on an ephemeral port of the
+                # loopback interface and isn't registered with the locator.
+                #
+                if len(properties.getProperty("Ice.Admin.Endpoints")) > 0:
+                    properties.setProperty("Ice.Admin.Endpoints", "tcp -h 127.0.0.1")
+                    properties.setProperty("Ice.Admin.ServerId", "")
+                    instanceName = properties.getProperty("Ice.Admin.InstanceName")
+                    if len(instanceName) > 0:
+                        properties.setProperty("Ice.Admin.InstanceName", instanceName + "-" + str(i))
+                return
+            os.close(w)
+            self._pipes[r] = i
+            self._pids.append(pid)
+
+    def index(self):
+        return self._index
+
+    def activate(self, communicator):
+        self._communicator = communicator
+        admin = communicator.getAdmin()
+        if self._index > 0:
+            #
+            # Send the admin proxy to worker 0. The pipe is closed by the
+            # operating system when this process terminates.
+            #
+            s = communicator.proxyToString(admin) if admin else ""
+            os.write(list(self._pipes.keys())[0], (s + "\n").encode("utf-8"))
+        else:
+            if admin:
+                self._admins[0] = admin
+                communicator.addAdminFacet(_createMetricsAdmin(_ProcessGroupMetricsAdmin, self), "IcePy.Processes")
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def destroy(self):
+        if self._index > 0:
+            return False
+
+        with self._lock:
+            self._stopped = True
+            for pid in self._pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:
+                    pass
+
+        for pid in self._pids:
+            status = os.waitpid(pid, 0)[1]
+            if os.WIFSIGNALED(status) and os.WTERMSIG(status) != signal.SIGTERM or \
+               os.WIFEXITED(status) and os.WEXITSTATUS(status) != 0:
+                self._failed = True
+
+        if self._thread:
+            self._thread.join()
+        else:
+            for fd in self._pipes:
+                os.close(fd)
+        return self._failed
+
+    def admins(self):
+        with self._lock:
+            return [self._admins[i] for i in sorted(self._admins)]
+
+    def _run(self):
+        data = dict((fd, b"") for fd in self._pipes)
+        while data:
+            try:
+                r = select.select(list(data), [], [])[0]
+            except (OSError, select.error):
+                if sys.exc_info()[1].args[0] == errno.EINTR:
+                    continue
+                raise
+            for fd in r:
+                s = os.read(fd, 4096)
+                if s:
+                    data[fd] += s
+                    if b"\n" in data[fd]:
+                        self._register(self._pipes[fd], data[fd].split(b"\n")[0].decode("utf-8"))
+                    continue
+
+                del data[fd]
+                os.close(fd)
+                with self._lock:
+                    self._admins.pop(self._pipes[fd], None)
+                    if self._stopped:
+                        continue
+                    self._stopped = True
+
+                #
+                # A worker terminated on its own, shut down the group.
+                #
+                try:
+                    self._communicator.shutdown()
+                except CommunicatorDestroyedException:
+                    pass
+
+    def _register(self, index, s):
+        if len(s) > 0:
+            with self._lock:
+                if index not in self._admins:
+                    self._admins[index] = self._communicator.stringToProxy(s)
+
+#
+# The classes below implement the IceMX::MetricsAdmin interface of the IcePy
+# admin facets. Ice.Metrics_ice is only imported when a facet is created, the
+# servant type derives from the implementation class and IceMX.MetricsAdmin.
+#
+_metricsAdminTypes = {}
+
+def _createMetricsAdmin(impl, *args):
+    t = _metricsAdminTypes.get(impl)
+    if t is None:
+        import Ice.Metrics_ice
+        t = type(impl.__name__, (impl, openModule('IceMX').MetricsAdmin), {})
+        _metricsAdminTypes[impl] = t
+    return t(*args)
+
+#
+# The IcePy.Processes admin facet of worker 0 aggregates the metrics
+# of all the workers. The metrics objects returned by the workers are
+# merged by adding their integer data members.
+#
+class _ProcessGroupMetricsAdmin(object):
+    def __init__(self, group):
+        self._group = group
+
+    def getMetricsViewNames(self, current=None):
+        enabled = []
+        disabled = []
+        for admin in self._admins():
+            e, d = admin.getMetricsViewNames()
+            enabled.extend([n for n in e if n not in enabled])
+            disabled.extend([n for n in d if n not in disabled])
+        return (enabled, [n for n in disabled if n not in enabled])
+
+    def enableMetricsView(self, name, current=None):
+        for admin in self._admins():
+            admin.enableMetricsView(name)
+
+    def disableMetricsView(self, name, current=None):
+        for admin in self._admins():
+            admin.disableMetricsView(name)
+
+    def getMetricsView(self, view, current=None):
+        result = {}
+        timestamp = 0
+        for admin in self._admins():
+            maps, t = admin.getMetricsView(view)
+            timestamp = max(timestamp, t)
+            for name, metrics in maps.items():
+                result[name] = self._mergeMetrics(result.get(name, []), metrics)
+        return (result, timestamp)
+
+    def getMapMetricsFailures(self, view, map, current=None):
+        result = []
+        for admin in self._admins():
+            for f in admin.getMapMetricsFailures(view, map):
+                for r in result:
+                    if r.id == f.id:
+                        self._mergeFailures(r, f)
+                        break
+                else:
+                    result.append(f)
+        return result
+
+    def getMetricsFailures(self, view, map, id, current=None):
+        result = None
+        for admin in self._admins():
+            f = admin.getMetricsFailures(view, map, id)
+            if result:
+                self._mergeFailures(result, f)
+            else:
+                result = f
+        return result
+
+    def _admins(self):
+        IceMX = openModule('IceMX')
+        return [IceMX.MetricsAdminPrx.uncheckedCast(a, "Metrics") for a in self._group.admins()]
+
+    def _mergeMetrics(self, result, metrics):
+        for m in metrics:
+            for r in result:
+                if r.id == m.id:
+                    for k, v in m.__dict__.items():
+                        if k != "id" and isinstance(v, numbers.Integral) and not isinstance(v, bool):
+                            setattr(r, k, getattr(r, k) + v)
+                    break
+            else:
+                result.append(m)
+        return result
+
+    def _mergeFailures(self, result, failures):
+        if result.failures is None:
+            result.failures = {}
+        for k, v in (failures.failures or {}).items():
+            result.failures[k] = result.failures.get(k, 0) + v
+
+#
+# The IcePy.Admission admin facet reports the admission control of the
+# operations dispatched with a concurrency limit. The metrics of an
+# operation count the dispatches (total), the dispatches in progress or
+# waiting for a slot (current) and the rejected dispatches (failures).
+# Operations with the same name are reported together.
+#
+class _AdmissionMetricsAdmin(object):
+    def getMetricsViewNames(self, current=None):
+        return (["Admission"], [])
+
+    def enableMetricsView(self, name, current=None):
+        self._checkView(name)
+
+    def disableMetricsView(self, name, current=None):
+        self._checkView(name)
+
+    def getMetricsView(self, view, current=None):
+        self._checkView(view)
+        return ({ "Operation": list(self._metrics().values()) }, int(time.time() * 1000))
+
+    def getMapMetricsFailures(self, view, map, current=None):
+        self._checkView(view)
+        if map != "Operation":
+            return []
+        return [self._failures(m) for m in self._metrics().values() if m.failures > 0]
+
+    def getMetricsFailures(self, view, map, id, current=None):
+        self._checkView(view)
+        m = self._metrics().get(id) if map == "Operation" else None
+        return self._failures(m) if m else openModule('IceMX').MetricsFailures(id, {})
+
+    def _checkView(self, name):
+        if name != "Admission":
+            raise openModule('IceMX').UnknownMetricsView()
+
+    def _metrics(self):
+        IceMX = openModule('IceMX')
+        metrics = {}
+        for (name, inFlight, queued, admitted, rejected) in IcePy.getAdmissionStats():
+            m = metrics.setdefault(name, IceMX.Metrics(name, 0, 0, 0, 0))
+            m.total += admitted + queued + rejected
+            m.current += inFlight + queued
+            m.failures += rejected
+        return metrics
+
+    def _failures(self, m):
+        return openModule('IceMX').MetricsFailures(m.id, { "rejected": m.failures })
+
+#
+# Provides the operation metrics (see getOperationMetrics) with the "Operation" view. The
+# "Marshal" and "Unmarshal" maps provide the number of requests and replies marshaled or
+# unmarshaled, the time spent and the size in bytes. The "Servant" map provides the number
+# of dispatches and the time spent in the servant.
+#
+class _OperationMetricsAdmin(object):
+    def getMetricsViewNames(self, current=None):
+        return (["Operation"], [])
+
+    def enableMetricsView(self, name, current=None):
+        self._checkView(name)
+
+    def disableMetricsView(self, name, current=None):
+        self._checkView(name)
+
+    def getMetricsView(self, view, current=None):
+        self._checkView(view)
+        IceMX = openModule('IceMX')
+        marshal = []
+        unmarshal = []
+        servant = []
+        for (name, m) in getOperationMetrics().items():
+            marshal.append(IceMX.DispatchMetrics(name, m["marshalCount"], 0, m["marshalTime"], 0, 0, m["bytesOut"]))
+            unmarshal.append(IceMX.DispatchMetrics(name, m["unmarshalCount"], 0, m["unmarshalTime"], 0, 0,
+                                                   m["bytesIn"]))
+            servant.append(IceMX.Metrics(name, m["servantCount"], 0, m["servantTime"], 0))
+        return ({ "Marshal": marshal, "Unmarshal": unmarshal, "Servant": servant }, int(time.time() * 1000))
+
+    def getMapMetricsFailures(self, view, map, current=None):
+        self._checkView(view)
+        return []
+
+    def getMetricsFailures(self, view, map, id, current=None):
+        self._checkView(view)
+        return openModule('IceMX').MetricsFailures(id, {})
+
+    def _checkView(self, name):
+        if name != "Operation":
+            raise openModule('IceMX').UnknownMetricsView()
+
 #
 # Application logger.
 #
@@ -1535,6 +2447,21 @@ value is an integer representing the exit status.
         if isinstance(getProcessLogger(), LoggerI):
             setProcessLogger(_ApplicationLoggerI(initData.properties.getProperty("Ice.ProgramName")))
 
+        #
+        # Start the worker processes if Ice.Python.Processes is set. This must
+        # be done before any thread is started.
+        #
+        processes = initData.properties.getPropertyAsInt("Ice.Python.Processes")
+        if processes > 1:
+            if not hasattr(os, "fork"):
+                getProcessLogger().warning("Ice.Python.Processes is not supported on this platform")
+            else:
+                try:
+                    Application._processGroup = _ProcessGroup(processes, initData.properties)
+                except:
+                    getProcessLogger().error(traceback.format_exc())
+                    return 1
+
         #
         # Install our handler for the signals we are interested in. We assume main()
         # is called from the main thread.
@@ -1570,18 +2497,32 @@ value is an integer representing the exit status.
             Application._ctrlCHandler.destroy()
             Application._ctrlCHandler = None
 
+        #
+        # Only the first process of a process group returns from main.
+        #
+        if Application._processGroup and Application._processGroup.index() > 0:
+            sys.exit(status)
+
         return status
 
     def doMain(self, args, initData):
         try:
             Application._communicator = initialize(args, initData)
             Application._destroyed = False
+            if Application._processGroup:
+                Application._processGroup.activate(Application._communicator)
             status = self.run(args)
 
         except:
             getProcessLogger().error(traceback.format_exc())
             status = 1
 
+        #
+        # Terminate the other processes of the process group, if any.
+        #
+        if Application._processGroup and Application._processGroup.destroy():
+            status = 1
+
         #
         # Don't want any new interrupt and at this point (post-run),
         # it would not make sense to release a held signal to run
@@ -1638,6 +2579,16 @@ the application.'''
         return self._communicator
     communicator = classmethod(communicator)
 
+    def processIndex(self):
+        '''Returns the index of this process in the process group
+started with Ice.Python.Processes. The first process has
+index 0, this is also the index returned if the application
+doesn't run as a process group.'''
+        if self._processGroup:
+            return self._processGroup.index()
+        return 0
+    processIndex = classmethod(processIndex)
+
     def destroyOnInterrupt(self):
         '''Configures the application to destroy its communicator
 when interrupted by a signal.'''
@@ -1845,6 +2796,7 @@ signal, or False otherwise.'''
     _communicator = None
     _application = None
     _ctrlCHandler = None
+    _processGroup = None
     _previousCallback = None
     _interrupted = False
     _released = False
@@ -0,0 +1,104 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, IceMX, Test, sys, time
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def waitPending(prx, n):
+    start = time.time()
+    while prx.pending() != n and time.time() - start < 10:
+        time.sleep(0.01)
+    test(prx.pending() == n)
+
+def getMetrics(admin):
+    view = admin.getMetricsView("Admission")[0]
+    return dict((m.id, m) for m in view["Operation"])
+
+def waitCurrent(admin, name, n):
+    start = time.time()
+    while getMetrics(admin)[name].current != n and time.time() - start < 10:
+        time.sleep(0.01)
+    test(getMetrics(admin)[name].current == n)
+
+def allTests(communicator):
+    prx = Test.TestIntfPrx.checkedCast(communicator.stringToProxy("test:default -p 12010"))
+    prx2 = Test.TestIntfPrx.checkedCast(communicator.stringToProxy("test:default -p 12011"))
+    admin = IceMX.MetricsAdminPrx.checkedCast(
+        communicator.stringToProxy("server/admin -f IcePy.Admission:default -p 12012"))
+    test(admin)
+
+    sys.stdout.write("testing operation concurrency limit... ")
+    sys.stdout.flush()
+    f1 = prx.limitedAsync()
+    waitPending(prx, 1)
+    try:
+        prx.limited()
+        test(False)
+    except Ice.UnknownLocalException as ex:
+        test("rejected" in ex.unknown)
+    f2 = prx.unlimitedAsync()
+    f3 = prx.unlimitedAsync()
+    waitPending(prx, 3)
+    prx.release()
+    f1.result()
+    f2.result()
+    f3.result()
+    print("ok")
+
+    sys.stdout.write("testing object adapter concurrency limit... ")
+    sys.stdout.flush()
+    f1 = prx2.limitedAsync()
+    waitPending(prx2, 1)
+    f2 = prx2.limitedAsync()
+    waitCurrent(admin, "limited", 2)
+    try:
+        prx2.limited()
+        test(False)
+    except Test.Overloaded:
+        pass
+    prx2.release()
+    f1.result()
+    waitPending(prx2, 1)
+    test(not f2.done())
+    prx2.release()
+    f2.result()
+
+    f1 = prx2.unlimitedAsync()
+    f2 = prx2.unlimitedAsync()
+    waitPending(prx2, 2)
+    test(getMetrics(admin)["unlimited"].current == 2)
+    prx2.release()
+    f1.result()
+    f2.result()
+    print("ok")
+
+    sys.stdout.write("testing admission facet... ")
+    sys.stdout.flush()
+    test(admin.getMetricsViewNames() == (["Admission"], []))
+    metrics = getMetrics(admin)
+    test(metrics["limited"].total == 5)
+    test(metrics["limited"].current == 0)
+    test(metrics["limited"].failures == 2)
+    test(metrics["unlimited"].total == 2)
+    test(metrics["unlimited"].failures == 0)
+    test(metrics["pending"].failures == 0) # The object adapter limit applies to all the operations.
+    failures = admin.getMapMetricsFailures("Admission", "Operation")
+    test(len(failures) == 1 and failures[0].id == "limited" and failures[0].failures["rejected"] == 2)
+    test(admin.getMetricsFailures("Admission", "Operation", "limited").failures["rejected"] == 2)
+    try:
+        admin.getMetricsView("Bogus")
+        test(False)
+    except IceMX.UnknownMetricsView:
+        pass
+    print("ok")
+
+    prx.shutdown()
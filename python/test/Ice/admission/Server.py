@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+
+import os, sys, traceback
+import Ice
+
+Ice.loadSlice('Test.ice')
+import Test, TestI
+
+def run(args, communicator):
+    properties = communicator.getProperties()
+    properties.setProperty("TestAdapter.Endpoints", "default -p 12010")
+    adapter = communicator.createObjectAdapter("TestAdapter")
+    adapter.add(TestI.TestIntfI(), Ice.stringToIdentity("test"))
+    adapter.activate()
+
+    properties.setProperty("TestAdapter2.Endpoints", "default -p 12011")
+    properties.setProperty("TestAdapter2.Python.MaxConcurrency", "2")
+    properties.setProperty("TestAdapter2.Python.MaxQueued", "1")
+    properties.setProperty("TestAdapter2.Python.RejectException", "::Test::Overloaded")
+    #
+    # A single thread, since the queued dispatches must not block a thread of the pool.
+    #
+    properties.setProperty("TestAdapter2.ThreadPool.Size", "1")
+    adapter2 = communicator.createObjectAdapter("TestAdapter2")
+    adapter2.add(TestI.TestIntfI(), Ice.stringToIdentity("test"))
+    adapter2.activate()
+
+    communicator.waitForShutdown()
+    return True
+
+try:
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties(sys.argv)
+    initData.properties.setProperty("Ice.Admin.Endpoints", "default -p 12012")
+    initData.properties.setProperty("Ice.Admin.InstanceName", "server")
+    initData.properties.setProperty("Ice.Python.AdmissionFacet", "1")
+    initData.properties.setProperty("Ice.Warn.Dispatch", "0")
+    with Ice.initialize(sys.argv, initData) as communicator:
+         status = run(sys.argv, communicator)
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
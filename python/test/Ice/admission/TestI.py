@@ -0,0 +1,42 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+
+import Ice, Test, threading
+
+class TestIntfI(Test.TestIntf):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures = []
+
+    def limited(self, current=None):
+        return self._hold()
+
+    def unlimited(self, current=None):
+        return self._hold()
+
+    def pending(self, current=None):
+        with self._lock:
+            return len(self._futures)
+
+    def release(self, current=None):
+        with self._lock:
+            futures = self._futures
+            self._futures = []
+        for f in futures:
+            f.set_result(None)
+
+    def shutdown(self, current=None):
+        current.adapter.getCommunicator().shutdown()
+
+    def _hold(self):
+        f = Ice.Future()
+        with self._lock:
+            self._futures.append(f)
+        return f
@@ -102,6 +102,32 @@ def allTests(communicator):
     s.s4 = stringList;
     custom.sendS(s)
 
+    #
+    # A sequence<byte> result can be provided by the servant in chunks.
+    #
+    expected = bytes(bytearray(i % 256 for i in range(0, 100000)))
+    for (size, chunkSize) in [(0, 10), (5, 2), (254, 127), (255, 100), (100000, 4096)]:
+        (r, b2) = custom.opByteStringChunks(size, chunkSize, False)
+        test(r == expected[:size])
+        test(b2 == expected[:size])
+        if sys.version_info[:2] >= (3, 6):
+            (r, b2) = custom.opByteStringChunks(size, chunkSize, True)
+            test(r == expected[:size])
+            test(b2 == expected[:size])
+
+    #
+    # The last out parameter can be provided in chunks without a return value, the
+    # other results can't.
+    #
+    (b1, b2) = custom.opByteStringChunksOut(1000, False)
+    test(b1 == expected[:1000])
+    test(b2 == expected[:1000])
+    try:
+        custom.opByteStringChunksOut(1000, True)
+        test(False)
+    except Ice.UnknownLocalException:
+        pass
+
     c = Test.C()
     c.b1 = byteList;
     c.b2 = byteList;
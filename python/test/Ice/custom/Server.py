@@ -14,6 +14,9 @@ import Ice
 Ice.loadSlice('Test.ice')
 import Test
 
+if sys.version_info[:2] >= (3, 6):
+    from TestAsyncGenI import generateChunksAsync
+
 def test(b):
     if not b:
         raise RuntimeError('test assertion failed')
@@ -54,6 +57,22 @@ class CustomI(Test.Custom):
         test(isinstance(s1, list))
         return (s1, s1)
 
+    def opByteStringChunks(self, size, chunkSize, asyncGenerator, current=None):
+        def generateChunks():
+            for i in range(0, size, chunkSize):
+                yield bytearray(j % 256 for j in range(i, min(i + chunkSize, size)))
+        # Only the return value, which is marshaled last, can be supplied in chunks.
+        b = bytes(bytearray(i % 256 for i in range(0, size)))
+        if asyncGenerator:
+            return (generateChunksAsync(size, chunkSize), b)
+        return (generateChunks(), b)
+
+    def opByteStringChunksOut(self, size, chunkFirst, current=None):
+        b = bytes(bytearray(i % 256 for i in range(0, size)))
+        if chunkFirst:
+            return (iter([b]), b)
+        return (b, iter([b[:size // 2], b[size // 2:]]))
+
     def sendS(self, val, current=None):
         if sys.version_info[0] == 2:
             test(isinstance(val.b1, str))
@@ -0,0 +1,22 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+#
+# Asynchronous generators require Python >= 3.6.
+#
+
+import Ice, threading
+
+async def generateChunksAsync(size, chunkSize):
+    for i in range(0, size, chunkSize):
+        # Resume the generator from another thread before each chunk.
+        f = Ice.Future()
+        threading.Thread(target=lambda: f.set_result(None)).start()
+        await f
+        yield bytearray(j % 256 for j in range(i, min(i + chunkSize, size)))
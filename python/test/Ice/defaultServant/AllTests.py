@@ -124,3 +124,45 @@ def allTests(communicator):
         test(prx.getName() == names[idx])
 
     print("ok")
+
+    oa.removeDefaultServant("")
+
+    sys.stdout.write("testing identity servant... ")
+    sys.stdout.flush()
+
+    servant = MyObjectI.MyObjectIdentityI()
+    oa.addDefaultIdentityServant(servant, "foo")
+    oa.addDefaultIdentityServant(servant, "future")
+
+    test(oa.findDefaultServant("foo") == servant)
+
+    for category in ("foo", "future"):
+        identity.category = category
+        for idx in range(0, 5):
+            identity.name = names[idx]
+            prx = Test.MyObjectPrx.uncheckedCast(oa.createProxy(identity))
+            prx.ice_ping()
+            test(prx.ice_isA(Test.MyObject.ice_staticId()))
+            test(prx.getName() == names[idx])
+
+    identity.category = "foo"
+    identity.name = "ObjectNotExist"
+    prx = Test.MyObjectPrx.uncheckedCast(oa.createProxy(identity))
+    try:
+        prx.getName()
+        test(False)
+    except Ice.ObjectNotExistException:
+        # Expected
+        pass
+
+    try:
+        oa.addDefaultIdentityServant(Ice.Blobject(), "bar")
+        test(False)
+    except ValueError:
+        # Expected
+        pass
+
+    test(oa.removeDefaultServant("foo") == servant)
+    test(oa.removeDefaultServant("future") == servant)
+
+    print("ok")
@@ -27,3 +27,14 @@ class MyObjectI(Test.MyObject):
             raise Ice.FacetNotExistException()
 
         return name
+
+class MyObjectIdentityI(Test.MyObject):
+    def getName(self, name, category):
+        if name == "ObjectNotExist":
+            raise Ice.ObjectNotExistException()
+        elif name == "FacetNotExist":
+            raise Ice.FacetNotExistException()
+
+        if category == "future":
+            return Ice.Future.completed(name)
+        return name
@@ -7,7 +7,7 @@
 #
 # **********************************************************************
 
-import Ice, Test, sys, threading
+import Ice, Test, sys, os, stat, threading
 
 def test(b):
     if not b:
@@ -192,6 +192,113 @@ def allTests(communicator):
 
     print("ok")
 
+    if sys.platform != "win32":
+        sys.stdout.write("testing shared memory endpoint and connection information... ")
+        sys.stdout.flush()
+
+        p1 = communicator.stringToProxy("test:shm -name \"info test\" -t 1200 -z")
+        info = p1.ice_getEndpoints()[0].getInfo()
+        test(isinstance(info, Ice.SHMEndpointInfo))
+        test(info.type() == Ice.SHMEndpointType)
+        test(info.name == "info test")
+        test(info.timeout == 1200)
+        test(info.compress)
+        test(not info.datagram())
+        test(not info.secure())
+        test(communicator.stringToProxy(communicator.proxyToString(p1)) == p1)
+
+        #
+        # The name of an unmarshaled endpoint can't refer to another directory.
+        #
+        try:
+            communicator.stringToProxy("test:opaque -t 10 -e 1.1 -v DS4uL3J1bi9zb2NrZXT/////AA==")
+            test(False)
+        except Ice.MarshalException:
+            pass
+
+        communicator.getProperties().setProperty("ShmAdapter.Endpoints", "shm -name info")
+        adapter = communicator.createObjectAdapter("ShmAdapter")
+        adapter.add(Test.TestIntf(), Ice.stringToIdentity("test"))
+        adapter.activate()
+
+        endpoints = adapter.getEndpoints()
+        test(len(endpoints) == 1)
+        test(endpoints[0].getInfo().name == "info")
+
+        p1 = adapter.createProxy(Ice.stringToIdentity("test")).ice_collocationOptimized(False)
+        p1.ice_ping()
+        connection = p1.ice_getConnection()
+        test(connection.type() == "shm")
+        info = connection.getInfo()
+        test(isinstance(info, Ice.SHMConnectionInfo))
+        test(not info.incoming)
+        test(info.rcvSize > 0)
+        test(info.sndSize > 0)
+        test(isinstance(connection.getEndpoint().getInfo(), Ice.SHMEndpointInfo))
+
+        connection.close(Ice.ConnectionClose.GracefullyWithWait)
+        adapter.destroy()
+
+        print("ok")
+
+        sys.stdout.write("testing Unix domain socket endpoint and connection information... ")
+        sys.stdout.flush()
+
+        p1 = communicator.stringToProxy("test:unix -p \"/tmp/info test.sock\" -t 1200 -z --mode 0600")
+        info = p1.ice_getEndpoints()[0].getInfo()
+        test(isinstance(info, Ice.UnixEndpointInfo))
+        test(info.type() == Ice.UnixEndpointType)
+        test(info.path == "/tmp/info test.sock")
+        test(info.timeout == 1200)
+        test(info.compress)
+        test(not info.datagram())
+        test(not info.secure())
+        test(communicator.stringToProxy(communicator.proxyToString(p1)) == p1)
+
+        #
+        # The mode isn't marshaled, so it doesn't distinguish the endpoints.
+        #
+        p2 = communicator.stringToProxy("test:unix -p \"/tmp/info test.sock\" -t 1200 -z")
+        test(p2 == p1 and hash(p2) == hash(p1))
+        test(p2.ice_getEndpoints()[0] == p1.ice_getEndpoints()[0])
+
+        try:
+            communicator.stringToProxy("test:unix -p /tmp/info.sock --mode 999")
+            test(False)
+        except Ice.EndpointParseException:
+            pass
+
+        path = "/tmp/ice-info-test-{0}.sock".format(os.getpid())
+        communicator.getProperties().setProperty("UnixAdapter.Endpoints", "unix -p " + path + " --mode 0600")
+        adapter = communicator.createObjectAdapter("UnixAdapter")
+        adapter.add(Test.TestIntf(), Ice.stringToIdentity("test"))
+        adapter.activate()
+
+        test(stat.S_ISSOCK(os.stat(path).st_mode))
+        test(stat.S_IMODE(os.stat(path).st_mode) == 0o600)
+
+        endpoints = adapter.getEndpoints()
+        test(len(endpoints) == 1)
+        test(endpoints[0].getInfo().path == path)
+
+        p1 = adapter.createProxy(Ice.stringToIdentity("test")).ice_collocationOptimized(False)
+        p1.ice_ping()
+        connection = p1.ice_getConnection()
+        test(connection.type() == "unix")
+        info = connection.getInfo()
+        test(isinstance(info, Ice.UnixConnectionInfo))
+        test(not info.incoming)
+        test(info.path == path)
+        test(info.rcvSize > 0)
+        test(info.sndSize > 0)
+        test(isinstance(connection.getEndpoint().getInfo(), Ice.UnixEndpointInfo))
+
+        connection.close(Ice.ConnectionClose.GracefullyWithWait)
+        adapter.destroy()
+        test(not os.path.exists(path))
+
+        print("ok")
+
     testIntf.shutdown()
 
     communicator.shutdown()
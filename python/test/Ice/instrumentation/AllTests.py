@@ -0,0 +1,129 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, IceMX, Test, TestI, sys
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def createCommunicator(communicator, sampleRate=None):
+    initData = Ice.InitializationData()
+    initData.properties = communicator.getProperties().clone()
+    if sampleRate is not None:
+        initData.properties.setProperty("Ice.Python.Observer.SampleRate", str(sampleRate))
+    initData.observer = TestI.CommunicatorObserverI()
+    return (Ice.initialize(initData), initData.observer)
+
+def allTests(communicator, args):
+    ref = "test:default -p 12010"
+
+    sys.stdout.write("testing invocation observers... ")
+    sys.stdout.flush()
+    (c, observer) = createCommunicator(communicator, 1)
+    test(observer.updater is not None)
+    prx = Test.TestIntfPrx.uncheckedCast(c.stringToProxy(ref))
+    for i in range(10):
+        prx.op()
+    try:
+        prx.opWithUserException()
+        test(False)
+    except Test.UserEx:
+        pass
+
+    test(len(observer.invocationObservers) == 11)
+    test(observer.operations[0] == ("test", "op"))
+    test(observer.operations[-1] == ("test", "opWithUserException"))
+    for o in observer.invocationObservers:
+        test(o.total == 1 and o.current == 0)
+    test(observer.invocationObservers[-1].userExceptions == 1)
+
+    metrics = observer.updater.getMetrics()
+    op = metrics["Invocation"]["op"]
+    test(op["total"] == 10 and op["current"] == 0 and op["failures"] == 0)
+    test(op["sentBytes"] > 0 and op["receivedBytes"] > 0)
+    test(metrics["Invocation"]["opWithUserException"]["userExceptions"] == 1)
+    print("ok")
+
+    sys.stdout.write("testing connection observers... ")
+    sys.stdout.flush()
+    test(len(observer.connectionObservers) == 1)
+    connection = observer.connectionObservers[0]
+    test(connection.total == 1 and connection.current == 1)
+    test(connection.sent > 0 and connection.received > 0)
+    (name, counters) = list(metrics["Connection"].items())[0]
+    test(counters["total"] == 1 and counters["current"] == 1)
+    test(counters["sentBytes"] == connection.sent)
+    observer.updater.updateConnectionObservers()
+    observer.updater.updateThreadObservers()
+    c.destroy()
+    test(connection.current == 0)
+    print("ok")
+
+    sys.stdout.write("testing observer sampling... ")
+    sys.stdout.flush()
+    #
+    # The Python observer isn't called by default.
+    #
+    (c, observer) = createCommunicator(communicator)
+    prx = Test.TestIntfPrx.uncheckedCast(c.stringToProxy(ref))
+    for i in range(10):
+        prx.op()
+    test(observer.getObserverCount() == 0)
+    test(observer.updater.getMetrics()["Invocation"]["op"]["total"] == 10)
+    c.destroy()
+
+    (c, observer) = createCommunicator(communicator, 3)
+    prx = Test.TestIntfPrx.uncheckedCast(c.stringToProxy(ref))
+    for i in range(9):
+        prx.op()
+    test(len(observer.invocationObservers) == 3)
+    test(observer.updater.getMetrics()["Invocation"]["op"]["total"] == 9)
+    c.destroy()
+    print("ok")
+
+    sys.stdout.write("testing dispatch metrics... ")
+    sys.stdout.flush()
+    prx = Test.TestIntfPrx.uncheckedCast(communicator.stringToProxy(ref))
+    test(prx.getDispatchTotal("op") == 29)
+    test(prx.getObserverCount() == 0)
+    print("ok")
+
+    sys.stdout.write("testing operation metrics... ")
+    sys.stdout.flush()
+    test("opString" not in Ice.getOperationMetrics())
+    Ice.enableOperationMetrics()
+    for i in range(5):
+        test(prx.opString("hello") == "hello")
+    Ice.enableOperationMetrics(False)
+    prx.opString("hello")
+    m = Ice.getOperationMetrics()["opString"]
+    test(m["calls"] == 5 and m["marshalCount"] == 5 and m["unmarshalCount"] == 5)
+    test(m["bytesOut"] > 5 * len("hello") and m["bytesIn"] > 5 * len("hello"))
+    test(m["marshalTime"] >= 0 and m["unmarshalTime"] >= 0 and m["servantCount"] == 0)
+
+    admin = IceMX.MetricsAdminPrx.checkedCast(
+        communicator.stringToProxy("server/admin -f IcePy.Metrics:default -p 12011"))
+    test(admin.getMetricsViewNames()[0] == ["Operation"])
+    view = admin.getMetricsView("Operation")[0]
+    unmarshal = dict((x.id, x) for x in view["Unmarshal"])
+    marshal = dict((x.id, x) for x in view["Marshal"])
+    servant = dict((x.id, x) for x in view["Servant"])
+    test(unmarshal["opString"].total == 6 and unmarshal["opString"].size == m["bytesOut"] * 6 // 5)
+    test(marshal["opString"].total == 6 and marshal["opString"].size == m["bytesIn"] * 6 // 5)
+    test(servant["opString"].total == 6)
+    test(servant["getMetricsViewNames"].total == 1)
+    try:
+        admin.getMetricsView("Unknown")
+        test(False)
+    except IceMX.UnknownMetricsView:
+        pass
+    print("ok")
+
+    prx.shutdown()
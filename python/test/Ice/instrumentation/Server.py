@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback
+import Ice
+
+Ice.loadSlice('Test.ice')
+import Test, TestI
+
+def run(args, communicator, observer):
+    communicator.getProperties().setProperty("TestAdapter.Endpoints", "default -p 12010")
+    adapter = communicator.createObjectAdapter("TestAdapter")
+    adapter.add(TestI.TestIntfI(observer), Ice.stringToIdentity("test"))
+    adapter.activate()
+    communicator.waitForShutdown()
+    return True
+
+try:
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties(sys.argv)
+    initData.properties.setProperty("Ice.Admin.Endpoints", "default -p 12011")
+    initData.properties.setProperty("Ice.Admin.InstanceName", "server")
+    initData.properties.setProperty("Ice.Admin.Facets", "IcePy.Metrics")
+    initData.properties.setProperty("Ice.Python.MetricsFacet", "1")
+    initData.observer = TestI.CommunicatorObserverI()
+    with Ice.initialize(sys.argv, initData) as communicator:
+         status = run(sys.argv, communicator, initData.observer)
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
@@ -0,0 +1,135 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, Test, threading
+
+class ObserverI(Ice.Instrumentation.Observer):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.total = 0
+        self.current = 0
+        self.failed = 0
+
+    def attach(self):
+        with self._lock:
+            self.total += 1
+            self.current += 1
+
+    def detach(self):
+        with self._lock:
+            self.current -= 1
+
+    def failed(self, exceptionName):
+        with self._lock:
+            self.failed += 1
+
+class InvocationObserverI(ObserverI, Ice.Instrumentation.InvocationObserver):
+    def __init__(self):
+        ObserverI.__init__(self)
+        self.userExceptions = 0
+        self.retries = 0
+
+    def retried(self):
+        with self._lock:
+            self.retries += 1
+
+    def userException(self):
+        with self._lock:
+            self.userExceptions += 1
+
+class DispatchObserverI(ObserverI, Ice.Instrumentation.DispatchObserver):
+    def __init__(self):
+        ObserverI.__init__(self)
+        self.replySize = 0
+
+    def userException(self):
+        pass
+
+    def reply(self, size):
+        with self._lock:
+            self.replySize += size
+
+class ConnectionObserverI(ObserverI, Ice.Instrumentation.ConnectionObserver):
+    def __init__(self):
+        ObserverI.__init__(self)
+        self.sent = 0
+        self.received = 0
+
+    def sentBytes(self, num):
+        with self._lock:
+            self.sent += num
+
+    def receivedBytes(self, num):
+        with self._lock:
+            self.received += num
+
+class CommunicatorObserverI(Ice.Instrumentation.CommunicatorObserver):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.updater = None
+        self.invocationObservers = []
+        self.dispatchObservers = []
+        self.connectionObservers = []
+        self.operations = []
+
+    def getConnectionEstablishmentObserver(self, endpoint, connector):
+        return None
+
+    def getEndpointLookupObserver(self, endpoint):
+        return None
+
+    def getConnectionObserver(self, info, endpoint, state, observer):
+        if observer:
+            return observer
+        with self._lock:
+            self.connectionObservers.append(ConnectionObserverI())
+            return self.connectionObservers[-1]
+
+    def getThreadObserver(self, parent, id, state, observer):
+        return None
+
+    def getInvocationObserver(self, prx, operation, ctx):
+        with self._lock:
+            self.operations.append((prx.ice_getIdentity().name, operation))
+            self.invocationObservers.append(InvocationObserverI())
+            return self.invocationObservers[-1]
+
+    def getDispatchObserver(self, current, size):
+        with self._lock:
+            self.dispatchObservers.append(DispatchObserverI())
+            return self.dispatchObservers[-1]
+
+    def setObserverUpdater(self, updater):
+        self.updater = updater
+
+    def getObserverCount(self):
+        with self._lock:
+            return len(self.invocationObservers) + len(self.dispatchObservers) + len(self.connectionObservers)
+
+class TestIntfI(Test.TestIntf):
+    def __init__(self, observer):
+        self._observer = observer
+
+    def op(self, current=None):
+        pass
+
+    def opString(self, s, current=None):
+        return s
+
+    def opWithUserException(self, current=None):
+        raise Test.UserEx()
+
+    def getDispatchTotal(self, operation, current=None):
+        return self._observer.updater.getMetrics()["Dispatch"][operation]["total"]
+
+    def getObserverCount(self, current=None):
+        return self._observer.getObserverCount()
+
+    def shutdown(self, current=None):
+        current.adapter.getCommunicator().shutdown()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback
+
+for toplevel in [".", "..", "../..", "../../..", "../../../.."]:
+    toplevel = os.path.normpath(toplevel)
+    if os.path.exists(os.path.join(toplevel, "python", "Ice", "__init__.py")):
+        break
+else:
+    raise RuntimeError("can't find toplevel directory!")
+
+import Ice
+
+status = True
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def loaded(name):
+    return name in sys.modules
+
+try:
+    sys.stdout.write("testing lazy import of generated modules... ")
+    sys.stdout.flush()
+
+    if sys.version_info[:2] >= (3, 7):
+        test(not loaded("Ice.RemoteLogger_ice"))
+        test(not loaded("Ice.Instrumentation_ice"))
+        test(not loaded("Ice.Metrics_ice"))
+
+        test(Ice.Instrumentation.ConnectionState.ConnectionStateActive.value == 2)
+        test(loaded("Ice.Instrumentation_ice"))
+
+        test(Ice.LogMessageType.ErrorMessage.value == 3)
+        test(issubclass(Ice.RemoteLoggerPrx, Ice.ObjectPrx))
+        test(loaded("Ice.RemoteLogger_ice"))
+
+        try:
+            Ice.NotDefined
+            test(False)
+        except AttributeError:
+            pass
+        test(not hasattr(Ice.Instrumentation, "NotDefined"))
+
+        test(not loaded("Ice.Metrics_ice"))
+        import IceMX
+        test(loaded("Ice.Metrics_ice"))
+        test(issubclass(IceMX.MetricsAdminPrx, Ice.ObjectPrx))
+
+    #
+    # The metrics admin facets of IcePy import Ice.Metrics_ice when created.
+    #
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties()
+    initData.properties.setProperty("Ice.Admin.Enabled", "1")
+    initData.properties.setProperty("Ice.Admin.Endpoints", "tcp -h 127.0.0.1")
+    initData.properties.setProperty("Ice.Admin.InstanceName", "client")
+    initData.properties.setProperty("Ice.Python.MetricsFacet", "1")
+    with Ice.initialize(initData) as communicator:
+        admin = communicator.getAdmin()
+        import IceMX
+        metrics = IceMX.MetricsAdminPrx.checkedCast(admin, "IcePy.Metrics")
+        test(metrics.getMetricsViewNames()[0] == ["Operation"])
+        test(isinstance(communicator.findAdminFacet("IcePy.Metrics"), IceMX.MetricsAdmin))
+
+    print("ok")
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
@@ -7,7 +7,7 @@
 #
 # **********************************************************************
 
-import Ice, Test, sys
+import Ice, Test, os, sys, tempfile
 
 class HelloI(Test.Hello):
     def sayHello(self, current=None):
@@ -196,6 +196,106 @@ def allTests(communicator, ref):
     hello.sayHello()
     print("ok")
 
+    sys.stdout.write("testing prewarm... ")
+    sys.stdout.flush()
+    test(communicator.prewarm([]).result() == [])
+
+    #
+    # Use a new communicator to start with an empty locator cache.
+    #
+    initData = Ice.InitializationData()
+    initData.properties = communicator.getProperties().clone()
+    ic = Ice.initialize(initData)
+    testLocator = Test.TestLocatorPrx.uncheckedCast(ic.getDefaultLocator())
+    count = testLocator.getRequestCount()
+    proxies = [ic.stringToProxy("test@TestAdapter"), ic.stringToProxy("test"), ic.stringToProxy("hello"),
+               ic.stringToProxy("test@TestAdapter").ice_connectionId("prewarm")]
+    connections = ic.prewarm(proxies, parallelism=2).result()
+    test(len(connections) == 4)
+    for i in range(0, 4):
+        test(connections[i] is not None and proxies[i].ice_getCachedConnection() == connections[i])
+    test(connections[0] != connections[3])
+    test(testLocator.getRequestCount() > count)
+
+    count = testLocator.getRequestCount()
+    ic.stringToProxy("test@TestAdapter").ice_ping()
+    ic.stringToProxy("hello").ice_ping()
+    test(testLocator.getRequestCount() == count)
+
+    proxies = [ic.stringToProxy("test@TestAdapterUnknown"), ic.stringToProxy("test2")]
+    try:
+        ic.prewarm(proxies).result()
+        test(False)
+    except Ice.NotRegisteredException:
+        pass
+    test(proxies[1].ice_getCachedConnection() is not None)
+    ic.destroy()
+    print("ok")
+
+    sys.stdout.write("testing locator cache... ")
+    sys.stdout.flush()
+    ic = Ice.initialize(initData)
+    cache = Ice.LocatorCache(ic)
+    ic.setDefaultLocator(cache.getLocator())
+    testLocator = Test.TestLocatorPrx.uncheckedCast(locator)
+    count = testLocator.getRequestCount()
+    adapterIds = ["TestAdapter", "ReplicatedAdapter", "TestAdapterUnknown"]
+    test(cache.resolve(adapterIds, [Ice.stringToIdentity("hello")]).result() == 3)
+    test(testLocator.getRequestCount() == count + 4)
+    test(sorted(cache.getAdapterEntries().keys()) == ["ReplicatedAdapter", "TestAdapter"])
+    test(list(cache.getObjectEntries().keys()) == [Ice.stringToIdentity("hello")])
+    ic.stringToProxy("test@TestAdapter").ice_ping()
+    ic.stringToProxy("hello").ice_ping()
+    test(testLocator.getRequestCount() == count + 4)
+
+    #
+    # The well-known objects resolved by the Ice run time are also cached.
+    #
+    ic.stringToProxy("test").ice_ping()
+    test(testLocator.getRequestCount() == count + 5)
+    test(len(cache.getObjectEntries()) == 2)
+
+    fd, path = tempfile.mkstemp(suffix=".cache")
+    os.close(fd)
+    try:
+        cache.save(path)
+        entries = cache.getAdapterEntries()
+        ic.destroy()
+
+        ic = Ice.initialize(initData)
+        cache = Ice.LocatorCache(ic)
+        test(cache.load(path) == 4)
+        test(cache.load(path) == 0)
+        test(cache.getAdapterEntries()["TestAdapter"][1] == entries["TestAdapter"][1])
+        test(str(cache.getAdapterEntries()["TestAdapter"][0]) == str(entries["TestAdapter"][0]))
+        ic.setDefaultLocator(cache.getLocator())
+        ic.stringToProxy("test@TestAdapter").ice_ping()
+        ic.stringToProxy("test").ice_ping()
+        ic.stringToProxy("hello").ice_ping()
+        test(testLocator.getRequestCount() == count + 5)
+        try:
+            ic.stringToProxy("test@TestAdapterUnknown").ice_ping()
+            test(False)
+        except Ice.NotRegisteredException:
+            pass
+        test(testLocator.getRequestCount() == count + 7)
+        ic.destroy()
+
+        #
+        # The expired entries are resolved again.
+        #
+        ic = Ice.initialize(initData)
+        cache = Ice.LocatorCache(ic, timeout=0)
+        test(cache.load(path) == 4)
+        ic.setDefaultLocator(cache.getLocator())
+        ic.stringToProxy("test@TestAdapter").ice_ping()
+        test(testLocator.getRequestCount() == count + 8)
+        test(cache.getAdapterEntries()["TestAdapter"][1] > entries["TestAdapter"][1])
+        ic.destroy()
+    finally:
+        os.remove(path)
+    print("ok")
+
     sys.stdout.write("testing object migration... ")
     sys.stdout.flush()
     hello = Test.HelloPrx.checkedCast(communicator.stringToProxy("hello"))
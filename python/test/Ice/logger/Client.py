@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback, threading
+
+for toplevel in [".", "..", "../..", "../../..", "../../../.."]:
+    toplevel = os.path.normpath(toplevel)
+    if os.path.exists(os.path.join(toplevel, "python", "Ice", "__init__.py")):
+        break
+else:
+    raise RuntimeError("can't find toplevel directory!")
+
+import Ice
+
+status = True
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+class LoggerI(Ice.Logger):
+    def __init__(self, prefix="", blocked=None):
+        self._prefix = prefix
+        self._blocked = blocked
+        self.messages = []
+        self.threads = set()
+
+    def _print(self, message):
+        self.add(message)
+
+    def trace(self, category, message):
+        self.add(category + ": " + message)
+
+    def warning(self, message):
+        self.add("warning: " + message)
+
+    def error(self, message):
+        self.add("error: " + message)
+
+    def getPrefix(self):
+        return self._prefix
+
+    def cloneWithPrefix(self, prefix):
+        return LoggerI(prefix)
+
+    def add(self, message):
+        if self._blocked:
+            self._blocked.wait()
+        self.threads.add(threading.current_thread())
+        self.messages.append(message)
+
+def createCommunicator(logger, queueSize=None):
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties()
+    initData.properties.setProperty("Ice.Python.AsyncLogger", "1")
+    if queueSize:
+        initData.properties.setProperty("Ice.Python.AsyncLogger.QueueSize", str(queueSize))
+    initData.properties.setProperty("Ice.Trace.Network", "3")
+    initData.properties.setProperty("Ice.Default.Host", "127.0.0.1")
+    initData.logger = logger
+    return Ice.initialize(initData)
+
+def createAdapters(communicator, count):
+    for i in range(0, count):
+        adapter = communicator.createObjectAdapterWithEndpoints("Adapter%d" % i, "tcp")
+        adapter.destroy()
+
+try:
+    sys.stdout.write("testing asynchronous logger... ")
+    sys.stdout.flush()
+
+    logger = LoggerI()
+    communicator = createCommunicator(logger)
+    test(communicator.getLogger() is logger)
+    createAdapters(communicator, 1)
+    communicator.destroy()
+    test(len([m for m in logger.messages if m.startswith("Network: ")]) > 0)
+    test(threading.current_thread() not in logger.threads)
+
+    #
+    # Messages logged after the communicator is destroyed are delivered synchronously.
+    #
+    communicator.getLogger().warning("after destroy")
+    test(logger.messages[-1] == "warning: after destroy")
+    print("ok")
+
+    sys.stdout.write("testing dropped messages... ")
+    sys.stdout.flush()
+
+    blocked = threading.Event()
+    logger = LoggerI(blocked=blocked)
+    communicator = createCommunicator(logger, queueSize=1)
+    createAdapters(communicator, 3)
+    blocked.set()
+    communicator.destroy()
+    test(len(logger.messages) >= 2)
+    test(len([m for m in logger.messages if m.startswith("warning: ") and "dropped" in m]) > 0)
+    print("ok")
+
+    sys.stdout.write("testing asynchronous process logger... ")
+    sys.stdout.flush()
+
+    logger = LoggerI()
+    Ice.setProcessLogger(logger)
+    communicator = createCommunicator(None)
+    createAdapters(communicator, 1)
+    communicator.destroy()
+    test(len([m for m in logger.messages if m.startswith("Network: ")]) > 0)
+    test(threading.current_thread() not in logger.threads)
+    print("ok")
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
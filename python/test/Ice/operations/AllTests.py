@@ -8,7 +8,7 @@
 # **********************************************************************
 
 import Ice, Test, Twoways, TwowaysFuture, TwowaysAMI, Oneways, OnewaysFuture, OnewaysAMI, BatchOneways, sys
-import BatchOnewaysAMI, BatchOnewaysFuture
+import BatchOnewaysAMI, BatchOnewaysFuture, LazyOperations
 
 def test(b):
     if not b:
@@ -27,6 +27,11 @@ def allTests(communicator):
     derived.opDerived()
     print("ok")
 
+    sys.stdout.write("testing lazy creation of operations... ")
+    sys.stdout.flush()
+    LazyOperations.lazyOperations(cl)
+    print("ok")
+
     sys.stdout.write("testing oneway operations... ")
     sys.stdout.flush()
     Oneways.oneways(communicator, cl)
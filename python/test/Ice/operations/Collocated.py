@@ -19,6 +19,49 @@ if not slice_dir:
 Ice.loadSlice('"-I' + slice_dir + '" Test.ice')
 import Test, TestI, AllTests
 
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+class RequestIdI(TestI.MyDerivedClassI):
+    def __init__(self):
+        TestI.MyDerivedClassI.__init__(self)
+        self.requestId = None
+
+    def opVoid(self, current=None):
+        self.requestId = current.requestId
+
+def testCollocation(communicator, adapter):
+    #
+    # With Ice.Python.Collocation set to Copy or Share, the invocations skip the Ice
+    # dispatch (and Current.requestId is -1) unless the adapter is held or deactivated,
+    # or the communicator has a dispatcher.
+    #
+    sys.stdout.write("testing collocation mode... ")
+    sys.stdout.flush()
+    fast = communicator.getProperties().getProperty("Ice.Python.Collocation") in ("Copy", "Share")
+    servant = RequestIdI()
+    prx = Test.MyClassPrx.uncheckedCast(adapter.add(servant, Ice.stringToIdentity("requestId")))
+    prx.opVoid()
+    test((servant.requestId == -1) == fast)
+    adapter.hold()
+    prx.opVoid()
+    test(servant.requestId != -1)
+    adapter.activate()
+    prx.opVoid()
+    test((servant.requestId == -1) == fast)
+    adapter.remove(Ice.stringToIdentity("requestId"))
+
+    initData = Ice.InitializationData()
+    initData.properties = communicator.getProperties().clone()
+    initData.dispatcher = lambda call, con: call()
+    with Ice.initialize(initData) as ic:
+        a = ic.createObjectAdapter("")
+        prx = Test.MyClassPrx.uncheckedCast(a.addWithUUID(servant))
+        prx.opVoid()
+        test(servant.requestId != -1)
+    print("ok")
+
 def run(args, communicator):
     communicator.getProperties().setProperty("TestAdapter.Endpoints", "default -p 12010")
     adapter = communicator.createObjectAdapter("TestAdapter")
@@ -28,6 +71,8 @@ def run(args, communicator):
     if prx.ice_getConnection():
         raise RuntimeError("collocation doesn't work")
 
+    testCollocation(communicator, adapter)
+
     cl = AllTests.allTests(communicator)
 
     return True
@@ -0,0 +1,56 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, IcePy, Test, threading, time
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def lazyOperations(p):
+    #
+    # Operations are created from their descriptor on first use. The operations are invoked
+    # directly rather than installed on Test.MyClass, which is shared with the other tests.
+    #
+    # The descriptor of older generated code doesn't use a function.
+    #
+    opByte = IcePy.Operation('opByte', Ice.OperationMode.Normal, Ice.OperationMode.Normal, False, None, (),
+                             (((), IcePy._t_byte, False, 0), ((), IcePy._t_byte, False, 0)),
+                             (((), IcePy._t_byte, False, 0),), ((), IcePy._t_byte, False, 0), ())
+    test(opByte.invoke(p, ((0xff, 0x0f), None)) == (0xff, 0xf0))
+
+    #
+    # A deprecation set before the operation is created.
+    #
+    opVoid = IcePy.Operation('opVoid', Ice.OperationMode.Normal, Ice.OperationMode.Normal, False, None, (),
+                             lambda: ((), (), None, ()))
+    opVoid.deprecate("opVoid is deprecated")
+    opVoid.invoke(p, ((), None))
+    opVoid.deprecate("")
+    opVoid.invoke(p, ((), None))
+
+    #
+    # The concurrent creation of an operation.
+    #
+    def params():
+        time.sleep(0.01) # Let other threads create the operation concurrently.
+        return ((), (), None, ())
+    opVoid = IcePy.Operation('opVoid', Ice.OperationMode.Normal, Ice.OperationMode.Normal, False, None, (), params)
+    errors = []
+    def invoke():
+        try:
+            opVoid.invoke(p, ((), None))
+        except Exception as ex:
+            errors.append(ex)
+    threads = [threading.Thread(target=invoke) for i in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    test(not errors)
@@ -307,6 +307,7 @@ class MyDerivedClassI(Test.MyDerivedClass):
         return count
 
     def opContext(self, current=None):
+        test(isinstance(current.ctx, Ice.Context))
         return current.ctx
 
     def opDoubleMarshaling(self, p1, p2, current=None):
@@ -7,7 +7,7 @@
 #
 # **********************************************************************
 
-import Ice, math, Test, array, sys
+import Ice, math, Test, array, sys, threading
 from sys import version_info
 
 def test(b):
@@ -1328,6 +1328,26 @@ def twoways(communicator, p):
     r = p2.opContext(ctx)
     test(r == ctx)
 
+    #
+    # An Ice.Context can be used instead of a dictionary.
+    #
+    ctx2 = Ice.Context(ctx)
+    test(ctx2 == ctx and dict(ctx2) == ctx)
+    test(p.opContext(ctx2) == ctx)
+    test(p.opContext(context=ctx2) == ctx)
+    p3 = Test.MyClassPrx.checkedCast(p, ctx2)
+    test(p3.ice_getContext() == {})
+    p3 = p.ice_context(ctx2)
+    test(p3.ice_getContext() == ctx)
+    test(p.ice_context(Ice.Context(ctx)) is p3)
+    test(p3.opContext() == ctx)
+    p.ice_ping(ctx2)
+    try:
+        p.opContext(context=[('one', 'ONE')])
+        test(False)
+    except ValueError:
+        pass
+
     #
     # Test implicit context propagation
     #
@@ -1370,8 +1390,41 @@ def twoways(communicator, p):
             ic.getImplicitContext().setContext(ctx)
             test(p2.opContext() == combined)
 
+            ic.getImplicitContext().setContext(Ice.Context(ctx))
+            test(ic.getImplicitContext().getContext() == ctx)
+            test(p1.opContext() == ctx)
+
             test(ic.getImplicitContext().remove('one') == 'ONE')
 
+            #
+            # The snapshot is only replaced when the context changes.
+            #
+            snapshot = ic.getImplicitContext().snapshot()
+            test(isinstance(snapshot, Ice.Context))
+            test(snapshot == ic.getImplicitContext().getContext())
+            test(ic.getImplicitContext().remove('one') == '')
+            test(ic.getImplicitContext().put('two', 'TWO') == 'TWO')
+            test(ic.getImplicitContext().snapshot() is snapshot)
+            test(ic.getImplicitContext().put('two', 'DEUX') == 'TWO')
+            test(ic.getImplicitContext().snapshot() is not snapshot)
+            test(snapshot['two'] == 'TWO')
+            test(p1.opContext() == ic.getImplicitContext().snapshot())
+            ic.getImplicitContext().setContext(snapshot)
+            test(ic.getImplicitContext().snapshot() is snapshot)
+            test(ic.getImplicitContext().get('two') == 'TWO')
+            test(p1.opContext() == snapshot)
+
+            if i == 'PerThread':
+                def run(result):
+                    result.append(ic.getImplicitContext().getContext())
+                    ic.getImplicitContext().setContext(snapshot)
+                    result.append(p1.opContext())
+                result = []
+                t = threading.Thread(target=run, args=(result,))
+                t.start()
+                t.join()
+                test(result == [{}, snapshot])
+
             ic.destroy()
 
     d = 1278312346.0 / 13.0
@@ -1435,3 +1488,4 @@ def twoways(communicator, p):
     p1 = { "test": "test" }
     (p3, p2) = p.opMDict2(p1)
     test(p3["test"] == "test" and p2["test"] == "test")
+
@@ -1258,6 +1258,10 @@ def twowaysFuture(communicator, p):
     c = f.result()
     test(c == ctx)
 
+    f = p.opContextAsync(context=Ice.Context(ctx))
+    c = f.result()
+    test(c == ctx)
+
     #
     # Test implicit context propagation
     #
@@ -0,0 +1,16 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+TestSuite(__name__, [
+    ClientServerTestCase(),
+    ClientAMDServerTestCase(),
+    CollocatedTestCase(),
+    CollocatedTestCase("collocated with copy", props={ "Ice.Python.Collocation": "Copy" }),
+    CollocatedTestCase("collocated with share", props={ "Ice.Python.Collocation": "Share" }),
+])
@@ -0,0 +1,54 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, IceMX, Test, sys, os, time
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def allTests(communicator):
+    sys.stdout.write("testing process group dispatch... ")
+    sys.stdout.flush()
+    base = communicator.stringToProxy("test:default -p 12010")
+    test(base)
+
+    #
+    # Each connection is accepted by one of the workers, the workers
+    # might not all be listening yet so we retry for a while.
+    #
+    pids = set()
+    calls = 0
+    start = time.time()
+    while len(pids) < 3 and time.time() - start < 30:
+        prx = Test.TestIntfPrx.uncheckedCast(base.ice_connectionId(str(calls)))
+        pids.add(prx.getPid())
+        calls += 1
+        prx.ice_getCachedConnection().close(Ice.ConnectionClose.GracefullyWithWait)
+    if hasattr(os, "fork"):
+        test(len(pids) == 3)
+    print("ok")
+
+    sys.stdout.write("testing process group metrics... ")
+    sys.stdout.flush()
+    admin = communicator.stringToProxy("server/admin -f IcePy.Processes:tcp -p 12011")
+    metrics = IceMX.MetricsAdminPrx.checkedCast(admin)
+    test(metrics)
+    enabled, disabled = metrics.getMetricsViewNames()
+    test(enabled == ["View"] and len(disabled) == 0)
+    view, timestamp = metrics.getMetricsView("View")
+    dispatch = [m for m in view["Dispatch"] if m.id == "getPid"]
+    test(len(dispatch) == 1 and dispatch[0].total == calls and dispatch[0].failures == 0)
+    print("ok")
+
+    sys.stdout.write("testing process group shutdown... ")
+    sys.stdout.flush()
+    prx = Test.TestIntfPrx.uncheckedCast(base.ice_connectionId("shutdown"))
+    prx.shutdown()
+    print("ok")
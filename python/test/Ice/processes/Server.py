@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback
+import Ice
+
+Ice.loadSlice('Test.ice')
+import Test, TestI
+
+class Server(Ice.Application):
+    def run(self, args):
+        self.communicator().getProperties().setProperty("TestAdapter.Endpoints", "default -p 12010")
+        adapter = self.communicator().createObjectAdapter("TestAdapter")
+        adapter.add(TestI.TestIntfI(), Ice.stringToIdentity("test"))
+        adapter.activate()
+        self.communicator().waitForShutdown()
+        return 0
+
+initData = Ice.InitializationData()
+initData.properties = Ice.createProperties(sys.argv)
+initData.properties.setProperty("Ice.Python.Processes", "3")
+initData.properties.setProperty("Ice.Admin.Endpoints", "tcp -p 12011")
+initData.properties.setProperty("Ice.Admin.InstanceName", "server")
+initData.properties.setProperty("IceMX.Metrics.View.Map.Dispatch.GroupBy", "operation")
+
+app = Server()
+sys.exit(app.main(sys.argv, initData=initData))
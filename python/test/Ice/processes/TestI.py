@@ -0,0 +1,17 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import Ice, Test, os
+
+class TestIntfI(Test.TestIntf):
+    def getPid(self, current=None):
+        return os.getpid()
+
+    def shutdown(self, current=None):
+        current.adapter.getCommunicator().shutdown()
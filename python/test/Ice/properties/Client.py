@@ -79,4 +79,64 @@ for k in props.keys():
 
 print("ok")
 
+sys.stdout.write("testing properties snapshot... ")
+sys.stdout.flush()
+properties = Ice.createProperties()
+properties.setProperty("Snapshot.Int", "10")
+properties.setProperty("Snapshot.List", "a b c")
+properties.setProperty("Other", "1")
+
+snapshot = properties.snapshot()
+test(isinstance(snapshot, Ice.PropertiesSnapshot))
+test(properties.snapshot() is snapshot)
+test(snapshot["Snapshot.Int"] == "10")
+test("Other" in snapshot and "Unknown" not in snapshot)
+test(len(snapshot) == 3)
+test(snapshot.getProperty("Unknown") == "")
+test(snapshot.getPropertyWithDefault("Unknown", "x") == "x")
+test(snapshot.getPropertyAsInt("Snapshot.Int") == 10)
+test(snapshot.getPropertyAsIntWithDefault("Unknown", 5) == 5)
+test(snapshot.getPropertyAsList("Snapshot.List") == ["a", "b", "c"])
+test(snapshot.getPropertyAsList("Snapshot.List") is not snapshot.getPropertyAsList("Snapshot.List"))
+test(snapshot.getPropertyAsListWithDefault("Unknown", ["d"]) == ["d"])
+test(snapshot.getPropertiesForPrefix("Snapshot.") == {"Snapshot.Int": "10", "Snapshot.List": "a b c"})
+
+properties.setProperty("Snapshot.Int", "10")
+test(properties.snapshot() is snapshot)
+properties.setProperty("Snapshot.Int", "11")
+newSnapshot = properties.snapshot()
+test(newSnapshot.generation > snapshot.generation)
+test(newSnapshot.getPropertyAsInt("Snapshot.Int") == 11)
+test(snapshot.getPropertyAsInt("Snapshot.Int") == 10)
+
+initData = Ice.InitializationData()
+initData.properties = properties
+with Ice.initialize(initData) as communicator:
+    test(communicator.getProperties().snapshot() is communicator.getProperties().snapshot())
+    test(communicator.getProperties().snapshot().generation != newSnapshot.generation)
+
+#
+# The snapshots are updated when the properties are modified through another
+# Properties object or the Properties admin facet.
+#
+initData = Ice.InitializationData()
+initData.properties = Ice.createProperties()
+initData.properties.setProperty("Ice.Admin.Endpoints", "tcp -h 127.0.0.1")
+initData.properties.setProperty("Ice.Admin.InstanceName", "Snapshot")
+with Ice.initialize(initData) as communicator:
+    properties = communicator.getProperties()
+    snapshot = properties.snapshot()
+    test("Snapshot.Admin" not in snapshot)
+    Ice.createProperties().setProperty("Snapshot.Other", "1")
+    test(properties.snapshot() is snapshot)
+    initData.properties.setProperty("Snapshot.Other", "1")
+    snapshot = properties.snapshot()
+    test(snapshot["Snapshot.Other"] == "1")
+    admin = Ice.PropertiesAdminPrx.uncheckedCast(communicator.getAdmin(), "Properties")
+    admin.setProperties({"Snapshot.Admin": "1"})
+    newSnapshot = properties.snapshot()
+    test(newSnapshot is not snapshot and newSnapshot["Snapshot.Admin"] == "1")
+    test(properties.snapshot() is newSnapshot)
+print("ok")
+
 sys.exit(0)
@@ -7,12 +7,16 @@
 #
 # **********************************************************************
 
-import Ice, Test, sys, threading
+import Ice, Test, sys, threading, time
 
 def test(b):
     if not b:
         raise RuntimeError('test assertion failed')
 
+def getTestEndpoint(communicator, num):
+    port = communicator.getProperties().getPropertyAsIntWithDefault("Test.BasePort", 12010) + num
+    return "default -p {0}".format(port)
+
 def allTests(communicator, collocated):
     sys.stdout.write("testing stringToProxy... ")
     sys.stdout.flush()
@@ -456,6 +460,46 @@ def allTests(communicator, collocated):
 
     print("ok")
 
+    sys.stdout.write("testing derived proxy caching... ")
+    sys.stdout.flush()
+    test(base.ice_oneway() is base.ice_oneway())
+    test(base.ice_oneway() is not base.ice_batchOneway())
+    test(base.ice_oneway().ice_twoway() == base)
+    test(base.ice_twoway() is base)
+    test(base.ice_timeout(10) is base.ice_timeout(10))
+    test(base.ice_timeout(10) is not base.ice_timeout(20))
+    test(base.ice_timeout(20).ice_getTimeout() == 20)
+    test(base.ice_invocationTimeout(10) is base.ice_invocationTimeout(10))
+    test(base.ice_invocationTimeout(10) is not base.ice_timeout(10))
+    test(base.ice_context({"a": "b", "c": "d"}) is base.ice_context({"c": "d", "a": "b"}))
+    test(base.ice_context({"a": "b"}) is not base.ice_context({"a": "c"}))
+    test(base.ice_context({"a": "c"}).ice_getContext() == {"a": "c"})
+    test(base.ice_facet("facet") is base.ice_facet("facet"))
+    test(base.ice_facet("facet").ice_getFacet() == "facet")
+    cl = Test.MyClassPrx.uncheckedCast(base)
+    test(isinstance(cl, Test.MyClassPrx))
+    test(cl is Test.MyClassPrx.uncheckedCast(base))
+    test(Test.MyClassPrx.uncheckedCast(cl) is cl)
+    test(Test.MyClassPrx.uncheckedCast(base, "facet") is Test.MyClassPrx.uncheckedCast(base, "facet"))
+    test(Test.MyClassPrx.uncheckedCast(base, "facet").ice_getFacet() == "facet")
+    test(Test.MyClassPrx.uncheckedCast(base.ice_facet("facet")) is not Test.MyClassPrx.uncheckedCast(base))
+    test(isinstance(cl.ice_oneway(), Test.MyClassPrx))
+    test(cl.ice_oneway() is not base.ice_oneway())
+    for i in range(1, 100):
+        test(base.ice_timeout(i).ice_getTimeout() == i)
+
+    test(communicator.stringToProxy(ref) is not communicator.stringToProxy(ref))
+    initData = Ice.InitializationData()
+    initData.properties = communicator.getProperties().clone()
+    initData.properties.setProperty("Ice.Python.ProxyInternSize", "2")
+    c = Ice.initialize(initData)
+    test(c.stringToProxy("test:tcp -p 12010") is c.stringToProxy("test:tcp -p 12010"))
+    test(c.stringToProxy("test:tcp -p 12010") is not c.stringToProxy("test:tcp -p 12011"))
+    test(c.stringToProxy("test:tcp -p 12010") == communicator.stringToProxy("test:tcp -p 12010"))
+    test(c.stringToProxy("") is None)
+    c.destroy()
+    print("ok")
+
     sys.stdout.write("testing proxy comparison... ")
     sys.stdout.flush()
 
@@ -655,6 +699,213 @@ def allTests(communicator, collocated):
     test(c == c2)
     print("ok")
 
+    #
+    # The collocated adapter is not activated so it can't be reached from another communicator.
+    #
+    if not collocated:
+        sys.stdout.write("testing checked cast cache... ")
+        sys.stdout.flush()
+        initData = Ice.InitializationData()
+        initData.properties = communicator.getProperties().clone()
+        initData.properties.setProperty("Ice.Python.CheckedCastCacheTimeout", "-1")
+        ic = Ice.initialize(initData)
+        cbase = ic.stringToProxy(ref)
+        test(Test.MyClassPrx.checkedCast(cbase) is not None)
+        test(Test.MyDerivedClassPrx.checkedCast(cbase) is not None)
+        test(Test.MyClassPrx.checkedCast(cbase, "facet") is None)
+
+        #
+        # A proxy without endpoints can't be cast without the cache.
+        #
+        wellKnown = ic.stringToProxy("test")
+        test(Test.MyClassPrx.checkedCast(wellKnown) is not None)
+        test(Test.MyClassPrx.checkedCast(wellKnown, "facet") is None)
+        test(isinstance(Test.MyDerivedClassPrx.checkedCast(wellKnown), Test.MyDerivedClassPrx))
+        try:
+            Test.MyClassPrx.checkedCast(wellKnown, { "one": "hello" })
+            test(False)
+        except Ice.NoEndpointException:
+            pass
+        try:
+            Test.MyClassPrx.checkedCast(wellKnown, "other")
+            test(False)
+        except Ice.NoEndpointException:
+            pass
+
+        #
+        # A FacetNotExistException invalidates the cached results of the facet.
+        #
+        try:
+            Test.MyClassPrx.uncheckedCast(cbase, "facet").getContext()
+            test(False)
+        except Ice.FacetNotExistException:
+            pass
+        test(Test.MyClassPrx.checkedCast(wellKnown) is not None)
+        try:
+            Test.MyClassPrx.checkedCast(wellKnown, "facet")
+            test(False)
+        except Ice.NoEndpointException:
+            pass
+        ic.destroy()
+        print("ok")
+
+    if not collocated:
+        sys.stdout.write("testing connection pool... ")
+        sys.stdout.flush()
+        test(cl.ice_getConnectionPoolInfo() is None)
+        pool = cl.ice_connectionPool(3)
+        test(isinstance(pool, Test.MyClassPrx))
+        test(pool == cl)
+        for i in range(0, 6):
+            pool.getContext()
+        info = pool.ice_getConnectionPoolInfo()
+        test(len(info) == 3)
+        test(len(set([m["connectionId"] for m in info])) == 3)
+        test([m["connectionId"].split("-")[-1] for m in info] == ["0", "1", "2"])
+        for m in info:
+            test(m["requests"] == 2 and m["outstanding"] == 0 and m["failures"] == 0)
+            test(m["connects"] == 1 and m["closes"] == 0)
+            test(m["connectionInfo"] is not None)
+        test(len(set([cl.ice_connectionId(m["connectionId"]).ice_getConnection() for m in info])) == 3)
+        test(cl.ice_getConnection() not in [cl.ice_connectionId(m["connectionId"]).ice_getConnection() for m in info])
+
+        futures = [pool.getContextAsync() for i in range(0, 9)]
+        for f in futures:
+            f.result()
+        info = pool.ice_getConnectionPoolInfo()
+        test(sum([m["requests"] for m in info]) == 15)
+        test(sum([m["outstanding"] for m in info]) == 0)
+
+        r = pool.begin_getContext()
+        pool.end_getContext(r)
+        pool.ice_ping()
+        test(sum([m["requests"] for m in pool.ice_getConnectionPoolInfo()]) == 17)
+
+        #
+        # The invocations started with begin_ are released once completed.
+        #
+        cb = threading.Event()
+        pool.begin_getContext(lambda ctx: cb.set(), lambda ex: cb.set())
+        cb.wait()
+        r = pool.begin_ice_ping()
+        pool.end_ice_ping(r)
+        for i in range(0, 100):
+            if sum([m["outstanding"] for m in pool.ice_getConnectionPoolInfo()]) == 0:
+                break
+            time.sleep(0.05)
+        info = pool.ice_getConnectionPoolInfo()
+        test(sum([m["outstanding"] for m in info]) == 0)
+        test(sum([m["requests"] for m in info]) == 19)
+
+        #
+        # The pool is shared by the proxies cast from the pooled proxy.
+        #
+        test(Test.MyClassPrx.uncheckedCast(base.ice_connectionPool(2)).ice_getConnectionPoolInfo() is not None)
+        test(Test.MyClassPrx.checkedCast(base.ice_connectionPool(2)).ice_getConnectionPoolInfo() is not None)
+        test(pool.ice_oneway().ice_getConnectionPoolInfo() is None)
+
+        #
+        # The connections closed are reported and re-established.
+        #
+        # The close callback set by the application isn't replaced by the pool.
+        #
+        closed = []
+        connection = cl.ice_connectionId(info[1]["connectionId"]).ice_getConnection()
+        connection.setCloseCallback(lambda c: closed.append(c))
+        connection.close(Ice.ConnectionClose.GracefullyWithWait)
+        for i in range(0, 100):
+            if pool.ice_getConnectionPoolInfo()[1]["closes"] == 1:
+                break
+            time.sleep(0.05)
+        info = pool.ice_getConnectionPoolInfo()
+        test(info[1]["closes"] == 1 and info[1]["connectionInfo"] is None)
+        for i in range(0, 100):
+            if closed:
+                break
+            time.sleep(0.05)
+        test(closed == [connection])
+        for i in range(0, 3):
+            pool.getContext()
+        info = pool.ice_getConnectionPoolInfo()
+        test(info[1]["connects"] == 2 and info[1]["connectionInfo"] is not None)
+
+        pool = cl.ice_connectionPool(2, Ice.ConnectionPoolPolicy.LeastOutstanding)
+        futures = [pool.getContextAsync() for i in range(0, 10)]
+        for f in futures:
+            f.result()
+        info = pool.ice_getConnectionPoolInfo()
+        test(sum([m["requests"] for m in info]) == 10)
+        test(info[0]["requests"] > 0 and info[1]["requests"] > 0)
+
+        #
+        # Pools created from the same proxy don't share connections.
+        #
+        other = cl.ice_connectionPool(2, Ice.ConnectionPoolPolicy.LeastOutstanding)
+        other.getContext()
+        other.getContext()
+        connections = [cl.ice_connectionId(m["connectionId"]).ice_getConnection() for m in info]
+        for m in other.ice_getConnectionPoolInfo():
+            test(m["connectionId"] not in [n["connectionId"] for n in info])
+            test(cl.ice_connectionId(m["connectionId"]).ice_getConnection() not in connections)
+
+        try:
+            cl.ice_connectionPool(0)
+            test(False)
+        except ValueError:
+            pass
+        print("ok")
+
+        sys.stdout.write("testing adaptive endpoint selection... ")
+        sys.stdout.flush()
+
+        #
+        # A proxy with a single endpoint uses the Ordered selection.
+        #
+        adaptive = cl.ice_endpointSelection(Ice.EndpointSelectionType.Adaptive)
+        test(adaptive.ice_getEndpointSelection() == Ice.EndpointSelectionType.Ordered)
+
+        endpoint = cl.ice_getEndpoints()[0]
+        down = communicator.stringToProxy("test:" + getTestEndpoint(communicator, 9)).ice_getEndpoints()[0]
+        multi = Test.MyClassPrx.uncheckedCast(cl.ice_endpoints([down, endpoint]))
+        adaptive = multi.ice_endpointSelection(Ice.EndpointSelectionType.Adaptive)
+        test(adaptive.ice_getEndpointSelection() == Ice.EndpointSelectionType.Adaptive)
+        test(Test.MyClassPrx.uncheckedCast(adaptive).ice_getEndpointSelection() ==
+             Ice.EndpointSelectionType.Adaptive)
+        test(adaptive.ice_oneway().ice_getEndpointSelection() == Ice.EndpointSelectionType.Ordered)
+        for i in range(0, 5):
+            adaptive.getContext()
+        adaptive.getContextAsync().result()
+
+        stats = down.getSelectionStats()
+        test(stats["latency"] is None and stats["failures"] > 0 and stats["errorRate"] > 0)
+        stats = endpoint.getSelectionStats()
+        test(stats["latency"] is not None and stats["failures"] == 0 and stats["errorRate"] == 0)
+        test(stats["outstanding"] == 0)
+        test(communicator.stringToProxy("test:" + getTestEndpoint(communicator, 8)).ice_getEndpoints()[0].getSelectionStats() is None)
+
+        #
+        # With per-request routing, the endpoint which failed is no longer selected. The
+        # statistics belong to the communicator.
+        #
+        initData = Ice.InitializationData()
+        initData.properties = communicator.getProperties().clone()
+        initData.properties.setProperty("Ice.Python.AdaptivePerRequest", "1")
+        ic = Ice.initialize(initData)
+        adaptive = Test.MyClassPrx.uncheckedCast(ic.stringToProxy(ic.proxyToString(multi)))
+        adaptive = adaptive.ice_endpointSelection(Ice.EndpointSelectionType.Adaptive)
+        requests = endpoint.getSelectionStats()["requests"]
+        icEndpoint = adaptive.ice_getEndpoints()[1]
+        test(icEndpoint.getSelectionStats()["requests"] == 0)
+        adaptive.getContext() # Might first select the endpoint which is down.
+        icRequests = icEndpoint.getSelectionStats()["requests"]
+        for i in range(0, 10):
+            adaptive.getContext()
+        test(icEndpoint.getSelectionStats()["requests"] == icRequests + 10)
+        test(endpoint.getSelectionStats()["requests"] == requests)
+        ic.destroy()
+        test(icEndpoint.getSelectionStats() is None)
+        print("ok")
+
     sys.stdout.write("testing ice_fixed... ")
     sys.stdout.flush()
     connection = cl.ice_getConnection()
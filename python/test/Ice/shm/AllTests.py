@@ -0,0 +1,61 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+
+import Ice, Test, TestI, sys
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def allTests(communicator):
+    prx = Test.TestIntfPrx.checkedCast(communicator.stringToProxy("test:shm -name shmtest"))
+    controller = Test.TestIntfControllerPrx.checkedCast(communicator.stringToProxy("testController:default -p 12010"))
+    test(prx.ice_getConnection().getInfo().sndSize == 65536)
+
+    sys.stdout.write("testing ring buffer wraparound... ")
+    sys.stdout.flush()
+    #
+    # The sizes don't divide the ring buffer size, the data wraps around the end of the
+    # ring buffers at different positions in both directions.
+    #
+    for i in range(0, 40):
+        seq = TestI.pattern(i, 10000 + i * 997)
+        test(prx.echo(seq) == seq)
+    print("ok")
+
+    sys.stdout.write("testing data larger than the ring buffer... ")
+    sys.stdout.flush()
+    for size in [65536, 65537, 300000, 1024 * 1024 + 3]:
+        seq = TestI.pattern(size % 256, size)
+        test(prx.echo(seq) == seq)
+    print("ok")
+
+    sys.stdout.write("testing full ring buffer... ")
+    sys.stdout.flush()
+    #
+    # The held adapter doesn't read the requests, once the ring buffer is full the data is
+    # sent inline over the socket.
+    #
+    controller.holdAdapter()
+    oneway = prx.ice_oneway()
+    futures = [oneway.sendAsync(TestI.pattern(i, 40000)) for i in range(0, 4)]
+    controller.resumeAdapter()
+    for f in futures:
+        f.result()
+    test(prx.getReceived() == [0, 1, 2, 3])
+
+    seq = TestI.pattern(7, 300000)
+    controller.holdAdapter()
+    f = prx.echoAsync(seq)
+    controller.resumeAdapter()
+    test(f.result() == seq)
+    print("ok")
+
+    prx.shutdown()
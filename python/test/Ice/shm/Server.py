@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+
+import os, sys, traceback
+import Ice
+
+Ice.loadSlice('Test.ice')
+import Test, TestI
+
+def run(args, communicator):
+    properties = communicator.getProperties()
+    properties.setProperty("TestAdapter.Endpoints", "shm -name shmtest")
+    properties.setProperty("ControllerAdapter.Endpoints", "default -p 12010")
+    adapter = communicator.createObjectAdapter("TestAdapter")
+    adapter.add(TestI.TestIntfI(), Ice.stringToIdentity("test"))
+    adapter.activate()
+
+    adapter2 = communicator.createObjectAdapter("ControllerAdapter")
+    adapter2.add(TestI.TestIntfControllerI(adapter), Ice.stringToIdentity("testController"))
+    adapter2.activate()
+
+    communicator.waitForShutdown()
+    return True
+
+try:
+    initData = Ice.InitializationData()
+    initData.properties = Ice.createProperties(sys.argv)
+    #
+    # Use the smallest ring buffers, so that the test data wraps around them and fills them.
+    #
+    initData.properties.setProperty("Ice.SHM.BufferSize", "65536")
+    initData.properties.setProperty("Ice.MessageSizeMax", "0")
+    with Ice.initialize(sys.argv, initData) as communicator:
+         status = run(sys.argv, communicator)
+except:
+    traceback.print_exc()
+    status = False
+
+sys.exit(not status)
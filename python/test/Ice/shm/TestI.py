@@ -0,0 +1,47 @@
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+
+import Ice, Test, threading
+
+def pattern(seed, size):
+    return bytes(bytearray((seed + i) % 256 for i in range(0, size)))
+
+class TestIntfI(Test.TestIntf):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._received = []
+
+    def echo(self, seq, current=None):
+        return seq
+
+    def send(self, seq, current=None):
+        #
+        # Record the seed of the data, or -1 if it doesn't match the pattern.
+        #
+        seed = bytearray(seq[:1])[0] if seq else 0
+        with self._lock:
+            self._received.append(seed if seq == pattern(seed, len(seq)) else -1)
+
+    def getReceived(self, current=None):
+        with self._lock:
+            return self._received
+
+    def shutdown(self, current=None):
+        current.adapter.getCommunicator().shutdown()
+
+class TestIntfControllerI(Test.TestIntfController):
+    def __init__(self, adapter):
+        self._adapter = adapter
+
+    def holdAdapter(self, current=None):
+        self._adapter.hold()
+
+    def resumeAdapter(self, current=None):
+        self._adapter.activate()
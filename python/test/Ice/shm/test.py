@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+#
+# The shared memory transport isn't available on Windows.
+#
+if not isinstance(platform, Windows):
+    TestSuite(__name__, [ ClientServerTestCase() ])
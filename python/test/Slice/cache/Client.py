@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback, shutil, subprocess, tempfile
+
+import Ice
+
+status = True
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def writeFile(path, data):
+    with open(path, "w") as f:
+        f.write(data)
+
+#
+# Loads Test.ice and the files it includes in a new process, to not reuse the types
+# already loaded, and returns the values of its constants.
+#
+def load(args, dontWriteBytecode=False, cwd=None):
+    code = "import Ice\nIce.loadSlice(%r)\nimport Test\nprint('%%s %%s' %% (Test.Number, getattr(Test, 'Defined', None)))" % \
+        ("--all " + args)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if dontWriteBytecode:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=cwd or testdir, env=env)
+    return out.decode().split()
+
+def inode(path):
+    return os.stat(path).st_ino if os.path.exists(path) else None
+
+testdir = tempfile.mkdtemp()
+try:
+    sys.stdout.write("testing loadSlice cache... ")
+    sys.stdout.flush()
+
+    os.mkdir(os.path.join(testdir, "include"))
+    writeFile(os.path.join(testdir, "include", "Included.ice"), "module Included { const int Number = 1; }\n")
+    writeFile(os.path.join(testdir, "Test.ice"),
+              "#include <Included.ice>\n"
+              "module Test\n"
+              "{\n"
+              "const int Number = Included::Number;\n"
+              "#ifdef DEFINED\n"
+              "const int Defined = 2;\n"
+              "#endif\n"
+              "}\n")
+
+    cache = os.path.join(testdir, "__pycache__", "Test.ice.cpython-%d%d.icepyc" % sys.version_info[:2])
+    test(load("-Iinclude Test.ice", dontWriteBytecode=True) == ["1", "None"])
+    test(not os.path.exists(cache))
+    test(load("-Iinclude Test.ice") == ["1", "None"])
+    test(os.path.exists(cache))
+    ino = inode(cache)
+
+    #
+    # The cached code is used if none of the Slice files changed.
+    #
+    test(load("-Iinclude Test.ice") == ["1", "None"])
+    test(inode(cache) == ino)
+
+    #
+    # The code is generated again if an included file or the options change.
+    #
+    writeFile(os.path.join(testdir, "include", "Included.ice"), "module Included { const int Number = 3; }\n")
+    test(load("-Iinclude Test.ice") == ["3", "None"])
+    test(inode(cache) != ino)
+    ino = inode(cache)
+    test(load("-Iinclude Test.ice") == ["3", "None"])
+    test(inode(cache) == ino)
+
+    test(load("-Iinclude -DDEFINED Test.ice") == ["3", "2"])
+    test(inode(cache) != ino)
+
+    #
+    # A relative include path is resolved from the working directory.
+    #
+    other = os.path.join(testdir, "other")
+    os.makedirs(os.path.join(other, "include"))
+    writeFile(os.path.join(other, "include", "Included.ice"), "module Included { const int Number = 4; }\n")
+    test(load("-Iinclude " + os.path.join(testdir, "Test.ice")) == ["3", "None"])
+    test(load("-Iinclude " + os.path.join(testdir, "Test.ice"), cwd=other) == ["4", "None"])
+
+    #
+    # A corrupted cache file is ignored.
+    #
+    writeFile(cache, "corrupted")
+    test(load("-Iinclude Test.ice") == ["3", "None"])
+    test(os.path.getsize(cache) > len("corrupted"))
+
+    #
+    # The cache directory can be set with --cache-dir, and the cache is disabled with --no-cache.
+    #
+    shutil.rmtree(os.path.join(testdir, "__pycache__"))
+    test(load("--no-cache -Iinclude Test.ice") == ["3", "None"])
+    test(not os.path.exists(os.path.join(testdir, "__pycache__")))
+    test(load("--cache-dir=cache -Iinclude Test.ice") == ["3", "None"])
+    test(not os.path.exists(os.path.join(testdir, "__pycache__")))
+    test(os.path.exists(os.path.join(testdir, "cache", os.path.basename(cache))))
+    print("ok")
+except:
+    traceback.print_exc()
+    status = False
+finally:
+    shutil.rmtree(testdir)
+
+sys.exit(not status)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# **********************************************************************
+#
+# Copyright (c) 2003-2018 ZeroC, Inc. All rights reserved.
+#
+# This copy of Ice is licensed to you under the terms described in the
+# ICE_LICENSE file included in this distribution.
+#
+# **********************************************************************
+
+import os, sys, traceback, shutil, tempfile
+
+for toplevel in [".", "..", "../..", "../../..", "../../../.."]:
+    toplevel = os.path.normpath(toplevel)
+    if os.path.exists(os.path.join(toplevel, "python", "Ice", "__init__.py")):
+        break
+else:
+    raise RuntimeError("can't find toplevel directory!")
+
+import Ice
+
+status = True
+
+def test(b):
+    if not b:
+        raise RuntimeError('test assertion failed')
+
+def writeFile(path, data):
+    with open(path, "w") as f:
+        f.write(data)
+
+testdir = tempfile.mkdtemp()
+sys.path.insert(0, testdir)
+try:
+    sys.stdout.write("testing import of Slice modules... ")
+    sys.stdout.flush()
+
+    #
+    # A package on the Python path is executed in the module created for the Slice module with
+    # the same name, regardless of whether it is imported before or after the Slice definitions.
+    #
+    os.mkdir(os.path.join(testdir, "ModA"))
+    writeFile(os.path.join(testdir, "ModA", "__init__.py"), "Extra = 1\n")
+    writeFile(os.path.join(testdir, "Test.ice"),
+              "module ModA { const int Number = 1; module Sub { const int Number = 2; } }\n"
+              "module ModB { const int Number = 3; }\n")
+
+    Ice.loadSlice("--no-cache " + os.path.join(testdir, "Test.ice"))
+    modA = Ice.openModule("ModA")
+    test(Ice.openModule("ModA") is modA)
+    test(Ice.openModule("ModA.Sub") is modA.Sub)
+
+    import ModA
+    import ModA.Sub
+    import ModB
+    test(ModA is modA)
+    test(ModA.Number == 1 and ModA.Extra == 1)
+    test(ModA.__file__.startswith(testdir))
+    test(ModA.Sub.Number == 2)
+    test(ModB.Number == 3)
+    test(sys.modules["ModA.Sub"] is ModA.Sub)
+    test(Ice.openModule("ModB") is ModB)
+
+    #
+    # Names which are not Slice modules are not affected.
+    #
+    try:
+        import ModC
+        test(False)
+    except ImportError:
+        pass
+
+    import Ice.Instrumentation
+    test(sys.modules["Ice.Instrumentation"] is Ice.Instrumentation)
+    test(Ice.openModule("Ice.Instrumentation") is Ice.Instrumentation)
+    print("ok")
+except:
+    traceback.print_exc()
+    status = False
+finally:
+    shutil.rmtree(testdir)
+
+sys.exit(not status)